@@ -0,0 +1,43 @@
+"""add_user_life_events_table
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create user_life_events table."""
+    op.create_table(
+        "user_life_events",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("telegram_id", sa.Integer(), nullable=False),
+        sa.Column("event_date", sa.Date(), nullable=False),
+        sa.Column("label", sa.String(length=100), nullable=False),
+        sa.Column("color", sa.String(length=7), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["telegram_id"], ["users.telegram_id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_user_life_events_telegram_id",
+        "user_life_events",
+        ["telegram_id"],
+    )
+
+
+def downgrade() -> None:
+    """Drop user_life_events table."""
+    op.drop_index("ix_user_life_events_telegram_id", table_name="user_life_events")
+    op.drop_table("user_life_events")
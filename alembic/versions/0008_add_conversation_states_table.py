@@ -0,0 +1,39 @@
+"""add_conversation_states_table
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create conversation_states table."""
+    op.create_table(
+        "conversation_states",
+        sa.Column("telegram_id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("state", sa.String(length=64), nullable=False),
+        sa.Column("state_id", sa.String(length=36), nullable=False),
+        sa.Column("updated_at", sa.Float(), nullable=False),
+        sa.Column("context_data", sa.JSON(), nullable=True),
+        sa.PrimaryKeyConstraint("telegram_id"),
+    )
+    op.create_index(
+        "ix_conversation_states_updated_at",
+        "conversation_states",
+        ["updated_at"],
+    )
+
+
+def downgrade() -> None:
+    """Drop conversation_states table."""
+    op.drop_index("ix_conversation_states_updated_at", table_name="conversation_states")
+    op.drop_table("conversation_states")
@@ -0,0 +1,31 @@
+"""add_scheduler_leases_table
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create scheduler_leases table."""
+    op.create_table(
+        "scheduler_leases",
+        sa.Column("name", sa.String(length=64), nullable=False),
+        sa.Column("holder", sa.String(length=255), nullable=False),
+        sa.Column("expires_at", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    """Drop scheduler_leases table."""
+    op.drop_table("scheduler_leases")
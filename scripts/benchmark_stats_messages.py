@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Benchmark rendering of the "weeks.statistics" message.
+
+Compares the cached per-locale formatters of StatsMessageRenderer with
+calling Babel's format_decimal/format_percent for every placeholder, and
+prints the number of messages rendered per second for each language.
+
+Usage: python scripts/benchmark_stats_messages.py [--messages N]
+"""
+
+import argparse
+import time
+from datetime import date
+from typing import Callable
+
+from babel.numbers import format_decimal, format_percent
+
+import src.bot  # noqa: F401  # import order of main.py; avoids a services cycle
+from src.core.life_calculator import calculate_life_statistics
+from src.i18n import normalize_babel_locale, use_locale
+from src.services.stats_renderer import stats_message_renderer
+
+LANGUAGES = ("en", "ru", "ua", "by")
+
+
+def translated_template(stats, pgettext: Callable) -> str:
+    """Return the translated "weeks.statistics" template used by the renderer."""
+    templates = []
+    stats_message_renderer.render(
+        stats=stats,
+        lang="en",
+        pgettext=lambda context, message: templates.append(pgettext(context, message))
+        or "",
+    )
+    return templates[0]
+
+
+def render_uncached(stats, lang: str, template: str) -> str:
+    """Render the message the way handlers did before the formatter cache."""
+    return template % {
+        "age": format_decimal(stats.age, locale=normalize_babel_locale(lang)),
+        "weeks_lived": format_decimal(
+            stats.total_weeks_lived,
+            locale=normalize_babel_locale(lang),
+            format="#,##0",
+        ),
+        "life_expectancy": format_decimal(
+            stats.life_expectancy, locale=normalize_babel_locale(lang)
+        ),
+        "remaining_weeks": format_decimal(
+            stats.remaining_weeks,
+            locale=normalize_babel_locale(lang),
+            format="#,##0",
+        ),
+        "life_percentage": format_percent(
+            stats.percentage_lived,
+            locale=normalize_babel_locale(lang),
+            format="#0.1%",
+        ),
+        "days_until_birthday": format_decimal(
+            stats.days_until_birthday, locale=normalize_babel_locale(lang)
+        ),
+    }
+
+
+def measure(render: Callable[[], str], messages: int) -> float:
+    """Return messages rendered per second."""
+    start = time.perf_counter()
+    for _ in range(messages):
+        render()
+    return messages / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=20000)
+    args = parser.parse_args()
+
+    stats = calculate_life_statistics(birth_date=date(1990, 3, 15), life_expectancy=80)
+    print(f"{'lang':<6}{'uncached msg/s':>16}{'cached msg/s':>16}{'speedup':>10}")
+    for lang in LANGUAGES:
+        _, _, pgettext = use_locale(lang)
+        template = translated_template(stats, pgettext)
+        assert render_uncached(stats, lang, template) == stats_message_renderer.render(
+            stats=stats, lang=lang, pgettext=pgettext
+        )
+        uncached = measure(
+            lambda: render_uncached(stats, lang, template), args.messages
+        )
+        cached = measure(
+            lambda: stats_message_renderer.render(
+                stats=stats, lang=lang, pgettext=pgettext
+            ),
+            args.messages,
+        )
+        print(f"{lang:<6}{uncached:>16,.0f}{cached:>16,.0f}{cached / uncached:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Simulate the notification peaks of busy slots with and without jitter.
+
+Plans the delivery delays of slots with the given audience sizes and
+prints, for each slot, the busiest second before and after peak shaving,
+and whether its last user is sent within the window. Slots are UTC
+instants, so the audience of a slot counts the users of every time zone
+whose notifications fire at that instant.
+
+The rate and window default to NOTIFICATION_SENDS_PER_SECOND and
+NOTIFICATION_JITTER_WINDOW_SECONDS.
+
+Usage: python scripts/simulate_delivery_peaks.py [--rate R] [--window S]
+       [--slot "Monday 09:00 UTC=20000" ...]
+"""
+
+import argparse
+
+from src.scheduler.peak_shaving import format_simulation, simulate_delivery
+from src.utils.config import (
+    NOTIFICATION_JITTER_WINDOW_SECONDS,
+    NOTIFICATION_SENDS_PER_SECOND,
+)
+
+# Default notification time of most users, next to a few custom ones
+DEFAULT_AUDIENCES = {
+    "Monday 09:00 UTC": 20000,
+    "Monday 10:00 UTC": 1500,
+    "Sunday 20:00 UTC": 300,
+    "Friday 18:30 UTC": 25,
+}
+
+
+def parse_slot(value: str) -> tuple[str, int]:
+    """Parse a "<slot>=<users>" argument."""
+    slot, separator, users = value.rpartition("=")
+    if not separator or not users.isdigit():
+        raise argparse.ArgumentTypeError(f"expected <slot>=<users>, got {value!r}")
+    return slot, int(users)
+
+
+def main() -> None:
+    """Run the simulation and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rate", type=float, default=NOTIFICATION_SENDS_PER_SECOND)
+    parser.add_argument(
+        "--window", type=float, default=NOTIFICATION_JITTER_WINDOW_SECONDS
+    )
+    parser.add_argument("--slot", type=parse_slot, action="append", default=[])
+    args = parser.parse_args()
+
+    audiences = dict(args.slot) or DEFAULT_AUDIENCES
+    simulations = simulate_delivery(audiences, args.rate, args.window)
+    print(f"{args.rate:g} messages/s, window {args.window:g}s")
+    print(format_simulation(simulations))
+    assert all(simulation.within_rate for simulation in simulations)
+
+
+if __name__ == "__main__":
+    main()
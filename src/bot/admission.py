@@ -0,0 +1,274 @@
+"""Admission control for commands that are expensive to execute.
+
+Rendering and uploading a ``/visualize`` image costs orders of magnitude
+more than answering ``/weeks`` or a menu callback. This module provides the
+AdmissionController class, which runs such commands on a fixed number of
+workers fed by a bounded priority queue instead of inline in the update
+pipeline, so a burst of them cannot occupy every update processing slot.
+
+Before queueing, a cheap check of the handler decides whether the command
+would do expensive work at all: commands that only end in an error, e.g.
+from unregistered users, run inline and answer right away. A user gets an
+immediate acknowledgement in their chosen language when their command is
+queued. Repeating the command while it is queued or running is collapsed
+into the existing job with a short notice, and commands arriving while the
+queue is full are rejected with a localized message instead of piling up.
+"""
+
+import asyncio
+import itertools
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any, Optional
+
+from telegram import Update
+
+from src.i18n import use_locale
+from src.utils.config import BOT_NAME
+from src.utils.logger import get_logger
+
+from .registry import HandlerMethod
+
+logger = get_logger(BOT_NAME)
+
+# Returns the user's language if the command may be queued, None to run inline
+AdmissionCheck = Callable[[Update, Any], Awaitable[Optional[str]]]
+
+
+class AdmissionResult(StrEnum):
+    """Outcome of submitting an expensive command."""
+
+    QUEUED = "queued"
+    DUPLICATE = "duplicate"
+    REJECTED = "rejected"
+    INLINE = "inline"
+
+
+@dataclass(order=True, slots=True)
+class AdmissionJob:
+    """Queued command, ordered by priority, then arrival.
+
+    :ivar priority: Lower values are executed first
+    :ivar sequence: Arrival number keeping equal priorities in order
+    :ivar key: Deduplication key of the user and command
+    :ivar callback: Handler method executing the command
+    :ivar update: Update carrying the command
+    :ivar context: Callback context of the update
+    """
+
+    priority: int
+    sequence: int
+    key: tuple[int, str] = field(compare=False)
+    callback: HandlerMethod = field(compare=False)
+    update: Update = field(compare=False)
+    context: Any = field(compare=False)
+
+
+class AdmissionController:
+    """Bounded priority queue and workers for expensive commands.
+
+    :ivar _queue: Jobs waiting for a worker
+    :ivar _workers: Number of worker tasks
+    :ivar _tasks: Running worker tasks
+    :ivar _active: Language of the user of each queued or running job
+    :ivar _sequence: Source of arrival numbers
+    """
+
+    def __init__(self, capacity: int, workers: int) -> None:
+        """Initialize the controller.
+
+        :param capacity: Jobs that may wait for a worker
+        :type capacity: int
+        :param workers: Jobs executed at the same time
+        :type workers: int
+        :raises ValueError: If capacity or workers is not positive
+        """
+        if capacity < 1 or workers < 1:
+            raise ValueError("capacity and workers must be positive")
+        self._queue: asyncio.PriorityQueue[AdmissionJob] = asyncio.PriorityQueue(
+            maxsize=capacity
+        )
+        self._workers = workers
+        self._tasks: list[asyncio.Task[None]] = []
+        self._active: dict[tuple[int, str], str] = {}
+        self._sequence = itertools.count()
+
+    @property
+    def queue_size(self) -> int:
+        """Jobs waiting for a worker."""
+        return self._queue.qsize()
+
+    def admit(
+        self,
+        command: str,
+        priority: int,
+        callback: HandlerMethod,
+        precheck: Optional[AdmissionCheck] = None,
+    ) -> HandlerMethod:
+        """Wrap a handler method so its updates go through admission control.
+
+        :param command: Command name, part of the deduplication key
+        :type command: str
+        :param priority: Queue priority, lower values are executed first
+        :type priority: int
+        :param callback: Handler method executing the command
+        :type callback: HandlerMethod
+        :param precheck: Cheap check run before queueing, see AdmissionCheck
+        :type precheck: Optional[AdmissionCheck]
+        :returns: Handler method submitting the update instead
+        :rtype: HandlerMethod
+        """
+
+        async def admitted(update: Update, context: Any) -> None:
+            await self.submit(
+                command=command,
+                priority=priority,
+                callback=callback,
+                update=update,
+                context=context,
+                precheck=precheck,
+            )
+
+        return admitted
+
+    async def submit(
+        self,
+        command: str,
+        priority: int,
+        callback: HandlerMethod,
+        update: Update,
+        context: Any,
+        precheck: Optional[AdmissionCheck] = None,
+    ) -> AdmissionResult:
+        """Queue a command and tell the user whether it was accepted.
+
+        Without a precheck every command is queued and answered in the
+        Telegram client language.
+
+        :param command: Command name, part of the deduplication key
+        :type command: str
+        :param priority: Queue priority, lower values are executed first
+        :type priority: int
+        :param callback: Handler method executing the command
+        :type callback: HandlerMethod
+        :param update: Update carrying the command
+        :type update: Update
+        :param context: Callback context of the update
+        :type context: Any
+        :param precheck: Cheap check run before queueing, see AdmissionCheck
+        :type precheck: Optional[AdmissionCheck]
+        :returns: Whether the command was queued, collapsed, rejected or run
+            inline
+        :rtype: AdmissionResult
+        """
+        key = (update.effective_user.id, command)
+        if key in self._active:
+            logger.debug(f"/{command}: [{key[0]}]: already queued, collapsed")
+            await self._reply(
+                update,
+                self._active[key],
+                "admission.duplicate",
+                "⏳ Still working on your previous request…",
+            )
+            return AdmissionResult.DUPLICATE
+
+        if precheck is None:
+            lang = update.effective_user.language_code or "en"
+        else:
+            lang = await precheck(update, context)
+            if lang is None:
+                # The handler only answers with an error, which is cheap
+                await callback(update, context)
+                return AdmissionResult.INLINE
+
+        job = AdmissionJob(
+            priority=priority,
+            sequence=next(self._sequence),
+            key=key,
+            callback=callback,
+            update=update,
+            context=context,
+        )
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            logger.warning(f"/{command}: [{key[0]}]: queue full, rejected")
+            await self._reply(
+                update,
+                lang,
+                "admission.rejected",
+                "🚦 The bot is busy right now.\nPlease try again in a minute.",
+            )
+            return AdmissionResult.REJECTED
+
+        self._active[key] = lang
+        self.start()
+        await self._reply(update, lang, "admission.queued", "⏳ Rendering, one moment…")
+        return AdmissionResult.QUEUED
+
+    def start(self) -> None:
+        """Start the workers unless they are running; done on first submit.
+
+        :returns: None
+        """
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._work()) for _ in range(self._workers)
+            ]
+
+    async def stop(self) -> None:
+        """Stop the workers; queued jobs are dropped.
+
+        :returns: None
+        """
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        if self._queue.qsize():
+            logger.warning(f"Dropping {self._queue.qsize()} queued expensive commands")
+
+    async def _work(self) -> None:
+        """Execute queued jobs one after another.
+
+        :returns: None
+        """
+        while True:
+            job = await self._queue.get()
+            try:
+                await job.callback(job.update, job.context)
+            except Exception as error:
+                logger.error(
+                    f"Expensive command of user {job.key[0]} failed: {error}",
+                    exc_info=True,
+                )
+            finally:
+                self._active.pop(job.key, None)
+                self._queue.task_done()
+
+    @staticmethod
+    async def _reply(update: Update, lang: str, key: str, default: str) -> None:
+        """Send a short localized notice.
+
+        :param update: Update carrying the command
+        :type update: Update
+        :param lang: Language of the notice
+        :type lang: str
+        :param key: Message key
+        :type key: str
+        :param default: English message
+        :type default: str
+        :returns: None
+        """
+        message = update.effective_message
+        if message is None:
+            return
+        _, _, pgettext = use_locale(lang=lang)
+        try:
+            await message.reply_text(text=pgettext(key, default))
+        except Exception as error:
+            logger.warning(f"Failed to send '{key}' notice: {error}")
@@ -5,34 +5,76 @@ for the Telegram bot application. It delegates handler registration to the
 plugin system and uses HandlerRegistry for centralized handler management.
 """
 
+import asyncio
 import multiprocessing
+import signal
+from functools import partial
 from typing import Optional
 
 from telegram import Update
 from telegram.error import NetworkError, RetryAfter, TimedOut
 from telegram.ext import (
     Application,
-    CallbackQueryHandler,
-    CommandHandler,
     ContextTypes,
     MessageHandler,
+    TypeHandler,
     filters,
 )
 
-from ..bot.event_listeners import register_event_listeners
+from ..bot.event_listeners import NotificationRescheduler, register_event_listeners
 from ..core.exceptions import BotError
+from ..database.service import DatabaseManager
 from ..enums import SupportedLanguage
-from ..i18n import use_locale
+from ..i18n import translation_registry, use_locale
 from ..scheduler.client import SchedulerClient
+from ..scheduler.sharding import ShardedSchedulerClient
 from ..scheduler.worker import SchedulerWorker
 from ..services.container import ServiceContainer
-from ..utils.config import BOT_NAME, TOKEN
+from ..services.validation_service import ValidationService
+from ..utils.config import (
+    BOT_NAME,
+    CONCURRENT_UPDATES,
+    EXPENSIVE_QUEUE_SIZE,
+    EXPENSIVE_WORKERS,
+    FLOOD_BURST,
+    FLOOD_RATE_PER_MINUTE,
+    NOTIFICATION_SENDS_PER_SECOND,
+    REGISTERED_USERS_FILTER,
+    RESCHEDULE_DEBOUNCE_SECONDS,
+    SCHEDULE_RECONCILE_INTERVAL_SECONDS,
+    SCHEDULER_HEARTBEAT_SECONDS,
+    SCHEDULER_HEARTBEAT_TIMEOUT_SECONDS,
+    SCHEDULER_LEADER_ELECTION,
+    SCHEDULER_LEASE_SECONDS,
+    SCHEDULER_SHARDS,
+    TOKEN,
+    USER_DATA_EVICTION_INTERVAL_SECONDS,
+    USER_DATA_MAX_USERS,
+    USER_QUEUE_DEPTH_WARNING,
+    WEBHOOK_ENABLED,
+    WEBHOOK_LISTEN,
+    WEBHOOK_PATH,
+    WEBHOOK_PORT,
+    WEBHOOK_SECRET_TOKEN,
+    WEBHOOK_URL,
+)
 from ..utils.logger import get_logger
+from .admission import AdmissionController
 from .constants import COMMAND_UNKNOWN
+from .conversations.persistence import get_state_persistence
 from .conversations.states import STATE_TO_COMMAND, ConversationState
+from .conversations.user_data import ConversationUserData, UserDataEvictor
+from .conversations.workflow_engine import WorkflowEngine
+from .flood_control import FloodController
 from .notification_schedule import build_notification_trigger
 from .plugins.loader import HandlerConfig, PluginLoader
 from .registry import HandlerRegistry
+from .router import UpdateRouter
+from .schedule_reconciler import ScheduleReconciler, ShardedDesiredJobs
+from .scheduler_leadership import SchedulerLeadership, default_holder
+from .scheduler_supervisor import SchedulerSupervisor
+from .update_processor import PerUserUpdateProcessor
+from .webhook import WebhookServer
 
 logger = get_logger(BOT_NAME)
 
@@ -54,6 +96,22 @@ class LifeWeeksBot:
     :type services: ServiceContainer
     :ivar registry: Handler registry for managing handlers
     :type registry: HandlerRegistry
+    :ivar router: Single PTB handler routing commands, callbacks and text
+    :type router: UpdateRouter
+    :ivar user_data_evictor: Drops the context.user_data of idle users
+    :type user_data_evictor: UserDataEvictor
+    :ivar admission: Queue and workers for expensive commands
+    :type admission: AdmissionController
+    :ivar rescheduler: Sends settings changes to the scheduler
+    :type rescheduler: NotificationRescheduler
+    :ivar schedule_reconcilers: Keep each worker's jobs in line with the database
+    :type schedule_reconcilers: dict[int, ScheduleReconciler]
+    :ivar scheduler_supervisors: Restart a dead or hung scheduler worker
+    :type scheduler_supervisors: list[SchedulerSupervisor]
+    :ivar scheduler_leadership: Runs the scheduler only in the elected process
+    :type scheduler_leadership: Optional[SchedulerLeadership]
+    :ivar flood_control: Drops updates of users exceeding their rate limit
+    :type flood_control: FloodController
     """
 
     def __init__(
@@ -69,20 +127,42 @@ class LifeWeeksBot:
         :type plugin_loader: PluginLoader | None
         """
         self._app: Optional[Application] = None
-        # Scheduler process components
-        self._scheduler_process: Optional[multiprocessing.Process] = None
-        self._scheduler_client: Optional[SchedulerClient] = None
-        self._scheduler_command_queue: Optional[multiprocessing.Queue] = None
-        self._scheduler_response_queue: Optional[multiprocessing.Queue] = None
+        # Scheduler worker processes by shard, and the client routing to them
+        self._scheduler_processes: list[multiprocessing.Process] = []
+        self._scheduler_client: Optional[ShardedSchedulerClient] = None
+        self.schedule_reconcilers: dict[int, ScheduleReconciler] = {}
+        # Desired jobs read from the database, shared by the reconcilers
+        self._desired_jobs: Optional[ShardedDesiredJobs] = None
+        self.scheduler_supervisors: list[SchedulerSupervisor] = []
+        self.scheduler_leadership: Optional[SchedulerLeadership] = None
 
         self.services = services or ServiceContainer()
         self.registry = HandlerRegistry()
+        self.router = UpdateRouter()
+        self.user_data_evictor = UserDataEvictor(
+            max_users=USER_DATA_MAX_USERS,
+            interval_seconds=USER_DATA_EVICTION_INTERVAL_SECONDS,
+        )
+        self.admission = AdmissionController(
+            capacity=EXPENSIVE_QUEUE_SIZE, workers=EXPENSIVE_WORKERS
+        )
+        self.rescheduler = NotificationRescheduler(
+            debounce_seconds=RESCHEDULE_DEBOUNCE_SECONDS,
+            max_users=USER_DATA_MAX_USERS,
+        )
+        self.flood_control = FloodController(
+            burst=FLOOD_BURST,
+            rate_per_minute=FLOOD_RATE_PER_MINUTE,
+            max_users=USER_DATA_MAX_USERS,
+        )
         self._plugin_loader = plugin_loader or PluginLoader()
 
         # Handler state for universal text handler routing
         self._handler_instances: dict[str, object] = {}
         self._text_input_handlers: dict[str, object] = {}
         self._waiting_states: dict[str, str] = {}  # Maps state value to command
+        # Compiled text-input transitions, filled once handlers are registered
+        self.workflow_engine = WorkflowEngine()
 
         logger.info("Initializing LifeWeeksBot")
 
@@ -90,6 +170,7 @@ class LifeWeeksBot:
         """Set up the bot with command handlers.
 
         This method:
+        - Loads the translation catalogs
         - Creates the telegram.ext.Application instance
         - Discovers and registers handlers via plugin system
         - Registers global error handler
@@ -101,34 +182,61 @@ class LifeWeeksBot:
             return  # Already set up
 
         logger.info("Setting up bot application")
+        # Load all translation catalogs once, before the first update
+        translation_registry.load()
         builder = Application.builder().token(TOKEN)
         builder.post_init(self._post_init_scheduler_start)
         builder.post_shutdown(self._post_shutdown_cleanup)
+        # Compact per-user data, dropped again once the user is idle
+        builder.context_types(ContextTypes(user_data=ConversationUserData))
+        # Users are served in parallel, each user's updates stay in order
+        builder.concurrent_updates(
+            PerUserUpdateProcessor(
+                max_concurrent_updates=CONCURRENT_UPDATES,
+                depth_warning=USER_QUEUE_DEPTH_WARNING,
+            )
+        )
+        if WEBHOOK_ENABLED:
+            # Updates arrive over HTTP, so no polling updater is needed
+            builder.updater(None)
         self._app = builder.build()
 
         # Register global error handler
         self._app.add_error_handler(callback=self._error_handler)
 
+        # Flooding users are stopped before any handler loads their profile
+        if self.flood_control.enabled:
+            self._app.add_handler(
+                handler=TypeHandler(type=Update, callback=self.flood_control.check),
+                group=-1,
+            )
+
         # Register event listeners
-        register_event_listeners(container=self.services)
+        register_event_listeners(container=self.services, rescheduler=self.rescheduler)
 
         # Discover and register handlers
         self._discover_and_register_handlers()
 
-        # Register universal text handler
-        self._app.add_handler(
-            handler=MessageHandler(
-                filters=filters.TEXT & ~filters.COMMAND,
-                callback=self._universal_text_handler,
-            )
+        # Resolve the workflow validators and actions once, up front
+        self.workflow_engine = WorkflowEngine.from_directory(
+            providers={
+                state: self._handler_instances[command]
+                for state, command in self._waiting_states.items()
+            },
+            validators=ValidationService(),
         )
-        logger.info("Registered universal text handler")
+
+        # Commands, callbacks and text input are routed by one handler
+        self.router.set_text_handler(self._universal_text_handler)
+        self._app.add_handler(handler=self.router)
+        logger.info("Registered update router")
 
         # Register unknown handler as fallback
         self._register_unknown_handler_fallback()
 
-        # Set up scheduler
-        self._setup_scheduler()
+        # Set up scheduler, unless it waits for this process to be elected
+        if not SCHEDULER_LEADER_ELECTION:
+            self._setup_scheduler()
 
     def _discover_and_register_handlers(self) -> None:
         """Discover handlers via plugin loader and register them.
@@ -154,25 +262,21 @@ class LifeWeeksBot:
             # Store in handler dicts for routing
             self._handler_instances[config.command] = handler_instance
 
-            # Register command handler
-            self._app.add_handler(
-                handler=CommandHandler(
-                    command=config.command, callback=handler_instance.handle
+            # Index the command and callbacks in the update router
+            self.router.register(config=config, handler=handler_instance)
+            if config.priority is not None:
+                # Expensive commands are queued instead of running inline
+                self.router.add_command(
+                    command=config.command,
+                    callback=self.admission.admit(
+                        command=config.command,
+                        priority=config.priority,
+                        callback=handler_instance.handle,
+                        precheck=handler_instance.admission_language,
+                    ),
                 )
-            )
             logger.debug(f"Registered command handler: /{config.command}")
 
-            # Register callbacks
-            for callback in config.callbacks:
-                callback_method = getattr(handler_instance, callback["method"])
-                self._app.add_handler(
-                    handler=CallbackQueryHandler(
-                        callback=callback_method,
-                        pattern=callback["pattern"],
-                    )
-                )
-                logger.debug(f"Registered callback: {callback['method']}")
-
             # Register text input handler
             text_input_method = None
             if config.text_input:
@@ -210,16 +314,63 @@ class LifeWeeksBot:
             logger.debug("Registered unknown handler as fallback")
 
     def start(self) -> None:
-        """Start the bot in polling mode.
+        """Start the bot in polling mode, or webhook mode when enabled.
 
         :returns: None
         """
         if not self._app:
             self.setup()
 
+        if WEBHOOK_ENABLED:
+            logger.info("Starting Life Weeks Bot in webhook mode")
+            asyncio.run(self._run_webhook())
+            return
+
         logger.info("Starting Life Weeks Bot")
         self._app.run_polling()
 
+    async def _run_webhook(self) -> None:
+        """Serve updates from the embedded webhook endpoint until a stop signal.
+
+        Mirrors the lifecycle of ``run_polling``: the post-init and
+        post-shutdown hooks run around the application, and SIGINT or
+        SIGTERM stops it. The webhook is registered with Telegram only when
+        ``WEBHOOK_URL`` is set, so the endpoint can be fed local POSTs.
+
+        :returns: None
+        """
+        server = WebhookServer(
+            application=self._app,
+            listen=WEBHOOK_LISTEN,
+            port=WEBHOOK_PORT,
+            path=WEBHOOK_PATH,
+            secret_token=WEBHOOK_SECRET_TOKEN,
+        )
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for stop_signal in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(stop_signal, stop_event.set)
+
+        await self._app.initialize()
+        try:
+            await self._post_init_scheduler_start(self._app)
+            await self._app.start()
+            await server.start()
+            if WEBHOOK_URL:
+                await self._app.bot.set_webhook(
+                    url=WEBHOOK_URL,
+                    secret_token=WEBHOOK_SECRET_TOKEN,
+                    allowed_updates=Update.ALL_TYPES,
+                )
+                logger.info(f"Registered webhook {WEBHOOK_URL}")
+            await stop_event.wait()
+        finally:
+            await server.stop()
+            if self._app.running:
+                await self._app.stop()
+            await self._app.shutdown()
+            await self._post_shutdown_cleanup(self._app)
+
     async def _universal_text_handler(
         self,
         update: Update,
@@ -233,9 +384,9 @@ class LifeWeeksBot:
         :type context: ContextTypes.DEFAULT_TYPE
         :returns: None
         """
-        waiting_for = context.user_data.get("waiting_for")
-        # Convert string state to ConversationState enum for FSM routing
-        current_state = ConversationState.from_string(value=waiting_for)
+        current_state = await get_state_persistence().get_state(
+            user_id=update.effective_user.id, context=context
+        )
 
         if current_state != ConversationState.IDLE:
             await self._handle_waiting_state(
@@ -260,13 +411,18 @@ class LifeWeeksBot:
         :type current_state: ConversationState
         :returns: None
         """
-        # Use STATE_TO_COMMAND mapping for FSM-based routing
-        target_command = STATE_TO_COMMAND.get(
-            current_state, self._waiting_states.get(current_state.value, "")
-        )
-        error_occurred = await self._try_text_input_handler(
-            update=update, context=context, target_command=target_command
-        )
+        if self.workflow_engine.handles(current_state):
+            error_occurred = await self._try_workflow_engine(
+                update=update, context=context, current_state=current_state
+            )
+        else:
+            # Use STATE_TO_COMMAND mapping for FSM-based routing
+            target_command = STATE_TO_COMMAND.get(
+                current_state, self._waiting_states.get(current_state.value, "")
+            )
+            error_occurred = await self._try_text_input_handler(
+                update=update, context=context, target_command=target_command
+            )
 
         if error_occurred:
             fallback_error = await self._try_unknown_handler_fallback(
@@ -296,6 +452,35 @@ class LifeWeeksBot:
         except Exception as error:
             logger.error(f"Error in unknown handler: {error}", exc_info=True)
 
+    async def _try_workflow_engine(
+        self,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        current_state: ConversationState,
+    ) -> bool:
+        """Try to execute the compiled workflow transition for the state.
+
+        :param update: Telegram update object
+        :type update: Update
+        :param context: Telegram context object
+        :type context: ContextTypes.DEFAULT_TYPE
+        :param current_state: Current conversation state, compiled by the engine
+        :type current_state: ConversationState
+        :returns: True if error occurred, False otherwise
+        :rtype: bool
+        """
+        try:
+            await self.workflow_engine.handle_text(
+                update=update, context=context, state=current_state
+            )
+            return False
+        except Exception as error:
+            logger.error(
+                f"Error in workflow for '{current_state.value}': {error}",
+                exc_info=True,
+            )
+            return True
+
     async def _try_text_input_handler(
         self,
         update: Update,
@@ -443,53 +628,63 @@ class LifeWeeksBot:
                 logger.error(f"Failed to notify user: {send_error}", exc_info=True)
 
     def _setup_scheduler(self) -> None:
-        """Set up the scheduler worker process.
+        """Set up the scheduler worker processes.
 
-        Creates IPC queues, initializes the worker and client,
-        and starts the worker process.
+        Starts one worker per shard of users and registers a client that
+        routes the commands for each job to the worker owning it. The client
+        listener loop needs the event loop, so it is started in post_init.
 
         :returns: None
         """
         try:
-            logger.info("Setting up scheduler worker process")
-
-            # Create IPC queues
-            self._scheduler_command_queue = multiprocessing.Queue()
-            self._scheduler_response_queue = multiprocessing.Queue()
-
-            # Initialize client
-            self._scheduler_client = SchedulerClient(
-                command_queue=self._scheduler_command_queue,
-                response_queue=self._scheduler_response_queue,
-            )
+            logger.info(f"Setting up {SCHEDULER_SHARDS} scheduler worker process(es)")
+            self._scheduler_processes = []
+            clients = [
+                self._start_scheduler_shard(shard) for shard in range(SCHEDULER_SHARDS)
+            ]
+            self._scheduler_client = ShardedSchedulerClient(clients)
 
             # Register client with container
             self.services.set_scheduler_client(self._scheduler_client)
 
-            # Initialize worker
-            worker = SchedulerWorker(
-                command_queue=self._scheduler_command_queue,
-                response_queue=self._scheduler_response_queue,
-            )
-
-            # Create and start process
-            self._scheduler_process = multiprocessing.Process(
-                target=worker.run,
-                name="SchedulerWorker",
-                daemon=True,  # Daemonize to ensure it dies with parent
-            )
-            self._scheduler_process.start()
+        except Exception as error:
+            logger.error(f"Failed to set up scheduler: {error}", exc_info=True)
 
-            # Start client listener loop
-            # We need to run this in the event loop, which isn't running yet in setup()
-            # It will be started in post_init or when needed.
+    def _start_scheduler_shard(self, shard: int) -> SchedulerClient:
+        """Start the worker process of a shard, replacing its previous one.
 
-            logger.info(
-                f"Scheduler worker started (PID: {self._scheduler_process.pid})"
-            )
+        :param shard: Shard index
+        :type shard: int
+        :returns: Client of the new worker
+        :rtype: SchedulerClient
+        """
+        # Create IPC queues
+        command_queue: multiprocessing.Queue = multiprocessing.Queue()
+        response_queue: multiprocessing.Queue = multiprocessing.Queue()
+
+        worker = SchedulerWorker(
+            command_queue=command_queue,
+            response_queue=response_queue,
+            shard=shard,
+            # The shards share the delivery rate
+            sends_per_second=NOTIFICATION_SENDS_PER_SECOND / SCHEDULER_SHARDS,
+        )
+        process = multiprocessing.Process(
+            target=worker.run,
+            name=f"SchedulerWorker-{shard}",
+            daemon=True,  # Daemonize to ensure it dies with parent
+        )
+        process.start()
+        if shard < len(self._scheduler_processes):
+            self._scheduler_processes[shard] = process
+        else:
+            self._scheduler_processes.append(process)
 
-        except Exception as error:
-            logger.error(f"Failed to set up scheduler: {error}", exc_info=True)
+        logger.info(f"Scheduler worker {shard} started (PID: {process.pid})")
+        return SchedulerClient(
+            command_queue=command_queue,
+            response_queue=response_queue,
+        )
 
     async def _post_init_scheduler_start(self, application: Application) -> None:
         """Post-initialization hook.
@@ -500,7 +695,42 @@ class LifeWeeksBot:
         """
         # Initialize services (database connections)
         await self.services.initialize()
+        if REGISTERED_USERS_FILTER and hasattr(
+            self.services.user_service, "load_registered_users"
+        ):
+            # Unregistered users are then answered without database lookups
+            await self.services.user_service.load_registered_users()
+        await get_state_persistence().start()
+        self.user_data_evictor.start(application)
+        # Event listeners run after the user has been answered from now on
+        self.services.event_bus.start()
+
+        if SCHEDULER_LEADER_ELECTION:
+            # Only the process holding the lease runs scheduler workers
+            self.scheduler_leadership = SchedulerLeadership(
+                repository=DatabaseManager().scheduler_lease_repository,
+                holder=default_holder(),
+                ttl_seconds=SCHEDULER_LEASE_SECONDS,
+                on_elected=self._become_scheduler_leader,
+                on_deposed=self._stop_scheduler,
+            )
+            self.scheduler_leadership.start()
+        else:
+            await self._start_scheduler()
+
+    async def _become_scheduler_leader(self) -> None:
+        """Start the scheduler workers once this process holds the lease.
+
+        :returns: None
+        """
+        self._setup_scheduler()
+        await self._start_scheduler()
 
+    async def _start_scheduler(self) -> None:
+        """Connect to the workers, restore their jobs and start supervising them.
+
+        :returns: None
+        """
         if self._scheduler_client:
             # Start client listening for responses
             await self._scheduler_client.start_listening()
@@ -515,6 +745,117 @@ class LifeWeeksBot:
             # Restore scheduled jobs from database
             await self._restore_scheduled_jobs()
 
+            for shard in range(len(self._scheduler_client.shards)):
+                self._start_schedule_reconciler(shard, retry_soon=not healthy)
+
+        # A dead or hung worker is replaced instead of failing silently
+        self.scheduler_supervisors = [
+            SchedulerSupervisor(
+                is_alive=partial(self._scheduler_is_alive, shard),
+                restart=partial(self._restart_scheduler, shard),
+                check_interval=SCHEDULER_HEARTBEAT_SECONDS,
+                name=f"Scheduler worker {shard}",
+            )
+            for shard in range(len(self._scheduler_processes))
+        ]
+        for supervisor in self.scheduler_supervisors:
+            supervisor.start()
+
+    def _start_schedule_reconciler(
+        self, shard: int, retry_soon: bool = False
+    ) -> ScheduleReconciler:
+        """Reconcile a shard's worker with the database periodically.
+
+        Only jobs that drift from the database are sent again.
+
+        :param shard: Shard index
+        :type shard: int
+        :param retry_soon: Reconcile soon, e.g. after a failed health check
+        :type retry_soon: bool
+        :returns: The started reconciler
+        :rtype: ScheduleReconciler
+        """
+        clients = self._scheduler_client.shards
+        if self._desired_jobs is None:
+            # The shards' reconcilers share one read of the users per pass
+            self._desired_jobs = ShardedDesiredJobs(
+                user_service=self.services.user_service, shards=len(clients)
+            )
+        reconciler = self.schedule_reconcilers[shard] = ScheduleReconciler(
+            client=clients[shard],
+            desired=self._desired_jobs,
+            interval_seconds=SCHEDULE_RECONCILE_INTERVAL_SECONDS,
+            shard=shard,
+        )
+        reconciler.start(retry_soon=retry_soon)
+        return reconciler
+
+    def _scheduler_is_alive(self, shard: int) -> bool:
+        """Check that a shard's worker process runs and its heartbeats arrive.
+
+        :param shard: Shard index
+        :type shard: int
+        :returns: True if the worker is alive
+        :rtype: bool
+        """
+        if shard >= len(self._scheduler_processes) or not self._scheduler_client:
+            return False
+        return bool(
+            self._scheduler_processes[shard].is_alive()
+            and self._scheduler_client.shards[shard].seconds_since_heartbeat()
+            < SCHEDULER_HEARTBEAT_TIMEOUT_SECONDS
+        )
+
+    async def _restart_scheduler(self, shard: int) -> bool:
+        """Replace a shard's worker, its queues and client, and restore its jobs.
+
+        Jobs are replayed from the old client's job mirror right away, which
+        needs no database access; a reconciliation against the database then
+        fixes whatever the mirror missed. Other shards keep running.
+
+        :param shard: Shard index
+        :type shard: int
+        :returns: True if the new worker came up
+        :rtype: bool
+        """
+        if not self._scheduler_client:
+            return False
+        old_client = self._scheduler_client.shards[shard]
+        jobs = old_client.get_all_jobs()
+        reconciler = self.schedule_reconcilers.pop(shard, None)
+        if reconciler:
+            await reconciler.stop()
+        await old_client.stop_listening()
+        old_client.fail_pending("Scheduler worker restarted")
+        await self._terminate_scheduler_process(shard)
+
+        try:
+            client = self._start_scheduler_shard(shard)
+        except Exception as error:
+            logger.error(f"Failed to start scheduler worker {shard}: {error}")
+            return False
+        self._scheduler_client.replace_shard(shard, client)
+        await client.start_listening()
+        if not await client.wait_for_heartbeat(
+            timeout=SCHEDULER_HEARTBEAT_TIMEOUT_SECONDS
+        ):
+            return False
+
+        replayed = 0
+        for job in jobs:
+            if job.trigger is None or "message_type" not in job.kwargs:
+                continue
+            replayed += await client.schedule_job(
+                job_id=job.job_id,
+                trigger=job.trigger,
+                job_type=job.kwargs["message_type"],
+                user_id=job.kwargs.get("user_id"),
+            )
+        logger.info(f"Replayed {replayed} of {len(jobs)} jobs on worker {shard}")
+
+        await self._start_schedule_reconciler(shard).run_once()
+        return True
+
     async def _restore_scheduled_jobs(self) -> None:
         """Restore scheduled jobs from database on startup.
 
@@ -561,6 +902,8 @@ class LifeWeeksBot:
                             user_id=user.telegram_id,
                             job_type=job_type,
                         )
+                        # Unchanged settings are then not rescheduled again
+                        self.rescheduler.remember(user.telegram_id, trigger)
                         count += 1
                     except Exception as e:
                         logger.error(
@@ -572,14 +915,42 @@ class LifeWeeksBot:
         except Exception as error:
             logger.error(f"Failed to restore scheduled jobs: {error}", exc_info=True)
 
-    async def _post_shutdown_cleanup(self, application: Application) -> None:
-        """Post-shutdown hook for graceful cleanup.
+    async def _terminate_scheduler_process(self, shard: int) -> None:
+        """Terminate a shard's worker process, killing it if it hangs.
 
-        :param application: The Application instance
-        :type application: Application
+        The joins run in a thread, so updates keep being processed while a
+        hung worker is given time to exit.
+
+        :param shard: Shard index
+        :type shard: int
         :returns: None
         """
-        logger.info("Running graceful shutdown cleanup...")
+        process = self._scheduler_processes[shard]
+        if process.is_alive():
+            logger.info(f"Terminating scheduler worker process {shard}...")
+            process.terminate()
+            await asyncio.to_thread(process.join, timeout=5)
+            if process.is_alive():
+                logger.warning("Worker didn't terminate gracefully, killing...")
+                process.kill()
+                await asyncio.to_thread(process.join, timeout=2)
+
+    async def _stop_scheduler(self) -> None:
+        """Stop supervising and reconciling the workers, then stop them.
+
+        :returns: None
+        """
+        # The workers are stopped on purpose now, so they must not be restarted
+        for supervisor in self.scheduler_supervisors:
+            await supervisor.stop()
+        self.scheduler_supervisors = []
+        for reconciler in self.schedule_reconcilers.values():
+            await reconciler.stop()
+        self.schedule_reconcilers = {}
+        self._desired_jobs = None
+        if self._scheduler_client:
+            # Commands are dropped from now on instead of waiting for timeouts
+            self.services.set_scheduler_client(None)
 
         # Stop scheduler client listener first
         if self._scheduler_client:
@@ -590,19 +961,45 @@ class LifeWeeksBot:
             except Exception as error:
                 logger.warning(f"Error stopping scheduler client: {error}")
 
-        # Terminate scheduler worker process
-        if self._scheduler_process and self._scheduler_process.is_alive():
-            logger.info("Terminating scheduler worker process...")
-            self._scheduler_process.terminate()
-            self._scheduler_process.join(timeout=5)
-            if self._scheduler_process.is_alive():
-                logger.warning("Worker didn't terminate gracefully, killing...")
-                self._scheduler_process.kill()
-                self._scheduler_process.join(timeout=2)
-
-        self._scheduler_process = None
+        await asyncio.gather(
+            *(
+                self._terminate_scheduler_process(shard)
+                for shard in range(len(self._scheduler_processes))
+            )
+        )
+        self._scheduler_processes = []
         self._scheduler_client = None
 
+    async def _post_shutdown_cleanup(self, application: Application) -> None:
+        """Post-shutdown hook for graceful cleanup.
+
+        :param application: The Application instance
+        :type application: Application
+        :returns: None
+        """
+        logger.info("Running graceful shutdown cleanup...")
+
+        # Let queued events reach the scheduler before it is stopped
+        if hasattr(self, "services"):
+            await self.services.event_bus.stop()
+        await self.rescheduler.stop()
+        if self.scheduler_leadership:
+            await self.scheduler_leadership.stop()
+        await self._stop_scheduler()
+        if self.scheduler_leadership:
+            # Another process may take over scheduling right away
+            await self.scheduler_leadership.release()
+
+        await self.admission.stop()
+        self.flood_control.log_summary()
+        await self.user_data_evictor.stop()
+
+        # Write pending conversation states while the database is still open
+        try:
+            await get_state_persistence().stop()
+        except Exception as error:
+            logger.warning(f"Error stopping conversation state persistence: {error}")
+
         # Cleanup services
         if hasattr(self, "services"):
             await self.services.cleanup()
@@ -11,6 +11,7 @@ COMMAND_START = "start"
 COMMAND_WEEKS = "weeks"
 COMMAND_SETTINGS = "settings"
 COMMAND_VISUALIZE = "visualize"
+COMMAND_EVENTS = "events"
 COMMAND_HELP = "help"
 COMMAND_SUBSCRIPTION = "subscription"
 COMMAND_CANCEL = "cancel"
@@ -4,7 +4,12 @@ This package provides conversation state management using a typed Finite State
 Machine architecture with declarative workflow definitions.
 """
 
-from .persistence import StatePersistenceProtocol, TelegramContextPersistence
+from .persistence import (
+    DatabasePersistence,
+    StatePersistenceProtocol,
+    TelegramContextPersistence,
+    get_state_persistence,
+)
 from .state_machine import (
     ConversationEvent,
     ConversationStateMachine,
@@ -20,11 +25,13 @@ from .workflow_config import (
     load_all_workflows,
     load_workflow,
 )
+from .workflow_engine import WorkflowCompileError, WorkflowEngine
 
 __all__ = [
     "ConversationState",
     "ConversationEvent",
     "ConversationStateMachine",
+    "DatabasePersistence",
     "EventType",
     "InputType",
     "StateConfig",
@@ -32,7 +39,10 @@ __all__ = [
     "TelegramContextPersistence",
     "TransitionConfig",
     "TransitionResult",
+    "WorkflowCompileError",
     "WorkflowConfig",
+    "WorkflowEngine",
+    "get_state_persistence",
     "load_all_workflows",
     "load_workflow",
 ]
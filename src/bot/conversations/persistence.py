@@ -1,17 +1,41 @@
 """State persistence protocol and implementations for conversation state storage.
 
-This module provides an abstract protocol for state storage and a Telegram-specific
-implementation that uses context.user_data for persistence.
+This module provides an abstract protocol for state storage, a Telegram-specific
+implementation that uses context.user_data for persistence and a database
+implementation sharing states across bot processes. get_state_persistence()
+returns the implementation selected by CONVERSATION_STATE_BACKEND.
 """
 
+import asyncio
 import time
 import uuid
-from typing import Any, Protocol
+from collections import OrderedDict
+from contextlib import suppress
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Any, Optional, Protocol
 
 from telegram.ext import ContextTypes
 
+from src.database.models.conversation_state import ConversationStateRecord
+from src.database.repositories.abstract.conversation_state_repository import (
+    AbstractConversationStateRepository,
+)
+from src.database.service import DatabaseManager
+from src.utils.config import (
+    BOT_NAME,
+    CONVERSATION_STATE_BACKEND,
+    CONVERSATION_STATE_CACHE_SIZE,
+    CONVERSATION_STATE_CACHE_TTL_SECONDS,
+    CONVERSATION_STATE_FLUSH_INTERVAL_SECONDS,
+    CONVERSATION_STATE_SWEEP_INTERVAL_SECONDS,
+)
+from src.utils.logger import get_logger
+
 from .states import ConversationState
 
+logger = get_logger(BOT_NAME)
+
 # Constants for state storage keys
 STATE_KEY = "waiting_for"
 TIMESTAMP_KEY = "waiting_timestamp"
@@ -21,6 +45,13 @@ CONTEXT_DATA_KEY = "conversation_context"
 # Default timeout for state expiration (5 minutes)
 DEFAULT_STATE_TIMEOUT_SECONDS: float = 300.0
 
+# Backends selectable with CONVERSATION_STATE_BACKEND
+MEMORY_BACKEND = "memory"
+DATABASE_BACKEND = "database"
+
+# Changed states from which the database backend writes before the interval ends
+FLUSH_BATCH_SIZE = 100
+
 
 class StatePersistenceProtocol(Protocol):
     """Protocol for conversation state storage.
@@ -31,6 +62,20 @@ class StatePersistenceProtocol(Protocol):
     - DatabasePersistence: For persistent storage
     """
 
+    async def start(self) -> None:
+        """Start background work of the backend.
+
+        :returns: None
+        """
+        ...
+
+    async def stop(self) -> None:
+        """Stop background work and persist pending changes.
+
+        :returns: None
+        """
+        ...
+
     async def get_state(
         self,
         user_id: int,
@@ -110,6 +155,18 @@ class TelegramContextPersistence:
     timestamp tracking for expiration and unique ID for race condition prevention.
     """
 
+    async def start(self) -> None:
+        """Nothing to start; states live in context.user_data.
+
+        :returns: None
+        """
+
+    async def stop(self) -> None:
+        """Nothing to stop; states live in context.user_data.
+
+        :returns: None
+        """
+
     async def get_state(
         self,
         user_id: int,
@@ -249,3 +306,404 @@ class TelegramContextPersistence:
         :returns: None
         """
         context.user_data[CONTEXT_DATA_KEY] = data
+
+
+@dataclass(frozen=True, slots=True)
+class StoredState:
+    """Conversation state of one user as kept by the database backend.
+
+    :ivar state: Conversation state value
+    :ivar state_id: Unique ID of this state
+    :ivar updated_at: Unix timestamp the state was set at
+    :ivar context_data: Conversation context data, None if not set
+    """
+
+    state: str
+    state_id: str
+    updated_at: float
+    context_data: Optional[dict[str, Any]] = None
+
+    @classmethod
+    def from_record(cls, record: ConversationStateRecord) -> "StoredState":
+        """Create a stored state from a database record.
+
+        :param record: Database record
+        :type record: ConversationStateRecord
+        :returns: Stored state
+        :rtype: StoredState
+        """
+        return cls(
+            state=record.state,
+            state_id=record.state_id,
+            updated_at=record.updated_at,
+            context_data=record.context_data,
+        )
+
+    def to_record(self, user_id: int) -> ConversationStateRecord:
+        """Create a database record of this state.
+
+        :param user_id: Telegram user ID
+        :type user_id: int
+        :returns: Database record
+        :rtype: ConversationStateRecord
+        """
+        return ConversationStateRecord(
+            telegram_id=user_id,
+            state=self.state,
+            state_id=self.state_id,
+            updated_at=self.updated_at,
+            context_data=self.context_data,
+        )
+
+
+class DatabasePersistence:
+    """State persistence implementation backed by the conversation_states table.
+
+    Reads go through a bounded LRU cache: a cached state, including the
+    absence of one, is trusted for ``cache_ttl_seconds`` and re-read
+    afterwards, so states set by other bot processes are picked up quickly.
+    Changes are applied to the cache at once and written to the database in
+    batches, every ``flush_interval_seconds`` or as soon as ``batch_size``
+    users changed. A sweep deletes states older than ``state_timeout_seconds``
+    every ``sweep_interval_seconds``.
+
+    The ``context`` arguments are unused and kept for protocol compatibility.
+
+    :ivar _repository: Conversation state repository
+    :ivar _cache: Cached states with their load time, least recently used first
+    :ivar _pending: Changed states not yet written, None marks a deletion
+    """
+
+    def __init__(
+        self,
+        repository: AbstractConversationStateRepository,
+        *,
+        cache_size: int = CONVERSATION_STATE_CACHE_SIZE,
+        cache_ttl_seconds: float = CONVERSATION_STATE_CACHE_TTL_SECONDS,
+        flush_interval_seconds: float = CONVERSATION_STATE_FLUSH_INTERVAL_SECONDS,
+        sweep_interval_seconds: float = CONVERSATION_STATE_SWEEP_INTERVAL_SECONDS,
+        batch_size: int = FLUSH_BATCH_SIZE,
+        state_timeout_seconds: float = DEFAULT_STATE_TIMEOUT_SECONDS,
+    ) -> None:
+        """Initialize the backend without touching the database.
+
+        :param repository: Conversation state repository
+        :type repository: AbstractConversationStateRepository
+        :param cache_size: Users whose state is kept in memory
+        :type cache_size: int
+        :param cache_ttl_seconds: Seconds a cached state is trusted
+        :type cache_ttl_seconds: float
+        :param flush_interval_seconds: Seconds between batched writes
+        :type flush_interval_seconds: float
+        :param sweep_interval_seconds: Seconds between deletions of expired states
+        :type sweep_interval_seconds: float
+        :param batch_size: Changed users from which a write starts early
+        :type batch_size: int
+        :param state_timeout_seconds: Age from which a state is deleted
+        :type state_timeout_seconds: float
+        """
+        self._repository = repository
+        self._cache_size = cache_size
+        self._cache_ttl_seconds = cache_ttl_seconds
+        self._flush_interval_seconds = flush_interval_seconds
+        self._sweep_interval_seconds = sweep_interval_seconds
+        self._batch_size = batch_size
+        self._state_timeout_seconds = state_timeout_seconds
+        self._cache: OrderedDict[int, tuple[Optional[StoredState], float]] = (
+            OrderedDict()
+        )
+        self._pending: dict[int, Optional[StoredState]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._flush_requested = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+
+    async def start(self) -> None:
+        """Prepare the table and start the flush and sweep loops.
+
+        :returns: None
+        """
+        if self._tasks:
+            return
+        await self._repository.initialize()
+        self._tasks = [
+            asyncio.create_task(self._flush_loop()),
+            asyncio.create_task(self._sweep_loop()),
+        ]
+        logger.info("Database conversation state persistence started")
+
+    async def stop(self) -> None:
+        """Stop the loops and write the remaining changes.
+
+        :returns: None
+        """
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Write all pending changes in one batch.
+
+        Changes that could not be written stay pending unless the user
+        changed again in the meantime.
+
+        :returns: None
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, {}
+            saved = [
+                stored.to_record(user_id)
+                for user_id, stored in batch.items()
+                if stored is not None
+            ]
+            deleted = [user_id for user_id, stored in batch.items() if stored is None]
+            if await self._repository.save_states(
+                saved
+            ) and await self._repository.delete_states(deleted):
+                return
+            logger.warning(f"Retrying {len(batch)} conversation state changes later")
+            for user_id, stored in batch.items():
+                self._pending.setdefault(user_id, stored)
+
+    async def sweep(self) -> int:
+        """Delete states older than the state timeout.
+
+        :returns: Number of states deleted from the database
+        :rtype: int
+        """
+        cutoff = time.time() - self._state_timeout_seconds
+        expired = [
+            user_id
+            for user_id, (stored, _) in self._cache.items()
+            if stored is not None and stored.updated_at < cutoff
+        ]
+        for user_id in expired:
+            del self._cache[user_id]
+        return await self._repository.delete_expired_states(updated_before=cutoff)
+
+    async def get_state(
+        self,
+        user_id: int,
+        context: ContextTypes.DEFAULT_TYPE,
+    ) -> ConversationState:
+        """Get current conversation state for user.
+
+        :param user_id: Telegram user ID
+        :type user_id: int
+        :param context: Telegram context object
+        :type context: ContextTypes.DEFAULT_TYPE
+        :returns: Current conversation state
+        :rtype: ConversationState
+        """
+        stored = await self._load(user_id)
+        return ConversationState.from_string(
+            value=stored.state if stored is not None else None
+        )
+
+    async def set_state(
+        self,
+        user_id: int,
+        state: ConversationState,
+        context: ContextTypes.DEFAULT_TYPE,
+    ) -> None:
+        """Set conversation state for user with timestamp and ID.
+
+        :param user_id: Telegram user ID
+        :type user_id: int
+        :param state: New conversation state
+        :type state: ConversationState
+        :param context: Telegram context object
+        :type context: ContextTypes.DEFAULT_TYPE
+        :returns: None
+        """
+        current = await self._load(user_id)
+        self._write(
+            user_id,
+            StoredState(
+                state=state.value,
+                state_id=str(uuid.uuid4()),
+                updated_at=time.time(),
+                context_data=current.context_data if current is not None else None,
+            ),
+        )
+
+    async def clear_state(
+        self,
+        user_id: int,
+        context: ContextTypes.DEFAULT_TYPE,
+    ) -> None:
+        """Clear conversation state and associated context data.
+
+        :param user_id: Telegram user ID
+        :type user_id: int
+        :param context: Telegram context object
+        :type context: ContextTypes.DEFAULT_TYPE
+        :returns: None
+        """
+        self._write(user_id, None)
+
+    async def is_state_valid(
+        self,
+        user_id: int,
+        expected_state: ConversationState,
+        context: ContextTypes.DEFAULT_TYPE,
+        max_age_seconds: float = DEFAULT_STATE_TIMEOUT_SECONDS,
+    ) -> bool:
+        """Check if current state matches expected and is not expired.
+
+        :param user_id: Telegram user ID
+        :type user_id: int
+        :param expected_state: Expected conversation state
+        :type expected_state: ConversationState
+        :param context: Telegram context object
+        :type context: ContextTypes.DEFAULT_TYPE
+        :param max_age_seconds: Maximum age of state in seconds
+        :type max_age_seconds: float
+        :returns: True if state is valid and matches, False otherwise
+        :rtype: bool
+        """
+        stored = await self._load(user_id)
+        if stored is None or stored.state != expected_state.value:
+            return False
+        return time.time() - stored.updated_at <= max_age_seconds
+
+    async def get_context_data(
+        self,
+        user_id: int,
+        context: ContextTypes.DEFAULT_TYPE,
+    ) -> dict[str, Any]:
+        """Get conversation context data.
+
+        :param user_id: Telegram user ID
+        :type user_id: int
+        :param context: Telegram context object
+        :type context: ContextTypes.DEFAULT_TYPE
+        :returns: Copy of the context data dictionary
+        :rtype: dict[str, Any]
+        """
+        stored = await self._load(user_id)
+        if stored is None or stored.context_data is None:
+            return {}
+        return dict(stored.context_data)
+
+    async def set_context_data(
+        self,
+        user_id: int,
+        data: dict[str, Any],
+        context: ContextTypes.DEFAULT_TYPE,
+    ) -> None:
+        """Set conversation context data, keeping the current state.
+
+        :param user_id: Telegram user ID
+        :type user_id: int
+        :param data: Context data to store
+        :type data: dict[str, Any]
+        :param context: Telegram context object
+        :type context: ContextTypes.DEFAULT_TYPE
+        :returns: None
+        """
+        current = await self._load(user_id)
+        if current is None:
+            current = StoredState(
+                state=ConversationState.IDLE.value,
+                state_id=str(uuid.uuid4()),
+                updated_at=time.time(),
+            )
+        self._write(user_id, replace(current, context_data=dict(data)))
+
+    async def _load(self, user_id: int) -> Optional[StoredState]:
+        """Return the state of a user from pending changes, cache or database.
+
+        :param user_id: Telegram user ID
+        :type user_id: int
+        :returns: Stored state, None if the user has none
+        :rtype: Optional[StoredState]
+        """
+        if user_id in self._pending:
+            return self._pending[user_id]
+        cached = self._cache.get(user_id)
+        if cached is not None and time.time() - cached[1] <= self._cache_ttl_seconds:
+            self._cache.move_to_end(user_id)
+            return cached[0]
+
+        record = await self._repository.get_state(telegram_id=user_id)
+        if user_id in self._pending:
+            # Changed while the database was read
+            return self._pending[user_id]
+        stored = StoredState.from_record(record) if record is not None else None
+        self._remember(user_id, stored)
+        return stored
+
+    def _write(self, user_id: int, stored: Optional[StoredState]) -> None:
+        """Apply a change to the cache and queue it for the next flush.
+
+        :param user_id: Telegram user ID
+        :type user_id: int
+        :param stored: New state, None to delete the state
+        :type stored: Optional[StoredState]
+        :returns: None
+        """
+        self._pending[user_id] = stored
+        self._remember(user_id, stored)
+        if len(self._pending) >= self._batch_size:
+            self._flush_requested.set()
+
+    def _remember(self, user_id: int, stored: Optional[StoredState]) -> None:
+        """Cache a state, evicting the least recently used users.
+
+        :param user_id: Telegram user ID
+        :type user_id: int
+        :param stored: State to cache, None if the user has none
+        :type stored: Optional[StoredState]
+        :returns: None
+        """
+        self._cache[user_id] = (stored, time.time())
+        self._cache.move_to_end(user_id)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    async def _flush_loop(self) -> None:
+        """Flush every interval or as soon as a batch is full.
+
+        :returns: None
+        """
+        while True:
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    self._flush_requested.wait(), timeout=self._flush_interval_seconds
+                )
+            self._flush_requested.clear()
+            await self.flush()
+
+    async def _sweep_loop(self) -> None:
+        """Delete expired states every sweep interval.
+
+        :returns: None
+        """
+        while True:
+            await asyncio.sleep(self._sweep_interval_seconds)
+            await self.sweep()
+
+
+@lru_cache(maxsize=1)
+def get_state_persistence() -> TelegramContextPersistence | DatabasePersistence:
+    """Return the process-wide conversation state persistence.
+
+    :returns: Implementation selected by CONVERSATION_STATE_BACKEND
+    :rtype: TelegramContextPersistence | DatabasePersistence
+    """
+    if CONVERSATION_STATE_BACKEND == DATABASE_BACKEND:
+        return DatabasePersistence(
+            repository=DatabaseManager().conversation_state_repository
+        )
+    if CONVERSATION_STATE_BACKEND != MEMORY_BACKEND:
+        logger.warning(
+            f"Unknown CONVERSATION_STATE_BACKEND '{CONVERSATION_STATE_BACKEND}', "
+            f"keeping conversation states in memory"
+        )
+    return TelegramContextPersistence()
@@ -11,7 +11,7 @@ from typing import Any
 
 from telegram.ext import ContextTypes
 
-from .persistence import TelegramContextPersistence
+from .persistence import StatePersistenceProtocol, get_state_persistence
 from .states import ConversationState
 
 logger = logging.getLogger(__name__)
@@ -90,14 +90,15 @@ class ConversationStateMachine:
 
     def __init__(
         self,
-        persistence: TelegramContextPersistence | None = None,
+        persistence: StatePersistenceProtocol | None = None,
     ) -> None:
         """Initialize the state machine.
 
-        :param persistence: State persistence implementation
-        :type persistence: TelegramContextPersistence | None
+        :param persistence: State persistence implementation, defaults to the
+            backend selected by CONVERSATION_STATE_BACKEND
+        :type persistence: StatePersistenceProtocol | None
         """
-        self._persistence = persistence or TelegramContextPersistence()
+        self._persistence = persistence or get_state_persistence()
 
     async def get_current_state(
         self,
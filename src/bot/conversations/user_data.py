@@ -0,0 +1,246 @@
+"""Bounded per-user ``context.user_data`` for the memory state backend.
+
+PTB creates a ``user_data`` object for every user who ever sent an update
+and keeps it for the lifetime of the process. This module provides the
+ConversationUserData class, a compact ``user_data`` record storing the
+TelegramContextPersistence keys in slots, and the UserDataEvictor class,
+which periodically drops the records of idle users. Memory use then follows
+the number of concurrently active conversations instead of the number of
+users the bot has ever seen.
+"""
+
+import asyncio
+import heapq
+import time
+from collections.abc import MutableMapping
+from contextlib import suppress
+from typing import Any, Iterator, Optional
+
+from telegram.ext import Application
+
+from src.utils.config import BOT_NAME
+from src.utils.logger import get_logger
+
+from .persistence import (
+    CONTEXT_DATA_KEY,
+    DEFAULT_STATE_TIMEOUT_SECONDS,
+    STATE_ID_KEY,
+    STATE_KEY,
+    TIMESTAMP_KEY,
+)
+
+logger = get_logger(BOT_NAME)
+
+# Keys stored in slots instead of a per-user dict
+SLOT_KEYS = frozenset({STATE_KEY, TIMESTAMP_KEY, STATE_ID_KEY, CONTEXT_DATA_KEY})
+
+_MISSING: Any = object()
+
+
+class ConversationUserData(MutableMapping):
+    """``context.user_data`` record of one user.
+
+    Behaves like a dict. The conversation state keys live in slots; any
+    other key goes to a dict that is only created when first needed.
+
+    :ivar last_access: ``time.monotonic()`` of the last read or write
+    """
+
+    __slots__ = (
+        STATE_KEY,
+        TIMESTAMP_KEY,
+        STATE_ID_KEY,
+        CONTEXT_DATA_KEY,
+        "_extra",
+        "last_access",
+    )
+
+    def __init__(self) -> None:
+        """Create an empty record."""
+        for key in SLOT_KEYS:
+            setattr(self, key, _MISSING)
+        self._extra: Optional[dict[str, Any]] = None
+        self.last_access = time.monotonic()
+
+    def __getitem__(self, key: str) -> Any:
+        """Return a value and mark the record as used.
+
+        :param key: Data key
+        :type key: str
+        :returns: Stored value
+        :rtype: Any
+        :raises KeyError: If the key is not set
+        """
+        self.last_access = time.monotonic()
+        if key in SLOT_KEYS:
+            value = getattr(self, key)
+        elif self._extra is not None:
+            value = self._extra.get(key, _MISSING)
+        else:
+            value = _MISSING
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Store a value and mark the record as used.
+
+        :param key: Data key
+        :type key: str
+        :param value: Value to store
+        :type value: Any
+        :returns: None
+        """
+        self.last_access = time.monotonic()
+        if key in SLOT_KEYS:
+            setattr(self, key, value)
+            return
+        if self._extra is None:
+            self._extra = {}
+        self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        """Remove a value and mark the record as used.
+
+        :param key: Data key
+        :type key: str
+        :returns: None
+        :raises KeyError: If the key is not set
+        """
+        self.last_access = time.monotonic()
+        if key in SLOT_KEYS:
+            if getattr(self, key) is _MISSING:
+                raise KeyError(key)
+            setattr(self, key, _MISSING)
+            return
+        if self._extra is None:
+            raise KeyError(key)
+        del self._extra[key]
+        if not self._extra:
+            self._extra = None
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the set keys.
+
+        :returns: Iterator over keys
+        :rtype: Iterator[str]
+        """
+        for key in SLOT_KEYS:
+            if getattr(self, key) is not _MISSING:
+                yield key
+        if self._extra is not None:
+            yield from list(self._extra)
+
+    def __len__(self) -> int:
+        """Return the number of set keys.
+
+        :returns: Number of keys
+        :rtype: int
+        """
+        count = sum(getattr(self, key) is not _MISSING for key in SLOT_KEYS)
+        return count + (len(self._extra) if self._extra is not None else 0)
+
+    def __repr__(self) -> str:
+        """Return a dict-like representation.
+
+        :returns: Representation
+        :rtype: str
+        """
+        return f"{type(self).__name__}({ {key: self[key] for key in self}!r})"
+
+
+class UserDataEvictor:
+    """Drop the ``user_data`` records of idle users.
+
+    A record unused for longer than the state timeout is dropped: any state
+    it holds has expired anyway. If more than ``max_users`` records remain,
+    the least recently used ones are dropped as well.
+
+    :ivar _max_users: Records kept at most after an eviction run
+    :ivar _idle_seconds: Seconds without access after which a record is dropped
+    :ivar _interval_seconds: Seconds between eviction runs
+    :ivar _task: Running eviction loop
+    """
+
+    def __init__(
+        self,
+        max_users: int,
+        interval_seconds: float,
+        idle_seconds: float = DEFAULT_STATE_TIMEOUT_SECONDS,
+    ) -> None:
+        """Initialize the evictor.
+
+        :param max_users: Records kept at most after an eviction run
+        :type max_users: int
+        :param interval_seconds: Seconds between eviction runs
+        :type interval_seconds: float
+        :param idle_seconds: Seconds without access after which a record is dropped
+        :type idle_seconds: float
+        """
+        self._max_users = max_users
+        self._interval_seconds = interval_seconds
+        self._idle_seconds = idle_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    def evict(self, application: Application) -> int:
+        """Drop expired and least recently used records.
+
+        :param application: Application owning the records
+        :type application: Application
+        :returns: Number of dropped records
+        :rtype: int
+        """
+        cutoff = time.monotonic() - self._idle_seconds
+        kept: list[tuple[float, int]] = []
+        dropped = 0
+        for user_id, data in list(application.user_data.items()):
+            last_access = getattr(data, "last_access", None)
+            if last_access is None:
+                continue
+            if last_access < cutoff:
+                application.drop_user_data(user_id)
+                dropped += 1
+            else:
+                kept.append((last_access, user_id))
+
+        excess = len(kept) - self._max_users
+        if excess > 0:
+            for _, user_id in heapq.nsmallest(excess, kept):
+                application.drop_user_data(user_id)
+            dropped += excess
+        if dropped:
+            logger.debug(f"Dropped user_data of {dropped} idle users")
+        return dropped
+
+    def start(self, application: Application) -> None:
+        """Start evicting periodically.
+
+        :param application: Application owning the records
+        :type application: Application
+        :returns: None
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(application))
+
+    async def stop(self) -> None:
+        """Stop the eviction loop.
+
+        :returns: None
+        """
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+    async def _run(self, application: Application) -> None:
+        """Evict every interval.
+
+        :param application: Application owning the records
+        :type application: Application
+        :returns: None
+        """
+        while True:
+            await asyncio.sleep(self._interval_seconds)
+            self.evict(application)
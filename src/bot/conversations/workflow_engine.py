@@ -0,0 +1,383 @@
+"""Compiled workflow engine executing text-input conversation transitions.
+
+This module compiles the declarative workflows in ``config/workflows/*.yaml``
+into a flat transition table keyed by ConversationState. Validator and
+action names are resolved to bound callables once, at startup, so handling a
+text message is a single dictionary lookup followed by direct calls; the
+Pydantic models and YAML are never touched per update.
+
+Validators are looked up on the ValidationService first and on the handler
+owning the state second. Actions are methods of the handler owning the
+state and are called as ``action(update, context, payload)``, where the
+payload is the validated value, the validation error or None on timeout.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Mapping, Optional
+
+from telegram import Update
+from telegram.ext import ContextTypes
+
+from src.core.exceptions import ValidationError as CoreValidationError
+from src.utils.config import BOT_NAME
+from src.utils.logger import get_logger
+
+from .persistence import DEFAULT_STATE_TIMEOUT_SECONDS
+from .state_machine import ConversationStateMachine
+from .states import ConversationState
+from .workflow_config import (
+    InputType,
+    StateConfig,
+    TransitionConfig,
+    WorkflowConfig,
+    load_all_workflows,
+)
+
+logger = get_logger(BOT_NAME)
+
+# Default workflows directory
+DEFAULT_WORKFLOWS_DIR = (
+    Path(__file__).parent.parent.parent.parent / "config" / "workflows"
+)
+
+Validator = Callable[[str], Any]
+Action = Callable[[Update, ContextTypes.DEFAULT_TYPE, Any], Awaitable[None]]
+
+
+class WorkflowCompileError(ValueError):
+    """Raised when a workflow state refers to unknown states or callables."""
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledTransition:
+    """Transition with its action resolved.
+
+    :ivar target: State after the transition, IDLE ends the conversation
+    :ivar action: Action called before the state changes, if any
+    """
+
+    target: ConversationState
+    action: Optional[Action] = None
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledState:
+    """Text-input state with its validator and transitions resolved.
+
+    :ivar state: The state waiting for text input
+    :ivar validator: Callable turning the message text into the payload
+    :ivar on_valid: Transition after successful validation
+    :ivar on_invalid: Transition after failed validation
+    :ivar on_timeout: Transition when the state has expired
+    :ivar timeout_seconds: Age from which the state has expired
+    """
+
+    state: ConversationState
+    validator: Validator
+    on_valid: CompiledTransition
+    on_invalid: CompiledTransition
+    on_timeout: CompiledTransition
+    timeout_seconds: float
+
+
+def _resolve_callable(name: str, *sources: object) -> Callable[..., Any]:
+    """Return the first callable attribute of that name on the sources.
+
+    :param name: Attribute name
+    :type name: str
+    :param sources: Objects searched in order
+    :type sources: object
+    :returns: Bound callable
+    :rtype: Callable[..., Any]
+    :raises WorkflowCompileError: If no source provides the callable
+    """
+    for source in sources:
+        candidate = getattr(source, name, None)
+        if callable(candidate):
+            return candidate
+    raise WorkflowCompileError(f"Unknown callable '{name}'")
+
+
+def _resolve_target(workflow: WorkflowConfig, name: str) -> ConversationState:
+    """Return the conversation state a transition leads to.
+
+    States of the workflow that expect no input end the conversation.
+
+    :param workflow: Workflow the transition belongs to
+    :type workflow: WorkflowConfig
+    :param name: Target state name
+    :type name: str
+    :returns: Target conversation state
+    :rtype: ConversationState
+    :raises WorkflowCompileError: If the target is not a known state
+    """
+    target = workflow.states.get(name)
+    if target is None:
+        raise WorkflowCompileError(f"Unknown target state '{name}'")
+    if target.input_type is InputType.NONE:
+        return ConversationState.IDLE
+    try:
+        return ConversationState(name)
+    except ValueError as error:
+        raise WorkflowCompileError(f"'{name}' is not a conversation state") from error
+
+
+def _compile_transition(
+    workflow: WorkflowConfig,
+    transition: Optional[TransitionConfig],
+    default_target: ConversationState,
+    provider: object,
+) -> CompiledTransition:
+    """Resolve the target and action of a transition.
+
+    :param workflow: Workflow the transition belongs to
+    :type workflow: WorkflowConfig
+    :param transition: Transition configuration, None for the default
+    :type transition: Optional[TransitionConfig]
+    :param default_target: Target used when the transition is not configured
+    :type default_target: ConversationState
+    :param provider: Handler providing the actions
+    :type provider: object
+    :returns: Compiled transition
+    :rtype: CompiledTransition
+    :raises WorkflowCompileError: If the target or action cannot be resolved
+    """
+    if transition is None:
+        return CompiledTransition(target=default_target)
+    return CompiledTransition(
+        target=_resolve_target(workflow, transition.target),
+        action=(
+            _resolve_callable(transition.action, provider)
+            if transition.action
+            else None
+        ),
+    )
+
+
+def compile_state(
+    workflow: WorkflowConfig,
+    state: ConversationState,
+    config: StateConfig,
+    provider: object,
+    validators: object,
+) -> CompiledState:
+    """Compile one text-input state of a workflow.
+
+    Without ``on_invalid`` the user stays in the state; without
+    ``on_timeout`` the conversation ends silently.
+
+    :param workflow: Workflow the state belongs to
+    :type workflow: WorkflowConfig
+    :param state: The state waiting for text input
+    :type state: ConversationState
+    :param config: State configuration
+    :type config: StateConfig
+    :param provider: Handler owning the state and providing its actions
+    :type provider: object
+    :param validators: Object providing shared validators
+    :type validators: object
+    :returns: Compiled state
+    :rtype: CompiledState
+    :raises WorkflowCompileError: If a target, validator or action is unknown
+    """
+    if config.on_valid is None:
+        raise WorkflowCompileError(f"State '{state.value}' has no on_valid transition")
+    validator = (
+        _resolve_callable(config.validation, validators, provider)
+        if config.validation
+        else str
+    )
+    return CompiledState(
+        state=state,
+        validator=validator,
+        on_valid=_compile_transition(workflow, config.on_valid, state, provider),
+        on_invalid=_compile_transition(workflow, config.on_invalid, state, provider),
+        on_timeout=_compile_transition(
+            workflow, config.on_timeout, ConversationState.IDLE, provider
+        ),
+        timeout_seconds=float(config.timeout_seconds or DEFAULT_STATE_TIMEOUT_SECONDS),
+    )
+
+
+def compile_workflows(
+    workflows: Mapping[str, WorkflowConfig],
+    providers: Mapping[str, object],
+    validators: object,
+) -> dict[ConversationState, CompiledState]:
+    """Compile the text-input states of all workflows into one table.
+
+    States without a handler or with unresolvable names are skipped with a
+    warning; their input keeps going to the handler's text input method.
+
+    :param workflows: Workflow configurations by name
+    :type workflows: Mapping[str, WorkflowConfig]
+    :param providers: Handler owning each state, by state value
+    :type providers: Mapping[str, object]
+    :param validators: Object providing shared validators
+    :type validators: object
+    :returns: Compiled states by conversation state
+    :rtype: dict[ConversationState, CompiledState]
+    """
+    table: dict[ConversationState, CompiledState] = {}
+    for workflow in workflows.values():
+        for name, config in workflow.states.items():
+            if config.input_type is not InputType.TEXT:
+                continue
+            provider = providers.get(name)
+            if provider is None:
+                logger.warning(f"Workflow '{workflow.name}': no handler for '{name}'")
+                continue
+            try:
+                table[ConversationState(name)] = compile_state(
+                    workflow=workflow,
+                    state=ConversationState(name),
+                    config=config,
+                    provider=provider,
+                    validators=validators,
+                )
+            except (WorkflowCompileError, ValueError) as error:
+                logger.warning(
+                    f"Workflow '{workflow.name}': state '{name}' not compiled: {error}"
+                )
+    return table
+
+
+class WorkflowEngine:
+    """Execute text-input transitions from a compiled workflow table.
+
+    :ivar _table: Compiled states by conversation state
+    :ivar _machine: State machine applying the transitions
+    """
+
+    def __init__(
+        self,
+        table: Optional[Mapping[ConversationState, CompiledState]] = None,
+        machine: Optional[ConversationStateMachine] = None,
+    ) -> None:
+        """Initialize the engine.
+
+        :param table: Compiled states by conversation state
+        :type table: Optional[Mapping[ConversationState, CompiledState]]
+        :param machine: State machine, defaults to one on the configured backend
+        :type machine: Optional[ConversationStateMachine]
+        """
+        self._table: dict[ConversationState, CompiledState] = dict(table or {})
+        self._machine = machine or ConversationStateMachine()
+
+    @classmethod
+    def from_directory(
+        cls,
+        providers: Mapping[str, object],
+        validators: object,
+        workflows_dir: Path = DEFAULT_WORKFLOWS_DIR,
+        machine: Optional[ConversationStateMachine] = None,
+    ) -> "WorkflowEngine":
+        """Load and compile all workflows of a directory.
+
+        :param providers: Handler owning each state, by state value
+        :type providers: Mapping[str, object]
+        :param validators: Object providing shared validators
+        :type validators: object
+        :param workflows_dir: Directory with workflow YAML files
+        :type workflows_dir: Path
+        :param machine: State machine, defaults to one on the configured backend
+        :type machine: Optional[ConversationStateMachine]
+        :returns: Engine for the compiled workflows
+        :rtype: WorkflowEngine
+        """
+        table = compile_workflows(
+            workflows=load_all_workflows(workflows_dir),
+            providers=providers,
+            validators=validators,
+        )
+        logger.info(f"Compiled {len(table)} workflow text-input states")
+        return cls(table=table, machine=machine)
+
+    @property
+    def states(self) -> frozenset[ConversationState]:
+        """States whose text input the engine handles."""
+        return frozenset(self._table)
+
+    def handles(self, state: ConversationState) -> bool:
+        """Check whether text input in a state is driven by the engine.
+
+        :param state: Current conversation state
+        :type state: ConversationState
+        :returns: True if the state is compiled
+        :rtype: bool
+        """
+        return state in self._table
+
+    async def handle_text(
+        self,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        state: ConversationState,
+    ) -> None:
+        """Validate a text message and execute the resulting transition.
+
+        :param update: Telegram update with the text message
+        :type update: Update
+        :param context: Telegram context object
+        :type context: ContextTypes.DEFAULT_TYPE
+        :param state: Current conversation state, must be compiled
+        :type state: ConversationState
+        :returns: None
+        :raises KeyError: If the state is not compiled
+        """
+        compiled = self._table[state]
+        user_id = update.effective_user.id
+        if not await self._machine.is_state_valid(
+            user_id=user_id,
+            expected_state=state,
+            context=context,
+            max_age_seconds=compiled.timeout_seconds,
+        ):
+            logger.info(f"[{user_id}]: '{state.value}' expired, ignoring input")
+            await self._apply(compiled.on_timeout, update, context, None, state)
+            return
+
+        try:
+            payload: Any = compiled.validator((update.message.text or "").strip())
+            transition = compiled.on_valid
+        except (CoreValidationError, ValueError) as error:
+            payload = error
+            transition = compiled.on_invalid
+        await self._apply(transition, update, context, payload, state)
+
+    async def _apply(
+        self,
+        transition: CompiledTransition,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        payload: Any,
+        current: ConversationState,
+    ) -> None:
+        """Run the action of a transition, then move to its target.
+
+        A failing action leaves the state unchanged.
+
+        :param transition: Compiled transition
+        :type transition: CompiledTransition
+        :param update: Telegram update
+        :type update: Update
+        :param context: Telegram context object
+        :type context: ContextTypes.DEFAULT_TYPE
+        :param payload: Validated value, validation error or None
+        :type payload: Any
+        :param current: State the user is in
+        :type current: ConversationState
+        :returns: None
+        """
+        if transition.action is not None:
+            await transition.action(update, context, payload)
+        if transition.target is current:
+            return
+        user_id = update.effective_user.id
+        if transition.target is ConversationState.IDLE:
+            await self._machine.clear_state(user_id=user_id, context=context)
+        else:
+            await self._machine.transition_to(
+                user_id=user_id, target_state=transition.target, context=context
+            )
@@ -2,25 +2,227 @@
 
 This module defines event handlers that subscribe to domain events and
 trigger appropriate actions on the scheduler via the SchedulerClient.
+
+Settings changes go through a NotificationRescheduler. It remembers the
+trigger last sent for each user and skips changes that leave it as it is
+(language, birth date, life expectancy), and it collects the changes of a
+user tapping through several settings into one scheduler command. Within
+the prewarm window of the user's next notification the job is sent again
+anyway, so the worker drops the payload it staged from the old settings.
 """
 
+import asyncio
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from ..contracts.scheduler_port_protocol import ScheduleTrigger
 from ..events.domain_events import (
     UserDeletedEvent,
     UserSettingsChangedEvent,
 )
 from ..services.container import ServiceContainer
-from ..utils.config import BOT_NAME
+from ..utils.config import BOT_NAME, SCHEDULER_PREWARM_WINDOW_SECONDS
 from ..utils.logger import get_logger
 from .notification_schedule import build_notification_trigger
 
 logger = get_logger(f"{BOT_NAME}.EventListeners")
 
 
+class NotificationRescheduler:
+    """Debounced, diff-aware rescheduling of notification jobs.
+
+    :ivar _debounce_seconds: Window collecting a user's changes, 0 disables it
+    :ivar _max_users: Users whose last trigger is remembered
+    :ivar _triggers: Trigger last sent per user, None if the job was removed
+    :ivar _pending: Delayed reschedule of each user with changes in the window
+    """
+
+    def __init__(self, debounce_seconds: float = 0, max_users: int = 10000) -> None:
+        """Initialize the rescheduler.
+
+        :param debounce_seconds: Seconds to collect a user's changes, 0 for none
+        :type debounce_seconds: float
+        :param max_users: Users whose last trigger is remembered
+        :type max_users: int
+        """
+        self._debounce_seconds = debounce_seconds
+        self._max_users = max_users
+        self._triggers: OrderedDict[int, Optional[ScheduleTrigger]] = OrderedDict()
+        self._pending: dict[int, asyncio.Task[None]] = {}
+
+    def remember(self, user_id: int, trigger: Optional[ScheduleTrigger]) -> None:
+        """Record the trigger the scheduler now has for a user.
+
+        :param user_id: Telegram user ID
+        :type user_id: int
+        :param trigger: Scheduled trigger, None if the user has no job
+        :type trigger: Optional[ScheduleTrigger]
+        :returns: None
+        """
+        self._triggers[user_id] = trigger
+        self._triggers.move_to_end(user_id)
+        while len(self._triggers) > self._max_users:
+            self._triggers.popitem(last=False)
+
+    def forget(self, user_id: int) -> None:
+        """Drop what is known about a user's job and any pending reschedule.
+
+        :param user_id: Telegram user ID
+        :type user_id: int
+        :returns: None
+        """
+        self._triggers.pop(user_id, None)
+        task = self._pending.pop(user_id, None)
+        if task is not None:
+            task.cancel()
+
+    async def on_settings_changed(self, event: UserSettingsChangedEvent) -> None:
+        """Reschedule the user's job once their changes have settled.
+
+        The first change of a user starts the debounce window; changes
+        arriving within it are covered by the same reschedule, which reads
+        the settings when the window ends.
+
+        :param event: The event instance
+        :type event: UserSettingsChangedEvent
+        :returns: None
+        """
+        logger.debug(
+            f"Handling settings change for user {event.user_id}: {event.setting_name}"
+        )
+        if self._debounce_seconds <= 0:
+            await self.reschedule(event.user_id)
+            return
+        if event.user_id in self._pending:
+            logger.debug(f"Reschedule of user {event.user_id} already pending")
+            return
+        self._pending[event.user_id] = asyncio.create_task(
+            self._reschedule_later(event.user_id)
+        )
+
+    async def on_user_deleted(self, event: UserDeletedEvent) -> None:
+        """Forget a deleted user.
+
+        :param event: The event instance
+        :type event: UserDeletedEvent
+        :returns: None
+        """
+        self.forget(event.user_id)
+
+    async def reschedule(self, user_id: int) -> None:
+        """Send the user's current trigger to the scheduler if it changed.
+
+        :param user_id: Telegram user ID
+        :type user_id: int
+        :returns: None
+        """
+        container = ServiceContainer()
+        client = container.get_scheduler_client()
+
+        if not client:
+            logger.warning("Scheduler client not available")
+            return
+
+        # The event doesn't carry all preferences, so fetch the user profile
+        user = await container.get_user_service().get_user_profile(user_id)
+
+        if not user:
+            logger.warning(f"User {user_id} not found for rescheduling")
+            return
+
+        trigger = None
+        if user.settings.notifications:
+            trigger = build_notification_trigger(user.settings)
+            if trigger is None:
+                logger.error("Invalid notification schedule for user %s", user_id)
+                return
+
+        job_id = f"notification_{user_id}"
+        if (
+            user_id in self._triggers
+            and self._triggers[user_id] == trigger
+            and not (trigger and _may_be_prewarmed(client, job_id))
+        ):
+            logger.debug(f"Schedule of user {user_id} unchanged, not rescheduled")
+            return
+
+        if trigger is None:
+            logger.info(
+                "Notifications disabled for user %s, removing scheduled job",
+                user_id,
+            )
+            await client.remove_job(job_id)
+            self.remember(user_id, None)
+            return
+
+        job_type = f"{user.settings.notification_frequency}_summary"
+        if await client.schedule_job(
+            job_id=job_id,
+            trigger=trigger,
+            user_id=user_id,
+            job_type=job_type,
+        ):
+            logger.info(f"Rescheduled {job_type} job for user {user_id}")
+            self.remember(user_id, trigger)
+        else:
+            logger.error(f"Failed to reschedule {job_type} job for user {user_id}")
+            self._triggers.pop(user_id, None)
+
+    async def stop(self) -> None:
+        """Cancel pending reschedules.
+
+        Their settings are already stored and are scheduled again when the
+        bot restores the jobs on its next start.
+
+        :returns: None
+        """
+        tasks = list(self._pending.values())
+        self._pending.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _reschedule_later(self, user_id: int) -> None:
+        """Reschedule the user's job when the debounce window ends.
+
+        :param user_id: Telegram user ID
+        :type user_id: int
+        :returns: None
+        """
+        await asyncio.sleep(self._debounce_seconds)
+        # Changes arriving from now on start a new window
+        self._pending.pop(user_id, None)
+        try:
+            await self.reschedule(user_id)
+        except Exception as error:
+            logger.error(f"Failed to reschedule user {user_id}: {error}", exc_info=True)
+
+
+def _may_be_prewarmed(client: Any, job_id: str) -> bool:
+    """Check whether the worker may have staged the job's next notification.
+
+    :param client: Scheduler client with a mirror of the worker's jobs
+    :type client: Any
+    :param job_id: Job ID
+    :type job_id: str
+    :returns: True if the job's next run is within the prewarm window
+    :rtype: bool
+    """
+    if SCHEDULER_PREWARM_WINDOW_SECONDS <= 0:
+        return False
+    next_run = client.get_next_run_time(job_id)
+    if next_run is None:
+        return False
+    window = timedelta(seconds=SCHEDULER_PREWARM_WINDOW_SECONDS)
+    return next_run - datetime.now(timezone.utc) <= window
+
+
 async def handle_user_settings_changed(event: UserSettingsChangedEvent) -> None:
     """Handle user settings changed event.
 
-    Updates the user's notification schedule if relevant settings
-    (birth_date, language, timezone) have changed.
+    Reschedules the user's notification job right away, without
+    debouncing or comparing with an earlier trigger.
 
     :param event: The event instance
     :type event: UserSettingsChangedEvent
@@ -29,66 +231,7 @@ async def handle_user_settings_changed(event: UserSettingsChangedEvent) -> None:
     logger.debug(
         f"Handling settings change for user {event.user_id}: {event.setting_name}"
     )
-
-    # We only care about settings that affect scheduling or message content
-    # If birth_date changed, we might need to reschedule if we had a specific time
-    # (though usually time is constant, but content changes)
-    # Actually, if language changes, we don't need to reschedule the JOB,
-    # because the job generates content at runtime using current user language.
-    # So we only need to reschedule if TIMING changes (timezone, or preferred time).
-
-    # However, existing logic might re-add job to be safe.
-    # Let's check what `update_user_schedule` did.
-    # It called `delete_job` then `add_job`.
-
-    # If setting is 'notification_time' or 'timezone' (if we had those), we reschedule.
-    # If setting is 'birth_date', we don't strictly need to reschedule unless
-    # we want to refresh some metadata.
-
-    # For now, let's assume we want to ensure the job exists and is correct.
-    container = ServiceContainer()
-    client = container.get_scheduler_client()
-
-    if not client:
-        logger.warning("Scheduler client not available")
-        return
-
-    # To reschedule, we need the user's preferences.
-    # Since event doesn't carry all preferences, we fetch the user profile.
-    user_service = container.get_user_service()
-    user = await user_service.get_user_profile(event.user_id)
-
-    if not user:
-        logger.warning(f"User {event.user_id} not found for rescheduling")
-        return
-
-    if not user.settings.notifications:
-        logger.info(
-            "Notifications disabled for user %s, removing scheduled job",
-            event.user_id,
-        )
-        await client.remove_job(f"notification_{event.user_id}")
-        return
-
-    trigger = build_notification_trigger(user.settings)
-    if trigger is None:
-        logger.error("Invalid notification schedule for user %s", event.user_id)
-        return
-
-    job_id = f"notification_{event.user_id}"
-    job_type = f"{user.settings.notification_frequency}_summary"
-
-    success = await client.schedule_job(
-        job_id=job_id,
-        trigger=trigger,
-        user_id=event.user_id,
-        job_type=job_type,
-    )
-
-    if success:
-        logger.info(f"Rescheduled {job_type} job for user {event.user_id}")
-    else:
-        logger.error(f"Failed to reschedule {job_type} job for user {event.user_id}")
+    await NotificationRescheduler().reschedule(event.user_id)
 
 
 async def handle_user_deleted(event: UserDeletedEvent) -> None:
@@ -119,18 +262,26 @@ async def handle_user_deleted(event: UserDeletedEvent) -> None:
         logger.debug(f"Job {job_id} not found or already removed")
 
 
-def register_event_listeners(container: ServiceContainer) -> None:
+def register_event_listeners(
+    container: ServiceContainer,
+    rescheduler: Optional[NotificationRescheduler] = None,
+) -> NotificationRescheduler:
     """Register all event listeners.
 
     :param container: Service container instance
     :type container: ServiceContainer
-    :returns: None
+    :param rescheduler: Rescheduler handling settings changes, a new
+        one without debouncing by default
+    :type rescheduler: Optional[NotificationRescheduler]
+    :returns: The rescheduler handling settings changes
+    :rtype: NotificationRescheduler
     """
     event_bus = container.get_event_bus()
+    rescheduler = rescheduler or NotificationRescheduler()
 
     event_bus.subscribe(
         event_type=UserSettingsChangedEvent,
-        handler=handle_user_settings_changed,
+        handler=rescheduler.on_settings_changed,
     )
 
     event_bus.subscribe(
@@ -138,4 +289,10 @@ def register_event_listeners(container: ServiceContainer) -> None:
         handler=handle_user_deleted,
     )
 
+    event_bus.subscribe(
+        event_type=UserDeletedEvent,
+        handler=rescheduler.on_user_deleted,
+    )
+
     logger.info("Registered scheduler event listeners")
+    return rescheduler
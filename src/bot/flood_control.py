@@ -0,0 +1,201 @@
+"""Per-user flood control applied before any handler sees an update.
+
+Every handler starts by loading the user's profile, so each update costs
+database queries even when it is spam text, a sticker or a photo nobody
+asked for. This module provides the FloodController class, a token-bucket
+rate limiter keyed by Telegram user ID. It is registered in a handler group
+running before all other handlers and stops updates exceeding the user's
+budget there, so one flooding client cannot turn into thousands of queries.
+
+Each user may send ``burst`` updates at once and gains ``rate_per_minute``
+more per minute. The first dropped update of a flood gets one short notice;
+the rest are dropped silently until the user is allowed through again.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from telegram import Update
+from telegram.ext import ApplicationHandlerStop
+
+from src.i18n import use_locale
+from src.utils.config import BOT_NAME
+from src.utils.logger import get_logger
+
+logger = get_logger(BOT_NAME)
+
+
+@dataclass(slots=True)
+class TokenBucket:
+    """Update budget of one user.
+
+    :ivar tokens: Updates the user may still send right now
+    :ivar updated_at: Monotonic time of the last refill
+    :ivar warned: Whether the current flood has been announced
+    :ivar dropped: Updates of the user dropped so far
+    """
+
+    tokens: float
+    updated_at: float
+    warned: bool = False
+    dropped: int = 0
+
+
+class FloodController:
+    """Token-bucket rate limiter for incoming updates.
+
+    :ivar _burst: Bucket size, 0 disables flood control
+    :ivar _refill_per_second: Tokens added per second
+    :ivar _max_users: Buckets kept, least recently used ones are forgotten
+    :ivar _buckets: Bucket of each recently active user
+    :ivar _dropped: Updates dropped across all users
+    """
+
+    def __init__(self, burst: int, rate_per_minute: int, max_users: int) -> None:
+        """Initialize the limiter.
+
+        :param burst: Updates a user may send at once, 0 disables the limiter
+        :type burst: int
+        :param rate_per_minute: Updates a user regains per minute
+        :type rate_per_minute: int
+        :param max_users: Users whose bucket is kept in memory
+        :type max_users: int
+        """
+        self._burst = burst
+        self._refill_per_second = rate_per_minute / 60
+        self._max_users = max_users
+        self._buckets: OrderedDict[int, TokenBucket] = OrderedDict()
+        self._dropped = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether updates are limited at all."""
+        return self._burst > 0
+
+    @property
+    def dropped(self) -> int:
+        """Updates dropped since start across all users."""
+        return self._dropped
+
+    def dropped_by_user(self) -> dict[int, int]:
+        """Return a snapshot of the updates dropped per user.
+
+        Counts are kept on the users' buckets, so users whose bucket has
+        been forgotten are no longer listed.
+
+        :returns: Dropped updates by Telegram user ID
+        :rtype: dict[int, int]
+        """
+        return {
+            user_id: bucket.dropped
+            for user_id, bucket in self._buckets.items()
+            if bucket.dropped
+        }
+
+    def allow(self, user_id: int, now: Optional[float] = None) -> bool:
+        """Take a token from the user's bucket if one is left.
+
+        :param user_id: Telegram user ID
+        :type user_id: int
+        :param now: Monotonic time, defaults to the current time
+        :type now: Optional[float]
+        :returns: True if the update may be processed
+        :rtype: bool
+        """
+        if not self.enabled:
+            return True
+        now = time.monotonic() if now is None else now
+        bucket = self._bucket(user_id, now)
+        bucket.tokens = min(
+            self._burst,
+            bucket.tokens + (now - bucket.updated_at) * self._refill_per_second,
+        )
+        bucket.updated_at = now
+        if bucket.tokens >= 1:
+            bucket.tokens -= 1
+            bucket.warned = False
+            return True
+        bucket.dropped += 1
+        self._dropped += 1
+        return False
+
+    async def check(self, update: object, context: Any) -> None:
+        """Stop further handling of updates exceeding the sender's budget.
+
+        Registered as a PTB handler in a group before every other handler.
+
+        :param update: Incoming update
+        :type update: object
+        :param context: Callback context of the update
+        :type context: Any
+        :returns: None
+        :raises ApplicationHandlerStop: If the update is dropped
+        """
+        if not isinstance(update, Update) or update.effective_user is None:
+            return
+        user_id = update.effective_user.id
+        if self.allow(user_id):
+            return
+
+        bucket = self._buckets[user_id]
+        if not bucket.warned:
+            bucket.warned = True
+            logger.warning(f"[{user_id}]: flooding, dropping updates")
+            await self._warn(update)
+        raise ApplicationHandlerStop
+
+    def log_summary(self) -> None:
+        """Log how many updates were dropped and how many tracked users flooded.
+
+        :returns: None
+        """
+        if self._dropped:
+            logger.info(
+                f"Flood control dropped {self._dropped} updates, "
+                f"{len(self.dropped_by_user())} tracked users flooded"
+            )
+
+    def _bucket(self, user_id: int, now: float) -> TokenBucket:
+        """Return the user's bucket, creating a full one for new users.
+
+        :param user_id: Telegram user ID
+        :type user_id: int
+        :param now: Monotonic time
+        :type now: float
+        :returns: Bucket of the user
+        :rtype: TokenBucket
+        """
+        bucket = self._buckets.get(user_id)
+        if bucket is not None:
+            self._buckets.move_to_end(user_id)
+            return bucket
+        bucket = self._buckets[user_id] = TokenBucket(
+            tokens=self._burst, updated_at=now
+        )
+        while len(self._buckets) > self._max_users:
+            self._buckets.popitem(last=False)
+        return bucket
+
+    @staticmethod
+    async def _warn(update: Update) -> None:
+        """Ask the user to slow down, in their Telegram client language.
+
+        :param update: Dropped update
+        :type update: Update
+        :returns: None
+        """
+        message = update.effective_message
+        if message is None:
+            return
+        _, _, pgettext = use_locale(lang=update.effective_user.language_code or "en")
+        try:
+            await message.reply_text(
+                text=pgettext(
+                    "flood.throttled",
+                    "🐢 Too many messages at once.\nPlease wait a moment.",
+                )
+            )
+        except Exception as error:
+            logger.warning(f"Failed to send flood notice: {error}")
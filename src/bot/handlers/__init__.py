@@ -10,6 +10,7 @@ The package includes:
 - WeeksHandler: Handles /weeks command for life statistics
 - SettingsHandler: Handles /settings command and related callbacks
 - VisualizeHandler: Handles /visualize command for life weeks visualization
+- EventsHandler: Handles /events command for life events on the grid
 - HelpHandler: Handles /help command for bot assistance
 - SubscriptionHandler: Handles /subscription command for subscription management
 - CancelHandler: Handles /cancel command for operation cancellation
@@ -21,6 +22,7 @@ logging, and user experience.
 
 from .base_handler import BaseHandler
 from .cancel_handler import CancelHandler
+from .events_handler import EventsHandler
 from .help_handler import HelpHandler
 from .settings import (
     BirthDateHandler,
@@ -43,6 +45,7 @@ __all__ = [
     "LanguageHandler",
     "LifeExpectancyHandler",
     "VisualizeHandler",
+    "EventsHandler",
     "HelpHandler",
     "SubscriptionHandler",
     "CancelHandler",
@@ -114,6 +114,46 @@ class BaseHandler(ABC):
         self.command_name: Optional[str] = None
         self.services = services
 
+    async def admission_language(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE
+    ) -> Optional[str]:
+        """Check whether a queued run of the command would do its work.
+
+        Used by the admission controller before an expensive command is
+        queued and acknowledged. Unregistered users are found in memory when
+        the registered users are loaded, so they cost no database access.
+
+        :param update: The update object containing the command
+        :type update: Update
+        :param context: The context object for the command execution
+        :type context: ContextTypes.DEFAULT_TYPE
+        :returns: The user's language, or None if the command only answers
+            with an error
+        :rtype: Optional[str]
+        """
+        profile = await self.services.user_service.get_user_profile(
+            telegram_id=update.effective_user.id
+        )
+        if not profile or not profile.settings or not profile.settings.birth_date:
+            return None
+        if not self._admits(profile=profile, context=context):
+            return None
+        return profile.settings.language or update.effective_user.language_code or "en"
+
+    def _admits(
+        self, profile: UserProfileDTO, context: ContextTypes.DEFAULT_TYPE
+    ) -> bool:
+        """Check command specific requirements of a registered user.
+
+        :param profile: Profile of the registered user
+        :type profile: UserProfileDTO
+        :param context: The context object for the command execution
+        :type context: ContextTypes.DEFAULT_TYPE
+        :returns: True if the command would do its work for the user
+        :rtype: bool
+        """
+        return True
+
     def _should_require_registration(self) -> bool:
         """Check if this handler should require registration.
 
@@ -340,6 +380,34 @@ class BaseHandler(ABC):
             parse_mode=ParseMode.HTML,
         )
 
+    async def send_timeout_message(
+        self,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        payload: Any = None,
+    ) -> None:
+        """Tell the user that the input they answered has expired.
+
+        Workflow action of the ``on_timeout`` transitions.
+
+        :param update: The update object containing the user's message
+        :type update: Update
+        :param context: The context object for the command execution
+        :type context: ContextTypes.DEFAULT_TYPE
+        :param payload: Unused, timeouts carry no payload
+        :type payload: Any
+        :returns: None
+        """
+        cmd_context = await self._extract_command_context(update)
+        _, _, pgettext = use_locale(lang=cmd_context.language)
+        await self.send_message(
+            update=update,
+            message_text=pgettext(
+                "conversation.timeout",
+                "⌛ This request has expired.\nPlease start again.",
+            ),
+        )
+
     @abstractmethod
     async def handle(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
@@ -0,0 +1,337 @@
+"""Events command handler for life events on the grid.
+
+This module contains the EventsHandler class which handles the /events command.
+Users record dated life events (graduation, wedding, moving abroad, ...) that
+are highlighted on the /visualize life grid.
+
+Supported forms:
+- ``/events`` - list the user's life events
+- ``/events add DD.MM.YYYY Label [#rrggbb]`` - record an event
+- ``/events delete N`` - delete event number N of the list
+"""
+
+import html
+from datetime import date
+from typing import Callable, Optional, Sequence
+
+from babel.dates import format_date
+from telegram import Update
+from telegram.ext import ContextTypes
+
+from src.i18n import normalize_babel_locale, use_locale
+
+from ...core.exceptions import ValidationError as CoreValidationError
+from ...database.constants import MAX_LIFE_EVENT_LABEL_LENGTH
+from ...database.service import UserLifeEventError
+from ...services.container import ServiceContainer
+from ...services.validation_service import (
+    ERROR_INVALID_COLOR,
+    ERROR_LABEL_REQUIRED,
+    ERROR_LABEL_TOO_LONG,
+    ValidationService,
+)
+from ...utils.config import BOT_NAME
+from ...utils.logger import get_logger
+from ..constants import COMMAND_EVENTS
+from .base_handler import BaseHandler, CommandContext
+
+# Initialize logger for this module
+logger = get_logger(BOT_NAME)
+
+# Sub-commands of /events
+EVENTS_ACTION_ADD = "add"
+EVENTS_ACTION_DELETE = "delete"
+
+
+class EventsHandler(BaseHandler):
+    """Handler for /events command - manage life events shown on the grid.
+
+    Attributes:
+        command_name: Name of the command this handler processes
+    """
+
+    def __init__(self, services: ServiceContainer) -> None:
+        """Initialize the events handler.
+
+        :param services: Service container with all dependencies
+        :type services: ServiceContainer
+        """
+        super().__init__(services)
+        self.command_name = f"/{COMMAND_EVENTS}"
+        self._validation_service = ValidationService()
+
+    async def handle(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE
+    ) -> Optional[int]:
+        """Handle /events command - list, add or delete life events.
+
+        :param update: The update object containing the events command
+        :type update: Update
+        :param context: The context object for the command execution
+        :type context: ContextTypes.DEFAULT_TYPE
+        :returns: None
+        """
+        return await self._wrap_with_registration(handler_method=self._handle_events)(
+            update=update,
+            context=context,
+        )
+
+    async def _handle_events(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE
+    ) -> Optional[int]:
+        """Internal method to handle /events command with registration check.
+
+        :param update: The update object containing the events command
+        :type update: Update
+        :param context: The context object for the command execution
+        :type context: ContextTypes.DEFAULT_TYPE
+        :returns: None
+        """
+        cmd_context = await self._extract_command_context(update=update)
+        _, _, pgettext = use_locale(lang=cmd_context.language)
+
+        args = getattr(context, "args", None)
+        args = [str(arg) for arg in args] if isinstance(args, (list, tuple)) else []
+
+        logger.info(f"{self.command_name}: [{cmd_context.user_id}]: {args[:1]}")
+
+        if not args:
+            await self._send_event_list(
+                update=update, cmd_context=cmd_context, pgettext=pgettext
+            )
+        elif args[0].lower() == EVENTS_ACTION_ADD and len(args) >= 3:
+            await self._add_event(
+                update=update,
+                cmd_context=cmd_context,
+                args=args[1:],
+                pgettext=pgettext,
+            )
+        elif args[0].lower() == EVENTS_ACTION_DELETE and len(args) == 2:
+            await self._delete_event(
+                update=update,
+                cmd_context=cmd_context,
+                number=args[1],
+                pgettext=pgettext,
+            )
+        else:
+            await self.send_message(
+                update=update,
+                message_text=pgettext(
+                    "events.usage",
+                    "ℹ️ Usage:\n"
+                    "/events - list your life events\n"
+                    "/events add DD.MM.YYYY Label [#rrggbb] - add an event\n"
+                    "/events delete N - delete event number N",
+                ),
+            )
+        return None
+
+    async def _send_event_list(
+        self, update: Update, cmd_context: CommandContext, pgettext: Callable
+    ) -> None:
+        """Send the numbered list of the user's life events.
+
+        :param update: The update object containing the events command
+        :type update: Update
+        :param cmd_context: Command context with user information
+        :type cmd_context: CommandContext
+        :param pgettext: Bound pgettext of the user's language
+        :type pgettext: Callable
+        :returns: None
+        """
+        events = await self.services.user_service.get_life_events(
+            telegram_id=cmd_context.user_id
+        )
+        if not events:
+            await self.send_message(
+                update=update,
+                message_text=pgettext(
+                    "events.empty",
+                    "📌 You have no life events yet.\n\n"
+                    "Add one with:\n"
+                    "/events add DD.MM.YYYY Label #rrggbb\n"
+                    "(the color is optional)",
+                ),
+            )
+            return
+
+        lines = [
+            f"{number}. {self._format_date(event.event_date, cmd_context.language)}"
+            f" — {html.escape(event.label)}"
+            for number, event in enumerate(events, start=1)
+        ]
+        await self.send_message(
+            update=update,
+            message_text=pgettext(
+                "events.list",
+                "📌 <b>Your life events</b>\n\n"
+                "%(events)s\n\n"
+                "They are highlighted on the /visualize grid.",
+            )
+            % {"events": "\n".join(lines)},
+        )
+
+    async def _add_event(
+        self,
+        update: Update,
+        cmd_context: CommandContext,
+        args: Sequence[str],
+        pgettext: Callable,
+    ) -> None:
+        """Validate and record a life event.
+
+        :param update: The update object containing the events command
+        :type update: Update
+        :param cmd_context: Command context with user information
+        :type cmd_context: CommandContext
+        :param args: Date, label words and an optional trailing "#rrggbb" color
+        :type args: Sequence[str]
+        :param pgettext: Bound pgettext of the user's language
+        :type pgettext: Callable
+        :returns: None
+        """
+        date_str, *words = args
+        color = words.pop() if len(words) > 1 and words[-1].startswith("#") else None
+
+        try:
+            event = self._validation_service.validate_life_event(
+                date_str=date_str, label=" ".join(words), color=color
+            )
+        except CoreValidationError as error:
+            await self.send_error_message(
+                update=update,
+                cmd_context=cmd_context,
+                error_message=self._validation_error_message(
+                    error_key=error.error_key, pgettext=pgettext
+                ),
+            )
+            return
+
+        profile = cmd_context.user_profile
+        birth_date = profile.settings.birth_date if profile else None
+        if birth_date and event.event_date < birth_date:
+            await self.send_error_message(
+                update=update,
+                cmd_context=cmd_context,
+                error_message=pgettext(
+                    "events.error_before_birth",
+                    "❌ The event date cannot be before your birth date.",
+                ),
+            )
+            return
+
+        try:
+            await self.services.user_service.add_life_event(
+                telegram_id=cmd_context.user_id,
+                event_date=event.event_date,
+                label=event.label,
+                color=event.color,
+            )
+        except UserLifeEventError:
+            await self.send_error_message(
+                update=update,
+                cmd_context=cmd_context,
+                error_message=pgettext(
+                    "events.error",
+                    "❌ Failed to save the event. Please try again later.",
+                ),
+            )
+            return
+
+        await self.send_message(
+            update=update,
+            message_text=pgettext(
+                "events.added", "✅ Event added: %(date)s — %(label)s"
+            )
+            % {
+                "date": self._format_date(event.event_date, cmd_context.language),
+                "label": html.escape(event.label),
+            },
+        )
+
+    async def _delete_event(
+        self,
+        update: Update,
+        cmd_context: CommandContext,
+        number: str,
+        pgettext: Callable,
+    ) -> None:
+        """Delete a life event by its number in the /events list.
+
+        :param update: The update object containing the events command
+        :type update: Update
+        :param cmd_context: Command context with user information
+        :type cmd_context: CommandContext
+        :param number: One based position of the event in the list
+        :type number: str
+        :param pgettext: Bound pgettext of the user's language
+        :type pgettext: Callable
+        :returns: None
+        """
+        events = await self.services.user_service.get_life_events(
+            telegram_id=cmd_context.user_id
+        )
+        position = int(number) if number.isdigit() else 0
+        deleted = 0 < position <= len(events) and (
+            await self.services.user_service.delete_life_event(
+                telegram_id=cmd_context.user_id,
+                event_id=events[position - 1].id,
+            )
+        )
+        if not deleted:
+            await self.send_error_message(
+                update=update,
+                cmd_context=cmd_context,
+                error_message=pgettext(
+                    "events.not_found",
+                    "❌ Event %(number)s not found. Use /events to see the list.",
+                )
+                % {"number": html.escape(number)},
+            )
+            return
+
+        await self.send_message(
+            update=update,
+            message_text=pgettext("events.deleted", "🗑 Event deleted."),
+        )
+
+    @staticmethod
+    def _validation_error_message(error_key: Optional[str], pgettext: Callable) -> str:
+        """Map a validation error key to a localized message.
+
+        :param error_key: Error key of the validation error
+        :type error_key: Optional[str]
+        :param pgettext: Bound pgettext of the user's language
+        :type pgettext: Callable
+        :returns: Localized error message
+        :rtype: str
+        """
+        if error_key in (ERROR_LABEL_REQUIRED, ERROR_LABEL_TOO_LONG):
+            return pgettext(
+                "events.error_label",
+                "❌ Please add a label of up to %(max_length)s characters.",
+            ) % {"max_length": MAX_LIFE_EVENT_LABEL_LENGTH}
+        if error_key == ERROR_INVALID_COLOR:
+            return pgettext(
+                "events.error_color",
+                "❌ Invalid color! Use the #rrggbb format, for example #ff9800.",
+            )
+        return pgettext(
+            "events.error_date",
+            "❌ Invalid date format!\nPlease use DD.MM.YYYY, for example 15.03.2010",
+        )
+
+    @staticmethod
+    def _format_date(value: date, lang: str) -> str:
+        """Format an event date for display.
+
+        :param value: Event date
+        :type value: date
+        :param lang: User's language code
+        :type lang: str
+        :returns: Date in dd.MM.yyyy format
+        :rtype: str
+        """
+        return format_date(
+            value, format="dd.MM.yyyy", locale=normalize_babel_locale(lang)
+        )
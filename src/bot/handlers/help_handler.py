@@ -17,6 +17,7 @@ from telegram import Update
 from telegram.ext import ContextTypes
 
 from src.core.messages import HelpMessages
+from src.i18n import LocaleArtifactCache
 
 from ...services.container import ServiceContainer
 from ...services.i18n_adapter import BabelI18nAdapter
@@ -50,6 +51,9 @@ class HelpHandler(BaseHandler):
         """
         super().__init__(services)
         self.command_name = f"/{COMMAND_HELP}"
+        self._help_texts: LocaleArtifactCache[str] = LocaleArtifactCache(
+            build=self._build_help_text
+        )
 
     async def handle(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
@@ -89,12 +93,20 @@ class HelpHandler(BaseHandler):
             else (cmd_context.user.language_code or "en")
         )
 
-        # Use helper for messages
-        i18n = BabelI18nAdapter(lang=lang)
-        messages = HelpMessages(i18n=i18n)
-
         await self.send_message(
             update=update,
-            message_text=messages.main_help(),
+            message_text=self._help_texts.get(lang),
         )
         return None
+
+    @staticmethod
+    def _build_help_text(lang: str) -> str:
+        """Build the help message of a language.
+
+        :param lang: Language code of the message
+        :type lang: str
+        :returns: Localized help message
+        :rtype: str
+        """
+        messages = HelpMessages(i18n=BabelI18nAdapter(lang=lang))
+        return messages.main_help()
@@ -10,7 +10,7 @@ from typing import Optional
 from telegram import Update
 from telegram.ext import ContextTypes
 
-from src.bot.conversations.persistence import TelegramContextPersistence
+from src.bot.conversations.persistence import get_state_persistence
 from src.bot.conversations.states import ConversationState
 from src.bot.handlers.base_handler import BaseHandler
 from src.services.container import ServiceContainer
@@ -23,7 +23,7 @@ class AbstractSettingsHandler(BaseHandler):
     settings management, particularly FSM state handling.
 
     :ivar _persistence: Persistence handler for FSM states
-    :type _persistence: TelegramContextPersistence
+    :type _persistence: TelegramContextPersistence | DatabasePersistence
     """
 
     def __init__(self, services: ServiceContainer) -> None:
@@ -33,7 +33,7 @@ class AbstractSettingsHandler(BaseHandler):
         :type services: ServiceContainer
         """
         super().__init__(services)
-        self._persistence = TelegramContextPersistence()
+        self._persistence = get_state_persistence()
 
     @abstractmethod
     async def handle(
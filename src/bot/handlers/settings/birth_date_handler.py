@@ -161,36 +161,73 @@ class BirthDateHandler(AbstractSettingsHandler):
             return
 
         try:
-            # Validate input
             birth_date_value = self._validation_service.validate_birth_date(
                 input_str=message_text
             )
+        except CoreValidationError as error:
+            await self.send_birth_date_validation_error(update, context, error)
+            return
+        except Exception as error:
+            logger.error(
+                f"{COMMAND_SETTINGS}: [{user_id}]: "
+                f"Exception in handle_birth_date_input: {error}"
+            )
+            error_message = pgettext(
+                "birth_date.format_error",
+                "❌ Invalid date format!\n"
+                "Please enter date in DD.MM.YYYY format\n"
+                "For example: 15.03.1990",
+            )
+            await self.send_error_message(
+                update=update,
+                cmd_context=cmd_context,
+                error_message=error_message,
+            )
+            return
+
+        await self.update_birth_date(update, context, birth_date_value)
+
+    async def update_birth_date(
+        self,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        birth_date: date,
+    ) -> None:
+        """Store a validated birth date and report the new statistics.
+
+        Workflow action of the ``settings_birth_date`` state.
+
+        :param update: The update object
+        :type update: Update
+        :param context: The context object
+        :type context: ContextTypes.DEFAULT_TYPE
+        :param birth_date: Validated birth date
+        :type birth_date: date
+        :returns: None
+        """
+        cmd_context = await self._extract_command_context(update)
+        user_id = cmd_context.user_id
+        lang = cmd_context.language
+        _, _, pgettext = use_locale(lang=lang)
 
+        try:
             await self._update_and_notify(
                 cmd_context=cmd_context,
-                birth_date=birth_date_value,
+                birth_date=birth_date,
             )
 
             await self._send_update_success(
                 update=update,
                 user_id=user_id,
-                birth_date=birth_date_value,
+                birth_date=birth_date,
                 lang=lang,
                 pgettext=pgettext,
             )
 
             await self._clear_waiting_state(user_id=user_id, context=context)
             logger.info(
-                f"{COMMAND_SETTINGS}: [{user_id}]: Updated birth date to {birth_date_value}"
-            )
-
-        except CoreValidationError as error:
-            await self._handle_validation_error(
-                update=update,
-                error_key=error.error_key,
-                lang=lang,
+                f"{COMMAND_SETTINGS}: [{user_id}]: Updated birth date to {birth_date}"
             )
-            return
 
         except (UserNotFoundError, UserSettingsUpdateError) as error:
             logger.error(
@@ -207,22 +244,30 @@ class BirthDateHandler(AbstractSettingsHandler):
                 error_message=error_message,
             )
 
-        except Exception as error:
-            logger.error(
-                f"{COMMAND_SETTINGS}: [{user_id}]: "
-                f"Exception in handle_birth_date_input: {error}"
-            )
-            error_message = pgettext(
-                "birth_date.format_error",
-                "❌ Invalid date format!\n"
-                "Please enter date in DD.MM.YYYY format\n"
-                "For example: 15.03.1990",
-            )
-            await self.send_error_message(
-                update=update,
-                cmd_context=cmd_context,
-                error_message=error_message,
-            )
+    async def send_birth_date_validation_error(
+        self,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        error: CoreValidationError,
+    ) -> None:
+        """Tell the user why the entered birth date was rejected.
+
+        Workflow action of the ``settings_birth_date`` state.
+
+        :param update: The update object
+        :type update: Update
+        :param context: The context object
+        :type context: ContextTypes.DEFAULT_TYPE
+        :param error: Validation error raised for the input
+        :type error: CoreValidationError
+        :returns: None
+        """
+        cmd_context = await self._extract_command_context(update)
+        await self._handle_validation_error(
+            update=update,
+            error_key=getattr(error, "error_key", None),
+            lang=cmd_context.language,
+        )
 
     async def _update_and_notify(
         self,
@@ -8,12 +8,17 @@ from typing import Optional
 
 from babel.dates import format_date
 from babel.numbers import format_decimal
-from telegram import Update
+from telegram import InlineKeyboardMarkup, Update
 from telegram.ext import ContextTypes
 
 from src.bot.constants import COMMAND_SETTINGS
 from src.bot.handlers.base_handler import BaseHandler
-from src.i18n import get_localized_language_name, normalize_babel_locale, use_locale
+from src.i18n import (
+    LocaleArtifactCache,
+    get_localized_language_name,
+    normalize_babel_locale,
+    use_locale,
+)
 from src.services.container import ServiceContainer
 from src.utils.config import BOT_NAME
 from src.utils.logger import get_logger
@@ -37,6 +42,9 @@ class SettingsDispatcher(BaseHandler):
         """
         super().__init__(services)
         self.command_name = f"/{COMMAND_SETTINGS}"
+        self._keyboards: LocaleArtifactCache[InlineKeyboardMarkup] = (
+            LocaleArtifactCache(build=self._build_keyboard)
+        )
 
     async def handle(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
@@ -128,7 +136,7 @@ class SettingsDispatcher(BaseHandler):
             await self.send_message(
                 update=update,
                 message_text=template,
-                reply_markup=get_settings_keyboard(pgettext, is_premium=is_premium),
+                reply_markup=self._keyboards.get(lang, is_premium),
             )
             return None
 
@@ -145,3 +153,17 @@ class SettingsDispatcher(BaseHandler):
                 update=update, cmd_context=cmd_context, error_message=error_text
             )
             return None
+
+    @staticmethod
+    def _build_keyboard(lang: str, is_premium: bool) -> InlineKeyboardMarkup:
+        """Build the settings menu keyboard of a language.
+
+        :param lang: Language code of the keyboard
+        :type lang: str
+        :param is_premium: Whether premium only buttons are shown
+        :type is_premium: bool
+        :returns: Inline keyboard markup for the settings menu
+        :rtype: InlineKeyboardMarkup
+        """
+        _, _, pgettext = use_locale(lang=lang)
+        return get_settings_keyboard(pgettext, is_premium=is_premium)
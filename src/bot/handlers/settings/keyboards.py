@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Callable
 
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
@@ -65,8 +66,13 @@ def get_settings_keyboard(
     return InlineKeyboardMarkup(keyboard)
 
 
+@lru_cache(maxsize=1)
 def get_language_keyboard() -> InlineKeyboardMarkup:
-    """Get the language selection keyboard."""
+    """Get the language selection keyboard.
+
+    The language names are not translated, so the frozen markup is built
+    once and shared by every user.
+    """
     keyboard = [
         [InlineKeyboardButton("🇷🇺 Русский", callback_data="language_ru")],
         [InlineKeyboardButton("🇺🇸 English", callback_data="language_en")],
@@ -146,11 +146,52 @@ class LifeExpectancyHandler(AbstractSettingsHandler):
             return
 
         try:
-            # Validate input
             life_expectancy = self._validation_service.validate_life_expectancy(
                 input_str=message_text
             )
+        except CoreValidationError as error:
+            await self.send_life_expectancy_validation_error(update, context, error)
+            return
+        except Exception:
+            # Invalid number format fallback
+            error_message = pgettext(
+                "settings.invalid_life_expectancy",
+                "❌ Invalid life expectancy.\n"
+                "Please enter a value between 50 and 120 years.",
+            )
+            await self.send_error_message(
+                update=update,
+                cmd_context=cmd_context,
+                error_message=error_message,
+            )
+            return
 
+        await self.update_life_expectancy(update, context, life_expectancy)
+
+    async def update_life_expectancy(
+        self,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        life_expectancy: int,
+    ) -> None:
+        """Store a validated life expectancy and confirm it to the user.
+
+        Workflow action of the ``settings_life_expectancy`` state.
+
+        :param update: The update object
+        :type update: Update
+        :param context: The context object
+        :type context: ContextTypes.DEFAULT_TYPE
+        :param life_expectancy: Validated life expectancy in years
+        :type life_expectancy: int
+        :returns: None
+        """
+        cmd_context = await self._extract_command_context(update)
+        user_id = cmd_context.user_id
+        lang = cmd_context.language
+        _, _, pgettext = use_locale(lang=lang)
+
+        try:
             await self._update_and_notify(
                 cmd_context=cmd_context,
                 life_expectancy=life_expectancy,
@@ -169,20 +210,6 @@ class LifeExpectancyHandler(AbstractSettingsHandler):
                 f"Updated life expectancy to {life_expectancy}"
             )
 
-        except CoreValidationError as error:
-            await self._handle_validation_error(
-                update=update,
-                error_key=error.error_key,
-                lang=lang,
-            )
-            return
-
-            await self._clear_waiting_state(user_id=user_id, context=context)
-            logger.info(
-                f"{COMMAND_SETTINGS}: [{user_id}]: "
-                f"Updated life expectancy to {life_expectancy}"
-            )
-
         except (UserNotFoundError, UserSettingsUpdateError) as error:
             logger.error(
                 f"{COMMAND_SETTINGS}: [{user_id}]: "
@@ -199,18 +226,30 @@ class LifeExpectancyHandler(AbstractSettingsHandler):
                 error_message=error_message,
             )
 
-        except Exception:
-            # Invalid number format fallback
-            error_message = pgettext(
-                "settings.invalid_life_expectancy",
-                "❌ Invalid life expectancy.\n"
-                "Please enter a value between 50 and 120 years.",
-            )
-            await self.send_error_message(
-                update=update,
-                cmd_context=cmd_context,
-                error_message=error_message,
-            )
+    async def send_life_expectancy_validation_error(
+        self,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        error: CoreValidationError,
+    ) -> None:
+        """Tell the user that the entered life expectancy was rejected.
+
+        Workflow action of the ``settings_life_expectancy`` state.
+
+        :param update: The update object
+        :type update: Update
+        :param context: The context object
+        :type context: ContextTypes.DEFAULT_TYPE
+        :param error: Validation error raised for the input
+        :type error: CoreValidationError
+        :returns: None
+        """
+        cmd_context = await self._extract_command_context(update)
+        await self._handle_validation_error(
+            update=update,
+            error_key=getattr(error, "error_key", None),
+            lang=cmd_context.language,
+        )
 
     async def _update_and_notify(
         self,
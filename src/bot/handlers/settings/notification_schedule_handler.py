@@ -86,7 +86,6 @@ class NotificationScheduleHandler(AbstractSettingsHandler):
     ) -> None:
         cmd_context = await self._extract_command_context(update)
         user_id = cmd_context.user_id
-        _, _, pgettext = use_locale(lang=cmd_context.language)
 
         if not await self._is_valid_waiting_state(
             user_id=user_id,
@@ -96,20 +95,49 @@ class NotificationScheduleHandler(AbstractSettingsHandler):
             await self._clear_waiting_state(user_id=user_id, context=context)
             return
 
-        raw_text = (update.message.text or "").strip()
-
         try:
-            parsed = self._parse_schedule_input(raw_text)
-        except ValueError:
-            await self.send_message(
-                update=update,
-                message_text=pgettext(
-                    "settings.notification_schedule.invalid",
-                    "❌ Invalid format. Use: daily HH:MM, weekly monday HH:MM, monthly 15 HH:MM.",
-                ),
+            parsed = self.validate_notification_schedule(update.message.text or "")
+        except ValueError as error:
+            await self.send_notification_schedule_validation_error(
+                update, context, error
             )
             return
 
+        await self.update_notification_schedule(update, context, parsed)
+
+    def validate_notification_schedule(self, text: str) -> ParsedNotificationSchedule:
+        """Workflow validator: parse the schedule text, ValueError if invalid."""
+        return self._parse_schedule_input(text.strip())
+
+    async def send_notification_schedule_validation_error(
+        self,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        error: ValueError,
+    ) -> None:
+        """Workflow action: explain the accepted schedule formats."""
+        cmd_context = await self._extract_command_context(update)
+        _, _, pgettext = use_locale(lang=cmd_context.language)
+        await self.send_message(
+            update=update,
+            message_text=pgettext(
+                "settings.notification_schedule.invalid",
+                "❌ Invalid format. Use: daily HH:MM, weekly monday HH:MM, monthly 15 HH:MM.",
+            ),
+        )
+
+    async def update_notification_schedule(
+        self,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        parsed: ParsedNotificationSchedule,
+    ) -> None:
+        """Workflow action: store the parsed schedule and end the conversation."""
+        cmd_context = await self._extract_command_context(update)
+        user_id = cmd_context.user_id
+        _, _, pgettext = use_locale(lang=cmd_context.language)
+        raw_text = (update.message.text or "").strip()
+
         try:
             try:
                 await self.services.user_service.update_user_settings(
@@ -7,14 +7,14 @@ selection and updating of the user's notification timezone.
 import zoneinfo
 from typing import Optional
 
-from telegram import CallbackQuery, Message, Update
+from telegram import CallbackQuery, InlineKeyboardMarkup, Message, Update
 from telegram.ext import ContextTypes
 
 from src.bot.constants import COMMAND_SETTINGS
 from src.bot.conversations.states import ConversationState
 from src.database.service import UserNotFoundError, UserSettingsUpdateError
 from src.events.domain_events import UserSettingsChangedEvent
-from src.i18n import use_locale
+from src.i18n import LocaleArtifactCache, use_locale
 from src.services.container import ServiceContainer
 from src.utils.config import BOT_NAME
 from src.utils.logger import get_logger
@@ -39,6 +39,9 @@ class TimezoneHandler(AbstractSettingsHandler):
         """
         super().__init__(services)
         self.command_name = "settings_timezone"
+        self._keyboards: LocaleArtifactCache[InlineKeyboardMarkup] = (
+            LocaleArtifactCache(build=self._build_keyboard)
+        )
 
     async def handle(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
@@ -83,7 +86,7 @@ class TimezoneHandler(AbstractSettingsHandler):
         await self.edit_message(
             query=query,
             message_text=message_text,
-            reply_markup=get_timezone_keyboard(pgettext),
+            reply_markup=self._keyboards.get(lang),
         )
 
     async def handle_selection_callback(
@@ -294,3 +297,15 @@ class TimezoneHandler(AbstractSettingsHandler):
                 await message.reply_text(error_text)
 
             return None
+
+    @staticmethod
+    def _build_keyboard(lang: str) -> InlineKeyboardMarkup:
+        """Build the timezone selection keyboard of a language.
+
+        :param lang: Language code of the keyboard
+        :type lang: str
+        :returns: Inline keyboard markup for timezone selection
+        :rtype: InlineKeyboardMarkup
+        """
+        _, _, pgettext = use_locale(lang=lang)
+        return get_timezone_keyboard(pgettext)
@@ -40,7 +40,7 @@ from ...database.service import UserRegistrationError, UserServiceError
 from ...services.container import ServiceContainer
 from ...utils.config import BOT_NAME
 from ...utils.logger import get_logger
-from ..conversations.persistence import TelegramContextPersistence
+from ..conversations.persistence import get_state_persistence
 from ..conversations.states import ConversationState
 from .base_handler import BaseHandler, CommandContext
 
@@ -68,7 +68,7 @@ class StartHandler(BaseHandler):
         """
         super().__init__(services)
         self.command_name = f"/{COMMAND_START}"
-        self._persistence = TelegramContextPersistence()
+        self._persistence = get_state_persistence()
         self._validation_service = ValidationService()
 
     async def handle(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -161,30 +161,49 @@ class StartHandler(BaseHandler):
     ) -> None:
         """Process registration input and validation.
 
+        Runs the same actions the registration workflow runs for text
+        input in the ``start_birth_date`` state.
+
         :param update: Telegram update object
         :type update: Update
         :param context: Telegram context object
         :type context: ContextTypes.DEFAULT_TYPE
         :returns: None
         """
-        # Extract user information using the new helper method
-        cmd_context = await self._extract_command_context(update=update)
-        user = cmd_context.user
-        user_id = cmd_context.user_id
-        birth_date_text = update.message.text.strip()
-
-        # For validation errors, use Telegram language since user not registered yet
-        lang = user.language_code or SupportedLanguage.EN.value
-        _, _, pgettext = use_locale(lang)
-        i18n = SimpleI18nAdapter(pgettext)
-        error_messages = ErrorMessages(i18n)
-
         try:
             # Validate birth date using ValidationService
             birth_date = self._validation_service.validate_birth_date(
-                input_str=birth_date_text
+                input_str=update.message.text.strip()
             )
+        except CoreValidationError as error:
+            await self.send_validation_error(update, context, error)
+            return
+
+        await self.create_user_profile(update, context, birth_date)
 
+    async def create_user_profile(
+        self,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        birth_date: date,
+    ) -> None:
+        """Register the user with a validated birth date.
+
+        Registration workflow action for valid birth date input.
+
+        :param update: Telegram update object
+        :type update: Update
+        :param context: Telegram context object
+        :type context: ContextTypes.DEFAULT_TYPE
+        :param birth_date: Validated birth date
+        :type birth_date: date
+        :returns: None
+        """
+        cmd_context = await self._extract_command_context(update=update)
+        user_id = cmd_context.user_id
+        lang, i18n = self._registration_locale(cmd_context=cmd_context)
+
+        try:
             await self._complete_registration(
                 cmd_context=cmd_context,
                 birth_date=birth_date,
@@ -194,14 +213,6 @@ class StartHandler(BaseHandler):
                 i18n=i18n,
             )
 
-        except CoreValidationError as error:
-            await self._handle_validation_error(
-                update=update,
-                error_key=error.error_key,
-                messages=error_messages,
-            )
-            return
-
         except (UserRegistrationError, UserServiceError) as error:
             # Handle all database errors with a single error message
             logger.error(
@@ -229,6 +240,47 @@ class StartHandler(BaseHandler):
             )
             await self._persistence.clear_state(user_id=user_id, context=context)
 
+    async def send_validation_error(
+        self,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        error: Exception,
+    ) -> None:
+        """Explain why the entered birth date was rejected.
+
+        Registration workflow action for invalid birth date input.
+
+        :param update: Telegram update object
+        :type update: Update
+        :param context: Telegram context object
+        :type context: ContextTypes.DEFAULT_TYPE
+        :param error: Validation error of the input
+        :type error: Exception
+        :returns: None
+        """
+        cmd_context = await self._extract_command_context(update=update)
+        _, i18n = self._registration_locale(cmd_context=cmd_context)
+        await self._handle_validation_error(
+            update=update,
+            error_key=getattr(error, "error_key", None),
+            messages=ErrorMessages(i18n),
+        )
+
+    @staticmethod
+    def _registration_locale(
+        cmd_context: CommandContext,
+    ) -> tuple[str, "SimpleI18nAdapter"]:
+        """Return the language used before the user has a profile.
+
+        :param cmd_context: Command context
+        :type cmd_context: CommandContext
+        :returns: Telegram language code and matching i18n adapter
+        :rtype: tuple[str, SimpleI18nAdapter]
+        """
+        lang = cmd_context.user.language_code or SupportedLanguage.EN.value
+        _, _, pgettext = use_locale(lang)
+        return lang, SimpleI18nAdapter(pgettext)
+
     async def _complete_registration(
         self,
         cmd_context: CommandContext,
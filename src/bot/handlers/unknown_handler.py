@@ -10,7 +10,7 @@ from typing import Optional
 from telegram import Update
 from telegram.ext import ContextTypes
 
-from src.i18n import use_locale
+from src.i18n import LocaleArtifactCache, use_locale
 
 from ...services.container import ServiceContainer
 from ...utils.config import BOT_NAME
@@ -43,6 +43,9 @@ class UnknownHandler(BaseHandler):
         """
         super().__init__(services)
         self.command_name = f"/{COMMAND_UNKNOWN}"
+        self._replies: LocaleArtifactCache[str] = LocaleArtifactCache(
+            build=self._build_reply
+        )
 
     async def handle(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
@@ -99,15 +102,24 @@ class UnknownHandler(BaseHandler):
             if profile and profile.settings and profile.settings.language
             else (user.language_code or "en")
         )
-        _, _, pgettext = use_locale(lang=lang)
 
-        message_text = pgettext(
+        await self.send_message(
+            update=update,
+            message_text=self._replies.get(lang),
+        )
+
+    @staticmethod
+    def _build_reply(lang: str) -> str:
+        """Build the unknown command reply of a language.
+
+        :param lang: Language code of the reply
+        :type lang: str
+        :returns: Localized reply
+        :rtype: str
+        """
+        _, _, pgettext = use_locale(lang=lang)
+        return pgettext(
             "unknown.command",
             "❌ Error: Unknown command or message.\n\n"
             "Use /help to get a list of available commands.",
         )
-
-        await self.send_message(
-            update=update,
-            message_text=message_text,
-        )
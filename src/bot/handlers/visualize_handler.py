@@ -11,26 +11,64 @@ The visualization includes:
 - Customizable chart types based on subscription
 """
 
-from typing import Optional
+from typing import Any, Callable, Optional, Tuple
 
-from babel.numbers import format_decimal, format_percent
 from telegram import Update
 from telegram.constants import ParseMode
 from telegram.ext import ContextTypes
 
-from src.i18n import normalize_babel_locale, use_locale
+from src.i18n import get_number_formatter, use_locale
 
+from ...core.dtos import UserProfileDTO
 from ...core.life_calculator import calculate_life_statistics
 from ...services.container import ServiceContainer
+from ...services.stats_renderer import stats_message_renderer
 from ...utils.config import BOT_NAME
 from ...utils.logger import get_logger
+from ...visualization.charts import ChartType, generate_chart
 from ...visualization.grid import generate_visualization
+from ...visualization.layout import GridGranularity
+from ...visualization.vector import VectorFormat, generate_vector_visualization
 from ..constants import COMMAND_VISUALIZE
 from .base_handler import BaseHandler
 
 # Initialize logger for this module
 logger = get_logger(BOT_NAME)
 
+# File name (without extension) of the vector poster document
+VECTOR_POSTER_FILENAME = "life_calendar"
+
+# Caption message (context, msgid) for every granularity
+CAPTION_MESSAGES: dict[GridGranularity, Tuple[str, str]] = {
+    GridGranularity.WEEKS: (
+        "visualize.info",
+        "📊 <b>Visualization of your life weeks</b>\n\n"
+        "🎂 Age: %(age)s years\n"
+        "📅 Weeks lived: %(weeks_lived)s\n"
+        "📈 Life progress: %(life_percentage)s\n\n"
+        "🟩 Green cells = weeks lived\n"
+        "⬜ White cells = future weeks",
+    ),
+    GridGranularity.MONTHS: (
+        "visualize.info_months",
+        "📊 <b>Visualization of your life months</b>\n\n"
+        "🎂 Age: %(age)s years\n"
+        "📅 Months lived: %(months_lived)s\n"
+        "📈 Life progress: %(life_percentage)s\n\n"
+        "🟩 Green cells = months lived\n"
+        "⬜ White cells = future months",
+    ),
+    GridGranularity.YEARS: (
+        "visualize.info_years",
+        "📊 <b>Visualization of your life years</b>\n\n"
+        "🎂 Age: %(age)s years\n"
+        "📅 Years lived: %(years_lived)s\n"
+        "📈 Life progress: %(life_percentage)s\n\n"
+        "🟩 Green cells = years lived\n"
+        "⬜ White cells = future years",
+    ),
+}
+
 
 class VisualizeHandler(BaseHandler):
     """Handler for /visualize command - generate life weeks visualization.
@@ -70,6 +108,11 @@ class VisualizeHandler(BaseHandler):
         4. Generates caption with key statistics
         5. Sends both image and caption to user
 
+        ``/visualize svg`` or ``/visualize pdf`` sends a printable vector
+        poster as a document instead of the image; ``months`` or ``years``
+        switch to a coarser grid. Premium users can request a ``pie``,
+        ``bar`` or ``timeline`` chart instead of the grid.
+
         The visual grid shows:
         - Each cell represents one week
         - Each row represents one year (52 weeks)
@@ -125,32 +168,42 @@ class VisualizeHandler(BaseHandler):
             life_expectancy=profile.settings.life_expectancy or 80,
         )
 
-        caption = pgettext(
-            "visualize.info",
-            "📊 <b>Visualization of your life weeks</b>\n\n"
-            "🎂 Age: %(age)s years\n"
-            "📅 Weeks lived: %(weeks_lived)s\n"
-            "📈 Life progress: %(life_percentage)s\n\n"
-            "🟩 Green cells = weeks lived\n"
-            "⬜ White cells = future weeks",
-        ) % {
-            "age": format_decimal(stats.age, locale=normalize_babel_locale(lang)),
-            "weeks_lived": format_decimal(
-                stats.total_weeks_lived,
-                locale=normalize_babel_locale(lang),
-                format="#,##0",
-            ),
-            "life_percentage": format_percent(
-                stats.percentage_lived,
-                locale=normalize_babel_locale(lang),
-                format="#0.1%",
-            ),
-        }
+        vector_format, granularity = self._parse_visualize_args(context=context)
+        values = stats_message_renderer.format_values(stats=stats, lang=lang)
+        formatter = get_number_formatter(lang)
+        values["months_lived"] = formatter.integer(stats.months_lived)
+        values["years_lived"] = formatter.integer(stats.years_lived)
+        # The caption counts the same unit as the cells of the grid
+        caption = pgettext(*CAPTION_MESSAGES[granularity]) % values
+
+        if vector_format is not None:
+            await self._send_vector_poster(
+                update=update,
+                user=user,
+                caption=caption,
+                output_format=vector_format,
+                granularity=granularity,
+            )
+            return None
+
+        chart_type = self._parse_chart_type(context=context)
+        if chart_type is not None:
+            await self._send_chart(
+                update=update,
+                user=user,
+                is_premium=bool(profile and profile.is_premium),
+                caption=caption,
+                chart_type=chart_type,
+                pgettext=pgettext,
+            )
+            return None
 
         # Generate and send visual representation with caption
         try:
             image_data = await generate_visualization(
-                user_info=user, user_service_instance=self.services.user_service
+                user_info=user,
+                user_service_instance=self.services.user_service,
+                granularity=granularity,
             )
         except Exception as e:
             logger.error(f"Failed to generate visualization: {e}")
@@ -162,3 +215,159 @@ class VisualizeHandler(BaseHandler):
             parse_mode=ParseMode.HTML,
         )
         return None
+
+    async def _send_vector_poster(
+        self,
+        update: Update,
+        user: Any,
+        caption: str,
+        output_format: VectorFormat,
+        granularity: GridGranularity,
+    ) -> None:
+        """Generate the vector life calendar poster and send it as a document.
+
+        :param update: The update object containing the visualize command
+        :type update: Update
+        :param user: Telegram user the poster is generated for
+        :type user: Any
+        :param caption: Localized statistics caption
+        :type caption: str
+        :param output_format: Requested vector document format
+        :type output_format: VectorFormat
+        :param granularity: Time span represented by one cell
+        :type granularity: GridGranularity
+        :returns: None
+        """
+        try:
+            document = await generate_vector_visualization(
+                user_info=user,
+                user_service_instance=self.services.user_service,
+                output_format=output_format,
+                granularity=granularity,
+            )
+        except Exception as e:
+            logger.error(f"Failed to generate vector visualization: {e}")
+            return
+
+        await update.message.reply_document(
+            document=document,
+            filename=f"{VECTOR_POSTER_FILENAME}.{output_format.value}",
+            caption=caption,
+            parse_mode=ParseMode.HTML,
+        )
+
+    async def _send_chart(
+        self,
+        update: Update,
+        user: Any,
+        is_premium: bool,
+        caption: str,
+        chart_type: ChartType,
+        pgettext: Callable,
+    ) -> None:
+        """Generate a premium chart and send it as a photo.
+
+        Users without an active premium subscription get an upgrade hint.
+
+        :param update: The update object containing the visualize command
+        :type update: Update
+        :param user: Telegram user the chart is generated for
+        :type user: Any
+        :param is_premium: Whether the user has an active premium subscription
+        :type is_premium: bool
+        :param caption: Localized statistics caption
+        :type caption: str
+        :param chart_type: Requested chart type
+        :type chart_type: ChartType
+        :param pgettext: Bound pgettext of the user's language
+        :type pgettext: Callable
+        :returns: None
+        """
+        if not is_premium:
+            await self.send_message(
+                update=update,
+                message_text=pgettext(
+                    "visualize.premium_required",
+                    "⭐ Charts are available with a Premium subscription.\n\n"
+                    "Use /subscription to upgrade, or /visualize for your life grid.",
+                ),
+            )
+            return
+
+        try:
+            chart = await generate_chart(
+                user_info=user,
+                user_service_instance=self.services.user_service,
+                chart_type=chart_type,
+            )
+        except Exception as e:
+            logger.error(f"Failed to generate {chart_type} chart: {e}")
+            return
+
+        await update.message.reply_photo(
+            photo=chart,
+            caption=caption,
+            parse_mode=ParseMode.HTML,
+        )
+
+    def _admits(
+        self, profile: UserProfileDTO, context: ContextTypes.DEFAULT_TYPE
+    ) -> bool:
+        """Check that premium charts are only queued for premium users.
+
+        :param profile: Profile of the registered user
+        :type profile: UserProfileDTO
+        :param context: The context object for the command execution
+        :type context: ContextTypes.DEFAULT_TYPE
+        :returns: False if a chart is requested without premium
+        :rtype: bool
+        """
+        return self._parse_chart_type(context=context) is None or bool(
+            profile.is_premium
+        )
+
+    @staticmethod
+    def _parse_chart_type(context: ContextTypes.DEFAULT_TYPE) -> Optional[ChartType]:
+        """Parse the optional premium chart type argument.
+
+        :param context: The context object for the command execution
+        :type context: ContextTypes.DEFAULT_TYPE
+        :returns: Requested chart type or None for the life grid
+        :rtype: Optional[ChartType]
+        """
+        args = getattr(context, "args", None)
+        if not isinstance(args, (list, tuple)):
+            return None
+        for arg in args:
+            value = str(arg).strip().lower()
+            if value in ChartType.__members__.values():
+                return ChartType(value)
+        return None
+
+    @staticmethod
+    def _parse_visualize_args(
+        context: ContextTypes.DEFAULT_TYPE,
+    ) -> Tuple[Optional[VectorFormat], GridGranularity]:
+        """Parse the optional format and granularity command arguments.
+
+        ``svg``/``pdf`` request a vector poster instead of the raster image,
+        ``weeks``/``months``/``years`` select the grid granularity. Arguments
+        may come in any order; unknown ones are ignored.
+
+        :param context: The context object for the command execution
+        :type context: ContextTypes.DEFAULT_TYPE
+        :returns: Tuple of (vector format or None, grid granularity)
+        :rtype: Tuple[Optional[VectorFormat], GridGranularity]
+        """
+        vector_format: Optional[VectorFormat] = None
+        granularity = GridGranularity.WEEKS
+        args = getattr(context, "args", None)
+        if not isinstance(args, (list, tuple)):
+            return vector_format, granularity
+        for arg in args:
+            value = str(arg).strip().lower()
+            if value in VectorFormat.__members__.values():
+                vector_format = VectorFormat(value)
+            elif value in GridGranularity.__members__.values():
+                granularity = GridGranularity(value)
+        return vector_format, granularity
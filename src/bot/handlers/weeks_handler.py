@@ -14,15 +14,15 @@ The statistics include:
 
 from typing import Optional
 
-from babel.numbers import format_decimal, format_percent
 from telegram import Update
 from telegram.ext import ContextTypes
 
-from src.i18n import normalize_babel_locale, use_locale
+from src.i18n import use_locale
 
 from ...constants import DEFAULT_LIFE_EXPECTANCY
 from ...core.life_calculator import calculate_life_statistics
 from ...services.container import ServiceContainer
+from ...services.stats_renderer import stats_message_renderer
 from ...utils.config import BOT_NAME
 from ...utils.logger import get_logger
 from ..constants import COMMAND_WEEKS
@@ -121,39 +121,9 @@ class WeeksHandler(BaseHandler):
             life_expectancy=life_expectancy,
         )
 
-        message_text = pgettext(
-            "weeks.statistics",
-            "📊 <b>Your life statistics:</b>\n\n"
-            "🎂 <b>Age:</b> %(age)s years\n"
-            "📅 <b>Weeks lived:</b> %(weeks_lived)s\n"
-            "⏳ <b>Remaining weeks (until %(life_expectancy)s years):</b> %(remaining_weeks)s\n"
-            "📈 <b>Life progress:</b> %(life_percentage)s\n"
-            "🎉 <b>Days until birthday:</b> %(days_until_birthday)s\n\n"
-            "💡 Use /visualize to visualize your life weeks",
-        ) % {
-            "age": format_decimal(stats.age, locale=normalize_babel_locale(lang)),
-            "weeks_lived": format_decimal(
-                stats.total_weeks_lived,
-                locale=normalize_babel_locale(lang),
-                format="#,##0",
-            ),
-            "life_expectancy": format_decimal(
-                life_expectancy, locale=normalize_babel_locale(lang)
-            ),
-            "remaining_weeks": format_decimal(
-                stats.remaining_weeks,
-                locale=normalize_babel_locale(lang),
-                format="#,##0",
-            ),
-            "life_percentage": format_percent(
-                stats.percentage_lived,
-                locale=normalize_babel_locale(lang),
-                format="#0.1%",
-            ),
-            "days_until_birthday": format_decimal(
-                stats.days_until_birthday, locale=normalize_babel_locale(lang)
-            ),
-        }
+        message_text = stats_message_renderer.render(
+            stats=stats, lang=lang, pgettext=pgettext
+        )
 
         # Generate and send life statistics message
         await self.send_message(
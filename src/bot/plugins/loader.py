@@ -39,6 +39,9 @@ class HandlerConfig:
     :type text_input: str | None
     :ivar waiting_states: List of waiting state identifiers
     :type waiting_states: list[str]
+    :ivar priority: Admission queue priority of an expensive command, lower
+        runs first; None executes the command inline
+    :type priority: int | None
     """
 
     module: str
@@ -47,6 +50,7 @@ class HandlerConfig:
     callbacks: list[dict[str, str]] = field(default_factory=list)
     text_input: str | None = None
     waiting_states: list[str] = field(default_factory=list)
+    priority: int | None = None
 
 
 class PluginLoadError(Exception):
@@ -134,6 +138,7 @@ class PluginLoader:
                     callbacks=handler_data.get("callbacks", []),
                     text_input=handler_data.get("text_input"),
                     waiting_states=handler_data.get("waiting_states", []),
+                    priority=handler_data.get("priority"),
                 )
                 configs.append(config)
                 logger.debug(f"Loaded handler config: {config.command}")
@@ -0,0 +1,265 @@
+"""Single dispatch router for commands, callback queries and text input.
+
+This module provides the UpdateRouter class, one PTB handler that replaces a
+``CommandHandler`` and a regex ``CallbackQueryHandler`` per configured
+callback. Commands are indexed by name and callbacks by exact data or by
+prefix in hash maps built from ``HandlerConfig``, so the cost of routing an
+update does not grow with the number of handler plugins.
+
+Callback patterns from ``config/handlers.yaml`` keep their ``re.match``
+semantics: a literal pattern matches data starting with it and a literal
+followed by ``.*`` is a prefix. Only patterns using other regex syntax are
+matched with regular expressions, after the hash lookups miss.
+
+Unlike PTB, which tries handlers in registration order, the router picks
+the most specific match: the longest literal prefix (an exact match being
+the longest possible one), then regex patterns in registration order.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from telegram import MessageEntity, Update
+from telegram.ext import BaseHandler as PTBBaseHandler
+from telegram.ext import filters
+
+from src.utils.config import BOT_NAME
+from src.utils.logger import get_logger
+
+from .plugins.loader import HandlerConfig
+from .registry import HandlerMethod
+
+logger = get_logger(BOT_NAME)
+
+# Suffix turning a literal callback pattern into an explicit prefix
+WILDCARD_SUFFIX = ".*"
+
+
+@dataclass(frozen=True, slots=True)
+class Route:
+    """Resolved destination of an update.
+
+    :ivar callback: Handler method receiving the update
+    :ivar args: Command arguments, None for non-command updates
+    """
+
+    callback: HandlerMethod
+    args: Optional[list[str]] = None
+
+
+class UpdateRouter(PTBBaseHandler[Update, Any, Any]):
+    """PTB handler routing every configured update with hash lookups.
+
+    :ivar _commands: Command callbacks by lowercase command name
+    :ivar _prefixes: Callback query handlers by callback data prefix
+    :ivar _prefix_lengths: Distinct prefix lengths, longest first
+    :ivar _regex_callbacks: Callbacks whose pattern needs a regular expression
+    :ivar _text_handler: Callback for text messages that are not commands
+    """
+
+    _TEXT_FILTER = filters.TEXT & ~filters.COMMAND
+
+    def __init__(self) -> None:
+        """Initialize an empty router.
+
+        :returns: None
+        """
+        super().__init__(callback=self._dispatch)
+        self._commands: dict[str, HandlerMethod] = {}
+        self._prefixes: dict[str, HandlerMethod] = {}
+        self._prefix_lengths: tuple[int, ...] = ()
+        self._regex_callbacks: list[tuple[re.Pattern[str], HandlerMethod]] = []
+        self._text_handler: Optional[HandlerMethod] = None
+
+    def register(self, config: HandlerConfig, handler: Any) -> None:
+        """Index the command and callbacks of a configured handler.
+
+        :param config: Handler configuration
+        :type config: HandlerConfig
+        :param handler: Handler instance created from the configuration
+        :type handler: Any
+        :returns: None
+        :raises AttributeError: If a configured callback method does not exist
+        """
+        self.add_command(command=config.command, callback=handler.handle)
+        for callback in config.callbacks:
+            self.add_callback(
+                pattern=callback["pattern"],
+                callback=getattr(handler, callback["method"]),
+            )
+
+    def add_command(self, command: str, callback: HandlerMethod) -> None:
+        """Route a command to a callback.
+
+        :param command: Command name (without leading slash)
+        :type command: str
+        :param callback: Handler method for the command
+        :type callback: HandlerMethod
+        :returns: None
+        """
+        self._commands[command.lower()] = callback
+        logger.debug(f"Routed command: /{command}")
+
+    def add_callback(self, pattern: str, callback: HandlerMethod) -> None:
+        """Route callback queries matching a pattern to a callback.
+
+        :param pattern: Callback data pattern from the handler configuration
+        :type pattern: str
+        :param callback: Handler method for matching callback queries
+        :type callback: HandlerMethod
+        :returns: None
+        """
+        literal = pattern.removesuffix(WILDCARD_SUFFIX)
+        if re.escape(literal) != literal:
+            self._regex_callbacks.append((re.compile(pattern), callback))
+        else:
+            # re.match anchors at the start only, so every literal is a prefix
+            self._prefixes.setdefault(literal, callback)
+            self._prefix_lengths = tuple(
+                sorted({len(prefix) for prefix in self._prefixes}, reverse=True)
+            )
+        logger.debug(f"Routed callback pattern: {pattern}")
+
+    def set_text_handler(self, callback: HandlerMethod) -> None:
+        """Route text messages that are not commands to a callback.
+
+        :param callback: Handler method for text input
+        :type callback: HandlerMethod
+        :returns: None
+        """
+        self._text_handler = callback
+
+    def check_update(self, update: object) -> Optional[Route]:
+        """Resolve the route of an update.
+
+        :param update: Incoming update
+        :type update: object
+        :returns: Route of the update, None if no handler is configured for it
+        :rtype: Optional[Route]
+        """
+        if not isinstance(update, Update):
+            return None
+        if update.callback_query is not None:
+            return self._match_callback(update.callback_query.data)
+        if update.effective_message is None:
+            return None
+        command_route = self._match_command(update)
+        if command_route is not None:
+            return command_route
+        if self._text_handler is not None and self._TEXT_FILTER.check_update(update):
+            return Route(callback=self._text_handler)
+        return None
+
+    def collect_additional_context(
+        self,
+        context: Any,
+        update: Update,
+        application: Any,
+        check_result: Route,
+    ) -> None:
+        """Expose command arguments as ``context.args`` like ``CommandHandler``.
+
+        :param context: Callback context of the update
+        :type context: Any
+        :param update: Incoming update
+        :type update: Update
+        :param application: Calling application
+        :type application: Any
+        :param check_result: Route returned by :meth:`check_update`
+        :type check_result: Route
+        :returns: None
+        """
+        if check_result.args is not None:
+            context.args = check_result.args
+
+    async def handle_update(
+        self,
+        update: Update,
+        application: Any,
+        check_result: Route,
+        context: Any,
+    ) -> Any:
+        """Call the handler method of the resolved route.
+
+        :param update: Incoming update
+        :type update: Update
+        :param application: Calling application
+        :type application: Any
+        :param check_result: Route returned by :meth:`check_update`
+        :type check_result: Route
+        :param context: Callback context of the update
+        :type context: Any
+        :returns: Value returned by the handler method
+        :rtype: Any
+        """
+        self.collect_additional_context(context, update, application, check_result)
+        return await check_result.callback(update, context)
+
+    async def _dispatch(self, update: Update, context: Any) -> None:
+        """Satisfy the PTB callback contract; routing uses :meth:`handle_update`.
+
+        :param update: Incoming update
+        :type update: Update
+        :param context: Callback context of the update
+        :type context: Any
+        :returns: None
+        """
+        route = self.check_update(update)
+        if route is not None:
+            await self.handle_update(update, None, route, context)
+
+    def _match_command(self, update: Update) -> Optional[Route]:
+        """Resolve a bot command the way ``CommandHandler`` parses it.
+
+        :param update: Incoming update with a message
+        :type update: Update
+        :returns: Route of a configured command, None otherwise
+        :rtype: Optional[Route]
+        """
+        message = update.effective_message
+        entities = message.entities
+        if not (
+            entities
+            and entities[0].type == MessageEntity.BOT_COMMAND
+            and entities[0].offset == 0
+            and message.text
+            and message.get_bot()
+        ):
+            return None
+
+        name, _, mention = message.text[1 : entities[0].length].partition("@")
+        username = message.get_bot().username
+        if mention and mention.lower() != username.lower():
+            return None
+        callback = self._commands.get(name.lower())
+        if callback is None:
+            return None
+        return Route(callback=callback, args=message.text.split()[1:])
+
+    def _match_callback(self, data: Optional[str]) -> Optional[Route]:
+        """Resolve callback data by longest literal prefix, then regex.
+
+        An exact match is the longest prefix, so it always wins.
+
+        :param data: Callback data of the query
+        :type data: Optional[str]
+        :returns: Route of a configured callback, None otherwise
+        :rtype: Optional[Route]
+        """
+        if not isinstance(data, str):
+            return None
+        callback = next(
+            (
+                self._prefixes[data[:length]]
+                for length in self._prefix_lengths
+                if data[:length] in self._prefixes
+            ),
+            None,
+        )
+        if callback is None:
+            callback = next(
+                (cb for regex, cb in self._regex_callbacks if regex.match(data)),
+                None,
+            )
+        return Route(callback=callback) if callback is not None else None
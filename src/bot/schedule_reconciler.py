@@ -0,0 +1,283 @@
+"""Reconciliation of the scheduler worker's jobs with the database.
+
+The worker keeps its jobs in memory, so after a crash, a restart or lost
+commands its job set can drift from the users' stored settings. This
+module provides the ScheduleReconciler class, which brings them back in
+line without rescheduling every user: it sends one combined digest of the
+desired jobs, and only if the worker's digest differs are the per-job
+digests compared and the differing jobs scheduled or removed.
+
+With several scheduler workers, each worker has its own reconciler that
+only compares the jobs of the users in that worker's shard. The reconcilers
+share a ShardedDesiredJobs, so one pass over all shards reads the users from
+the database once instead of once per shard.
+
+Reconciliation runs periodically, soon after a failed health check, and
+whenever the owner calls :meth:`ScheduleReconciler.reconcile`, e.g. after
+the worker was restarted.
+"""
+
+import asyncio
+import time
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from ..contracts.scheduler_port_protocol import ScheduleTrigger
+from ..scheduler.client import SchedulerClient
+from ..scheduler.digest import combine_digests, job_digest
+from ..scheduler.sharding import shard_for_user
+from ..utils.config import BOT_NAME
+from ..utils.logger import get_logger
+from .notification_schedule import build_notification_trigger
+
+logger = get_logger(BOT_NAME)
+
+# Seconds until a reconciliation skipped for an unhealthy worker is retried
+RETRY_SECONDS = 60
+NOTIFICATION_JOB_PREFIX = "notification_"
+
+
+@dataclass(frozen=True, slots=True)
+class DesiredJob:
+    """Notification job a user should have according to the database.
+
+    :ivar user_id: Telegram user ID
+    :ivar trigger: Trigger built from the user's settings
+    :ivar job_type: Job type, e.g. "weekly_summary"
+    """
+
+    user_id: int
+    trigger: ScheduleTrigger
+    job_type: str
+
+    @property
+    def digest(self) -> str:
+        """Digest the worker reports for this job once it is scheduled."""
+        return job_digest(self.trigger, self.job_type)
+
+
+def desired_jobs(users: list[Any]) -> dict[str, DesiredJob]:
+    """Build the notification jobs the users should have.
+
+    :param users: User profiles
+    :type users: list[Any]
+    :returns: Desired job by job ID
+    :rtype: dict[str, DesiredJob]
+    """
+    jobs: dict[str, DesiredJob] = {}
+    for user in users:
+        if not (
+            user.settings.notifications
+            and user.subscription
+            and user.subscription.is_active
+        ):
+            continue
+        trigger = build_notification_trigger(user.settings)
+        if trigger is None:
+            continue
+        jobs[f"{NOTIFICATION_JOB_PREFIX}{user.telegram_id}"] = DesiredJob(
+            user_id=user.telegram_id,
+            trigger=trigger,
+            job_type=f"{user.settings.notification_frequency}_summary",
+        )
+    return jobs
+
+
+class ShardedDesiredJobs:
+    """Desired jobs of every shard, read from the database once per pass.
+
+    The reconcilers of all shards run at the same interval, so their passes
+    come close together: the first one reads the users and partitions their
+    jobs by shard, and the others take their partition from that read. A
+    shard asking again, or a read older than ``max_age_seconds``, causes a
+    new read, so no reconciler compares against data older than its
+    previous pass.
+
+    :ivar _user_service: Source of the users' settings
+    :ivar _shards: Number of shards
+    :ivar _max_age_seconds: Seconds a read is shared with other shards
+    :ivar _partitions: Desired jobs by shard of the last read
+    :ivar _taken: Shards that got their partition of the last read
+    :ivar _read_at: Monotonic time of the last read
+    :ivar _lock: Lets concurrent passes wait for one read
+    """
+
+    def __init__(
+        self,
+        user_service: Any,
+        shards: int = 1,
+        max_age_seconds: float = RETRY_SECONDS,
+    ) -> None:
+        """Initialize without reading.
+
+        :param user_service: Service providing ``get_all_users``
+        :type user_service: Any
+        :param shards: Number of shards
+        :type shards: int
+        :param max_age_seconds: Seconds a read is shared with other shards
+        :type max_age_seconds: float
+        """
+        self._user_service = user_service
+        self._shards = shards
+        self._max_age_seconds = max_age_seconds
+        self._partitions: list[dict[str, DesiredJob]] = []
+        self._taken: set[int] = set()
+        self._read_at = float("-inf")
+        self._lock = asyncio.Lock()
+
+    async def for_shard(self, shard: int) -> dict[str, DesiredJob]:
+        """Return the jobs the users of a shard should have.
+
+        :param shard: Shard index
+        :type shard: int
+        :returns: Desired job by job ID
+        :rtype: dict[str, DesiredJob]
+        """
+        async with self._lock:
+            if (
+                shard in self._taken
+                or time.monotonic() - self._read_at > self._max_age_seconds
+            ):
+                await self._read()
+            self._taken.add(shard)
+            return self._partitions[shard]
+
+    async def _read(self) -> None:
+        """Read the users and partition their jobs by shard.
+
+        :returns: None
+        """
+        jobs = desired_jobs(await self._user_service.get_all_users())
+        self._partitions = [{} for _ in range(self._shards)]
+        for job_id, job in jobs.items():
+            self._partitions[shard_for_user(job.user_id, self._shards)][job_id] = job
+        self._taken = set()
+        self._read_at = time.monotonic()
+
+
+class ScheduleReconciler:
+    """Periodic, incremental reconciliation of scheduled jobs.
+
+    :ivar _client: Client of the scheduler worker
+    :ivar _desired: Desired jobs of the users, shared by the shards
+    :ivar _interval_seconds: Seconds between reconciliations, 0 disables them
+    :ivar _shard: Shard of the worker, whose jobs alone are compared
+    :ivar _task: Running reconciliation loop
+    """
+
+    def __init__(
+        self,
+        client: SchedulerClient,
+        desired: ShardedDesiredJobs,
+        interval_seconds: int,
+        shard: int = 0,
+    ) -> None:
+        """Initialize the reconciler.
+
+        :param client: Client of the scheduler worker
+        :type client: SchedulerClient
+        :param desired: Desired jobs of the users, shared by the shards
+        :type desired: ShardedDesiredJobs
+        :param interval_seconds: Seconds between reconciliations, 0 for none
+        :type interval_seconds: int
+        :param shard: Shard of the worker the client talks to
+        :type shard: int
+        """
+        self._client = client
+        self._desired = desired
+        self._interval_seconds = interval_seconds
+        self._shard = shard
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def reconcile(self) -> Optional[int]:
+        """Send the worker only the jobs that differ from the database.
+
+        :returns: Jobs scheduled or removed, None if the worker did not answer
+        :rtype: Optional[int]
+        """
+        desired = await self._desired.for_shard(self._shard)
+        digests = {job_id: job.digest for job_id, job in desired.items()}
+        state = await self._client.get_digest(combine_digests(digests))
+        if state is None:
+            logger.warning("Scheduler worker did not report its job digest")
+            return None
+        if state["jobs"] is None:
+            logger.debug(f"Scheduled jobs in sync ({len(desired)} jobs)")
+            return 0
+
+        actual: dict[str, str] = state["jobs"]
+        changed = [
+            job_id for job_id, digest in digests.items() if actual.get(job_id) != digest
+        ]
+        stale = [
+            job_id
+            for job_id in actual
+            if job_id.startswith(NOTIFICATION_JOB_PREFIX) and job_id not in desired
+        ]
+        for job_id in changed:
+            job = desired[job_id]
+            await self._client.schedule_job(
+                job_id=job_id,
+                trigger=job.trigger,
+                user_id=job.user_id,
+                job_type=job.job_type,
+            )
+        for job_id in stale:
+            await self._client.remove_job(job_id)
+        logger.info(
+            f"Reconciled scheduled jobs: {len(changed)} scheduled, "
+            f"{len(stale)} removed of {len(desired)} desired"
+        )
+        return len(changed) + len(stale)
+
+    async def run_once(self) -> bool:
+        """Reconcile if the worker is healthy.
+
+        :returns: True if the jobs were reconciled
+        :rtype: bool
+        """
+        if not await self._client.health_check():
+            logger.warning("Scheduler worker unhealthy, reconciliation postponed")
+            return False
+        try:
+            return await self.reconcile() is not None
+        except Exception as error:
+            logger.error(f"Schedule reconciliation failed: {error}", exc_info=True)
+            return False
+
+    def start(self, retry_soon: bool = False) -> None:
+        """Start reconciling periodically.
+
+        :param retry_soon: Run the first reconciliation after the retry delay,
+            e.g. because the worker just failed its health check
+        :type retry_soon: bool
+        :returns: None
+        """
+        if self._task is None and self._interval_seconds > 0:
+            first_delay = RETRY_SECONDS if retry_soon else self._interval_seconds
+            self._task = asyncio.create_task(self._run(first_delay))
+
+    async def stop(self) -> None:
+        """Stop the reconciliation loop.
+
+        :returns: None
+        """
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+    async def _run(self, delay: float) -> None:
+        """Reconcile every interval, retrying sooner after a failure.
+
+        :param delay: Seconds until the first reconciliation
+        :type delay: float
+        :returns: None
+        """
+        while True:
+            await asyncio.sleep(delay)
+            reconciled = await self.run_once()
+            delay = self._interval_seconds if reconciled else RETRY_SECONDS
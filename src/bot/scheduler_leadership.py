@@ -0,0 +1,223 @@
+"""Election of the one bot process that runs the scheduler.
+
+Every bot process starts its own scheduler workers, so two processes
+sharing a database, e.g. during a rolling deploy, send every notification
+twice. This module provides the SchedulerLeadership class, which lets only
+the process holding the scheduler lease in the database run the workers.
+
+The leader renews its lease several times per lease period, also while
+its workers are still starting and restoring their jobs: starting and
+stopping the scheduler run as background tasks, so a slow start cannot
+let the lease expire under it. When it stops
+renewing, because it crashed, hangs or lost the database, the lease expires
+and another process takes it over and starts its workers. A leader shutting
+down releases the lease, so the next process takes over at its next check.
+Processes that are not the leader have no scheduler client: scheduling
+commands of their users are dropped there, and the leader's periodic
+reconciliation picks the changed settings up from the database.
+"""
+
+import asyncio
+import os
+import socket
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from typing import Optional
+
+from ..database.repositories.abstract.scheduler_lease_repository import (
+    AbstractSchedulerLeaseRepository,
+)
+from ..utils.config import BOT_NAME
+from ..utils.logger import get_logger
+
+logger = get_logger(BOT_NAME)
+
+SCHEDULER_LEASE_NAME = "scheduler"
+# Renewals per lease period, so a few missed renewals don't cost the lease
+RENEWALS_PER_LEASE = 3
+
+
+def default_holder() -> str:
+    """Identify this process among the bot processes sharing the database.
+
+    :returns: Host name and process ID, e.g. "bot-1:4242"
+    :rtype: str
+    """
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class SchedulerLeadership:
+    """Lease-based leader election for running the scheduler.
+
+    :ivar _repository: Storage of the lease
+    :ivar _holder: ID of this process
+    :ivar _ttl_seconds: Seconds a lease lasts unless renewed
+    :ivar _on_elected: Starts the scheduler once the lease is taken
+    :ivar _on_deposed: Stops the scheduler once the lease is lost
+    :ivar _leader: Whether this process holds the lease
+    :ivar _task: Running election loop
+    :ivar _transition: Running start or stop of the scheduler
+    """
+
+    def __init__(
+        self,
+        repository: AbstractSchedulerLeaseRepository,
+        holder: str,
+        ttl_seconds: float,
+        on_elected: Callable[[], Awaitable[None]],
+        on_deposed: Callable[[], Awaitable[None]],
+    ) -> None:
+        """Initialize the election.
+
+        :param repository: Storage of the lease
+        :type repository: AbstractSchedulerLeaseRepository
+        :param holder: ID of this process, unique among the bot processes
+        :type holder: str
+        :param ttl_seconds: Seconds a lease lasts unless renewed
+        :type ttl_seconds: float
+        :param on_elected: Starts the scheduler once the lease is taken
+        :type on_elected: Callable[[], Awaitable[None]]
+        :param on_deposed: Stops the scheduler once the lease is lost
+        :type on_deposed: Callable[[], Awaitable[None]]
+        """
+        self._repository = repository
+        self._holder = holder
+        self._ttl_seconds = ttl_seconds
+        self._on_elected = on_elected
+        self._on_deposed = on_deposed
+        self._leader = False
+        self._task: Optional[asyncio.Task[None]] = None
+        self._transition: Optional[asyncio.Task[None]] = None
+
+    @property
+    def is_leader(self) -> bool:
+        """Whether this process holds the scheduler lease."""
+        return self._leader
+
+    async def check(self) -> bool:
+        """Take or renew the lease, and start or stop the scheduler on changes.
+
+        A failed renewal stops the scheduler right away: the lease may
+        expire before the next renewal, and a second process running the
+        scheduler is worse than a short gap. Starting and stopping run in
+        the background, so the next renewal is not delayed by them.
+
+        :returns: True if this process is the leader
+        :rtype: bool
+        """
+        acquired = await self._repository.acquire_lease(
+            SCHEDULER_LEASE_NAME, self._holder, time.time(), self._ttl_seconds
+        )
+        if acquired and not self._leader:
+            self._leader = True
+            logger.info(f"{self._holder} took the scheduler lease, starting scheduler")
+            self._begin_transition(self._on_elected, cancel_previous=False)
+        elif not acquired and self._leader:
+            self._leader = False
+            logger.warning(
+                f"{self._holder} lost the scheduler lease, stopping scheduler"
+            )
+            # A start still in progress would bring up workers after losing
+            self._begin_transition(self._on_deposed, cancel_previous=True)
+        return self._leader
+
+    def start(self) -> None:
+        """Start taking part in the election.
+
+        :returns: None
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop taking part in the election, keeping the lease if held.
+
+        A scheduler start still in progress is cancelled; the caller stops
+        the scheduler afterwards.
+
+        :returns: None
+        """
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        transition, self._transition = self._transition, None
+        if transition is not None:
+            transition.cancel()
+            with suppress(asyncio.CancelledError):
+                await transition
+
+    async def release(self) -> None:
+        """Give up the lease, once the scheduler has been stopped.
+
+        :returns: None
+        """
+        if not self._leader:
+            return
+        self._leader = False
+        if await self._repository.release_lease(SCHEDULER_LEASE_NAME, self._holder):
+            logger.info(f"{self._holder} released the scheduler lease")
+
+    def _begin_transition(
+        self, callback: Callable[[], Awaitable[None]], cancel_previous: bool
+    ) -> None:
+        """Run a scheduler start or stop after the previous one in the background.
+
+        :param callback: Starts or stops the scheduler
+        :type callback: Callable[[], Awaitable[None]]
+        :param cancel_previous: Whether to cancel the previous transition
+            instead of waiting for it
+        :type cancel_previous: bool
+        :returns: None
+        """
+        self._transition = asyncio.create_task(
+            self._run_transition(self._transition, callback, cancel_previous)
+        )
+
+    async def _run_transition(
+        self,
+        previous: Optional[asyncio.Task[None]],
+        callback: Callable[[], Awaitable[None]],
+        cancel_previous: bool,
+    ) -> None:
+        """Start or stop the scheduler once the previous transition is over.
+
+        :param previous: Previous transition, if any
+        :type previous: Optional[asyncio.Task[None]]
+        :param callback: Starts or stops the scheduler
+        :type callback: Callable[[], Awaitable[None]]
+        :param cancel_previous: Whether to cancel the previous transition
+        :type cancel_previous: bool
+        :returns: None
+        """
+        if previous is not None:
+            if cancel_previous:
+                previous.cancel()
+            try:
+                await asyncio.wait([previous])
+            except asyncio.CancelledError:
+                previous.cancel()
+                raise
+        try:
+            await callback()
+        except Exception as error:
+            logger.error(
+                f"Scheduler {'stop' if cancel_previous else 'start'} failed: {error}",
+                exc_info=True,
+            )
+
+    async def _run(self) -> None:
+        """Check the lease now and several times per lease period.
+
+        :returns: None
+        """
+        while True:
+            try:
+                await self.check()
+            except Exception as error:
+                logger.error(
+                    f"Scheduler leader election failed: {error}", exc_info=True
+                )
+            await asyncio.sleep(self._ttl_seconds / RENEWALS_PER_LEASE)
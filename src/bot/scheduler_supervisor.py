@@ -0,0 +1,128 @@
+"""Supervision of the scheduler worker process.
+
+The scheduler worker runs in its own process; if it dies or hangs, no
+notification is sent until someone restarts the bot. This module provides
+the SchedulerSupervisor class, which checks the worker's liveness at a
+fixed interval and has it restarted when it is gone or its heartbeats
+stopped. Restarts that follow each other quickly wait exponentially longer,
+so a worker failing on start does not spin the bot's CPU.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from typing import Optional
+
+from ..utils.config import BOT_NAME
+from ..utils.logger import get_logger
+
+logger = get_logger(BOT_NAME)
+
+INITIAL_BACKOFF_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 60.0
+
+
+class SchedulerSupervisor:
+    """Liveness checks and restarts with exponential backoff.
+
+    :ivar _is_alive: Whether the worker runs and sends heartbeats
+    :ivar _restart: Replaces the worker, returns whether it came up
+    :ivar _check_interval: Seconds between liveness checks
+    :ivar _name: Name of the worker in log messages
+    :ivar _backoff: Seconds to wait before the next restart
+    :ivar _restarted_at: Monotonic time of the last restart
+    :ivar _restarts: Restarts since start
+    :ivar _task: Running supervision loop
+    """
+
+    def __init__(
+        self,
+        is_alive: Callable[[], bool],
+        restart: Callable[[], Awaitable[bool]],
+        check_interval: float,
+        name: str = "Scheduler worker",
+    ) -> None:
+        """Initialize the supervisor.
+
+        :param is_alive: Returns whether the worker runs and sends heartbeats
+        :type is_alive: Callable[[], bool]
+        :param restart: Replaces the worker, returns whether it came up
+        :type restart: Callable[[], Awaitable[bool]]
+        :param check_interval: Seconds between liveness checks
+        :type check_interval: float
+        :param name: Name of the worker in log messages
+        :type name: str
+        """
+        self._is_alive = is_alive
+        self._restart = restart
+        self._check_interval = check_interval
+        self._name = name
+        self._backoff = INITIAL_BACKOFF_SECONDS
+        self._restarted_at = float("-inf")
+        self._restarts = 0
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def restarts(self) -> int:
+        """Restarts of the worker since the supervisor was started."""
+        return self._restarts
+
+    async def check(self) -> bool:
+        """Restart the worker if it is not alive.
+
+        A worker that stays alive for the longest backoff is considered
+        stable again, and its next restart happens after the initial delay.
+
+        :returns: True if the worker was alive
+        :rtype: bool
+        """
+        if self._is_alive():
+            if time.monotonic() - self._restarted_at > MAX_BACKOFF_SECONDS:
+                self._backoff = INITIAL_BACKOFF_SECONDS
+            return True
+
+        logger.error(
+            f"{self._name} is not responding, restarting in {self._backoff:.0f}s"
+        )
+        await asyncio.sleep(self._backoff)
+        self._backoff = min(self._backoff * 2, MAX_BACKOFF_SECONDS)
+        self._restarted_at = time.monotonic()
+        self._restarts += 1
+        try:
+            if await self._restart():
+                logger.info(f"{self._name} restarted (restart #{self._restarts})")
+            else:
+                logger.error(f"{self._name} did not come up after the restart")
+        except Exception as error:
+            logger.error(f"Failed to restart {self._name}: {error}", exc_info=True)
+        return False
+
+    def start(self) -> None:
+        """Start supervising.
+
+        :returns: None
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop supervising, e.g. before the worker is shut down on purpose.
+
+        :returns: None
+        """
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+    async def _run(self) -> None:
+        """Check the worker every interval.
+
+        :returns: None
+        """
+        while True:
+            await asyncio.sleep(self._check_interval)
+            await self.check()
@@ -0,0 +1,157 @@
+"""Concurrent update processing that keeps every user's updates in order.
+
+This module provides the PerUserUpdateProcessor class, a PTB update
+processor running updates of different users in parallel while updates of
+the same user are processed one after another, in arrival order. The
+conversation state in ``context.user_data`` and the registration flow
+therefore never see two updates of one user at the same time.
+
+Updates wait for their user first and take one of the global processing
+slots afterwards, so a user sending many updates queues behind their own
+updates only instead of occupying every slot. PTB's own limit is taken
+before :meth:`do_process_update` and held while an update waits for its
+user, so it is set out of reach and the processing slots are enforced here.
+"""
+
+import asyncio
+import sys
+from typing import Any, Awaitable, Optional
+
+from telegram import Update
+from telegram.ext import BaseUpdateProcessor
+
+from src.utils.config import BOT_NAME
+from src.utils.logger import get_logger
+
+logger = get_logger(BOT_NAME)
+
+# Limit of PTB's semaphore; a lower one would let a single backlogged user
+# hold every admission while their updates wait for each other
+ADMITTED_UPDATES_LIMIT = sys.maxsize
+
+
+class PerUserUpdateProcessor(BaseUpdateProcessor):
+    """Update processor with a global limit and per-user serialization.
+
+    :ivar _processing: Global limit of updates processed at the same time
+    :ivar _processing_limit: Size of the global limit
+    :ivar _locks: Lock serializing the updates of each user
+    :ivar _depths: Updates of each user waiting or being processed
+    :ivar _depth_warning: Per-user depth from which a warning is logged
+    """
+
+    __slots__ = (
+        "_processing",
+        "_processing_limit",
+        "_locks",
+        "_depths",
+        "_depth_warning",
+    )
+
+    def __init__(self, max_concurrent_updates: int, depth_warning: int = 5) -> None:
+        """Initialize the processor.
+
+        :param max_concurrent_updates: Updates processed at the same time
+        :type max_concurrent_updates: int
+        :param depth_warning: Per-user queue depth from which a warning is logged
+        :type depth_warning: int
+        :raises ValueError: If max_concurrent_updates is not positive
+        """
+        if max_concurrent_updates < 1:
+            raise ValueError("`max_concurrent_updates` must be a positive integer!")
+        super().__init__(ADMITTED_UPDATES_LIMIT)
+        self._processing = asyncio.Semaphore(max_concurrent_updates)
+        self._processing_limit = max_concurrent_updates
+        self._locks: dict[int, asyncio.Lock] = {}
+        self._depths: dict[int, int] = {}
+        self._depth_warning = depth_warning
+
+    @property
+    def processing_limit(self) -> int:
+        """Updates processed at the same time across all users."""
+        return self._processing_limit
+
+    def queue_depth(self, user_id: int) -> int:
+        """Return the updates of a user waiting or being processed.
+
+        :param user_id: Telegram user ID
+        :type user_id: int
+        :returns: Queue depth of the user
+        :rtype: int
+        """
+        return self._depths.get(user_id, 0)
+
+    def queue_depths(self) -> dict[int, int]:
+        """Return a snapshot of the queue depth of every active user.
+
+        :returns: Queue depth by Telegram user ID
+        :rtype: dict[int, int]
+        """
+        return dict(self._depths)
+
+    async def do_process_update(
+        self, update: object, coroutine: Awaitable[Any]
+    ) -> None:
+        """Process an update after the earlier updates of its user.
+
+        :param update: The update to be processed
+        :type update: object
+        :param coroutine: Coroutine processing the update
+        :type coroutine: Awaitable[Any]
+        :returns: None
+        """
+        user_id = self._user_key(update)
+        if user_id is None:
+            async with self._processing:
+                await coroutine
+            return
+
+        depth = self._depths.get(user_id, 0) + 1
+        self._depths[user_id] = depth
+        if depth >= self._depth_warning:
+            logger.warning(f"Update queue of user {user_id} is {depth} deep")
+        lock = self._locks.setdefault(user_id, asyncio.Lock())
+        try:
+            async with lock, self._processing:
+                await coroutine
+        finally:
+            self._release(user_id)
+
+    async def initialize(self) -> None:
+        """Nothing to allocate; locks are created per user on demand."""
+
+    async def shutdown(self) -> None:
+        """Report users whose updates were still queued on shutdown."""
+        if self._depths:
+            logger.warning(f"Shutting down with queued updates: {self._depths}")
+
+    def _release(self, user_id: int) -> None:
+        """Account for a finished update and forget idle users.
+
+        :param user_id: Telegram user ID
+        :type user_id: int
+        :returns: None
+        """
+        depth = self._depths[user_id] - 1
+        if depth:
+            self._depths[user_id] = depth
+            return
+        del self._depths[user_id]
+        del self._locks[user_id]
+
+    @staticmethod
+    def _user_key(update: object) -> Optional[int]:
+        """Return the ID updates are serialized by, the user or else the chat.
+
+        :param update: The update to be processed
+        :type update: object
+        :returns: Serialization key, None for updates without user and chat
+        :rtype: Optional[int]
+        """
+        if not isinstance(update, Update):
+            return None
+        if update.effective_user is not None:
+            return update.effective_user.id
+        if update.effective_chat is not None:
+            return update.effective_chat.id
+        return None
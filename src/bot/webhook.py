@@ -0,0 +1,333 @@
+"""Embedded HTTP endpoint receiving Telegram updates in webhook mode.
+
+This module provides the WebhookServer class, a small HTTP/1.1 server on top
+of ``asyncio`` streams. Telegram POSTs every update as JSON to the configured
+path. Each request is checked against the ``X-Telegram-Bot-Api-Secret-Token``
+header, put into the PTB update queue and acknowledged with 200 at once;
+processing happens afterwards in the application. As the endpoint faces the
+internet, slow or idle connections are closed after a read timeout, the
+number of open connections is capped, and oversized header lines are
+answered with 431. The same endpoint accepts
+recorded ``Update`` JSON POSTed locally, e.g.::
+
+    curl -X POST http://127.0.0.1:8080/telegram \\
+        -H "X-Telegram-Bot-Api-Secret-Token: $WEBHOOK_SECRET_TOKEN" \\
+        -H "Content-Type: application/json" -d @update.json
+"""
+
+import asyncio
+import hmac
+import json
+from contextlib import suppress
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Any, Optional
+
+from telegram import Update
+from telegram.ext import Application
+
+from src.utils.config import (
+    BOT_NAME,
+    WEBHOOK_MAX_BODY_BYTES,
+    WEBHOOK_MAX_CONNECTIONS,
+    WEBHOOK_READ_TIMEOUT_SECONDS,
+)
+from src.utils.logger import get_logger
+
+logger = get_logger(BOT_NAME)
+
+SECRET_TOKEN_HEADER = "x-telegram-bot-api-secret-token"
+MAX_HEADER_COUNT = 100
+
+
+@dataclass(slots=True)
+class WebhookRequest:
+    """Parsed HTTP request.
+
+    :ivar method: Request method in upper case
+    :ivar path: Request path without the query string
+    :ivar headers: Header values by lowercase name
+    :ivar body: Request body
+    :ivar keep_alive: Whether the client keeps the connection open
+    """
+
+    method: str
+    path: str
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    keep_alive: bool = True
+
+
+class WebhookServer:
+    """HTTP endpoint feeding POSTed updates into the application update queue.
+
+    :ivar _application: Application whose update queue receives the updates
+    :ivar _listen: Interface the server binds to
+    :ivar _port: Requested port, 0 picks a free one
+    :ivar _path: URL path Telegram POSTs to
+    :ivar _secret_token: Expected value of the secret token header
+    :ivar _max_body_bytes: Largest accepted request body
+    :ivar _read_timeout: Seconds to read a request or wait for the next one
+    :ivar _max_connections: Connections served at the same time
+    :ivar _connections: Connections being served
+    :ivar _server: Running asyncio server
+    """
+
+    def __init__(
+        self,
+        application: Application,
+        *,
+        listen: str,
+        port: int,
+        path: str,
+        secret_token: str,
+        max_body_bytes: int = WEBHOOK_MAX_BODY_BYTES,
+        read_timeout: float = WEBHOOK_READ_TIMEOUT_SECONDS,
+        max_connections: int = WEBHOOK_MAX_CONNECTIONS,
+    ) -> None:
+        """Initialize the server without binding it.
+
+        :param application: Application whose update queue receives the updates
+        :type application: Application
+        :param listen: Interface to bind to
+        :type listen: str
+        :param port: Port to bind to, 0 picks a free one
+        :type port: int
+        :param path: URL path Telegram POSTs to
+        :type path: str
+        :param secret_token: Expected value of the secret token header
+        :type secret_token: str
+        :param max_body_bytes: Largest accepted request body
+        :type max_body_bytes: int
+        :param read_timeout: Seconds to read a request or wait for the next one
+        :type read_timeout: float
+        :param max_connections: Connections served at the same time
+        :type max_connections: int
+        :raises ValueError: If the secret token is empty
+        """
+        if not secret_token:
+            raise ValueError("Webhook mode requires WEBHOOK_SECRET_TOKEN to be set")
+        self._application = application
+        self._listen = listen
+        self._port = port
+        self._path = "/" + path.lstrip("/")
+        self._secret_token = secret_token.encode()
+        self._max_body_bytes = max_body_bytes
+        self._read_timeout = read_timeout
+        self._max_connections = max_connections
+        self._connections = 0
+        self._server: Optional[asyncio.Server] = None
+
+    @property
+    def port(self) -> int:
+        """Port the server is bound to, the requested one before start."""
+        if self._server is None or not self._server.sockets:
+            return self._port
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self) -> None:
+        """Bind the server and start accepting connections.
+
+        :returns: None
+        """
+        self._server = await asyncio.start_server(
+            self._handle_connection, host=self._listen, port=self._port
+        )
+        logger.info(f"Webhook endpoint listening on {self._listen}:{self.port}")
+
+    async def stop(self) -> None:
+        """Stop accepting connections and close the server.
+
+        :returns: None
+        """
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+        logger.info("Webhook endpoint stopped")
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve a connection unless the connection limit is reached.
+
+        :param reader: Stream of the client connection
+        :type reader: asyncio.StreamReader
+        :param writer: Writer of the client connection
+        :type writer: asyncio.StreamWriter
+        :returns: None
+        """
+        if self._connections >= self._max_connections:
+            logger.warning(f"Rejected webhook connection, {self._connections} are open")
+            writer.write(
+                _build_response(status=HTTPStatus.SERVICE_UNAVAILABLE, keep_alive=False)
+            )
+            await _close(writer)
+            return
+
+        self._connections += 1
+        try:
+            await self._serve(reader, writer)
+        finally:
+            self._connections -= 1
+            await _close(writer)
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve the requests of one, possibly kept alive, connection.
+
+        :param reader: Stream of the client connection
+        :type reader: asyncio.StreamReader
+        :param writer: Writer of the client connection
+        :type writer: asyncio.StreamWriter
+        :returns: None
+        """
+        try:
+            while True:
+                request = await asyncio.wait_for(
+                    self._read_request(reader), self._read_timeout
+                )
+                if request is None:
+                    break
+                status = (
+                    self._accept(request)
+                    if isinstance(request, WebhookRequest)
+                    else request
+                )
+                keep_alive = (
+                    isinstance(request, WebhookRequest)
+                    and request.keep_alive
+                    and status is not HTTPStatus.BAD_REQUEST
+                )
+                writer.write(_build_response(status=status, keep_alive=keep_alive))
+                await asyncio.wait_for(writer.drain(), self._read_timeout)
+                if not keep_alive:
+                    break
+        except asyncio.TimeoutError:
+            logger.debug("Webhook connection timed out")
+        except (asyncio.IncompleteReadError, ConnectionError) as error:
+            logger.debug(f"Webhook connection closed: {error}")
+
+    async def _read_request(
+        self, reader: asyncio.StreamReader
+    ) -> WebhookRequest | HTTPStatus | None:
+        """Read one request from the connection.
+
+        :param reader: Stream of the client connection
+        :type reader: asyncio.StreamReader
+        :returns: Parsed request, an error status for malformed or oversized
+            requests, or None when the client closed the connection
+        :rtype: WebhookRequest | HTTPStatus | None
+        """
+        try:
+            request_line = await reader.readline()
+            if not request_line.strip():
+                return None
+            parts = request_line.decode("latin-1").split()
+            if len(parts) != 3:
+                return HTTPStatus.BAD_REQUEST
+            method, target, version = parts
+
+            headers: dict[str, str] = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, separator, value = line.decode("latin-1").partition(":")
+                if not separator or len(headers) >= MAX_HEADER_COUNT:
+                    return HTTPStatus.BAD_REQUEST
+                headers[name.strip().lower()] = value.strip()
+        except ValueError:
+            # A line longer than the stream's buffer limit
+            return HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE
+
+        length = headers.get("content-length", "0")
+        if not length.isdigit():
+            return HTTPStatus.BAD_REQUEST
+        if int(length) > self._max_body_bytes:
+            return HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+
+        connection = headers.get("connection", "").lower()
+        return WebhookRequest(
+            method=method.upper(),
+            path=target.split("?", 1)[0],
+            headers=headers,
+            body=await reader.readexactly(int(length)),
+            keep_alive=(
+                connection != "close"
+                if version == "HTTP/1.1"
+                else connection == "keep-alive"
+            ),
+        )
+
+    def _accept(self, request: WebhookRequest) -> HTTPStatus:
+        """Validate a request and enqueue its update.
+
+        :param request: Parsed request
+        :type request: WebhookRequest
+        :returns: Response status
+        :rtype: HTTPStatus
+        """
+        if request.path != self._path:
+            return HTTPStatus.NOT_FOUND
+        if request.method != "POST":
+            return HTTPStatus.METHOD_NOT_ALLOWED
+        secret = request.headers.get(SECRET_TOKEN_HEADER, "").encode()
+        if not hmac.compare_digest(secret, self._secret_token):
+            logger.warning("Rejected webhook request with an invalid secret token")
+            return HTTPStatus.FORBIDDEN
+
+        update = self._parse_update(request.body)
+        if update is None:
+            return HTTPStatus.BAD_REQUEST
+        self._application.update_queue.put_nowait(update)
+        return HTTPStatus.OK
+
+    def _parse_update(self, body: bytes) -> Optional[Update]:
+        """Deserialize an update from a request body.
+
+        :param body: JSON request body
+        :type body: bytes
+        :returns: Update, None if the body is not a valid update
+        :rtype: Optional[Update]
+        """
+        try:
+            data: Any = json.loads(body)
+            if not isinstance(data, dict):
+                raise ValueError("Update JSON must be an object")
+            return Update.de_json(data, self._application.bot)
+        except (ValueError, TypeError, KeyError) as error:
+            logger.warning(f"Rejected malformed webhook update: {error}")
+            return None
+
+
+async def _close(writer: asyncio.StreamWriter) -> None:
+    """Close a client connection.
+
+    :param writer: Writer of the client connection
+    :type writer: asyncio.StreamWriter
+    :returns: None
+    """
+    writer.close()
+    with suppress(ConnectionError):
+        await writer.wait_closed()
+
+
+def _build_response(status: HTTPStatus, keep_alive: bool) -> bytes:
+    """Build an HTTP response without a body.
+
+    :param status: Response status
+    :type status: HTTPStatus
+    :param keep_alive: Whether the connection stays open
+    :type keep_alive: bool
+    :returns: Encoded response
+    :rtype: bytes
+    """
+    connection = "keep-alive" if keep_alive else "close"
+    return (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        f"Content-Length: 0\r\n"
+        f"Connection: {connection}\r\n\r\n"
+    ).encode("latin-1")
@@ -38,7 +38,7 @@ class I18nServiceProtocol(Protocol):
         Callable[[str, str, int], str],
         Callable[[str, str], str],
     ]:
-        """Install and return translation functions for the specified language.
+        """Return translation functions for the specified language.
 
         :param lang: Language code (e.g., 'en', 'ru')
         :type lang: str
@@ -129,6 +129,15 @@ class SchedulerPortProtocol(Protocol):
         """
         ...
 
+    def add_fire_listener(self, listener: Callable[[str], None]) -> None:
+        """Call a listener with the job ID after each run of a job.
+
+        :param listener: Function receiving the ID of the job that ran
+        :type listener: Callable[[str], None]
+        :returns: None
+        """
+        ...
+
     def start(self) -> None:
         """Start the scheduler.
 
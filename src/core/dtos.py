@@ -89,3 +89,19 @@ class UserProfileDTO:
             in (SubscriptionType.PREMIUM, SubscriptionType.TRIAL)
             and self.subscription.is_active
         )
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UserLifeEventDTO:
+    """Immutable DTO for a user's life event.
+
+    :param id: Life event primary key
+    :param event_date: Date the event happened
+    :param label: Short description of the event
+    :param color: Optional "#rrggbb" color of the event cell
+    """
+
+    id: int
+    event_date: date
+    label: str
+    color: Optional[str]
@@ -90,6 +90,20 @@ class LifeCalculationResult:
             return 0.0
         return min(1.0, self.total_weeks_lived / self.total_weeks_expected)
 
+    @cached_property
+    def months_lived(self) -> int:
+        """Calculate complete calendar months lived since birth.
+
+        :returns: Total number of complete months lived
+        :rtype: int
+        """
+        months = (self.reference_date.year - self.birth_date.year) * 12 + (
+            self.reference_date.month - self.birth_date.month
+        )
+        if self.reference_date.day < self.birth_date.day:
+            months -= 1
+        return max(0, months)
+
     @cached_property
     def years_lived(self) -> int:
         """Calculate years component of weeks lived.
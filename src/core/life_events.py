@@ -0,0 +1,90 @@
+"""Week index of user life events.
+
+Life events are drawn on the life grid, which is addressed by the number of
+weeks since birth. :class:`LifeEventIndex` groups a user's events by that
+week number once, so rendering only has to look at weeks that carry events.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date
+from types import MappingProxyType
+from typing import Iterable, Iterator, Mapping
+
+from .dtos import UserLifeEventDTO
+
+
+def week_of_life(birth_date: date, event_date: date) -> int:
+    """Return the zero based week of life a date falls into.
+
+    Uses the same complete-week arithmetic as
+    :attr:`LifeCalculationResult.total_weeks_lived`.
+
+    :param birth_date: User's birth date
+    :type birth_date: date
+    :param event_date: Date to locate
+    :type event_date: date
+    :returns: Week number; negative for dates before birth
+    :rtype: int
+    """
+    return (event_date - birth_date).days // 7
+
+
+@dataclass(frozen=True, slots=True)
+class LifeEventIndex:
+    """Immutable index of a user's life events by week of life.
+
+    :ivar birth_date: Birth date the week numbers are relative to
+    :ivar by_week: Events grouped by week number, in date order
+    """
+
+    birth_date: date
+    by_week: Mapping[int, tuple[UserLifeEventDTO, ...]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+
+    @classmethod
+    def build(
+        cls, birth_date: date, events: Iterable[UserLifeEventDTO]
+    ) -> "LifeEventIndex":
+        """Group events by week of life.
+
+        Events dated before the birth date cannot be placed on the grid
+        and are left out.
+
+        :param birth_date: User's birth date
+        :type birth_date: date
+        :param events: Life events of the user
+        :type events: Iterable[UserLifeEventDTO]
+        :returns: Index of the events
+        :rtype: LifeEventIndex
+        """
+        grouped: dict[int, list[UserLifeEventDTO]] = {}
+        for event in sorted(events, key=lambda item: (item.event_date, item.id)):
+            week = week_of_life(birth_date=birth_date, event_date=event.event_date)
+            if week >= 0:
+                grouped.setdefault(week, []).append(event)
+        return cls(
+            birth_date=birth_date,
+            by_week=MappingProxyType(
+                {week: tuple(items) for week, items in grouped.items()}
+            ),
+        )
+
+    def __len__(self) -> int:
+        """Return the number of indexed events."""
+        return sum(len(items) for items in self.by_week.values())
+
+    def __iter__(self) -> Iterator[UserLifeEventDTO]:
+        """Iterate over all indexed events in date order."""
+        for week in sorted(self.by_week):
+            yield from self.by_week[week]
+
+    def events_in_week(self, week: int) -> tuple[UserLifeEventDTO, ...]:
+        """Return the events of a week of life.
+
+        :param week: Zero based week number
+        :type week: int
+        :returns: Events in that week, empty if there are none
+        :rtype: tuple[UserLifeEventDTO, ...]
+        """
+        return self.by_week.get(week, ())
@@ -77,6 +77,7 @@ HELP_MAIN_DEFAULT: Final[str] = (
     "• /start - Registration and settings\n"
     "• /weeks - Show life weeks\n"
     "• /visualize - Visualize life weeks\n"
+    "• /events - Life events on the grid\n"
     "• /settings - Settings\n"
     "• /subscription - Subscription\n"
     "• /help - This help\n\n"
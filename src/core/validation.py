@@ -4,11 +4,13 @@ This module provides Pydantic models for user input validation, replacing
 ad-hoc validation logic in handlers.
 """
 
+import re
 from datetime import date, datetime
-from typing import Annotated
+from typing import Annotated, Optional
 
 from pydantic import BaseModel, BeforeValidator, field_validator
 
+from src.database.constants import MAX_LIFE_EVENT_LABEL_LENGTH
 from src.utils.config import (
     MAX_LIFE_EXPECTANCY,
     MIN_BIRTH_YEAR,
@@ -22,6 +24,12 @@ ERROR_DATE_TOO_OLD = "date_too_old"
 ERROR_INVALID_NUMBER = "invalid_number"
 ERROR_VALUE_TOO_LOW = "value_too_low"
 ERROR_VALUE_TOO_HIGH = "value_too_high"
+ERROR_LABEL_REQUIRED = "label_required"
+ERROR_LABEL_TOO_LONG = "label_too_long"
+ERROR_INVALID_COLOR = "invalid_color"
+
+# "#rrggbb" color of a life event
+EVENT_COLOR_PATTERN = re.compile(r"^#[0-9a-fA-F]{6}$")
 
 
 def parse_dd_mm_yyyy_date(v: str | date) -> date:
@@ -99,3 +107,54 @@ class LifeExpectancyInput(BaseModel):
         if v > MAX_LIFE_EXPECTANCY:
             raise ValueError(ERROR_VALUE_TOO_HIGH)
         return v
+
+
+class LifeEventInput(BaseModel):
+    """Pydantic model for life event validation.
+
+    :ivar event_date: Date the event happened
+    :type event_date: CustomDate
+    :ivar label: Short description of the event
+    :type label: str
+    :ivar color: Optional "#rrggbb" color, stored lowercase
+    :type color: Optional[str]
+    """
+
+    event_date: CustomDate
+    label: str
+    color: Optional[str] = None
+
+    @field_validator("label")
+    @classmethod
+    def validate_label(cls, v: str) -> str:
+        """Validate the event label.
+
+        :param v: input value
+        :type v: str
+        :returns: stripped label
+        :rtype: str
+        :raises ValueError: if the label is empty or too long
+        """
+        v = v.strip()
+        if not v:
+            raise ValueError(ERROR_LABEL_REQUIRED)
+        if len(v) > MAX_LIFE_EVENT_LABEL_LENGTH:
+            raise ValueError(ERROR_LABEL_TOO_LONG)
+        return v
+
+    @field_validator("color")
+    @classmethod
+    def validate_color(cls, v: Optional[str]) -> Optional[str]:
+        """Validate the optional event color.
+
+        :param v: input value
+        :type v: Optional[str]
+        :returns: lowercase color or None
+        :rtype: Optional[str]
+        :raises ValueError: if the color is not in "#rrggbb" format
+        """
+        if v is None:
+            return None
+        if not EVENT_COLOR_PATTERN.match(v):
+            raise ValueError(ERROR_INVALID_COLOR)
+        return v.lower()
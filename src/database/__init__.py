@@ -4,9 +4,11 @@ Exports database repositories and services.
 """
 
 from .repositories import (
+    AbstractUserLifeEventRepository,
     AbstractUserRepository,
     AbstractUserSettingsRepository,
     AbstractUserSubscriptionRepository,
+    SQLiteUserLifeEventRepository,
     SQLiteUserRepository,
     SQLiteUserSettingsRepository,
     SQLiteUserSubscriptionRepository,
@@ -17,8 +19,10 @@ __all__ = [
     "AbstractUserRepository",
     "AbstractUserSettingsRepository",
     "AbstractUserSubscriptionRepository",
+    "AbstractUserLifeEventRepository",
     # SQLite implementations
     "SQLiteUserRepository",
     "SQLiteUserSettingsRepository",
     "SQLiteUserSubscriptionRepository",
+    "SQLiteUserLifeEventRepository",
 ]
@@ -11,12 +11,21 @@ DEFAULT_DATABASE_PATH = "lifeweeks.db"  # Default SQLite database filename
 USERS_TABLE = "users"  # Main users table name
 USER_SETTINGS_TABLE = "user_settings"  # User settings table name
 USER_SUBSCRIPTIONS_TABLE = "user_subscriptions"  # User subscriptions table name
+USER_LIFE_EVENTS_TABLE = "user_life_events"  # User life events table name
+CONVERSATION_STATES_TABLE = "conversation_states"  # Pending conversation states
+SCHEDULER_LEASES_TABLE = "scheduler_leases"  # Leases electing the scheduling replica
 
 # Column constraints
 MAX_USERNAME_LENGTH = 255  # Maximum length for Telegram username
 MAX_FIRST_NAME_LENGTH = 255  # Maximum length for user's first name
 MAX_LAST_NAME_LENGTH = 255  # Maximum length for user's last name
 MAX_TIMEZONE_LENGTH = 100  # Maximum length for timezone identifier
+MAX_LIFE_EVENT_LABEL_LENGTH = 100  # Maximum length for a life event label
+LIFE_EVENT_COLOR_LENGTH = 7  # Length of a "#rrggbb" life event color
+MAX_CONVERSATION_STATE_LENGTH = 64  # Maximum length of a conversation state name
+CONVERSATION_STATE_ID_LENGTH = 36  # Length of a UUID4 conversation state ID
+MAX_LEASE_NAME_LENGTH = 64  # Maximum length of a lease name
+MAX_LEASE_HOLDER_LENGTH = 255  # Maximum length of a lease holder ID (host:pid)
 
 # Default values
 
@@ -4,10 +4,16 @@ __all__ = [
     "User",
     "UserSettings",
     "UserSubscription",
+    "UserLifeEvent",
+    "ConversationStateRecord",
+    "SchedulerLease",
     "Base",
 ]
 
 from .base import Base
+from .conversation_state import ConversationStateRecord
+from .scheduler_lease import SchedulerLease
 from .user import User
+from .user_life_event import UserLifeEvent
 from .user_settings import UserSettings
 from .user_subscription import UserSubscription
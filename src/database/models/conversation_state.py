@@ -0,0 +1,46 @@
+"""Conversation state model for the database state backend.
+
+This module defines the ConversationStateRecord model which stores the
+pending conversation state of a user (e.g. waiting for the birth date) so
+that every bot process sharing the database sees the same state.
+"""
+
+from typing import Any, Optional
+
+from sqlalchemy import JSON, Float, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..constants import (
+    CONVERSATION_STATE_ID_LENGTH,
+    CONVERSATION_STATES_TABLE,
+    MAX_CONVERSATION_STATE_LENGTH,
+)
+from .base import Base
+
+
+class ConversationStateRecord(Base):
+    """Pending conversation state of a user.
+
+    There is no foreign key to the users table: the state of the
+    registration flow exists before the user does.
+
+    :param telegram_id: Telegram user ID
+    :param state: Conversation state value (ConversationState.value)
+    :param state_id: Unique ID of this state, changes with every new state
+    :param updated_at: Unix timestamp the state was set at, indexed for sweeping
+    :param context_data: Optional conversation context data
+    """
+
+    __tablename__ = CONVERSATION_STATES_TABLE
+
+    telegram_id: Mapped[int] = mapped_column(
+        Integer, primary_key=True, autoincrement=False
+    )
+    state: Mapped[str] = mapped_column(
+        String(MAX_CONVERSATION_STATE_LENGTH), nullable=False
+    )
+    state_id: Mapped[str] = mapped_column(
+        String(CONVERSATION_STATE_ID_LENGTH), nullable=False
+    )
+    updated_at: Mapped[float] = mapped_column(Float, nullable=False, index=True)
+    context_data: Mapped[Optional[dict[str, Any]]] = mapped_column(JSON, nullable=True)
@@ -0,0 +1,31 @@
+"""Scheduler lease model for leader election between bot replicas.
+
+This module defines the SchedulerLease model. When several bot processes
+share the database, the process holding an unexpired lease is the only one
+running scheduler workers, so every notification is sent once.
+"""
+
+from sqlalchemy import Float, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..constants import (
+    MAX_LEASE_HOLDER_LENGTH,
+    MAX_LEASE_NAME_LENGTH,
+    SCHEDULER_LEASES_TABLE,
+)
+from .base import Base
+
+
+class SchedulerLease(Base):
+    """Time-limited ownership of a role by one bot process.
+
+    :param name: Name of the role, e.g. "scheduler"
+    :param holder: ID of the process holding the lease
+    :param expires_at: Unix timestamp the lease expires at unless renewed
+    """
+
+    __tablename__ = SCHEDULER_LEASES_TABLE
+
+    name: Mapped[str] = mapped_column(String(MAX_LEASE_NAME_LENGTH), primary_key=True)
+    holder: Mapped[str] = mapped_column(String(MAX_LEASE_HOLDER_LENGTH), nullable=False)
+    expires_at: Mapped[float] = mapped_column(Float, nullable=False)
@@ -52,3 +52,6 @@ class User(Base):
     subscription: Mapped["UserSubscription"] = relationship(
         back_populates="user", uselist=False, cascade="all, delete-orphan"
     )
+    life_events: Mapped[list["UserLifeEvent"]] = relationship(
+        back_populates="user", cascade="all, delete-orphan"
+    )
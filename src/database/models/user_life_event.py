@@ -0,0 +1,53 @@
+"""User life event model for grid annotations.
+
+This module defines the UserLifeEvent model which stores dated life events
+(e.g. graduation, wedding) that are highlighted on the life grid.
+"""
+
+from datetime import UTC, date, datetime
+from typing import Optional
+
+from sqlalchemy import Date, DateTime, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from ..constants import (
+    LIFE_EVENT_COLOR_LENGTH,
+    MAX_LIFE_EVENT_LABEL_LENGTH,
+    USER_LIFE_EVENTS_TABLE,
+    USERS_TABLE,
+)
+from .base import Base
+
+
+class UserLifeEvent(Base):
+    """User life event model for storing dated grid annotations.
+
+    :param telegram_id: Telegram user ID (foreign key to User)
+    :param event_date: Date the event happened
+    :param label: Short description of the event
+    :param color: Optional "#rrggbb" color of the event cell
+    :param created_at: Event creation date
+    """
+
+    __tablename__ = USER_LIFE_EVENTS_TABLE
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    telegram_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey(f"{USERS_TABLE}.telegram_id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    event_date: Mapped[date] = mapped_column(Date, nullable=False)
+    label: Mapped[str] = mapped_column(
+        String(MAX_LIFE_EVENT_LABEL_LENGTH), nullable=False
+    )
+    color: Mapped[Optional[str]] = mapped_column(
+        String(LIFE_EVENT_COLOR_LENGTH), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=lambda: datetime.now(UTC)
+    )
+
+    # Relationship
+    user: Mapped["User"] = relationship(back_populates="life_events")
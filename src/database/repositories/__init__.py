@@ -6,11 +6,17 @@ for different database backends.
 
 from .abstract import (
     AbstractBaseRepository,
+    AbstractConversationStateRepository,
+    AbstractSchedulerLeaseRepository,
+    AbstractUserLifeEventRepository,
     AbstractUserRepository,
     AbstractUserSettingsRepository,
     AbstractUserSubscriptionRepository,
 )
 from .sqlite import (
+    SQLiteConversationStateRepository,
+    SQLiteSchedulerLeaseRepository,
+    SQLiteUserLifeEventRepository,
     SQLiteUserRepository,
     SQLiteUserSettingsRepository,
     SQLiteUserSubscriptionRepository,
@@ -22,8 +28,14 @@ __all__ = [
     "AbstractUserRepository",
     "AbstractUserSettingsRepository",
     "AbstractUserSubscriptionRepository",
+    "AbstractUserLifeEventRepository",
+    "AbstractConversationStateRepository",
+    "AbstractSchedulerLeaseRepository",
     # SQLite implementations
     "SQLiteUserRepository",
     "SQLiteUserSettingsRepository",
     "SQLiteUserSubscriptionRepository",
+    "SQLiteUserLifeEventRepository",
+    "SQLiteConversationStateRepository",
+    "SQLiteSchedulerLeaseRepository",
 ]
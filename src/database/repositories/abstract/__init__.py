@@ -1,6 +1,9 @@
 """Abstract repository interfaces."""
 
 from .base_repository import AbstractBaseRepository
+from .conversation_state_repository import AbstractConversationStateRepository
+from .scheduler_lease_repository import AbstractSchedulerLeaseRepository
+from .user_life_event_repository import AbstractUserLifeEventRepository
 from .user_repository import AbstractUserRepository
 from .user_settings_repository import AbstractUserSettingsRepository
 from .user_subscription_repository import AbstractUserSubscriptionRepository
@@ -10,4 +13,7 @@ __all__ = [
     "AbstractUserRepository",
     "AbstractUserSettingsRepository",
     "AbstractUserSubscriptionRepository",
+    "AbstractUserLifeEventRepository",
+    "AbstractConversationStateRepository",
+    "AbstractSchedulerLeaseRepository",
 ]
@@ -0,0 +1,59 @@
+"""Abstract repository interface for conversation state operations.
+
+Defines the contract for conversation state storage operations
+that can be implemented by different database backends.
+"""
+
+from abc import abstractmethod
+from typing import Optional, Sequence
+
+from ...models.conversation_state import ConversationStateRecord
+from .base_repository import AbstractBaseRepository
+
+
+class AbstractConversationStateRepository(AbstractBaseRepository):
+    """Abstract base class for conversation state repository operations.
+
+    Defines the interface for conversation state storage that can be implemented
+    by different database backends (SQLite, PostgreSQL, etc.)
+    """
+
+    @abstractmethod
+    async def get_state(self, telegram_id: int) -> Optional[ConversationStateRecord]:
+        """Get the conversation state of a user.
+
+        :param telegram_id: Telegram user ID
+        :type telegram_id: int
+        :returns: Conversation state if stored, None otherwise
+        :rtype: Optional[ConversationStateRecord]
+        """
+
+    @abstractmethod
+    async def save_states(self, states: Sequence[ConversationStateRecord]) -> bool:
+        """Insert or replace the conversation states of several users at once.
+
+        :param states: Conversation states, at most one per user
+        :type states: Sequence[ConversationStateRecord]
+        :returns: True if successful, False otherwise
+        :rtype: bool
+        """
+
+    @abstractmethod
+    async def delete_states(self, telegram_ids: Sequence[int]) -> bool:
+        """Delete the conversation states of several users at once.
+
+        :param telegram_ids: Telegram user IDs
+        :type telegram_ids: Sequence[int]
+        :returns: True if successful, False otherwise
+        :rtype: bool
+        """
+
+    @abstractmethod
+    async def delete_expired_states(self, updated_before: float) -> int:
+        """Delete all conversation states set before a point in time.
+
+        :param updated_before: Unix timestamp; older states are deleted
+        :type updated_before: float
+        :returns: Number of deleted states
+        :rtype: int
+        """
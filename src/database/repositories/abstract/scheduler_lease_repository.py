@@ -0,0 +1,47 @@
+"""Abstract repository interface for scheduler lease operations.
+
+Defines the contract for lease storage operations used to elect the one
+bot process that runs the scheduler, implementable by different backends.
+"""
+
+from abc import abstractmethod
+
+from .base_repository import AbstractBaseRepository
+
+
+class AbstractSchedulerLeaseRepository(AbstractBaseRepository):
+    """Abstract base class for scheduler lease repository operations.
+
+    Defines the interface for lease storage that can be implemented
+    by different database backends (SQLite, PostgreSQL, etc.)
+    """
+
+    @abstractmethod
+    async def acquire_lease(
+        self, name: str, holder: str, now: float, ttl_seconds: float
+    ) -> bool:
+        """Take or renew a lease unless another holder's lease is unexpired.
+
+        :param name: Name of the lease
+        :type name: str
+        :param holder: ID of the process asking for the lease
+        :type holder: str
+        :param now: Current Unix timestamp
+        :type now: float
+        :param ttl_seconds: Seconds the lease lasts from now
+        :type ttl_seconds: float
+        :returns: True if the holder owns the lease now
+        :rtype: bool
+        """
+
+    @abstractmethod
+    async def release_lease(self, name: str, holder: str) -> bool:
+        """Give up a lease, if the holder still owns it.
+
+        :param name: Name of the lease
+        :type name: str
+        :param holder: ID of the process giving up the lease
+        :type holder: str
+        :returns: True if the lease was released
+        :rtype: bool
+        """
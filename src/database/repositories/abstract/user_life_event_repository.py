@@ -0,0 +1,60 @@
+"""Abstract repository interface for user life event operations.
+
+Defines the contract for life event storage operations
+that can be implemented by different database backends.
+"""
+
+from abc import abstractmethod
+
+from ...models.user_life_event import UserLifeEvent
+from .base_repository import AbstractBaseRepository
+
+
+class AbstractUserLifeEventRepository(AbstractBaseRepository):
+    """Abstract base class for user life event repository operations.
+
+    Defines the interface for life event storage that can be implemented
+    by different database backends (SQLite, PostgreSQL, etc.)
+    """
+
+    @abstractmethod
+    async def create_life_event(self, event: UserLifeEvent) -> bool:
+        """Create a new life event.
+
+        :param event: UserLifeEvent object to create
+        :type event: UserLifeEvent
+        :returns: True if successful, False otherwise
+        :rtype: bool
+        """
+
+    @abstractmethod
+    async def get_life_events(self, telegram_id: int) -> list[UserLifeEvent]:
+        """Get all life events of a user ordered by event date.
+
+        :param telegram_id: Telegram user ID
+        :type telegram_id: int
+        :returns: List of the user's life events
+        :rtype: list[UserLifeEvent]
+        """
+
+    @abstractmethod
+    async def delete_life_event(self, telegram_id: int, event_id: int) -> bool:
+        """Delete a single life event of a user.
+
+        :param telegram_id: Telegram user ID owning the event
+        :type telegram_id: int
+        :param event_id: Life event primary key
+        :type event_id: int
+        :returns: True if the event was deleted, False otherwise
+        :rtype: bool
+        """
+
+    @abstractmethod
+    async def delete_life_events(self, telegram_id: int) -> bool:
+        """Delete all life events of a user.
+
+        :param telegram_id: Telegram user ID
+        :type telegram_id: int
+        :returns: True if any event was deleted, False otherwise
+        :rtype: bool
+        """
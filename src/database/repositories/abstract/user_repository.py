@@ -5,7 +5,7 @@ that can be implemented by different database backends.
 """
 
 from abc import abstractmethod
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from ...models.user import User
 from .base_repository import AbstractBaseRepository
@@ -39,6 +39,16 @@ class AbstractUserRepository(AbstractBaseRepository):
         :rtype: Optional[User]
         """
 
+    @abstractmethod
+    def iter_user_ids(self, batch_size: int = 1000) -> AsyncIterator[int]:
+        """Stream the Telegram IDs of all users.
+
+        :param batch_size: IDs fetched from the database at a time
+        :type batch_size: int
+        :returns: Async iterator over Telegram user IDs
+        :rtype: AsyncIterator[int]
+        """
+
     @abstractmethod
     async def delete_user(self, telegram_id: int) -> bool:
         """Delete user and all associated data.
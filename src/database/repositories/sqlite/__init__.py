@@ -1,5 +1,8 @@
 """SQLite repository implementations."""
 
+from .conversation_state_repository import SQLiteConversationStateRepository
+from .scheduler_lease_repository import SQLiteSchedulerLeaseRepository
+from .user_life_event_repository import SQLiteUserLifeEventRepository
 from .user_repository import SQLiteUserRepository
 from .user_settings_repository import SQLiteUserSettingsRepository
 from .user_subscription_repository import SQLiteUserSubscriptionRepository
@@ -8,4 +11,7 @@ __all__ = [
     "SQLiteUserRepository",
     "SQLiteUserSettingsRepository",
     "SQLiteUserSubscriptionRepository",
+    "SQLiteUserLifeEventRepository",
+    "SQLiteConversationStateRepository",
+    "SQLiteSchedulerLeaseRepository",
 ]
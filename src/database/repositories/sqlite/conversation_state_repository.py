@@ -0,0 +1,132 @@
+"""SQLite implementation of conversation state repository.
+
+Provides SQLite-based async implementation of AbstractConversationStateRepository
+for storing pending conversation states in SQLite database.
+"""
+
+import logging
+from typing import Optional, Sequence
+
+from sqlalchemy import delete
+from sqlalchemy.dialects.sqlite import insert
+
+from ....utils.config import BOT_NAME
+from ...models.conversation_state import ConversationStateRecord
+from ..abstract.conversation_state_repository import (
+    AbstractConversationStateRepository,
+)
+from .base_repository import BaseSQLiteRepository
+
+logger = logging.getLogger(BOT_NAME)
+
+
+class SQLiteConversationStateRepository(
+    BaseSQLiteRepository, AbstractConversationStateRepository
+):
+    """SQLite async implementation of conversation state repository.
+
+    Handles all async database operations for conversation states using SQLite as the backend storage.
+    """
+
+    async def get_state(self, telegram_id: int) -> Optional[ConversationStateRecord]:
+        """Get the conversation state of a user.
+
+        :param telegram_id: Telegram user ID
+        :type telegram_id: int
+        :returns: Conversation state if stored, None otherwise
+        :rtype: Optional[ConversationStateRecord]
+        """
+        return await self._get_entity_by_telegram_id(
+            model_class=ConversationStateRecord,
+            telegram_id=telegram_id,
+            entity_name="conversation state",
+        )
+
+    async def save_states(self, states: Sequence[ConversationStateRecord]) -> bool:
+        """Insert or replace the conversation states of several users at once.
+
+        All states are written by one upsert statement in one transaction.
+
+        :param states: Conversation states, at most one per user
+        :type states: Sequence[ConversationStateRecord]
+        :returns: True if successful, False otherwise
+        :rtype: bool
+        """
+        if not states:
+            return True
+        rows = [
+            {
+                "telegram_id": state.telegram_id,
+                "state": state.state,
+                "state_id": state.state_id,
+                "updated_at": state.updated_at,
+                "context_data": state.context_data,
+            }
+            for state in states
+        ]
+        try:
+            async with self.async_session() as session:
+                stmt = insert(ConversationStateRecord).values(rows)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[ConversationStateRecord.telegram_id],
+                    set_={
+                        "state": stmt.excluded.state,
+                        "state_id": stmt.excluded.state_id,
+                        "updated_at": stmt.excluded.updated_at,
+                        "context_data": stmt.excluded.context_data,
+                    },
+                )
+                await session.execute(stmt)
+                return True
+
+        except Exception as e:
+            logger.error(f"Failed to save {len(rows)} conversation states: {e}")
+            return False
+
+    async def delete_states(self, telegram_ids: Sequence[int]) -> bool:
+        """Delete the conversation states of several users at once.
+
+        :param telegram_ids: Telegram user IDs
+        :type telegram_ids: Sequence[int]
+        :returns: True if successful, False otherwise
+        :rtype: bool
+        """
+        if not telegram_ids:
+            return True
+        try:
+            async with self.async_session() as session:
+                stmt = delete(ConversationStateRecord).where(
+                    ConversationStateRecord.telegram_id.in_(telegram_ids)
+                )
+                await session.execute(stmt)
+                return True
+
+        except Exception as e:
+            logger.error(
+                f"Failed to delete {len(telegram_ids)} conversation states: {e}"
+            )
+            return False
+
+    async def delete_expired_states(self, updated_before: float) -> int:
+        """Delete all conversation states set before a point in time.
+
+        :param updated_before: Unix timestamp; older states are deleted
+        :type updated_before: float
+        :returns: Number of deleted states
+        :rtype: int
+        """
+        try:
+            async with self.async_session() as session:
+                stmt = delete(ConversationStateRecord).where(
+                    ConversationStateRecord.updated_at < updated_before
+                )
+                result = await session.execute(stmt)
+                if result.rowcount:
+                    logger.info(
+                        f"Deleted {result.rowcount} expired conversation states"
+                    )
+                return result.rowcount
+
+        except Exception as e:
+            logger.error(f"Failed to delete expired conversation states: {e}")
+            return 0
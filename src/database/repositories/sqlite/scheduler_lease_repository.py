@@ -0,0 +1,95 @@
+"""SQLite implementation of scheduler lease repository.
+
+Provides SQLite-based async implementation of AbstractSchedulerLeaseRepository
+for electing the bot process that runs the scheduler.
+"""
+
+import logging
+
+from sqlalchemy import delete, or_, select
+from sqlalchemy.dialects.sqlite import insert
+
+from ....utils.config import BOT_NAME
+from ...models.scheduler_lease import SchedulerLease
+from ..abstract.scheduler_lease_repository import AbstractSchedulerLeaseRepository
+from .base_repository import BaseSQLiteRepository
+
+logger = logging.getLogger(BOT_NAME)
+
+
+class SQLiteSchedulerLeaseRepository(
+    BaseSQLiteRepository, AbstractSchedulerLeaseRepository
+):
+    """SQLite async implementation of scheduler lease repository.
+
+    Handles all async database operations for scheduler leases using SQLite as the backend storage.
+    """
+
+    async def acquire_lease(
+        self, name: str, holder: str, now: float, ttl_seconds: float
+    ) -> bool:
+        """Take or renew a lease unless another holder's lease is unexpired.
+
+        The conditional upsert and the read of the resulting holder run in
+        one transaction, and SQLite serializes writers, so two processes
+        can never both own the lease.
+
+        :param name: Name of the lease
+        :type name: str
+        :param holder: ID of the process asking for the lease
+        :type holder: str
+        :param now: Current Unix timestamp
+        :type now: float
+        :param ttl_seconds: Seconds the lease lasts from now
+        :type ttl_seconds: float
+        :returns: True if the holder owns the lease now, False if another
+            holder does or the database failed
+        :rtype: bool
+        """
+        try:
+            async with self.async_session() as session:
+                stmt = insert(SchedulerLease).values(
+                    name=name, holder=holder, expires_at=now + ttl_seconds
+                )
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[SchedulerLease.name],
+                    set_={
+                        "holder": stmt.excluded.holder,
+                        "expires_at": stmt.excluded.expires_at,
+                    },
+                    where=or_(
+                        SchedulerLease.holder == holder,
+                        SchedulerLease.expires_at <= now,
+                    ),
+                )
+                await session.execute(stmt)
+                owner = await session.scalar(
+                    select(SchedulerLease.holder).where(SchedulerLease.name == name)
+                )
+                return owner == holder
+
+        except Exception as e:
+            logger.error(f"Failed to acquire lease {name}: {e}")
+            return False
+
+    async def release_lease(self, name: str, holder: str) -> bool:
+        """Give up a lease, if the holder still owns it.
+
+        :param name: Name of the lease
+        :type name: str
+        :param holder: ID of the process giving up the lease
+        :type holder: str
+        :returns: True if the lease was released
+        :rtype: bool
+        """
+        try:
+            async with self.async_session() as session:
+                stmt = delete(SchedulerLease).where(
+                    SchedulerLease.name == name, SchedulerLease.holder == holder
+                )
+                result = await session.execute(stmt)
+                return bool(result.rowcount)
+
+        except Exception as e:
+            logger.error(f"Failed to release lease {name}: {e}")
+            return False
@@ -0,0 +1,108 @@
+"""SQLite implementation of user life event repository.
+
+Provides SQLite-based async implementation of AbstractUserLifeEventRepository
+for storing user life events in SQLite database.
+"""
+
+import logging
+
+from sqlalchemy import delete, select
+
+from ....utils.config import BOT_NAME
+from ...models.user_life_event import UserLifeEvent
+from ..abstract.user_life_event_repository import AbstractUserLifeEventRepository
+from .base_repository import BaseSQLiteRepository
+
+logger = logging.getLogger(BOT_NAME)
+
+
+class SQLiteUserLifeEventRepository(
+    BaseSQLiteRepository, AbstractUserLifeEventRepository
+):
+    """SQLite async implementation of user life event repository.
+
+    Handles all async database operations for life events using SQLite as the backend storage.
+    """
+
+    async def create_life_event(self, event: UserLifeEvent) -> bool:
+        """Create a new life event.
+
+        :param event: UserLifeEvent object to create
+        :type event: UserLifeEvent
+        :returns: True if successful, False otherwise
+        :rtype: bool
+        """
+        return await self._create_entity(
+            entity=event,
+            entity_name=f"life event for user {event.telegram_id}",
+        )
+
+    async def get_life_events(self, telegram_id: int) -> list[UserLifeEvent]:
+        """Get all life events of a user ordered by event date.
+
+        :param telegram_id: Telegram user ID
+        :type telegram_id: int
+        :returns: List of the user's life events
+        :rtype: list[UserLifeEvent]
+        """
+        try:
+            async with self.async_session() as session:
+                stmt = (
+                    select(UserLifeEvent)
+                    .where(UserLifeEvent.telegram_id == telegram_id)
+                    .order_by(UserLifeEvent.event_date, UserLifeEvent.id)
+                )
+                result = await session.execute(stmt)
+                events = list(result.scalars().all())
+                for event in events:
+                    self._detach_instance(session, event)
+                return events
+
+        except Exception as e:
+            logger.error(f"Failed to get life events for user {telegram_id}: {e}")
+            return []
+
+    async def delete_life_event(self, telegram_id: int, event_id: int) -> bool:
+        """Delete a single life event of a user.
+
+        :param telegram_id: Telegram user ID owning the event
+        :type telegram_id: int
+        :param event_id: Life event primary key
+        :type event_id: int
+        :returns: True if the event was deleted, False otherwise
+        :rtype: bool
+        """
+        try:
+            async with self.async_session() as session:
+                stmt = delete(UserLifeEvent).where(
+                    UserLifeEvent.id == event_id,
+                    UserLifeEvent.telegram_id == telegram_id,
+                )
+                result = await session.execute(stmt)
+
+                if result.rowcount > 0:
+                    logger.info(f"Deleted life event {event_id} of user {telegram_id}")
+                    return True
+                else:
+                    logger.warning(
+                        f"Life event {event_id} of user {telegram_id} not found"
+                    )
+                    return False
+
+        except Exception as e:
+            logger.error(f"Failed to delete life event {event_id}: {e}")
+            return False
+
+    async def delete_life_events(self, telegram_id: int) -> bool:
+        """Delete all life events of a user.
+
+        :param telegram_id: Telegram user ID
+        :type telegram_id: int
+        :returns: True if any event was deleted, False otherwise
+        :rtype: bool
+        """
+        return await self._delete_entity_by_telegram_id(
+            model_class=UserLifeEvent,
+            telegram_id=telegram_id,
+            entity_name="life events",
+        )
@@ -5,7 +5,9 @@ for storing user data in SQLite database.
 """
 
 import logging
-from typing import Optional
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import select
 
 from ....utils.config import BOT_NAME
 from ...models.user import User
@@ -48,6 +50,23 @@ class SQLiteUserRepository(BaseSQLiteRepository, AbstractUserRepository):
             entity_name="user",
         )
 
+    async def iter_user_ids(self, batch_size: int = 1000) -> AsyncIterator[int]:
+        """Stream the Telegram IDs of all users.
+
+        IDs are fetched in batches, so the whole table is never loaded.
+
+        :param batch_size: IDs fetched from the database at a time
+        :type batch_size: int
+        :returns: Async iterator over Telegram user IDs
+        :rtype: AsyncIterator[int]
+        """
+        async with self.async_session() as session:
+            result = await session.stream_scalars(
+                select(User.telegram_id).execution_options(yield_per=batch_size)
+            )
+            async for telegram_id in result:
+                yield telegram_id
+
     async def delete_user(self, telegram_id: int) -> bool:
         """Delete user and all associated data.
 
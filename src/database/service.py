@@ -5,6 +5,7 @@ working with models and repositories to handle complex operations.
 """
 
 import threading
+from collections import OrderedDict
 from datetime import UTC, date, datetime, time, timedelta
 from typing import Any, Optional
 
@@ -18,15 +19,31 @@ from ..constants import (
     DEFAULT_NOTIFICATIONS_TIME,
     DEFAULT_TIMEZONE,
 )
-from ..core.dtos import UserProfileDTO, UserSettingsDTO, UserSubscriptionDTO
+from ..core.dtos import (
+    UserLifeEventDTO,
+    UserProfileDTO,
+    UserSettingsDTO,
+    UserSubscriptionDTO,
+)
+from ..core.life_events import LifeEventIndex
 from ..utils.config import BOT_NAME
 from ..utils.logger import get_logger
 from .models.user import User
+from .models.user_life_event import UserLifeEvent
 from .models.user_settings import UserSettings
 from .models.user_subscription import (
     DEFAULT_SUBSCRIPTION_EXPIRATION_DAYS,
     UserSubscription,
 )
+from .repositories.sqlite.conversation_state_repository import (
+    SQLiteConversationStateRepository,
+)
+from .repositories.sqlite.scheduler_lease_repository import (
+    SQLiteSchedulerLeaseRepository,
+)
+from .repositories.sqlite.user_life_event_repository import (
+    SQLiteUserLifeEventRepository,
+)
 from .repositories.sqlite.user_repository import SQLiteUserRepository
 from .repositories.sqlite.user_settings_repository import SQLiteUserSettingsRepository
 from .repositories.sqlite.user_subscription_repository import (
@@ -35,6 +52,9 @@ from .repositories.sqlite.user_subscription_repository import (
 
 logger = get_logger(f"{BOT_NAME}.DatabaseService")
 
+# Number of per-user life event indexes kept in memory
+LIFE_EVENT_INDEX_CACHE_SIZE = 1024
+
 
 class DatabaseManager:
     """Manager for database repositories (repositories are already singletons).
@@ -85,10 +105,20 @@ class DatabaseManager:
             self.subscription_repository = SQLiteUserSubscriptionRepository(
                 db_path=db_path
             )
+            self.life_event_repository = SQLiteUserLifeEventRepository(db_path=db_path)
+            self.conversation_state_repository = SQLiteConversationStateRepository(
+                db_path=db_path
+            )
+            self.scheduler_lease_repository = SQLiteSchedulerLeaseRepository(
+                db_path=db_path
+            )
         else:
             self.user_repository = SQLiteUserRepository()
             self.settings_repository = SQLiteUserSettingsRepository()
             self.subscription_repository = SQLiteUserSubscriptionRepository()
+            self.life_event_repository = SQLiteUserLifeEventRepository()
+            self.conversation_state_repository = SQLiteConversationStateRepository()
+            self.scheduler_lease_repository = SQLiteSchedulerLeaseRepository()
 
         # Mark as initialized to prevent re-initialization on subsequent __init__ calls
         self._initialized = True
@@ -102,6 +132,9 @@ class DatabaseManager:
         await self.user_repository.initialize()
         await self.settings_repository.initialize()
         await self.subscription_repository.initialize()
+        await self.life_event_repository.initialize()
+        await self.conversation_state_repository.initialize()
+        await self.scheduler_lease_repository.initialize()
 
     async def close(self) -> None:
         """Close all database connections.
@@ -112,6 +145,9 @@ class DatabaseManager:
         await self.user_repository.close()
         await self.settings_repository.close()
         await self.subscription_repository.close()
+        await self.life_event_repository.close()
+        await self.conversation_state_repository.close()
+        await self.scheduler_lease_repository.close()
 
     @classmethod
     def reset_instance(cls) -> None:
@@ -123,6 +159,9 @@ class DatabaseManager:
         SQLiteUserRepository.reset_instances()
         SQLiteUserSettingsRepository.reset_instances()
         SQLiteUserSubscriptionRepository.reset_instances()
+        SQLiteUserLifeEventRepository.reset_instances()
+        SQLiteConversationStateRepository.reset_instances()
+        SQLiteSchedulerLeaseRepository.reset_instances()
         cls._instance = None
 
 
@@ -206,6 +245,16 @@ class UserSubscriptionUpdateError(UserServiceError):
     pass
 
 
+class UserLifeEventError(UserServiceError):
+    """Exception raised when a life event operation fails.
+
+    This exception is raised when the system fails to store
+    a user's life event in the database.
+    """
+
+    pass
+
+
 class UserService:
     """Service for managing user data in the database."""
 
@@ -214,6 +263,7 @@ class UserService:
         user_repository: Optional[SQLiteUserRepository] = None,
         settings_repository: Optional[SQLiteUserSettingsRepository] = None,
         subscription_repository: Optional[SQLiteUserSubscriptionRepository] = None,
+        life_event_repository: Optional[SQLiteUserLifeEventRepository] = None,
     ) -> None:
         """Initialize user service.
 
@@ -223,6 +273,8 @@ class UserService:
         :type settings_repository: Optional[SQLiteUserSettingsRepository]
         :param subscription_repository: User subscription repository instance
         :type subscription_repository: Optional[SQLiteUserSubscriptionRepository]
+        :param life_event_repository: User life event repository instance
+        :type life_event_repository: Optional[SQLiteUserLifeEventRepository]
         """
         # Use DatabaseManager to get singleton repositories
         db_manager = DatabaseManager()
@@ -231,6 +283,13 @@ class UserService:
         self.subscription_repository = (
             subscription_repository or db_manager.subscription_repository
         )
+        self.life_event_repository = (
+            life_event_repository or db_manager.life_event_repository
+        )
+        # Per-user week index of life events, invalidated on every change
+        self._life_event_indexes: OrderedDict[int, LifeEventIndex] = OrderedDict()
+        # Telegram IDs of registered users, None until loaded
+        self._registered_ids: Optional[set[int]] = None
 
     async def initialize(self) -> None:
         """Initialize database connections.
@@ -250,6 +309,43 @@ class UserService:
         db_manager = DatabaseManager()
         await db_manager.close()
 
+    async def load_registered_users(self) -> int:
+        """Load the IDs of all registered users for cheap negative lookups.
+
+        Afterwards profile lookups of users outside the set return at once
+        without touching the database. The set is kept up to date by this
+        service's create and delete methods, so it must only be loaded in
+        the process that registers and deletes users.
+
+        :returns: Number of registered users
+        :rtype: int
+        """
+        try:
+            registered = {
+                telegram_id
+                async for telegram_id in self.user_repository.iter_user_ids()
+            }
+        except Exception as e:
+            logger.error(f"Failed to load registered users: {e}")
+            self._registered_ids = None
+            return 0
+        self._registered_ids = registered
+        logger.info(f"Loaded {len(registered)} registered users")
+        return len(registered)
+
+    def is_known_unregistered(self, telegram_id: int) -> bool:
+        """Check whether a user is definitely not registered.
+
+        :param telegram_id: Telegram user ID
+        :type telegram_id: int
+        :returns: True if the registered users are loaded and the user is not
+            one of them, False if the database has to be asked
+        :rtype: bool
+        """
+        return (
+            self._registered_ids is not None and telegram_id not in self._registered_ids
+        )
+
     async def create_user_profile(
         self,
         user_info: Any,  # Usually a telegram.User or mock
@@ -358,6 +454,8 @@ class UserService:
 
                 # All operations successful
                 logger.info(f"Created complete user profile for {user_info.id}")
+                if self._registered_ids is not None:
+                    self._registered_ids.add(user_info.id)
                 return await self.get_user_profile(telegram_id=user_info.id)
             else:
                 logger.error(f"Failed to create user {user_info.id}")
@@ -416,6 +514,18 @@ class UserService:
             None if user, settings, or subscription are missing
         :rtype: Optional[UserProfileDTO]
         """
+        if self.is_known_unregistered(telegram_id):
+            return None
+        return await self._load_user_profile(telegram_id=telegram_id)
+
+    async def _load_user_profile(self, telegram_id: int) -> Optional[UserProfileDTO]:
+        """Read a user with settings and subscription from the database.
+
+        :param telegram_id: Telegram user ID
+        :type telegram_id: int
+        :returns: User DTO if user, settings and subscription exist, else None
+        :rtype: Optional[UserProfileDTO]
+        """
         try:
             user = await self.user_repository.get_user(telegram_id=telegram_id)
             if not user:
@@ -474,6 +584,8 @@ class UserService:
         :returns: True if profile is valid, False otherwise
         :rtype: bool
         """
+        if self.is_known_unregistered(telegram_id):
+            return False
         try:
             settings = await self.settings_repository.get_user_settings(
                 telegram_id=telegram_id
@@ -605,6 +717,104 @@ class UserService:
                 f"Error updating settings for {telegram_id}: {e}"
             )
 
+    async def add_life_event(
+        self,
+        telegram_id: int,
+        event_date: date,
+        label: str,
+        color: Optional[str] = None,
+    ) -> None:
+        """Record a life event for a user.
+
+        :param telegram_id: Telegram user ID
+        :type telegram_id: int
+        :param event_date: Date the event happened
+        :type event_date: date
+        :param label: Short description of the event
+        :type label: str
+        :param color: Optional "#rrggbb" color of the event cell
+        :type color: Optional[str]
+        :raises UserLifeEventError: If the event could not be stored
+        """
+        event = UserLifeEvent(
+            telegram_id=telegram_id,
+            event_date=event_date,
+            label=label,
+            color=color,
+        )
+        created = await self.life_event_repository.create_life_event(event=event)
+        self._life_event_indexes.pop(telegram_id, None)
+        if not created:
+            raise UserLifeEventError(f"Failed to add life event for {telegram_id}")
+        logger.info(f"Added life event for user {telegram_id} on {event_date}")
+
+    async def get_life_events(self, telegram_id: int) -> list[UserLifeEventDTO]:
+        """Get all life events of a user ordered by date.
+
+        :param telegram_id: Telegram user ID
+        :type telegram_id: int
+        :returns: Life events of the user
+        :rtype: list[UserLifeEventDTO]
+        """
+        events = await self.life_event_repository.get_life_events(
+            telegram_id=telegram_id
+        )
+        return [
+            UserLifeEventDTO(
+                id=event.id,
+                event_date=event.event_date,
+                label=event.label,
+                color=event.color,
+            )
+            for event in events
+        ]
+
+    async def delete_life_event(self, telegram_id: int, event_id: int) -> bool:
+        """Delete one life event of a user.
+
+        :param telegram_id: Telegram user ID
+        :type telegram_id: int
+        :param event_id: Life event primary key
+        :type event_id: int
+        :returns: True if the event was deleted, False if it was not found
+        :rtype: bool
+        """
+        deleted = await self.life_event_repository.delete_life_event(
+            telegram_id=telegram_id, event_id=event_id
+        )
+        if deleted:
+            self._life_event_indexes.pop(telegram_id, None)
+        return deleted
+
+    async def get_life_event_index(
+        self, telegram_id: int, birth_date: date
+    ) -> LifeEventIndex:
+        """Get the week index of a user's life events.
+
+        The index is cached per user and rebuilt only after the user's
+        events or birth date changed.
+
+        :param telegram_id: Telegram user ID
+        :type telegram_id: int
+        :param birth_date: User's birth date the weeks are relative to
+        :type birth_date: date
+        :returns: Life events grouped by week of life
+        :rtype: LifeEventIndex
+        """
+        index = self._life_event_indexes.get(telegram_id)
+        if index is not None and index.birth_date == birth_date:
+            self._life_event_indexes.move_to_end(telegram_id)
+            return index
+
+        index = LifeEventIndex.build(
+            birth_date=birth_date,
+            events=await self.get_life_events(telegram_id=telegram_id),
+        )
+        self._life_event_indexes[telegram_id] = index
+        if len(self._life_event_indexes) > LIFE_EVENT_INDEX_CACHE_SIZE:
+            self._life_event_indexes.popitem(last=False)
+        return index
+
     async def delete_user(self, telegram_id: int) -> bool:
         """Delete user and all associated data.
 
@@ -617,6 +827,7 @@ class UserService:
             success = await self.user_repository.delete_user(telegram_id=telegram_id)
             if success:
                 logger.info(f"Deleted user {telegram_id}")
+                self._forget_registered(telegram_id)
             else:
                 logger.warning(f"Failed to delete user {telegram_id}")
             return success
@@ -663,6 +874,10 @@ class UserService:
             if not subscription_deleted:
                 logger.warning(f"Subscription not found for user {telegram_id}")
 
+            # Then delete life events (users without events are common)
+            await self.life_event_repository.delete_life_events(telegram_id=telegram_id)
+            self._life_event_indexes.pop(telegram_id, None)
+
             # Finally delete user
             user_deleted = await self.user_repository.delete_user(
                 telegram_id=telegram_id
@@ -671,6 +886,7 @@ class UserService:
 
             if not user_deleted:
                 raise UserDeletionError(f"User {telegram_id} not found")
+            self._forget_registered(telegram_id)
 
             logger.info(f"Successfully deleted user profile for {telegram_id}")
 
@@ -678,6 +894,16 @@ class UserService:
             logger.error(f"Failed to delete user profile for {telegram_id}: {e}")
             raise UserDeletionError(f"Failed to delete user profile: {e}")
 
+    def _forget_registered(self, telegram_id: int) -> None:
+        """Remove a deleted user from the registered users.
+
+        :param telegram_id: Telegram user ID
+        :type telegram_id: int
+        :returns: None
+        """
+        if self._registered_ids is not None:
+            self._registered_ids.discard(telegram_id)
+
     async def get_all_users(self) -> list[UserProfileDTO]:
         """Get all users from the database.
 
@@ -3,10 +3,19 @@
 This module provides a simple event bus for decoupling handlers from
 the scheduler. Handlers publish events, and the event bus routes them
 to registered subscribers.
+
+Until :meth:`EventBus.start` is called, ``publish`` runs the subscribers
+before returning. Once started, ``publish`` only enqueues the event for a
+pool of background workers, so a user's reply is not held up by listeners
+such as the scheduler IPC round trip. Events of one user always go to the
+same worker and are handled in publishing order; ``publish_and_wait``
+remains available for callers that need the subscribers to have finished.
 """
 
+import asyncio
 from collections.abc import Callable, Coroutine
-from typing import Any
+from contextlib import suppress
+from typing import Any, Optional
 
 from ..utils.config import BOT_NAME
 from ..utils.logger import get_logger
@@ -21,8 +30,9 @@ class EventBus:
     """Simple in-process event bus with async handler support.
 
     Handlers subscribe to event types and receive notifications when
-    events of that type are published. All handlers are executed
-    asynchronously.
+    events of that type are published. The handlers of one event are
+    started in subscription order and run concurrently, each bounded by
+    its timeout.
 
     Example usage::
 
@@ -37,35 +47,76 @@ class EventBus:
         await event_bus.publish(UserSettingsChangedEvent(user_id=123, ...))
 
     :ivar _handlers: Mapping of event types to list of handlers
+    :ivar _timeouts: Timeout in seconds of handlers subscribed with one
+    :ivar _default_timeout: Timeout of the other handlers, None for no limit
+    :ivar _queues: Bounded event queue of each background worker
+    :ivar _tasks: Running background worker tasks
+    :ivar _running: Whether published events go to the background workers
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        workers: int = 1,
+        queue_size: int = 100,
+        default_timeout: Optional[float] = None,
+    ) -> None:
         """Initialize the event bus with empty handler registry.
 
+        :param workers: Background workers used once the bus is started
+        :type workers: int
+        :param queue_size: Events waiting per worker before publishers block
+        :type queue_size: int
+        :param default_timeout: Seconds a handler may run, None for no limit
+        :type default_timeout: Optional[float]
         :returns: None
+        :raises ValueError: If workers or queue_size is not positive
         """
+        if workers < 1 or queue_size < 1:
+            raise ValueError("workers and queue_size must be positive")
         self._handlers: dict[type, list[EventHandler]] = {}
+        self._timeouts: dict[EventHandler, float] = {}
+        self._default_timeout = default_timeout
+        self._queues: list[asyncio.Queue[object]] = [
+            asyncio.Queue(maxsize=queue_size) for _ in range(workers)
+        ]
+        self._tasks: list[asyncio.Task[None]] = []
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        """Whether published events are dispatched in the background."""
+        return self._running
+
+    @property
+    def pending(self) -> int:
+        """Events waiting for a background worker."""
+        return sum(queue.qsize() for queue in self._queues)
 
     def subscribe(
         self,
         event_type: type,
         handler: EventHandler,
+        timeout: Optional[float] = None,
     ) -> None:
         """Subscribe a handler to an event type.
 
         Multiple handlers can subscribe to the same event type.
-        Handlers are called in subscription order.
+        Handlers are started in subscription order.
 
         :param event_type: Type of event to subscribe to
         :type event_type: type
         :param handler: Async function to call when event is published
         :type handler: EventHandler
+        :param timeout: Seconds the handler may run, defaults to the bus timeout
+        :type timeout: Optional[float]
         :returns: None
         """
         if event_type not in self._handlers:
             self._handlers[event_type] = []
 
         self._handlers[event_type].append(handler)
+        if timeout is not None:
+            self._timeouts[handler] = timeout
         logger.debug(f"Subscribed handler {handler.__name__} to {event_type.__name__}")
 
     def unsubscribe(
@@ -95,8 +146,38 @@ class EventBus:
     async def publish(self, event: object) -> None:
         """Publish an event to all subscribed handlers.
 
-        All handlers for the event type are called asynchronously.
-        Errors in individual handlers are logged but don't prevent
+        When the bus is started, the event is queued for a background
+        worker and this returns at once; if that worker's queue is full,
+        the publisher waits for room. Otherwise the handlers are run as
+        by :meth:`publish_and_wait`.
+
+        :param event: Event instance to publish
+        :type event: object
+        :returns: None
+        """
+        if not self._running:
+            await self.publish_and_wait(event)
+            return
+
+        if not self._handlers.get(type(event)):
+            logger.debug(f"No handlers registered for {type(event).__name__}")
+            return
+
+        self._start_workers()
+        queue = self._queues[hash(getattr(event, "user_id", None)) % len(self._queues)]
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            logger.warning(
+                f"Event queue full, waiting to publish {type(event).__name__}"
+            )
+            await queue.put(event)
+
+    async def publish_and_wait(self, event: object) -> None:
+        """Publish an event and return once all handlers have finished.
+
+        All handlers for the event type run concurrently. Errors and
+        timeouts in individual handlers are logged but don't prevent
         other handlers from executing.
 
         :param event: Event instance to publish
@@ -112,15 +193,49 @@ class EventBus:
 
         logger.debug(f"Publishing {event_type.__name__} to {len(handlers)} handler(s)")
 
-        for handler in handlers:
-            try:
-                await handler(event)
-            except Exception as error:
-                logger.error(
-                    f"Error in handler {handler.__name__} for "
-                    f"{event_type.__name__}: {error}",
-                    exc_info=True,
-                )
+        await asyncio.gather(
+            *(self._run_handler(handler, event) for handler in handlers)
+        )
+
+    def start(self) -> None:
+        """Dispatch published events in the background from now on.
+
+        The workers themselves are created with the first queued event.
+
+        :returns: None
+        """
+        self._running = True
+
+    async def stop(self, drain_timeout: float = 5.0) -> None:
+        """Finish queued events, then stop the background workers.
+
+        Events still queued after ``drain_timeout`` seconds are dropped.
+        Events published afterwards are handled inline again.
+
+        :param drain_timeout: Seconds to wait for queued events
+        :type drain_timeout: float
+        :returns: None
+        """
+        self._running = False
+        tasks, self._tasks = self._tasks, []
+        if not tasks:
+            return
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(queue.join() for queue in self._queues)),
+                timeout=drain_timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Dropping {self.pending} unhandled events")
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        for queue in self._queues:
+            while not queue.empty():
+                queue.get_nowait()
+                queue.task_done()
 
     def clear(self) -> None:
         """Remove all registered handlers.
@@ -128,6 +243,7 @@ class EventBus:
         :returns: None
         """
         self._handlers.clear()
+        self._timeouts.clear()
         logger.debug("Cleared all event handlers")
 
     def get_handlers(self, event_type: type) -> list[EventHandler]:
@@ -139,3 +255,51 @@ class EventBus:
         :rtype: list[EventHandler]
         """
         return self._handlers.get(event_type, []).copy()
+
+    def _start_workers(self) -> None:
+        """Create the background workers unless they are running.
+
+        :returns: None
+        """
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._work(queue)) for queue in self._queues
+            ]
+
+    async def _work(self, queue: "asyncio.Queue[object]") -> None:
+        """Handle the events of one queue one after another.
+
+        :param queue: Queue of this worker
+        :type queue: asyncio.Queue[object]
+        :returns: None
+        """
+        while True:
+            event = await queue.get()
+            try:
+                await self.publish_and_wait(event)
+            finally:
+                queue.task_done()
+
+    async def _run_handler(self, handler: EventHandler, event: object) -> None:
+        """Run one handler, logging its errors and cutting it off on timeout.
+
+        :param handler: Subscribed handler
+        :type handler: EventHandler
+        :param event: Published event
+        :type event: object
+        :returns: None
+        """
+        timeout = self._timeouts.get(handler, self._default_timeout)
+        try:
+            await asyncio.wait_for(handler(event), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.error(
+                f"Handler {handler.__name__} for {type(event).__name__} "
+                f"timed out after {timeout}s"
+            )
+        except Exception as error:
+            logger.error(
+                f"Error in handler {handler.__name__} for "
+                f"{type(event).__name__}: {error}",
+                exc_info=True,
+            )
@@ -1,12 +1,18 @@
 import gettext
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Final
+from types import MappingProxyType
+from typing import Any, Callable, Final, Generic, Hashable, Mapping, Optional, TypeVar
 
 try:  # pragma: no cover - optional dependency at runtime
     from babel import Locale
     from babel.core import UnknownLocaleError
+    from babel.numbers import NumberPattern, parse_pattern
 except ModuleNotFoundError:  # pragma: no cover - fallback when Babel missing
     Locale = None
+    NumberPattern = Any
 
     class UnknownLocaleError(Exception):
         """Fallback exception when Babel is not installed."""
@@ -37,6 +43,12 @@ translation catalogs (.mo files) for all supported languages.
 :type: Final[Path]
 """
 
+FALLBACK_LANGUAGE: Final[str] = "en"
+"""Language served for codes without a catalog.
+
+:type: Final[str]
+"""
+
 
 def get_translator(lang: str) -> gettext.NullTranslations:
     """Load translation for the specified language with English fallback.
@@ -59,27 +71,205 @@ def get_translator(lang: str) -> gettext.NullTranslations:
         )
 
 
+@dataclass(frozen=True, slots=True)
+class LocaleTranslations:
+    """Translation functions bound to the catalog of one language.
+
+    :ivar lang: Language code of the catalog
+    :ivar gettext: Bound ``gettext`` of the catalog
+    :ivar ngettext: Bound ``ngettext`` of the catalog
+    :ivar pgettext: Bound ``pgettext`` of the catalog
+    """
+
+    lang: str
+    gettext: Callable[[str], str]
+    ngettext: Callable[[str, str, int], str]
+    pgettext: Callable[[str, str], str]
+
+    @classmethod
+    def from_translator(
+        cls, lang: str, translator: gettext.NullTranslations
+    ) -> "LocaleTranslations":
+        """Bind the translation functions of a loaded catalog.
+
+        :param lang: Language code of the catalog
+        :type lang: str
+        :param translator: Loaded translation catalog
+        :type translator: gettext.NullTranslations
+        :returns: Bound translation functions
+        :rtype: LocaleTranslations
+        """
+        return cls(
+            lang=lang,
+            gettext=translator.gettext,
+            ngettext=translator.ngettext,
+            pgettext=translator.pgettext,
+        )
+
+
+class TranslationRegistry:
+    """Read-only registry of all translation catalogs.
+
+    Every catalog under the locale directory is loaded once into an
+    immutable mapping of :class:`LocaleTranslations`, so a lookup is a
+    dictionary access and no per-call ``gettext`` state is touched. Nothing
+    is installed into builtins. :meth:`load` builds a new mapping and swaps
+    it in, so readers never see a partially loaded registry.
+
+    :ivar _locale_dir: Directory containing the ``<lang>/LC_MESSAGES`` catalogs
+    :ivar _locales: Bound translations by language code
+    :ivar _fallback: Translations served for unknown language codes
+    :ivar _version: Number of completed loads, bumped on every reload
+    :ivar _lock: Serializes loading
+    """
+
+    def __init__(self, locale_dir: Path = LOCALE_DIR) -> None:
+        """Initialize an empty registry; catalogs are loaded on first use.
+
+        :param locale_dir: Directory containing the translation catalogs
+        :type locale_dir: Path
+        :returns: None
+        """
+        self._locale_dir = locale_dir
+        self._locales: Optional[Mapping[str, LocaleTranslations]] = None
+        self._fallback: Optional[LocaleTranslations] = None
+        self._version = 0
+        self._lock = threading.Lock()
+
+    @property
+    def languages(self) -> frozenset[str]:
+        """Language codes with a loaded catalog."""
+        return frozenset(self._get_locales())
+
+    @property
+    def version(self) -> int:
+        """Number of completed loads; caches of translated text compare it."""
+        return self._version
+
+    def load(self) -> None:
+        """Load every catalog of the locale directory and replace the registry.
+
+        :returns: None
+        """
+        with self._lock:
+            locales = {
+                path.parents[1].name: LocaleTranslations.from_translator(
+                    lang=path.parents[1].name,
+                    translator=get_translator(path.parents[1].name),
+                )
+                for path in sorted(self._locale_dir.glob(f"*/LC_MESSAGES/{DOMAIN}.mo"))
+            }
+            self._fallback = locales.get(
+                FALLBACK_LANGUAGE
+            ) or LocaleTranslations.from_translator(
+                lang=FALLBACK_LANGUAGE, translator=get_translator(FALLBACK_LANGUAGE)
+            )
+            self._locales = MappingProxyType(locales)
+            self._version += 1
+
+    def get(self, lang: Optional[str]) -> LocaleTranslations:
+        """Return the translations of a language.
+
+        :param lang: Language code (e.g., 'ru', 'en', 'ua', 'by')
+        :type lang: Optional[str]
+        :returns: Translations of the language, English if it has no catalog
+        :rtype: LocaleTranslations
+        """
+        translations = self._get_locales().get(lang)
+        return translations if translations is not None else self._fallback
+
+    def _get_locales(self) -> Mapping[str, LocaleTranslations]:
+        """Return the loaded catalogs, loading them on first access.
+
+        :returns: Bound translations by language code
+        :rtype: Mapping[str, LocaleTranslations]
+        """
+        if self._locales is None:
+            self.load()
+        return self._locales
+
+
+# Process wide registry shared by all handlers and services
+translation_registry = TranslationRegistry()
+
+
+T = TypeVar("T")
+
+
+class LocaleArtifactCache(Generic[T]):
+    """Per-language cache of values built from translated text.
+
+    Keyboards and static replies only depend on the language, so they are
+    built on first use and then shared. Languages without a catalog share
+    the entry of the fallback language. Every entry is dropped when the
+    registry reloads its catalogs. The cached values must be immutable.
+
+    :ivar _build: Builds the value of a language code and variant
+    :ivar _registry: Registry whose reloads invalidate the cache
+    :ivar _artifacts: Built values by language code and variant
+    :ivar _version: Registry version the values were built with
+    """
+
+    def __init__(
+        self,
+        build: Callable[..., T],
+        registry: Optional[TranslationRegistry] = None,
+    ) -> None:
+        """Initialize an empty cache.
+
+        :param build: Called as ``build(lang, *variant)`` on a cache miss
+        :type build: Callable[..., T]
+        :param registry: Registry to follow, the process wide one by default
+        :type registry: Optional[TranslationRegistry]
+        :returns: None
+        """
+        self._build = build
+        self._registry = registry
+        self._artifacts: Mapping[tuple[Hashable, ...], T] = {}
+        self._version = 0
+
+    def get(self, lang: Optional[str], *variant: Hashable) -> T:
+        """Return the value of a language, building it on first use.
+
+        :param lang: Language code (e.g., 'ru', 'en', 'ua', 'by')
+        :type lang: Optional[str]
+        :param variant: Extra key parts, e.g. the subscription level
+        :type variant: Hashable
+        :returns: Cached value of the language
+        :rtype: T
+        """
+        registry = self._registry or translation_registry
+        resolved = registry.get(lang).lang
+        if self._version != registry.version:
+            self._artifacts = {}
+            self._version = registry.version
+
+        key = (resolved, *variant)
+        artifact = self._artifacts.get(key)
+        if artifact is None:
+            artifact = self._build(resolved, *variant)
+            # Copy on write so concurrent readers never see a half updated dict
+            self._artifacts = {**self._artifacts, key: artifact}
+        return artifact
+
+
 def use_locale(
     lang: str,
 ) -> tuple[
     Callable[[str], str], Callable[[str, str, int], str], Callable[[str, str], str]
 ]:
-    """Install and return translation functions for the specified language.
+    """Return translation functions for the specified language.
 
-    This function installs the translation functions into Python builtins
-    and returns them for direct use. The installed functions include:
-    - `_` (gettext) for basic message translation
-    - `ngettext` for pluralized message translation
-    - `pgettext` for contextual message translation
+    The functions come from the preloaded :data:`translation_registry`;
+    nothing is installed into Python builtins.
 
     :param lang: Language code (e.g., 'ru', 'en', 'ua', 'by')
     :type lang: str
     :returns: Tuple of (gettext_func, ngettext_func, pgettext_func)
     :rtype: tuple[Callable[[str], str], Callable[[str, str, int], str], Callable[[str, str], str]]
     """
-    translator = get_translator(lang)
-    translator.install()  # installs `_`, `ngettext`, `pgettext` into builtins
-    return translator.gettext, translator.ngettext, translator.pgettext
+    translations = translation_registry.get(lang)
+    return translations.gettext, translations.ngettext, translations.pgettext
 
 
 def normalize_babel_locale(lang: str) -> str:
@@ -104,6 +294,89 @@ def normalize_babel_locale(lang: str) -> str:
     return mapping.get(code, code)
 
 
+INTEGER_NUMBER_PATTERN: Final[str] = "#,##0"
+"""Number pattern of grouped integers such as week counts.
+
+:type: Final[str]
+"""
+
+PERCENT_NUMBER_PATTERN: Final[str] = "#0.1%"
+"""Number pattern of percentages with one fraction digit.
+
+:type: Final[str]
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class LocaleNumberFormatter:
+    """Number formatter with a resolved Babel locale and pre-parsed patterns.
+
+    Produces the same output as ``format_decimal``/``format_percent`` without
+    resolving the locale and parsing the pattern on every call.
+
+    :ivar locale: Resolved Babel locale
+    :ivar decimal_pattern: Default decimal pattern of the locale
+    :ivar integer_pattern: Parsed :data:`INTEGER_NUMBER_PATTERN`
+    :ivar percent_pattern: Parsed :data:`PERCENT_NUMBER_PATTERN`
+    """
+
+    locale: Any
+    decimal_pattern: NumberPattern
+    integer_pattern: NumberPattern
+    percent_pattern: NumberPattern
+
+    def decimal(self, value: float) -> str:
+        """Format a number with the locale's default decimal pattern.
+
+        :param value: Number to format
+        :type value: float
+        :returns: Localized number
+        :rtype: str
+        """
+        return self.decimal_pattern.apply(value, self.locale)
+
+    def integer(self, value: int) -> str:
+        """Format a grouped integer, e.g. ``1,234``.
+
+        :param value: Number to format
+        :type value: int
+        :returns: Localized number
+        :rtype: str
+        """
+        return self.integer_pattern.apply(value, self.locale)
+
+    def percent(self, value: float) -> str:
+        """Format a ratio as a percentage with one fraction digit.
+
+        :param value: Ratio between 0.0 and 1.0
+        :type value: float
+        :returns: Localized percentage, e.g. ``42.5%``
+        :rtype: str
+        """
+        return self.percent_pattern.apply(value, self.locale)
+
+
+@lru_cache(maxsize=32)
+def get_number_formatter(lang: str) -> LocaleNumberFormatter:
+    """Return the cached number formatter of a language.
+
+    :param lang: Language code (e.g., 'ru', 'en', 'ua', 'by')
+    :type lang: str
+    :returns: Number formatter of the language, English for unknown codes
+    :rtype: LocaleNumberFormatter
+    """
+    try:
+        locale = Locale.parse(normalize_babel_locale(lang))
+    except (ValueError, UnknownLocaleError):
+        locale = Locale.parse(FALLBACK_LANGUAGE)
+    return LocaleNumberFormatter(
+        locale=locale,
+        decimal_pattern=parse_pattern(locale.decimal_formats[None]),
+        integer_pattern=parse_pattern(INTEGER_NUMBER_PATTERN),
+        percent_pattern=parse_pattern(PERCENT_NUMBER_PATTERN),
+    )
+
+
 def get_localized_language_name(
     language_code: str | None,
     display_locale: str | None,
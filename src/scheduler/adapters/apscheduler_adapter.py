@@ -4,8 +4,14 @@ This module provides an adapter for APScheduler's AsyncIOScheduler that
 implements the SchedulerPortProtocol for scheduling operations.
 """
 
-from typing import Any
+from typing import Any, Callable
 
+from apscheduler.events import (
+    EVENT_JOB_ERROR,
+    EVENT_JOB_EXECUTED,
+    EVENT_JOB_MISSED,
+    JobEvent,
+)
 from apscheduler.job import Job
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
@@ -154,6 +160,24 @@ class APSchedulerAdapter:
         jobs = self._scheduler.get_jobs()
         return [self._job_to_info(job=job) for job in jobs]
 
+    def add_fire_listener(self, listener: Callable[[str], None]) -> None:
+        """Call a listener with the job ID after each run of a job.
+
+        Missed and failed runs count as runs, as they move the job on to
+        its next run time as well.
+
+        :param listener: Function receiving the ID of the job that ran
+        :type listener: Callable[[str], None]
+        :returns: None
+        """
+
+        def on_event(event: JobEvent) -> None:
+            listener(event.job_id)
+
+        self._scheduler.add_listener(
+            on_event, EVENT_JOB_EXECUTED | EVENT_JOB_ERROR | EVENT_JOB_MISSED
+        )
+
     def start(self) -> None:
         """Start the scheduler.
 
@@ -2,19 +2,32 @@
 
 This module provides the SchedulerClient class which allows the main application
 to communicate with the scheduler worker process via IPC queues.
+
+The client also mirrors the worker's jobs from the JobStateUpdate messages
+the worker pushes after every change, so looking up a job or its next run
+time is an in-memory read instead of a round trip to the worker.
 """
 
 import asyncio
+import time
 import uuid
+from datetime import datetime
 from multiprocessing import Queue
 from typing import Any
 
 from ..contracts.scheduler_port_protocol import (
+    JobInfo,
     ScheduleTrigger,
 )
 from ..utils.config import BOT_NAME
 from ..utils.logger import get_logger
-from .commands import SchedulerCommand, SchedulerCommandType, SchedulerResponse
+from .commands import (
+    JobStateUpdate,
+    SchedulerCommand,
+    SchedulerCommandType,
+    SchedulerResponse,
+    WorkerHeartbeat,
+)
 
 logger = get_logger(f"{BOT_NAME}.SchedulerClient")
 
@@ -28,6 +41,9 @@ class SchedulerClient:
     :ivar _command_queue: Queue for sending commands
     :ivar _response_queue: Queue for receiving responses
     :ivar _response_futures: Dictionary mapping command IDs to futures
+    :ivar _jobs: Read-only mirror of the worker's jobs by job ID
+    :ivar _last_heartbeat: Monotonic time the worker was last heard from
+    :ivar _heartbeat_received: Set whenever a heartbeat arrives
     """
 
     def __init__(
@@ -53,6 +69,9 @@ class SchedulerClient:
         self._response_futures: dict[str, asyncio.Future] = {}
         self._listening = False
         self._listen_task: asyncio.Task | None = None
+        self._jobs: dict[str, JobInfo] = {}
+        self._last_heartbeat = time.monotonic()
+        self._heartbeat_received = asyncio.Event()
 
     async def start_listening(self) -> None:
         """Start listening for responses in the background.
@@ -70,7 +89,7 @@ class SchedulerClient:
         while self._listening:
             try:
                 if not self._response_queue.empty():
-                    response: SchedulerResponse = self._response_queue.get_nowait()
+                    response = self._response_queue.get_nowait()
                     self._handle_response(response)
                 else:
                     await asyncio.sleep(0.1)
@@ -102,13 +121,94 @@ class SchedulerClient:
         self._listen_task = None
         logger.info("Scheduler client listener stopped")
 
-    def _handle_response(self, response: SchedulerResponse) -> None:
-        """Handle a received response.
+    def seconds_since_heartbeat(self) -> float:
+        """Seconds since the worker's last heartbeat, or since the client was created.
+
+        :returns: Seconds without a sign of life from the worker
+        :rtype: float
+        """
+        return time.monotonic() - self._last_heartbeat
+
+    async def wait_for_heartbeat(self, timeout: float) -> bool:
+        """Wait for the next heartbeat of the worker.
+
+        :param timeout: Seconds to wait
+        :type timeout: float
+        :returns: True if a heartbeat arrived in time
+        :rtype: bool
+        """
+        self._heartbeat_received.clear()
+        try:
+            await asyncio.wait_for(self._heartbeat_received.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def fail_pending(self, error: str) -> None:
+        """Answer every command still waiting for the worker with a failure.
+
+        Used when the worker is replaced, so callers don't wait for their
+        timeout on responses that will never come.
 
-        :param response: Received response
-        :type response: SchedulerResponse
+        :param error: Error message of the failed responses
+        :type error: str
         :returns: None
         """
+        futures, self._response_futures = self._response_futures, {}
+        for command_id, future in futures.items():
+            if not future.done():
+                future.set_result(
+                    SchedulerResponse(command_id=command_id, success=False, error=error)
+                )
+
+    def get_job(self, job_id: str) -> JobInfo | None:
+        """Get a job from the mirror of the worker's jobs.
+
+        :param job_id: Job ID
+        :type job_id: str
+        :returns: Job information or None if no such job is scheduled
+        :rtype: JobInfo | None
+        """
+        return self._jobs.get(job_id)
+
+    def get_all_jobs(self) -> list[JobInfo]:
+        """Get all jobs from the mirror of the worker's jobs.
+
+        :returns: Scheduled jobs
+        :rtype: list[JobInfo]
+        """
+        return list(self._jobs.values())
+
+    def get_next_run_time(self, job_id: str) -> datetime | None:
+        """Get when a job runs next, from the mirror of the worker's jobs.
+
+        :param job_id: Job ID
+        :type job_id: str
+        :returns: Next run time or None if the job is not scheduled
+        :rtype: datetime | None
+        """
+        job = self._jobs.get(job_id)
+        return job.next_run_time if job else None
+
+    def _handle_response(
+        self, response: SchedulerResponse | JobStateUpdate | WorkerHeartbeat
+    ) -> None:
+        """Handle a received response, job state update or heartbeat.
+
+        :param response: Received message
+        :type response: SchedulerResponse | JobStateUpdate | WorkerHeartbeat
+        :returns: None
+        """
+        if isinstance(response, WorkerHeartbeat):
+            self._last_heartbeat = time.monotonic()
+            self._heartbeat_received.set()
+            return
+        if isinstance(response, JobStateUpdate):
+            if response.job is None:
+                self._jobs.pop(response.job_id, None)
+            else:
+                self._jobs[response.job_id] = response.job
+            return
         if response.command_id in self._response_futures:
             future = self._response_futures.pop(response.command_id)
             if not future.done():
@@ -248,6 +348,21 @@ class SchedulerClient:
         )
         return response.success if response else False
 
+    async def get_digest(self, digest: str) -> dict[str, Any] | None:
+        """Compare the worker's jobs with a combined digest of desired jobs.
+
+        :param digest: Combined digest of the desired jobs
+        :type digest: str
+        :returns: The worker's combined ``digest`` and, if it differs, the
+            digest of each of its jobs as ``jobs``; None on failure
+        :rtype: dict[str, Any] | None
+        """
+        response = await self._send_command(
+            SchedulerCommandType.GET_DIGEST,
+            payload={"digest": digest},
+        )
+        return response.data if response and response.success else None
+
     async def health_check(self) -> bool:
         """Check if scheduler worker is healthy.
 
@@ -2,12 +2,19 @@
 
 This module defines the data structures used for Inter-Process Communication (IPC)
 between the main application and the scheduler worker process.
+
+Besides responses, the worker pushes a JobStateUpdate whenever a job is
+scheduled, rescheduled, removed or fired, so the client keeps a mirror of
+the jobs and can answer lookups without a round trip. A WorkerHeartbeat
+is pushed every few seconds so the bot can tell a stuck or dead worker.
 """
 
 from dataclasses import dataclass, field
 from enum import StrEnum, auto
 from typing import Any
 
+from ..contracts.scheduler_port_protocol import JobInfo
+
 
 class SchedulerCommandType(StrEnum):
     """Types of commands that can be sent to the scheduler worker."""
@@ -16,7 +23,7 @@ class SchedulerCommandType(StrEnum):
     REMOVE_JOB = auto()
     RESCHEDULE_JOB = auto()
     GET_JOB = auto()
-    GET_ALL_JOBS = auto()
+    GET_DIGEST = auto()
     PAUSE = auto()
     RESUME = auto()
     SHUTDOWN = auto()
@@ -51,3 +58,25 @@ class SchedulerResponse:
     success: bool
     data: Any | None = None
     error: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class JobStateUpdate:
+    """Current state of a job, pushed by the worker after every change.
+
+    :ivar job_id: ID of the changed job
+    :ivar job: Job information, None if the job no longer exists
+    """
+
+    job_id: str
+    job: JobInfo | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class WorkerHeartbeat:
+    """Liveness signal pushed by the worker at a fixed interval.
+
+    :ivar pid: Process ID of the worker
+    """
+
+    pid: int
@@ -0,0 +1,43 @@
+"""Digests of scheduled notification jobs.
+
+The bot and the scheduler worker both describe a job by a short hash of
+its trigger and job type. Comparing one combined hash tells whether the
+worker's jobs match the database; only when it differs are the per-job
+hashes exchanged, and only the jobs whose hashes differ are sent again.
+"""
+
+from collections.abc import Mapping
+from hashlib import blake2b
+
+from ..contracts.scheduler_port_protocol import ScheduleTrigger
+
+
+def job_digest(trigger: ScheduleTrigger, job_type: str) -> str:
+    """Hash what a job is scheduled with.
+
+    :param trigger: Trigger of the job
+    :type trigger: ScheduleTrigger
+    :param job_type: Job type, e.g. "weekly_summary"
+    :type job_type: str
+    :returns: 16 hex characters
+    :rtype: str
+    """
+    data = (
+        f"{job_type}|{trigger.day_of_week}|{trigger.day_of_month}|"
+        f"{trigger.hour}|{trigger.minute}|{trigger.timezone}"
+    )
+    return blake2b(data.encode(), digest_size=8).hexdigest()
+
+
+def combine_digests(digests: Mapping[str, str]) -> str:
+    """Hash a whole set of jobs, independent of their order.
+
+    :param digests: Job digest by job ID
+    :type digests: Mapping[str, str]
+    :returns: 32 hex characters
+    :rtype: str
+    """
+    combined = blake2b(digest_size=16)
+    for job_id in sorted(digests):
+        combined.update(f"{job_id}={digests[job_id]};".encode())
+    return combined.hexdigest()
@@ -4,14 +4,18 @@ This module defines the callable functions that execute scheduler jobs.
 These functions are run by the scheduler worker process when a job is triggered.
 """
 
+import asyncio
+
 from ..services.container import ServiceContainer
 from ..services.notification_service import (
     MESSAGE_TYPE_DAILY_SUMMARY,
     MESSAGE_TYPE_MONTHLY_SUMMARY,
     MESSAGE_TYPE_WEEKLY_SUMMARY,
 )
-from ..utils.config import BOT_NAME
+from ..utils.config import BOT_NAME, SCHEDULER_PREWARM_RENDER_IMAGES
 from ..utils.logger import get_logger
+from .peak_shaving import delivery_planner
+from .prewarm import notification_prewarm_cache, render_grid_image
 
 logger = get_logger(f"{BOT_NAME}.SchedulerJobs")
 
@@ -24,7 +28,11 @@ async def execute_notification_job(
 
     This function is called by the scheduler when a scheduled notification
     job is triggered. It gets necessary services from the container and
-    executes the notification generation and delivery workflow.
+    executes the notification generation and delivery workflow. Users
+    sharing the slot are delayed by their planned offset, so the worker
+    sends at its delivery rate instead of all at once. With
+    SCHEDULER_PREWARM_RENDER_IMAGES the grid image is sent whether or not
+    it was staged ahead of the slot.
 
     :param user_id: Telegram user ID
     :type user_id: int
@@ -48,13 +56,25 @@ async def execute_notification_job(
 
         # Determine payload generation based on message type
         payload = None
-        if message_type in summary_types:
+        image: bytes | None = None
+        if message_type not in summary_types:
+            logger.warning(f"Unknown message type: {message_type}")
+            return
+
+        # Use the payload prepared ahead of the slot when available; it is
+        # taken before the delay, as it is only valid around the slot time
+        prewarmed = notification_prewarm_cache.take(
+            user_id=user_id, message_type=message_type
+        )
+        delay = delivery_planner.offset(user_id)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if prewarmed is not None:
+            payload, image = prewarmed.payload, prewarmed.image
+        else:
             payload = await notification_service.generate_summary(
                 user_id=user_id, message_type=message_type
             )
-        else:
-            logger.warning(f"Unknown message type: {message_type}")
-            return
 
         if not payload:
             logger.warning(f"No payload generated for user {user_id} ({message_type})")
@@ -65,6 +85,13 @@ async def execute_notification_job(
 
         if result.success:
             logger.info(f"Successfully sent {message_type} to user {user_id}")
+            if image is None and SCHEDULER_PREWARM_RENDER_IMAGES:
+                # Not staged in time, e.g. scheduled inside the window
+                image = await render_grid_image(
+                    user_id=user_id, user_service=container.get_user_service()
+                )
+            if image is not None:
+                await gateway.send_photo(recipient_id=user_id, photo=image)
             # Optional: Publish NotificationSentEvent if needed in worker process
             # await container.event_bus.publish(NotificationSentEvent(...))
         else:
@@ -0,0 +1,276 @@
+"""Peak shaving of notification deliveries.
+
+Most users keep the default notification time, so all their jobs fire in
+the same second and the worker tries to send far more messages than the
+delivery rate allows, while it idles the rest of the week. This module
+spreads the users of each slot: :func:`plan_jitter` gives every user a
+deterministic delay so that no more than the configured number of messages
+per second are sent, and :func:`simulate_delivery` reports the busiest
+second of each slot with and without the delays.
+
+A slot is the UTC instant the jobs fire at, so users of different time
+zones whose notifications fall into the same second share its rate.
+
+Users are ordered by a hash of their ID rather than the ID itself, so
+users of one shard (whose IDs share a remainder) are spread evenly, and a
+user joining a slot moves the others by one step at most.
+
+The :class:`DeliveryPlanner` keeps the audience of each slot in the
+scheduler worker and is read by :func:`execute_notification_job`.
+"""
+
+import math
+from collections import Counter
+from collections.abc import Hashable, Iterable, Mapping
+from dataclasses import dataclass
+from hashlib import blake2b
+
+from ..utils.config import (
+    BOT_NAME,
+    NOTIFICATION_JITTER_WINDOW_SECONDS,
+    NOTIFICATION_SENDS_PER_SECOND,
+)
+from ..utils.logger import get_logger
+
+logger = get_logger(f"{BOT_NAME}.DeliveryPlanner")
+
+
+def _rank(user_id: int) -> bytes:
+    """Stable pseudo-random sort key of a user.
+
+    :param user_id: Telegram user ID
+    :type user_id: int
+    :returns: Hash of the user ID
+    :rtype: bytes
+    """
+    return blake2b(str(user_id).encode(), digest_size=8).digest()
+
+
+def plan_jitter(
+    user_ids: Iterable[int], sends_per_second: float, window_seconds: float
+) -> dict[int, float]:
+    """Spread the users of one slot so deliveries stay below the rate.
+
+    The users are sent one every ``1 / sends_per_second`` seconds, even if
+    the last ones are then sent after the window: messages over the rate
+    are rejected by Telegram, while a late notification is only late.
+
+    :param user_ids: Users whose notifications are due in the same slot
+    :type user_ids: Iterable[int]
+    :param sends_per_second: Messages that may be sent per second
+    :type sends_per_second: float
+    :param window_seconds: Expected longest delay, 0 disables jitter
+    :type window_seconds: float
+    :returns: Delay in seconds after the slot by user ID
+    :rtype: dict[int, float]
+    """
+    ordered = sorted(set(user_ids), key=_rank)
+    if not ordered or sends_per_second <= 0 or window_seconds <= 0:
+        return dict.fromkeys(ordered, 0.0)
+    step = 1 / sends_per_second
+    return {user_id: round(index * step, 3) for index, user_id in enumerate(ordered)}
+
+
+@dataclass(frozen=True, slots=True)
+class SlotSimulation:
+    """Busiest second of one slot with and without jitter.
+
+    :ivar slot: Name of the slot, e.g. "Monday 09:00 UTC"
+    :ivar audience: Users whose notifications are due in the slot
+    :ivar sends_per_second: Delivery rate the slot was planned for
+    :ivar window_seconds: Expected longest delay the slot was planned for
+    :ivar spread_seconds: Delay of the last user
+    :ivar peak_before: Messages in the busiest second without jitter
+    :ivar peak_after: Messages in the busiest second with jitter
+    """
+
+    slot: str
+    audience: int
+    sends_per_second: float
+    window_seconds: float
+    spread_seconds: float
+    peak_before: int
+    peak_after: int
+
+    @property
+    def within_rate(self) -> bool:
+        """Whether no second of the slot exceeds the delivery rate."""
+        return self.peak_after <= math.ceil(self.sends_per_second)
+
+    @property
+    def within_window(self) -> bool:
+        """Whether the last user of the slot is sent within the window."""
+        return self.spread_seconds <= self.window_seconds
+
+
+def simulate_delivery(
+    audiences: Mapping[str, int], sends_per_second: float, window_seconds: float
+) -> list[SlotSimulation]:
+    """Simulate the deliveries of slots with the given audience sizes.
+
+    :param audiences: Number of users by slot name
+    :type audiences: Mapping[str, int]
+    :param sends_per_second: Messages that may be sent per second
+    :type sends_per_second: float
+    :param window_seconds: Expected longest delay after the slot
+    :type window_seconds: float
+    :returns: Simulation of each slot, busiest first
+    :rtype: list[SlotSimulation]
+    """
+    simulations = []
+    for slot, audience in audiences.items():
+        offsets = plan_jitter(range(audience), sends_per_second, window_seconds)
+        per_second = Counter(math.floor(offset) for offset in offsets.values())
+        simulations.append(
+            SlotSimulation(
+                slot=slot,
+                audience=audience,
+                sends_per_second=sends_per_second,
+                window_seconds=window_seconds,
+                spread_seconds=max(offsets.values(), default=0.0),
+                peak_before=audience,
+                peak_after=max(per_second.values(), default=0),
+            )
+        )
+    return sorted(simulations, key=lambda simulation: -simulation.audience)
+
+
+def format_simulation(simulations: Iterable[SlotSimulation]) -> str:
+    """Render a simulation as a table, one slot per line.
+
+    :param simulations: Simulated slots
+    :type simulations: Iterable[SlotSimulation]
+    :returns: Table with the audience, spread and peaks of each slot
+    :rtype: str
+    """
+    lines = [
+        f"{'slot':<28}{'users':>8}{'spread s':>10}{'peak/s':>8}"
+        f"{'shaved/s':>10}  within rate/window"
+    ]
+    for simulation in simulations:
+        lines.append(
+            f"{simulation.slot:<28}{simulation.audience:>8}"
+            f"{simulation.spread_seconds:>10.1f}{simulation.peak_before:>8}"
+            f"{simulation.peak_after:>10}  "
+            f"{'yes' if simulation.within_rate else 'no'}/"
+            f"{'yes' if simulation.within_window else 'no'}"
+        )
+    return "\n".join(lines)
+
+
+class DeliveryPlanner:
+    """Delivery delays of the users of each slot in one scheduler worker.
+
+    Delays are planned per slot on first use and planned again when a user
+    joins the slot. Users leaving a slot, e.g. moving on to their next run
+    while the slot's jobs are being sent, keep the others' delays; the plan
+    is dropped once the slot is empty.
+
+    :ivar sends_per_second: Messages this worker may send per second
+    :ivar window_seconds: Expected longest delay, 0 disables jitter
+    :ivar _slots: Users by slot
+    :ivar _user_slots: Slot of each user
+    :ivar _offsets: Planned delays by slot
+    """
+
+    def __init__(self, sends_per_second: float, window_seconds: float) -> None:
+        """Initialize a planner without users.
+
+        :param sends_per_second: Messages this worker may send per second
+        :type sends_per_second: float
+        :param window_seconds: Expected longest delay, 0 disables jitter
+        :type window_seconds: float
+        """
+        self.sends_per_second = sends_per_second
+        self.window_seconds = window_seconds
+        self._slots: dict[Hashable, set[int]] = {}
+        self._user_slots: dict[int, Hashable] = {}
+        self._offsets: dict[Hashable, dict[int, float]] = {}
+
+    def configure(self, sends_per_second: float, window_seconds: float) -> None:
+        """Change the delivery rate and window, e.g. to a shard's share.
+
+        :param sends_per_second: Messages this worker may send per second
+        :type sends_per_second: float
+        :param window_seconds: Expected longest delay, 0 disables jitter
+        :type window_seconds: float
+        :returns: None
+        """
+        self.sends_per_second = sends_per_second
+        self.window_seconds = window_seconds
+        self._offsets.clear()
+
+    def assign(self, user_id: int, slot: Hashable) -> None:
+        """Put a user's notification into a slot, leaving any previous one.
+
+        :param user_id: Telegram user ID
+        :type user_id: int
+        :param slot: Slot key, the UTC instant the job fires at next
+        :type slot: Hashable
+        :returns: None
+        """
+        if self._user_slots.get(user_id) == slot:
+            return
+        self.remove(user_id)
+        self._user_slots[user_id] = slot
+        self._slots.setdefault(slot, set()).add(user_id)
+        self._offsets.pop(slot, None)
+
+    def remove(self, user_id: int) -> None:
+        """Take a user's notification out of its slot.
+
+        :param user_id: Telegram user ID
+        :type user_id: int
+        :returns: None
+        """
+        slot = self._user_slots.pop(user_id, None)
+        if slot is None:
+            return
+        users = self._slots[slot]
+        users.discard(user_id)
+        if not users:
+            del self._slots[slot]
+            self._offsets.pop(slot, None)
+
+    def offset(self, user_id: int) -> float:
+        """Return how long after the slot the user's notification is sent.
+
+        :param user_id: Telegram user ID
+        :type user_id: int
+        :returns: Delay in seconds, 0 for users without a slot
+        :rtype: float
+        """
+        slot = self._user_slots.get(user_id)
+        if slot is None:
+            return 0.0
+        offsets = self._offsets.get(slot)
+        if offsets is None:
+            offsets = self._offsets[slot] = plan_jitter(
+                self._slots[slot], self.sends_per_second, self.window_seconds
+            )
+            spread = max(offsets.values())
+            logger.debug(
+                f"Planned {len(offsets)} deliveries over {spread:.1f}s for slot {slot}"
+            )
+            if spread > self.window_seconds:
+                logger.warning(
+                    f"Slot {slot} needs {spread:.0f}s at {self.sends_per_second:g} "
+                    f"messages/s, longer than the {self.window_seconds:g}s window"
+                )
+        return offsets.get(user_id, 0.0)
+
+    def clear(self) -> None:
+        """Forget all slots.
+
+        :returns: None
+        """
+        self._slots.clear()
+        self._user_slots.clear()
+        self._offsets.clear()
+
+
+# Process-wide planner of the scheduler worker
+delivery_planner = DeliveryPlanner(
+    sends_per_second=NOTIFICATION_SENDS_PER_SECOND,
+    window_seconds=NOTIFICATION_JITTER_WINDOW_SECONDS,
+)
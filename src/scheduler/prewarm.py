@@ -0,0 +1,362 @@
+"""Ahead-of-time preparation of scheduled notifications.
+
+Popular notification slots (e.g. 09:00) make every due job generate its
+payload at the same moment. The :class:`NotificationPrewarmer` runs in the
+scheduler worker, looks a configurable window ahead of each job's next run
+time and stages the payload (and optionally the rendered life grid) in a
+:class:`PrewarmCache`. When the job fires, :func:`execute_notification_job`
+takes the staged result and only has to send it.
+"""
+
+import asyncio
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Optional
+
+from ..contracts.scheduler_port_protocol import JobInfo, SchedulerPortProtocol
+from ..events.domain_events import NotificationPayload
+from ..utils.config import BOT_NAME
+from ..utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from ..services.notification_service import NotificationService
+
+logger = get_logger(f"{BOT_NAME}.NotificationPrewarmer")
+
+# How far a job may fire from the staged slot time and still use the entry
+DEFAULT_FIRE_TOLERANCE_SECONDS = 120
+
+
+@dataclass(frozen=True, slots=True)
+class PrewarmedNotification:
+    """Notification prepared ahead of its scheduled send time.
+
+    :ivar payload: Generated notification payload
+    :ivar fire_time: Scheduled run time the payload was prepared for
+    :ivar image: Rendered life grid PNG, if image pre-rendering is enabled
+    """
+
+    payload: NotificationPayload
+    fire_time: datetime
+    image: bytes | None = None
+
+
+class PrewarmCache:
+    """Payload and render cache keyed by ``(user_id, message_type)``.
+
+    Entries are valid only around the slot they were prepared for, so a
+    payload staged for a slot that was missed is never sent later. The
+    worker evicts a user's entries whenever their job is scheduled,
+    rescheduled or removed, as they were built from the old settings.
+
+    :ivar _entries: Staged notifications
+    :ivar _tolerance: Allowed distance between fire time and staged slot
+    """
+
+    def __init__(
+        self, tolerance_seconds: float = DEFAULT_FIRE_TOLERANCE_SECONDS
+    ) -> None:
+        """Initialize an empty cache.
+
+        :param tolerance_seconds: Allowed distance between the actual fire
+            time and the staged slot time
+        :type tolerance_seconds: float
+        :returns: None
+        """
+        self._entries: dict[tuple[int, str], PrewarmedNotification] = {}
+        self._tolerance = timedelta(seconds=tolerance_seconds)
+
+    def __len__(self) -> int:
+        """Return the number of staged notifications."""
+        return len(self._entries)
+
+    def stage(
+        self, user_id: int, message_type: str, entry: PrewarmedNotification
+    ) -> None:
+        """Stage a prepared notification, replacing any previous one.
+
+        :param user_id: Telegram user ID
+        :type user_id: int
+        :param message_type: Notification message type
+        :type message_type: str
+        :param entry: Prepared notification
+        :type entry: PrewarmedNotification
+        :returns: None
+        """
+        self._entries[(user_id, message_type)] = entry
+
+    def is_staged(self, user_id: int, message_type: str, fire_time: datetime) -> bool:
+        """Check whether a notification is already staged for a slot.
+
+        :param user_id: Telegram user ID
+        :type user_id: int
+        :param message_type: Notification message type
+        :type message_type: str
+        :param fire_time: Scheduled run time
+        :type fire_time: datetime
+        :returns: True if an entry for this exact slot exists
+        :rtype: bool
+        """
+        entry = self._entries.get((user_id, message_type))
+        return entry is not None and entry.fire_time == fire_time
+
+    def take(
+        self, user_id: int, message_type: str, now: Optional[datetime] = None
+    ) -> PrewarmedNotification | None:
+        """Remove and return the staged notification if it belongs to ``now``.
+
+        :param user_id: Telegram user ID
+        :type user_id: int
+        :param message_type: Notification message type
+        :type message_type: str
+        :param now: Current time (default: now in UTC)
+        :type now: Optional[datetime]
+        :returns: Staged notification or None if missing or for another slot
+        :rtype: PrewarmedNotification | None
+        """
+        entry = self._entries.pop((user_id, message_type), None)
+        if entry is None:
+            return None
+        now = now or datetime.now(timezone.utc)
+        if abs(now - entry.fire_time) > self._tolerance:
+            logger.debug(
+                f"Discarding prewarmed {message_type} for user {user_id}: "
+                f"prepared for {entry.fire_time}, fired at {now}"
+            )
+            return None
+        return entry
+
+    def evict_user(self, user_id: int) -> int:
+        """Drop the staged notifications of a user, e.g. after a settings change.
+
+        :param user_id: Telegram user ID
+        :type user_id: int
+        :returns: Number of evicted entries
+        :rtype: int
+        """
+        stale = [key for key in self._entries if key[0] == user_id]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def evict_expired(self, now: Optional[datetime] = None) -> int:
+        """Drop entries whose slot has passed without being taken.
+
+        :param now: Current time (default: now in UTC)
+        :type now: Optional[datetime]
+        :returns: Number of evicted entries
+        :rtype: int
+        """
+        now = now or datetime.now(timezone.utc)
+        expired = [
+            key
+            for key, entry in self._entries.items()
+            if now - entry.fire_time > self._tolerance
+        ]
+        for key in expired:
+            del self._entries[key]
+        return len(expired)
+
+    def clear(self) -> None:
+        """Remove all staged notifications.
+
+        :returns: None
+        """
+        self._entries.clear()
+
+
+@dataclass(frozen=True, slots=True)
+class _PrewarmTarget:
+    """Job due within the prewarm window."""
+
+    user_id: int
+    message_type: str
+    fire_time: datetime
+
+
+class NotificationPrewarmer:
+    """Prepares notifications for jobs that are about to fire.
+
+    Work for a slot is paced across the window: every run handles only the
+    share of pending jobs needed to finish before the earliest slot, so the
+    CPU cost of a popular slot is spread over the preceding minutes.
+
+    :ivar _scheduler: Scheduler holding the notification jobs
+    :ivar _notification_service: Service generating notification payloads
+    :ivar _cache: Cache receiving the prepared notifications
+    :ivar _window: How far ahead of a slot preparation starts
+    :ivar _interval: Seconds between two prewarm runs
+    :ivar _user_service: User service for rendering images, or None to skip
+    """
+
+    def __init__(
+        self,
+        scheduler: SchedulerPortProtocol,
+        notification_service: "NotificationService",
+        cache: PrewarmCache,
+        window_seconds: float,
+        interval_seconds: float,
+        user_service: Any | None = None,
+    ) -> None:
+        """Initialize the prewarmer.
+
+        :param scheduler: Scheduler holding the notification jobs
+        :type scheduler: SchedulerPortProtocol
+        :param notification_service: Service generating notification payloads
+        :type notification_service: NotificationService
+        :param cache: Cache receiving the prepared notifications
+        :type cache: PrewarmCache
+        :param window_seconds: How far ahead of a slot preparation starts
+        :type window_seconds: float
+        :param interval_seconds: Seconds between two prewarm runs
+        :type interval_seconds: float
+        :param user_service: User service used to render grid images;
+            images are not rendered when None
+        :type user_service: Any | None
+        :returns: None
+        """
+        self._scheduler = scheduler
+        self._notification_service = notification_service
+        self._cache = cache
+        self._window = timedelta(seconds=window_seconds)
+        self._interval = max(1.0, interval_seconds)
+        self._user_service = user_service
+
+    @property
+    def interval_seconds(self) -> float:
+        """Seconds between two prewarm runs."""
+        return self._interval
+
+    async def prewarm_due(self, now: Optional[datetime] = None) -> int:
+        """Prepare the due share of notifications in the prewarm window.
+
+        :param now: Current time (default: now in UTC)
+        :type now: Optional[datetime]
+        :returns: Number of notifications staged in this run
+        :rtype: int
+        """
+        now = now or datetime.now(timezone.utc)
+        self._cache.evict_expired(now=now)
+
+        pending = self._collect_pending(now=now)
+        if not pending:
+            return 0
+
+        # Spread the remaining work evenly over the runs left before the slot
+        seconds_left = (pending[0].fire_time - now).total_seconds()
+        runs_left = max(1, int(seconds_left // self._interval))
+        batch = pending[: math.ceil(len(pending) / runs_left)]
+
+        staged = 0
+        for target in batch:
+            entry = await self._prepare(target=target)
+            if entry is not None:
+                self._cache.stage(
+                    user_id=target.user_id,
+                    message_type=target.message_type,
+                    entry=entry,
+                )
+                staged += 1
+            # Let the worker loop process IPC commands between users
+            await asyncio.sleep(0)
+
+        logger.debug(f"Prewarmed {staged}/{len(pending)} pending notifications")
+        return staged
+
+    def _collect_pending(self, now: datetime) -> list[_PrewarmTarget]:
+        """Collect jobs firing within the window that are not staged yet.
+
+        :param now: Current time
+        :type now: datetime
+        :returns: Pending targets ordered by fire time
+        :rtype: list[_PrewarmTarget]
+        """
+        horizon = now + self._window
+        pending: list[_PrewarmTarget] = []
+        for job in self._scheduler.get_all_jobs():
+            target = self._to_target(job=job)
+            if target is None or not now < target.fire_time <= horizon:
+                continue
+            if not self._cache.is_staged(
+                user_id=target.user_id,
+                message_type=target.message_type,
+                fire_time=target.fire_time,
+            ):
+                pending.append(target)
+        pending.sort(key=lambda target: target.fire_time)
+        return pending
+
+    @staticmethod
+    def _to_target(job: JobInfo) -> _PrewarmTarget | None:
+        """Extract the prewarm target of a notification job.
+
+        :param job: Scheduled job
+        :type job: JobInfo
+        :returns: Target or None if the job is not a user notification
+        :rtype: _PrewarmTarget | None
+        """
+        user_id = job.kwargs.get("user_id")
+        message_type = job.kwargs.get("message_type")
+        if user_id is None or message_type is None or job.next_run_time is None:
+            return None
+        return _PrewarmTarget(
+            user_id=user_id,
+            message_type=message_type,
+            fire_time=job.next_run_time,
+        )
+
+    async def _prepare(self, target: _PrewarmTarget) -> PrewarmedNotification | None:
+        """Generate the payload and optional image for a target.
+
+        :param target: Job to prepare
+        :type target: _PrewarmTarget
+        :returns: Prepared notification or None if no payload was generated
+        :rtype: PrewarmedNotification | None
+        """
+        payload = await self._notification_service.generate_summary(
+            user_id=target.user_id,
+            message_type=target.message_type,
+            reference_date=target.fire_time.date(),
+        )
+        if payload is None:
+            return None
+
+        image: bytes | None = None
+        if self._user_service is not None:
+            image = await render_grid_image(
+                user_id=target.user_id, user_service=self._user_service
+            )
+
+        return PrewarmedNotification(
+            payload=payload, fire_time=target.fire_time, image=image
+        )
+
+
+async def render_grid_image(user_id: int, user_service: Any) -> bytes | None:
+    """Render the life grid attached to a scheduled summary.
+
+    Used by the prewarmer ahead of the slot and by the job itself when the
+    cache has no image for the user, so both send the same notification.
+
+    :param user_id: Telegram user ID
+    :type user_id: int
+    :param user_service: User service the grid reads the profile from
+    :type user_service: Any
+    :returns: PNG image, or None if rendering failed
+    :rtype: bytes | None
+    """
+    try:
+        from ..visualization.grid import generate_visualization
+
+        buffer = await generate_visualization(
+            user_info=user_id, user_service_instance=user_service
+        )
+    except Exception as error:
+        logger.warning(f"Failed to render grid for user {user_id}: {error}")
+        return None
+    return buffer.getvalue()
+
+
+# Worker-process wide cache shared by the prewarmer and notification jobs
+notification_prewarm_cache = PrewarmCache()
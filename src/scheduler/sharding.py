@@ -0,0 +1,212 @@
+"""Partitioning of scheduled jobs across several scheduler workers.
+
+A single worker process runs every job, builds every payload and sends
+every notification, so at large user counts its one event loop becomes the
+bottleneck. With several workers, each owns the users whose Telegram ID
+falls into its hash partition, and the ShardedSchedulerClient sends every
+command to the worker owning the job. Job IDs end with the user's ID
+(``notification_<telegram_id>``), so scheduling, rescheduling and removing
+a user's job always reach the same worker without a lookup table.
+"""
+
+import asyncio
+import zlib
+from datetime import datetime
+
+from ..contracts.scheduler_port_protocol import JobInfo, ScheduleTrigger
+from ..utils.config import BOT_NAME
+from ..utils.logger import get_logger
+from .client import SchedulerClient
+
+logger = get_logger(f"{BOT_NAME}.SchedulerClient")
+
+
+def shard_for_user(user_id: int, shards: int) -> int:
+    """Return the shard owning a user's jobs.
+
+    :param user_id: Telegram user ID
+    :type user_id: int
+    :param shards: Number of shards
+    :type shards: int
+    :returns: Shard index from 0 to ``shards - 1``
+    :rtype: int
+    """
+    return user_id % shards
+
+
+def shard_for_job(job_id: str, shards: int) -> int:
+    """Return the shard owning a job.
+
+    Jobs whose ID ends with ``_<user_id>`` belong to the user's shard;
+    others are placed by a stable hash of their ID.
+
+    :param job_id: Job ID, e.g. "notification_123"
+    :type job_id: str
+    :param shards: Number of shards
+    :type shards: int
+    :returns: Shard index from 0 to ``shards - 1``
+    :rtype: int
+    """
+    _, _, suffix = job_id.rpartition("_")
+    if suffix.isdigit():
+        return shard_for_user(int(suffix), shards)
+    return zlib.crc32(job_id.encode()) % shards
+
+
+class ShardedSchedulerClient:
+    """Client routing commands to the scheduler worker owning the job.
+
+    Offers the job commands of SchedulerClient; per-worker operations such
+    as heartbeats and digests are done on the clients in :attr:`shards`.
+
+    :ivar _clients: Client of each shard's worker, by shard index
+    """
+
+    def __init__(self, clients: list[SchedulerClient]) -> None:
+        """Initialize the client.
+
+        :param clients: Client of each shard's worker, by shard index
+        :type clients: list[SchedulerClient]
+        :raises ValueError: If no client is given
+        """
+        if not clients:
+            raise ValueError("At least one scheduler shard is required")
+        self._clients = list(clients)
+
+    @property
+    def shards(self) -> list[SchedulerClient]:
+        """Client of each shard's worker, by shard index."""
+        return list(self._clients)
+
+    def shard(self, job_id: str) -> SchedulerClient:
+        """Return the client of the worker owning a job.
+
+        :param job_id: Job ID
+        :type job_id: str
+        :returns: Client of the owning shard
+        :rtype: SchedulerClient
+        """
+        return self._clients[shard_for_job(job_id, len(self._clients))]
+
+    def replace_shard(self, index: int, client: SchedulerClient) -> None:
+        """Route a shard's commands to a new client, e.g. of a restarted worker.
+
+        :param index: Shard index
+        :type index: int
+        :param client: Client of the shard's new worker
+        :type client: SchedulerClient
+        :returns: None
+        """
+        self._clients[index] = client
+
+    async def start_listening(self) -> None:
+        """Start listening for responses of every worker.
+
+        :returns: None
+        """
+        for client in self._clients:
+            await client.start_listening()
+
+    async def stop_listening(self) -> None:
+        """Stop listening for responses of every worker.
+
+        :returns: None
+        """
+        for client in self._clients:
+            await client.stop_listening()
+
+    def get_job(self, job_id: str) -> JobInfo | None:
+        """Get a job from the owning worker's job mirror.
+
+        :param job_id: Job ID
+        :type job_id: str
+        :returns: Job information or None if no such job is scheduled
+        :rtype: JobInfo | None
+        """
+        return self.shard(job_id).get_job(job_id)
+
+    def get_all_jobs(self) -> list[JobInfo]:
+        """Get the jobs of all workers from their job mirrors.
+
+        :returns: Scheduled jobs
+        :rtype: list[JobInfo]
+        """
+        return [job for client in self._clients for job in client.get_all_jobs()]
+
+    def get_next_run_time(self, job_id: str) -> datetime | None:
+        """Get when a job runs next, from the owning worker's job mirror.
+
+        :param job_id: Job ID
+        :type job_id: str
+        :returns: Next run time or None if the job is not scheduled
+        :rtype: datetime | None
+        """
+        return self.shard(job_id).get_next_run_time(job_id)
+
+    async def schedule_job(
+        self,
+        job_id: str,
+        trigger: ScheduleTrigger,
+        job_type: str = "notification",
+        user_id: int | None = None,
+    ) -> bool:
+        """Schedule a job on the worker owning it.
+
+        :param job_id: Job ID
+        :type job_id: str
+        :param trigger: Schedule trigger
+        :type trigger: ScheduleTrigger
+        :param job_type: Type of job
+        :type job_type: str
+        :param user_id: User ID associated with job
+        :type user_id: int | None
+        :returns: True if successful
+        :rtype: bool
+        """
+        return await self.shard(job_id).schedule_job(
+            job_id=job_id, trigger=trigger, job_type=job_type, user_id=user_id
+        )
+
+    async def remove_job(self, job_id: str) -> bool:
+        """Remove a job from the worker owning it.
+
+        :param job_id: Job ID
+        :type job_id: str
+        :returns: True if successful
+        :rtype: bool
+        """
+        return await self.shard(job_id).remove_job(job_id)
+
+    async def reschedule_job(self, job_id: str, trigger: ScheduleTrigger) -> bool:
+        """Reschedule a job on the worker owning it.
+
+        :param job_id: Job ID
+        :type job_id: str
+        :param trigger: New trigger
+        :type trigger: ScheduleTrigger
+        :returns: True if successful
+        :rtype: bool
+        """
+        return await self.shard(job_id).reschedule_job(job_id, trigger)
+
+    async def health_check(self) -> bool:
+        """Check the workers of all shards at once.
+
+        :returns: True if every worker is healthy
+        :rtype: bool
+        """
+        results: list[bool] = await asyncio.gather(
+            *(client.health_check() for client in self._clients)
+        )
+        unhealthy = [index for index, healthy in enumerate(results) if not healthy]
+        if unhealthy:
+            logger.warning(f"Scheduler shards {unhealthy} failed their health check")
+        return not unhealthy
+
+    async def shutdown(self) -> None:
+        """Shutdown the workers of all shards.
+
+        :returns: None
+        """
+        for client in self._clients:
+            await client.shutdown()
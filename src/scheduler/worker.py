@@ -5,7 +5,9 @@ and manages the scheduler lifecycle, handling IPC commands from the main applica
 """
 
 import asyncio
+import os
 import signal
+from datetime import timezone
 from multiprocessing import Queue
 from typing import Any
 
@@ -19,11 +21,28 @@ from ..services.notification_service import (
     MESSAGE_TYPE_MONTHLY_SUMMARY,
     MESSAGE_TYPE_WEEKLY_SUMMARY,
 )
-from ..utils.config import BOT_NAME
+from ..utils.config import (
+    BOT_NAME,
+    NOTIFICATION_JITTER_WINDOW_SECONDS,
+    NOTIFICATION_SENDS_PER_SECOND,
+    SCHEDULER_HEARTBEAT_SECONDS,
+    SCHEDULER_PREWARM_INTERVAL_SECONDS,
+    SCHEDULER_PREWARM_RENDER_IMAGES,
+    SCHEDULER_PREWARM_WINDOW_SECONDS,
+)
 from ..utils.logger import get_logger
 from .adapters.apscheduler_adapter import APSchedulerAdapter
-from .commands import SchedulerCommand, SchedulerCommandType, SchedulerResponse
+from .commands import (
+    JobStateUpdate,
+    SchedulerCommand,
+    SchedulerCommandType,
+    SchedulerResponse,
+    WorkerHeartbeat,
+)
+from .digest import combine_digests, job_digest
 from .jobs import execute_notification_job
+from .peak_shaving import delivery_planner
+from .prewarm import NotificationPrewarmer, notification_prewarm_cache
 
 logger = get_logger(f"{BOT_NAME}.SchedulerWorker")
 
@@ -37,6 +56,10 @@ class SchedulerWorker:
     :ivar _response_queue: Queue for sending responses
     :ivar _scheduler: The underlying scheduler implementation
     :ivar _running: Whether the worker loop is running
+    :ivar _prewarmer: Prepares notifications ahead of their slot, if enabled
+    :ivar _schedules: Trigger and job type of each scheduled job, for digests
+    :ivar _shard: Index of the partition of users whose jobs this worker runs
+    :ivar _sends_per_second: This worker's share of the delivery rate
     """
 
     def __init__(
@@ -44,6 +67,8 @@ class SchedulerWorker:
         command_queue: Queue,
         response_queue: Queue,
         scheduler: SchedulerPortProtocol | None = None,
+        shard: int = 0,
+        sends_per_second: float = NOTIFICATION_SENDS_PER_SECOND,
     ) -> None:
         """Initialize the scheduler worker.
 
@@ -53,6 +78,10 @@ class SchedulerWorker:
         :type response_queue: Queue
         :param scheduler: Scheduler implementation (default: APSchedulerAdapter)
         :type scheduler: SchedulerPortProtocol | None
+        :param shard: Index of the partition of users this worker runs jobs for
+        :type shard: int
+        :param sends_per_second: Notifications this worker may send per second
+        :type sends_per_second: float
         :returns: None
         """
         self._command_queue = command_queue
@@ -60,6 +89,10 @@ class SchedulerWorker:
         self._scheduler = scheduler or APSchedulerAdapter()
         self._running = False
         self._loop: asyncio.AbstractEventLoop | None = None
+        self._prewarmer: NotificationPrewarmer | None = None
+        self._schedules: dict[str, tuple[ScheduleTrigger, str]] = {}
+        self._shard = shard
+        self._sends_per_second = sends_per_second
 
     def run(self) -> None:
         """Run the worker process.
@@ -68,17 +101,24 @@ class SchedulerWorker:
         It sets up signal handlers and starts the main loop.
         """
         self._running = True
-        logger.info("Scheduler worker started")
+        logger.info(f"Scheduler worker {self._shard} started (PID: {os.getpid()})")
 
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGTERM, self._handle_shutdown_signal)
         signal.signal(signal.SIGINT, self._handle_shutdown_signal)
 
+        # Users sharing a notification time are sent at this worker's rate
+        delivery_planner.configure(
+            sends_per_second=self._sends_per_second,
+            window_seconds=NOTIFICATION_JITTER_WINDOW_SECONDS,
+        )
+
         try:
             self._loop = asyncio.new_event_loop()
             asyncio.set_event_loop(self._loop)
 
-            # Start scheduler
+            # Start scheduler, keeping the client's job mirror current
+            self._scheduler.add_fire_listener(self._handle_job_fired)
             self._scheduler.start()
 
             # Run main loop
@@ -96,19 +136,64 @@ class SchedulerWorker:
         await container.initialize()
         logger.info("Worker services initialized")
 
-        while self._running:
-            try:
-                # Non-blocking get from queue
-                if not self._command_queue.empty():
-                    command: SchedulerCommand = self._command_queue.get_nowait()
-                    await self._process_command(command)
+        heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        prewarm_task: asyncio.Task | None = None
+        if SCHEDULER_PREWARM_WINDOW_SECONDS > 0:
+            self._prewarmer = NotificationPrewarmer(
+                scheduler=self._scheduler,
+                notification_service=container.get_notification_service(),
+                cache=notification_prewarm_cache,
+                window_seconds=SCHEDULER_PREWARM_WINDOW_SECONDS,
+                interval_seconds=SCHEDULER_PREWARM_INTERVAL_SECONDS,
+                user_service=(
+                    container.get_user_service()
+                    if SCHEDULER_PREWARM_RENDER_IMAGES
+                    else None
+                ),
+            )
+            prewarm_task = asyncio.create_task(self._prewarm_loop())
 
-                # Sleep briefly to avoid busy loop
-                await asyncio.sleep(0.1)
+        try:
+            while self._running:
+                try:
+                    # Non-blocking get from queue
+                    if not self._command_queue.empty():
+                        command: SchedulerCommand = self._command_queue.get_nowait()
+                        await self._process_command(command)
+
+                    # Sleep briefly to avoid busy loop
+                    await asyncio.sleep(0.1)
+
+                except Exception as error:
+                    logger.error(f"Error in scheduler worker loop: {error}")
+                    await asyncio.sleep(1)
+        finally:
+            heartbeat_task.cancel()
+            if prewarm_task is not None:
+                prewarm_task.cancel()
 
+    async def _heartbeat_loop(self) -> None:
+        """Tell the bot at a fixed interval that this worker is responsive."""
+        while self._running:
+            self._response_queue.put(WorkerHeartbeat(pid=os.getpid()))
+            await asyncio.sleep(SCHEDULER_HEARTBEAT_SECONDS)
+
+    async def _prewarm_loop(self) -> None:
+        """Periodically prepare notifications for upcoming slots."""
+        if self._prewarmer is None:
+            return
+        logger.info(
+            f"Notification prewarming enabled "
+            f"({SCHEDULER_PREWARM_WINDOW_SECONDS}s window)"
+        )
+        while self._running:
+            try:
+                await self._prewarmer.prewarm_due()
+            except asyncio.CancelledError:
+                raise
             except Exception as error:
-                logger.error(f"Error in scheduler worker loop: {error}")
-                await asyncio.sleep(1)
+                logger.error(f"Notification prewarm failed: {error}")
+            await asyncio.sleep(self._prewarmer.interval_seconds)
 
     async def _process_command(self, command: SchedulerCommand) -> None:  # noqa: C901
         """Process a received command.
@@ -126,7 +211,7 @@ class SchedulerWorker:
 
             elif command.type == SchedulerCommandType.REMOVE_JOB:
                 job_id = command.payload["job_id"]
-                if not self._scheduler.remove_job(job_id):
+                if not self._handle_remove_job(job_id):
                     response = SchedulerResponse(
                         command_id=command.id,
                         success=False,
@@ -145,12 +230,11 @@ class SchedulerWorker:
                     data=job_info,
                 )
 
-            elif command.type == SchedulerCommandType.GET_ALL_JOBS:
-                jobs = self._scheduler.get_all_jobs()
+            elif command.type == SchedulerCommandType.GET_DIGEST:
                 response = SchedulerResponse(
                     command_id=command.id,
                     success=True,
-                    data=jobs,
+                    data=self._handle_get_digest(command.payload),
                 )
 
             elif command.type == SchedulerCommandType.PAUSE:
@@ -227,6 +311,12 @@ class SchedulerWorker:
                 callback=callback,
                 kwargs=kwargs,
             )
+            self._schedules[job_id] = (trigger, job_type)
+            if user_id:
+                # Staged payloads were built from the settings before the change
+                notification_prewarm_cache.evict_user(user_id)
+            self._plan_delivery(job_id)
+            self._publish_job_state(job_id)
             logger.info(f"Successfully scheduled job {job_id}")
         else:
             logger.warning(f"Unknown job type: {job_type}")
@@ -242,7 +332,101 @@ class SchedulerWorker:
         trigger_data = payload["trigger"]
         trigger = ScheduleTrigger(**trigger_data)
 
-        self._scheduler.reschedule_job(job_id, trigger)
+        if (
+            self._scheduler.reschedule_job(job_id, trigger)
+            and job_id in self._schedules
+        ):
+            self._schedules[job_id] = (trigger, self._schedules[job_id][1])
+            self._evict_prewarmed(job_id)
+            self._plan_delivery(job_id)
+        self._publish_job_state(job_id)
+
+    def _handle_remove_job(self, job_id: str) -> bool:
+        """Handle remove job command.
+
+        :param job_id: ID of the job to remove
+        :type job_id: str
+        :returns: True if the job existed
+        :rtype: bool
+        """
+        job = self._scheduler.get_job(job_id)
+        removed = self._scheduler.remove_job(job_id)
+        self._schedules.pop(job_id, None)
+        if job and job.kwargs.get("user_id"):
+            notification_prewarm_cache.evict_user(job.kwargs["user_id"])
+            delivery_planner.remove(job.kwargs["user_id"])
+        self._publish_job_state(job_id)
+        return removed
+
+    def _evict_prewarmed(self, job_id: str) -> None:
+        """Drop the notifications staged for a job's user before a change.
+
+        :param job_id: Job ID
+        :type job_id: str
+        :returns: None
+        """
+        job = self._scheduler.get_job(job_id)
+        if job and job.kwargs.get("user_id"):
+            notification_prewarm_cache.evict_user(job.kwargs["user_id"])
+
+    def _handle_job_fired(self, job_id: str) -> None:
+        """Move a job that ran on to its next slot and update the mirror.
+
+        :param job_id: ID of the job that ran
+        :type job_id: str
+        :returns: None
+        """
+        self._plan_delivery(job_id)
+        self._publish_job_state(job_id)
+
+    def _plan_delivery(self, job_id: str) -> None:
+        """Put a job's user into the slot of the job's next run.
+
+        Slots are the UTC instants jobs fire at, so users whose triggers
+        differ only by time zone share the delivery rate of their slot.
+
+        :param job_id: Job ID
+        :type job_id: str
+        :returns: None
+        """
+        job = self._scheduler.get_job(job_id)
+        user_id = job.kwargs.get("user_id") if job else None
+        if not user_id:
+            return
+        if job.next_run_time is None:
+            delivery_planner.remove(user_id)
+        else:
+            delivery_planner.assign(user_id, job.next_run_time.astimezone(timezone.utc))
+
+    def _handle_get_digest(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Describe the scheduled jobs for reconciliation with the database.
+
+        :param payload: Command payload with the bot's combined ``digest``
+        :type payload: dict[str, Any]
+        :returns: Combined ``digest`` and, unless it matches the bot's,
+            the digest of each job as ``jobs``
+        :rtype: dict[str, Any]
+        """
+        digests = {
+            job_id: job_digest(trigger, job_type)
+            for job_id, (trigger, job_type) in self._schedules.items()
+        }
+        combined = combine_digests(digests)
+        return {
+            "digest": combined,
+            "jobs": None if combined == payload.get("digest") else digests,
+        }
+
+    def _publish_job_state(self, job_id: str) -> None:
+        """Push the current state of a job to the client's mirror.
+
+        :param job_id: ID of the changed job
+        :type job_id: str
+        :returns: None
+        """
+        self._response_queue.put(
+            JobStateUpdate(job_id=job_id, job=self._scheduler.get_job(job_id))
+        )
 
     def _handle_shutdown_signal(self, signum: int, frame: Any) -> None:
         """Handle shutdown signals.
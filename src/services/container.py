@@ -16,7 +16,13 @@ from ..contracts.notification_gateway_protocol import NotificationGatewayProtoco
 from ..database.service import DatabaseManager, UserService
 from ..events.event_bus import EventBus
 from ..scheduler.client import SchedulerClient
-from ..utils.config import TOKEN
+from ..scheduler.sharding import ShardedSchedulerClient
+from ..utils.config import (
+    EVENT_BUS_QUEUE_SIZE,
+    EVENT_BUS_WORKERS,
+    EVENT_HANDLER_TIMEOUT_SECONDS,
+    TOKEN,
+)
 from .i18n_adapter import BabelI18nAdapter
 from .notification_service import NotificationService
 
@@ -108,7 +114,11 @@ class ServiceContainer:
             self.user_service = UserService()
 
         # Initialize event bus
-        self.event_bus = EventBus()
+        self.event_bus = EventBus(
+            workers=EVENT_BUS_WORKERS,
+            queue_size=EVENT_BUS_QUEUE_SIZE,
+            default_timeout=EVENT_HANDLER_TIMEOUT_SECONDS,
+        )
 
         # Initialize notification gateway (skip for testing)
         if skip_telegram:
@@ -127,7 +137,7 @@ class ServiceContainer:
         self.localization_service = BabelI18nAdapter(lang="en")
 
         # Scheduler client (initialized externally)
-        self.scheduler_client: Optional[SchedulerClient] = None
+        self.scheduler_client: Optional[SchedulerClient | ShardedSchedulerClient] = None
 
         # Initialize services that depend on other services
         self._initialize_service_dependencies()
@@ -189,20 +199,24 @@ class ServiceContainer:
         """
         return self.notification_gateway
 
-    def set_scheduler_client(self, client: SchedulerClient) -> None:
+    def set_scheduler_client(
+        self, client: Optional[SchedulerClient | ShardedSchedulerClient]
+    ) -> None:
         """Set the scheduler client instance.
 
-        :param client: Scheduler client instance
-        :type client: SchedulerClient
+        :param client: Scheduler client instance, None once the scheduler stopped
+        :type client: Optional[SchedulerClient | ShardedSchedulerClient]
         :returns: None
         """
         self.scheduler_client = client
 
-    def get_scheduler_client(self) -> Optional[SchedulerClient]:
+    def get_scheduler_client(
+        self,
+    ) -> Optional[SchedulerClient | ShardedSchedulerClient]:
         """Get the scheduler client instance.
 
         :returns: Scheduler client instance or None
-        :rtype: Optional[SchedulerClient]
+        :rtype: Optional[SchedulerClient | ShardedSchedulerClient]
         """
         return self.scheduler_client
 
@@ -261,7 +275,11 @@ class ServiceContainer:
         )
 
         # Initialize event bus
-        instance.event_bus = EventBus()
+        instance.event_bus = EventBus(
+            workers=EVENT_BUS_WORKERS,
+            queue_size=EVENT_BUS_QUEUE_SIZE,
+            default_timeout=EVENT_HANDLER_TIMEOUT_SECONDS,
+        )
 
         # Skip notification gateway for testing
         instance.notification_gateway = None
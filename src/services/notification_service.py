@@ -7,15 +7,14 @@ mechanism (Telegram, email, etc.).
 
 from datetime import date
 
-from babel.numbers import format_decimal, format_percent
-
 from ..constants import DEFAULT_LIFE_EXPECTANCY
 from ..contracts.user_service_protocol import UserServiceProtocol
 from ..core.life_calculator import calculate_life_statistics
 from ..events.domain_events import NotificationPayload
-from ..i18n import normalize_babel_locale, use_locale
+from ..i18n import use_locale
 from ..utils.config import BOT_NAME, DEFAULT_LANGUAGE
 from ..utils.logger import get_logger
+from .stats_renderer import stats_message_renderer
 
 logger = get_logger(f"{BOT_NAME}.NotificationService")
 
@@ -51,6 +50,7 @@ class NotificationService:
         self,
         user_id: int,
         message_type: str = MESSAGE_TYPE_WEEKLY_SUMMARY,
+        reference_date: date | None = None,
     ) -> NotificationPayload | None:
         """Generate life statistics summary notification payload for a user.
 
@@ -61,6 +61,9 @@ class NotificationService:
         :type user_id: int
         :param message_type: Type of summary (daily, weekly, monthly)
         :type message_type: str
+        :param reference_date: Date the statistics are computed for
+            (default: today); used when payloads are prepared ahead of time
+        :type reference_date: date | None
         :returns: Notification payload or None if user not found
         :rtype: NotificationPayload | None
         """
@@ -91,11 +94,11 @@ class NotificationService:
             stats = calculate_life_statistics(
                 birth_date=user.settings.birth_date,
                 life_expectancy=life_expectancy,
+                reference_date=reference_date,
             )
 
             # Generate localized message
             _, _, pgettext = use_locale(user_lang)
-            babel_locale = normalize_babel_locale(user_lang)
 
             # Determine title based on message type
             if message_type == MESSAGE_TYPE_DAILY_SUMMARY:
@@ -109,40 +112,10 @@ class NotificationService:
                     "notifications.weekly", "📊 Your weekly life statistics"
                 )
 
-            # Use the same pgettext context + msgid as /weeks handler
-            # so .po translations are resolved correctly
-            body = pgettext(
-                "weeks.statistics",
-                "📊 <b>Your life statistics:</b>\n\n"
-                "🎂 <b>Age:</b> %(age)s years\n"
-                "📅 <b>Weeks lived:</b> %(weeks_lived)s\n"
-                "⏳ <b>Remaining weeks (until %(life_expectancy)s years):"
-                "</b> %(remaining_weeks)s\n"
-                "📈 <b>Life progress:</b> %(life_percentage)s\n"
-                "🎉 <b>Days until birthday:</b> %(days_until_birthday)s\n\n"
-                "💡 Use /visualize to visualize your life weeks",
-            ) % {
-                "age": format_decimal(stats.age, locale=babel_locale),
-                "weeks_lived": format_decimal(
-                    stats.total_weeks_lived,
-                    locale=babel_locale,
-                    format="#,##0",
-                ),
-                "life_expectancy": format_decimal(life_expectancy, locale=babel_locale),
-                "remaining_weeks": format_decimal(
-                    stats.remaining_weeks,
-                    locale=babel_locale,
-                    format="#,##0",
-                ),
-                "life_percentage": format_percent(
-                    stats.percentage_lived,
-                    locale=babel_locale,
-                    format="#0.1%",
-                ),
-                "days_until_birthday": format_decimal(
-                    stats.days_until_birthday, locale=babel_locale
-                ),
-            }
+            # Same message as the /weeks handler
+            body = stats_message_renderer.render(
+                stats=stats, lang=user_lang, pgettext=pgettext
+            )
 
             return NotificationPayload(
                 recipient_id=user_id,
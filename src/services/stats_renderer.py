@@ -0,0 +1,69 @@
+"""Shared rendering of the life statistics message.
+
+The "weeks.statistics" message is sent by the /weeks command and by scheduled
+summary notifications, and /visualize captions reuse the same numbers. This
+module formats those numbers once per message with the cached per-locale
+formatters from :func:`src.i18n.get_number_formatter`.
+"""
+
+from typing import Callable
+
+from ..core.life_calculator import LifeCalculationResult
+from ..i18n import get_number_formatter
+
+
+class StatsMessageRenderer:
+    """Renderer of localized life statistics."""
+
+    def format_values(self, stats: LifeCalculationResult, lang: str) -> dict[str, str]:
+        """Format the statistics placeholders for a language.
+
+        :param stats: Life statistics of the user
+        :type stats: LifeCalculationResult
+        :param lang: User's language code
+        :type lang: str
+        :returns: Placeholder name to localized number
+        :rtype: dict[str, str]
+        """
+        formatter = get_number_formatter(lang)
+        return {
+            "age": formatter.decimal(stats.age),
+            "weeks_lived": formatter.integer(stats.total_weeks_lived),
+            "life_expectancy": formatter.decimal(stats.life_expectancy),
+            "remaining_weeks": formatter.integer(stats.remaining_weeks),
+            "life_percentage": formatter.percent(stats.percentage_lived),
+            "days_until_birthday": formatter.decimal(stats.days_until_birthday),
+        }
+
+    def render(
+        self,
+        stats: LifeCalculationResult,
+        lang: str,
+        pgettext: Callable[[str, str], str],
+    ) -> str:
+        """Render the "weeks.statistics" message.
+
+        :param stats: Life statistics of the user
+        :type stats: LifeCalculationResult
+        :param lang: User's language code, selects the number format
+        :type lang: str
+        :param pgettext: Bound pgettext of the user's language
+        :type pgettext: Callable[[str, str], str]
+        :returns: Localized statistics message
+        :rtype: str
+        """
+        # Literal context and msgid keep the message extractable by pybabel
+        return pgettext(
+            "weeks.statistics",
+            "📊 <b>Your life statistics:</b>\n\n"
+            "🎂 <b>Age:</b> %(age)s years\n"
+            "📅 <b>Weeks lived:</b> %(weeks_lived)s\n"
+            "⏳ <b>Remaining weeks (until %(life_expectancy)s years):</b> %(remaining_weeks)s\n"
+            "📈 <b>Life progress:</b> %(life_percentage)s\n"
+            "🎉 <b>Days until birthday:</b> %(days_until_birthday)s\n\n"
+            "💡 Use /visualize to visualize your life weeks",
+        ) % self.format_values(stats=stats, lang=lang)
+
+
+# Process wide renderer shared by handlers and the notification service
+stats_message_renderer = StatsMessageRenderer()
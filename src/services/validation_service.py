@@ -5,6 +5,7 @@ input validation using Pydantic models from the core logic.
 """
 
 from datetime import date
+from typing import Optional
 
 from pydantic import ValidationError
 
@@ -12,11 +13,15 @@ from src.core.exceptions import ValidationError as CoreValidationError
 from src.core.validation import (
     ERROR_DATE_IN_FUTURE,
     ERROR_DATE_TOO_OLD,
+    ERROR_INVALID_COLOR,
     ERROR_INVALID_DATE_FORMAT,
     ERROR_INVALID_NUMBER,
+    ERROR_LABEL_REQUIRED,
+    ERROR_LABEL_TOO_LONG,
     ERROR_VALUE_TOO_HIGH,
     ERROR_VALUE_TOO_LOW,
     BirthDateInput,
+    LifeEventInput,
     LifeExpectancyInput,
 )
 
@@ -114,3 +119,40 @@ class ValidationService:
             raise CoreValidationError(
                 message="Invalid life expectancy number", error_key=ERROR_INVALID_NUMBER
             ) from error
+
+    def validate_life_event(
+        self, date_str: str, label: str, color: Optional[str] = None
+    ) -> LifeEventInput:
+        """Validate life event input.
+
+        :param date_str: Event date string (expected DD.MM.YYYY)
+        :type date_str: str
+        :param label: Event label
+        :type label: str
+        :param color: Optional "#rrggbb" color
+        :type color: Optional[str]
+        :returns: Validated life event with stripped label and lowercase color
+        :rtype: LifeEventInput
+        :raises CoreValidationError: If validation fails
+        """
+        try:
+            return LifeEventInput(event_date=date_str, label=label, color=color)
+
+        except ValidationError as error:
+            # Map Pydantic errors to our error keys
+            for err in error.errors():
+                msg = err.get("msg", "")
+                for error_key in (
+                    ERROR_LABEL_REQUIRED,
+                    ERROR_LABEL_TOO_LONG,
+                    ERROR_INVALID_COLOR,
+                ):
+                    if error_key in msg:
+                        raise CoreValidationError(
+                            message=f"Invalid life event: {error_key}",
+                            error_key=error_key,
+                        ) from error
+
+            raise CoreValidationError(
+                message="Invalid date format", error_key=ERROR_INVALID_DATE_FORMAT
+            ) from error
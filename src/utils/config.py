@@ -25,6 +25,9 @@ PADDING = 40
 FONT_SIZE = 12
 MAX_YEARS = 90
 WEEKS_PER_YEAR = 52
+MIN_CELL_SIZE = 4
+# Maximum grid area in pixels; matches the classic 90-year weekly grid
+GRID_PIXEL_BUDGET = WEEKS_PER_YEAR * MAX_YEARS * CELL_SIZE * CELL_SIZE
 
 # Validation Constants
 MIN_BIRTH_YEAR = 1900
@@ -36,6 +39,7 @@ COLORS = {
     "background": (255, 255, 255),  # White
     "grid": (200, 200, 200),  # Light gray
     "lived": (76, 175, 80),  # Green
+    "event": (255, 152, 0),  # Orange, for life events without own color
     "text": (0, 0, 0),  # Black
     "axis": (100, 100, 100),  # Dark gray
 }
@@ -44,6 +48,264 @@ COLORS = {
 WEEKLY_NOTIFICATION_DAY = "mon"
 WEEKLY_NOTIFICATION_HOUR = 9
 WEEKLY_NOTIFICATION_MINUTE = 0
+DEFAULT_SCHEDULER_PREWARM_WINDOW_SECONDS = 300
+DEFAULT_SCHEDULER_PREWARM_INTERVAL_SECONDS = 15
+DEFAULT_SCHEDULE_RECONCILE_INTERVAL_SECONDS = 3600
+DEFAULT_SCHEDULER_HEARTBEAT_SECONDS = 2
+DEFAULT_SCHEDULER_HEARTBEAT_TIMEOUT_SECONDS = 10
+DEFAULT_SCHEDULER_SHARDS = 1
+DEFAULT_SCHEDULER_LEASE_SECONDS = 30
+# Telegram allows a bot about 30 messages per second in total
+DEFAULT_NOTIFICATION_SENDS_PER_SECOND = 25
+DEFAULT_NOTIFICATION_JITTER_WINDOW_SECONDS = 600
+DEFAULT_GRID_LAYER_CACHE_SIZE = 32
+DEFAULT_CHART_FIGURE_POOL_SIZE = 2
+# Size of premium matplotlib charts in inches and their resolution
+CHART_FIGSIZE = (8, 6)
+CHART_DPI = 100
+DEFAULT_WEBHOOK_PORT = 8080
+DEFAULT_WEBHOOK_PATH = "/telegram"
+DEFAULT_CONCURRENT_UPDATES = 16
+DEFAULT_USER_QUEUE_DEPTH_WARNING = 5
+DEFAULT_CONVERSATION_STATE_BACKEND = "memory"
+DEFAULT_CONVERSATION_STATE_CACHE_SIZE = 1024
+DEFAULT_CONVERSATION_STATE_CACHE_TTL_SECONDS = 2
+DEFAULT_CONVERSATION_STATE_FLUSH_INTERVAL_SECONDS = 1
+DEFAULT_CONVERSATION_STATE_SWEEP_INTERVAL_SECONDS = 60
+DEFAULT_USER_DATA_MAX_USERS = 10000
+DEFAULT_USER_DATA_EVICTION_INTERVAL_SECONDS = 60
+DEFAULT_EXPENSIVE_QUEUE_SIZE = 32
+DEFAULT_EXPENSIVE_WORKERS = 2
+DEFAULT_FLOOD_BURST = 10
+DEFAULT_FLOOD_RATE_PER_MINUTE = 30
+DEFAULT_EVENT_BUS_WORKERS = 4
+DEFAULT_EVENT_BUS_QUEUE_SIZE = 100
+DEFAULT_EVENT_HANDLER_TIMEOUT_SECONDS = 10
+DEFAULT_RESCHEDULE_DEBOUNCE_SECONDS = 3
+# Largest accepted webhook request body; Telegram updates are a few KB
+WEBHOOK_MAX_BODY_BYTES = 1024 * 1024
+DEFAULT_WEBHOOK_READ_TIMEOUT_SECONDS = 10
+# Telegram opens at most 100 webhook connections (40 by default)
+DEFAULT_WEBHOOK_MAX_CONNECTIONS = 100
+
+
+def _get_int_setting(name: str, default: int) -> int:
+    """
+    Get a non-negative integer setting from environment or use default.
+
+    :param name: Environment variable name
+    :param default: Value used when the variable is unset or invalid
+    :returns: Setting value as integer
+    """
+    try:
+        value = os.getenv(name)
+        if value is not None and int(value) >= 0:
+            return int(value)
+    except (ValueError, TypeError):
+        pass
+    return default
+
+
+def _get_bool_setting(name: str, default: bool) -> bool:
+    """
+    Get a boolean setting from environment or use default.
+
+    :param name: Environment variable name
+    :param default: Value used when the variable is unset
+    :returns: True for "1", "true", "yes" or "on" (case-insensitive)
+    """
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# Seconds before a notification slot in which payloads are pre-computed (0 = off)
+SCHEDULER_PREWARM_WINDOW_SECONDS: int = _get_int_setting(
+    "SCHEDULER_PREWARM_WINDOW_SECONDS", DEFAULT_SCHEDULER_PREWARM_WINDOW_SECONDS
+)
+SCHEDULER_PREWARM_INTERVAL_SECONDS: int = _get_int_setting(
+    "SCHEDULER_PREWARM_INTERVAL_SECONDS", DEFAULT_SCHEDULER_PREWARM_INTERVAL_SECONDS
+)
+# Attach the life grid image to scheduled summaries, pre-rendered when possible
+SCHEDULER_PREWARM_RENDER_IMAGES: bool = _get_bool_setting(
+    "SCHEDULER_PREWARM_RENDER_IMAGES", False
+)
+# Seconds between checks that the worker's jobs match the database (0 = off)
+SCHEDULE_RECONCILE_INTERVAL_SECONDS: int = _get_int_setting(
+    "SCHEDULE_RECONCILE_INTERVAL_SECONDS", DEFAULT_SCHEDULE_RECONCILE_INTERVAL_SECONDS
+)
+# Seconds between heartbeats of the scheduler worker
+SCHEDULER_HEARTBEAT_SECONDS: int = max(
+    1,
+    _get_int_setting(
+        "SCHEDULER_HEARTBEAT_SECONDS", DEFAULT_SCHEDULER_HEARTBEAT_SECONDS
+    ),
+)
+# Seconds without a heartbeat after which the scheduler worker is restarted
+SCHEDULER_HEARTBEAT_TIMEOUT_SECONDS: int = max(
+    1,
+    _get_int_setting(
+        "SCHEDULER_HEARTBEAT_TIMEOUT_SECONDS",
+        DEFAULT_SCHEDULER_HEARTBEAT_TIMEOUT_SECONDS,
+    ),
+)
+# Scheduler worker processes, each running the jobs of a partition of users
+SCHEDULER_SHARDS: int = max(
+    1, _get_int_setting("SCHEDULER_SHARDS", DEFAULT_SCHEDULER_SHARDS)
+)
+# Run the scheduler only in the bot process holding a lease in the database;
+# enable when several bot processes share the database
+SCHEDULER_LEADER_ELECTION: bool = _get_bool_setting("SCHEDULER_LEADER_ELECTION", False)
+# Seconds the scheduler lease lasts unless renewed, i.e. the longest fail-over
+SCHEDULER_LEASE_SECONDS: int = max(
+    3, _get_int_setting("SCHEDULER_LEASE_SECONDS", DEFAULT_SCHEDULER_LEASE_SECONDS)
+)
+# Notifications sent per second by all scheduler workers together
+NOTIFICATION_SENDS_PER_SECOND: int = max(
+    1,
+    _get_int_setting(
+        "NOTIFICATION_SENDS_PER_SECOND", DEFAULT_NOTIFICATION_SENDS_PER_SECOND
+    ),
+)
+# Expected longest delay to stay below that rate, longer slots are logged (0 = none)
+NOTIFICATION_JITTER_WINDOW_SECONDS: int = _get_int_setting(
+    "NOTIFICATION_JITTER_WINDOW_SECONDS", DEFAULT_NOTIFICATION_JITTER_WINDOW_SECONDS
+)
+
+# Rendered grid layers (base grid, per-user progress) kept in memory (0 = off)
+GRID_LAYER_CACHE_SIZE: int = _get_int_setting(
+    "GRID_LAYER_CACHE_SIZE", DEFAULT_GRID_LAYER_CACHE_SIZE
+)
+# Matplotlib figures kept for reuse by premium charts (0 = new figure per chart)
+CHART_FIGURE_POOL_SIZE: int = _get_int_setting(
+    "CHART_FIGURE_POOL_SIZE", DEFAULT_CHART_FIGURE_POOL_SIZE
+)
+
+# Webhook mode: updates are POSTed to an embedded HTTP endpoint instead of polled
+WEBHOOK_ENABLED: bool = _get_bool_setting("WEBHOOK_ENABLED", False)
+# Public HTTPS URL registered with Telegram; empty serves local POSTs only
+WEBHOOK_URL: str = os.getenv("WEBHOOK_URL", "").strip()
+WEBHOOK_LISTEN: str = os.getenv("WEBHOOK_LISTEN", "0.0.0.0").strip() or "0.0.0.0"
+WEBHOOK_PORT: int = _get_int_setting("WEBHOOK_PORT", DEFAULT_WEBHOOK_PORT)
+WEBHOOK_PATH: str = os.getenv("WEBHOOK_PATH", "").strip() or DEFAULT_WEBHOOK_PATH
+# Compared with the X-Telegram-Bot-Api-Secret-Token header of every request
+WEBHOOK_SECRET_TOKEN: str = os.getenv("WEBHOOK_SECRET_TOKEN", "").strip()
+# Seconds a connection may take to send a request, or stay idle between requests
+WEBHOOK_READ_TIMEOUT_SECONDS: int = max(
+    1,
+    _get_int_setting(
+        "WEBHOOK_READ_TIMEOUT_SECONDS", DEFAULT_WEBHOOK_READ_TIMEOUT_SECONDS
+    ),
+)
+# Open connections served at the same time; further ones are answered with 503
+WEBHOOK_MAX_CONNECTIONS: int = max(
+    1, _get_int_setting("WEBHOOK_MAX_CONNECTIONS", DEFAULT_WEBHOOK_MAX_CONNECTIONS)
+)
+
+# Updates of different users processed at the same time (1 = one at a time);
+# updates of the same user are always processed in order
+CONCURRENT_UPDATES: int = max(
+    1, _get_int_setting("CONCURRENT_UPDATES", DEFAULT_CONCURRENT_UPDATES)
+)
+# Pending updates of one user from which a warning is logged
+USER_QUEUE_DEPTH_WARNING: int = max(
+    1, _get_int_setting("USER_QUEUE_DEPTH_WARNING", DEFAULT_USER_QUEUE_DEPTH_WARNING)
+)
+
+# Where conversation states live: "memory" (context.user_data of this process)
+# or "database" (shared by every bot process using the same database)
+CONVERSATION_STATE_BACKEND: str = (
+    os.getenv("CONVERSATION_STATE_BACKEND", "").strip().lower()
+    or DEFAULT_CONVERSATION_STATE_BACKEND
+)
+# Users whose state the database backend keeps in memory
+CONVERSATION_STATE_CACHE_SIZE: int = max(
+    1,
+    _get_int_setting(
+        "CONVERSATION_STATE_CACHE_SIZE", DEFAULT_CONVERSATION_STATE_CACHE_SIZE
+    ),
+)
+# Seconds a cached state is trusted before it is re-read (0 = always re-read)
+CONVERSATION_STATE_CACHE_TTL_SECONDS: int = _get_int_setting(
+    "CONVERSATION_STATE_CACHE_TTL_SECONDS",
+    DEFAULT_CONVERSATION_STATE_CACHE_TTL_SECONDS,
+)
+# Seconds between batched writes of changed states
+CONVERSATION_STATE_FLUSH_INTERVAL_SECONDS: int = max(
+    1,
+    _get_int_setting(
+        "CONVERSATION_STATE_FLUSH_INTERVAL_SECONDS",
+        DEFAULT_CONVERSATION_STATE_FLUSH_INTERVAL_SECONDS,
+    ),
+)
+# Seconds between deletions of expired states
+CONVERSATION_STATE_SWEEP_INTERVAL_SECONDS: int = max(
+    1,
+    _get_int_setting(
+        "CONVERSATION_STATE_SWEEP_INTERVAL_SECONDS",
+        DEFAULT_CONVERSATION_STATE_SWEEP_INTERVAL_SECONDS,
+    ),
+)
+
+# Users whose context.user_data is kept in memory; idle users are dropped first
+USER_DATA_MAX_USERS: int = max(
+    1, _get_int_setting("USER_DATA_MAX_USERS", DEFAULT_USER_DATA_MAX_USERS)
+)
+# Seconds between drops of idle users' context.user_data
+USER_DATA_EVICTION_INTERVAL_SECONDS: int = max(
+    1,
+    _get_int_setting(
+        "USER_DATA_EVICTION_INTERVAL_SECONDS",
+        DEFAULT_USER_DATA_EVICTION_INTERVAL_SECONDS,
+    ),
+)
+
+# Expensive commands (e.g. /visualize) waiting for a worker; more are rejected
+EXPENSIVE_QUEUE_SIZE: int = max(
+    1, _get_int_setting("EXPENSIVE_QUEUE_SIZE", DEFAULT_EXPENSIVE_QUEUE_SIZE)
+)
+# Expensive commands executed at the same time
+EXPENSIVE_WORKERS: int = max(
+    1, _get_int_setting("EXPENSIVE_WORKERS", DEFAULT_EXPENSIVE_WORKERS)
+)
+
+# Updates one user may send at once before being throttled (0 = no limit)
+FLOOD_BURST: int = _get_int_setting("FLOOD_BURST", DEFAULT_FLOOD_BURST)
+# Updates a throttled user regains per minute
+FLOOD_RATE_PER_MINUTE: int = max(
+    1, _get_int_setting("FLOOD_RATE_PER_MINUTE", DEFAULT_FLOOD_RATE_PER_MINUTE)
+)
+
+# Background workers running event listeners (e.g. rescheduling after settings changes)
+EVENT_BUS_WORKERS: int = max(
+    1, _get_int_setting("EVENT_BUS_WORKERS", DEFAULT_EVENT_BUS_WORKERS)
+)
+# Events waiting per worker before publishers have to wait
+EVENT_BUS_QUEUE_SIZE: int = max(
+    1, _get_int_setting("EVENT_BUS_QUEUE_SIZE", DEFAULT_EVENT_BUS_QUEUE_SIZE)
+)
+# Seconds an event listener may run before it is cancelled
+EVENT_HANDLER_TIMEOUT_SECONDS: int = max(
+    1,
+    _get_int_setting(
+        "EVENT_HANDLER_TIMEOUT_SECONDS", DEFAULT_EVENT_HANDLER_TIMEOUT_SECONDS
+    ),
+)
+# Seconds a user's settings changes are collected into one reschedule (0 = none)
+RESCHEDULE_DEBOUNCE_SECONDS: int = _get_int_setting(
+    "RESCHEDULE_DEBOUNCE_SECONDS", DEFAULT_RESCHEDULE_DEBOUNCE_SECONDS
+)
+
+# Keep registered user IDs in memory so unknown users never hit the database.
+# The IDs are loaded once per process and miss registrations made by other
+# processes, so the filter is off whenever several bot processes share the
+# database, i.e. with leader election or database conversation states
+REGISTERED_USERS_FILTER: bool = (
+    _get_bool_setting("REGISTERED_USERS_FILTER", True)
+    and not SCHEDULER_LEADER_ELECTION
+    and CONVERSATION_STATE_BACKEND != "database"
+)
 
 # Subscription message probability (percentage)
 DEFAULT_SUBSCRIPTION_MESSAGE_PROBABILITY = 20  # 20% default probability
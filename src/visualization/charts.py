@@ -0,0 +1,467 @@
+"""Premium matplotlib charts of life progress.
+
+Besides the life grid, premium users can request classic charts through
+``/visualize``:
+
+- **pie** - weeks lived versus weeks remaining
+- **bar** - lived and remaining weeks for every decade of life
+- **timeline** - cumulative weeks lived by age, with life events marked
+
+Creating a matplotlib figure and resolving its fonts cost far more than
+drawing a few artists, so charts are drawn on figures taken from a
+:class:`FigurePool` and handed back cleared after rendering. Rendering runs
+in a worker thread, so it does not hold up other users' updates. matplotlib is
+imported only when the first figure is created, keeping bot startup free of
+its import time.
+"""
+
+import asyncio
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import StrEnum
+from io import BytesIO
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, Tuple
+
+from ..core.life_calculator import LifeCalculationResult, calculate_life_statistics
+from ..core.life_events import LifeEventIndex
+from ..database.service import user_service
+from ..utils.config import (
+    BOT_NAME,
+    CHART_DPI,
+    CHART_FIGSIZE,
+    CHART_FIGURE_POOL_SIZE,
+    COLORS,
+    DEFAULT_LANGUAGE,
+    WEEKS_PER_YEAR,
+)
+from ..utils.logger import get_logger
+from .grid import (
+    LEGEND_MESSAGES,
+    _load_event_index,
+    _parse_legend_labels,
+    _resolve_user_id,
+)
+from .layers import _event_color
+from .layout import GridGranularity
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
+    from ..database.service import UserService
+
+logger = get_logger(f"{BOT_NAME}.Charts")
+
+# Years grouped into one bar of the bar chart
+YEARS_PER_DECADE = 10
+
+
+class ChartType(StrEnum):
+    """Supported premium chart types."""
+
+    PIE = "pie"
+    BAR = "bar"
+    TIMELINE = "timeline"
+
+
+# Title message (context, msgid) for every chart type
+CHART_TITLE_MESSAGES: dict[ChartType, Tuple[str, str]] = {
+    ChartType.PIE: ("chart.title_pie", "Life progress"),
+    ChartType.BAR: ("chart.title_bar", "Weeks by decade of life"),
+    ChartType.TIMELINE: ("chart.title_timeline", "Weeks lived over the years"),
+}
+AGE_AXIS_MESSAGE = ("chart.axis_age", "Age (years)")
+WEEKS_AXIS_MESSAGE = ("chart.axis_weeks", "Weeks")
+EVENTS_LEGEND_MESSAGE = ("chart.events", "Life events")
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ChartLabels:
+    """Localized texts of a chart.
+
+    :ivar title: Chart title
+    :ivar lived: Label of lived weeks
+    :ivar future: Label of remaining weeks
+    :ivar age_axis: Label of the age axis
+    :ivar weeks_axis: Label of the weeks axis
+    :ivar events: Legend label of life event markers
+    """
+
+    title: str
+    lived: str = "Lived weeks"
+    future: str = "Future weeks"
+    age_axis: str = "Age (years)"
+    weeks_axis: str = "Weeks"
+    events: str = "Life events"
+
+
+class FigurePool:
+    """Pool of reusable matplotlib figures attached to Agg canvases.
+
+    The pool is filled on first use. Figures are cleared when returned, so
+    every chart starts from an empty figure of the same size. When all pooled
+    figures are busy an extra one is created and discarded after use.
+
+    :ivar _size: Maximum number of idle figures kept for reuse
+    :ivar _figsize: Figure size in inches
+    :ivar _idle: Figures ready to be drawn on
+    :ivar _warmed_up: Whether the pool has been filled
+    :ivar _lock: Guards ``_idle`` against concurrent renders in threads
+    """
+
+    def __init__(
+        self,
+        size: int = CHART_FIGURE_POOL_SIZE,
+        figsize: Tuple[float, float] = CHART_FIGSIZE,
+    ) -> None:
+        """Initialize an empty pool.
+
+        :param size: Maximum number of idle figures kept; 0 disables pooling
+        :type size: int
+        :param figsize: Figure size in inches
+        :type figsize: Tuple[float, float]
+        :returns: None
+        """
+        self._size = max(0, size)
+        self._figsize = figsize
+        self._idle: list["Figure"] = []
+        self._warmed_up = False
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of idle figures."""
+        return len(self._idle)
+
+    @contextmanager
+    def figure(self) -> Iterator["Figure"]:
+        """Borrow an empty figure for the duration of the block.
+
+        :returns: Context manager yielding an empty figure
+        :rtype: Iterator[Figure]
+        """
+        if not self._warmed_up:
+            self.warm_up()
+        with self._lock:
+            figure = self._idle.pop() if self._idle else None
+        if figure is None:
+            figure = self._create_figure()
+        try:
+            yield figure
+        finally:
+            figure.clear()
+            with self._lock:
+                if len(self._idle) < self._size:
+                    self._idle.append(figure)
+
+    def warm_up(self) -> None:
+        """Fill the pool and resolve the default font once.
+
+        :returns: None
+        """
+        with self._lock:
+            missing = self._size - len(self._idle)
+            self._warmed_up = True
+        figures = [self._create_figure() for _ in range(missing)]
+        if figures:
+            # Drawing a text once caches the font lookup for later charts
+            figures[0].text(0, 0, "0")
+            figures[0].canvas.draw()
+            figures[0].clear()
+        with self._lock:
+            self._idle.extend(figures[: self._size - len(self._idle)])
+
+    def _create_figure(self) -> "Figure":
+        """Create a figure rendered by the Agg backend.
+
+        :returns: New empty figure
+        :rtype: Figure
+        """
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        figure = Figure(figsize=self._figsize, dpi=CHART_DPI)
+        FigureCanvasAgg(figure)
+        return figure
+
+
+async def generate_chart(
+    user_info: Any,
+    user_service_instance: Optional["UserService"] = None,
+    chart_type: ChartType = ChartType.PIE,
+) -> BytesIO:
+    """Generate a premium chart of the user's life progress.
+
+    :param user_info: DB ``User`` | Telegram ``User`` | ``int`` user id
+    :type user_info: Any
+    :param user_service_instance: Optional user service instance to use
+    :type user_service_instance: Optional[UserService]
+    :param chart_type: Kind of chart to draw
+    :type chart_type: ChartType
+    :returns: BytesIO object containing the PNG chart.
+    :rtype: BytesIO
+    :raises TypeError: If ``user_info`` is not a supported type
+    :raises ValueError: If user profile cannot be found in the database
+    """
+    svc = user_service_instance or user_service
+    user_id = _resolve_user_id(user_info=user_info, caller="generate_chart")
+
+    user_profile = await svc.get_user_profile(telegram_id=user_id)
+    if not user_profile:
+        raise ValueError(f"User profile not found for telegram_id: {user_id}")
+    user_lang: str = (
+        user_profile.settings.language
+        if getattr(user_profile, "settings", None)
+        and getattr(user_profile.settings, "language", None)
+        else DEFAULT_LANGUAGE
+    )
+
+    stats = calculate_life_statistics(
+        birth_date=user_profile.settings.birth_date,
+        life_expectancy=user_profile.settings.life_expectancy or 80,
+    )
+    events = None
+    if chart_type == ChartType.TIMELINE:
+        events = await _load_event_index(
+            svc=svc, user_id=user_id, birth_date=user_profile.settings.birth_date
+        )
+
+    from ..i18n import use_locale
+
+    _, _, pgettext = use_locale(user_lang)
+    # savefig takes long enough to stall the event loop, the pool is thread-safe
+    return await asyncio.to_thread(
+        render_chart,
+        chart_type=chart_type,
+        stats=stats,
+        labels=_chart_labels(chart_type=chart_type, pgettext=pgettext),
+        events=events,
+    )
+
+
+def render_chart(
+    chart_type: ChartType,
+    stats: LifeCalculationResult,
+    labels: ChartLabels,
+    events: Optional[LifeEventIndex] = None,
+    pool: Optional[FigurePool] = None,
+) -> BytesIO:
+    """Draw a chart on a pooled figure and encode it as PNG.
+
+    :param chart_type: Kind of chart to draw
+    :type chart_type: ChartType
+    :param stats: Life statistics of the user
+    :type stats: LifeCalculationResult
+    :param labels: Localized chart texts
+    :type labels: ChartLabels
+    :param events: Optional life events, marked on the timeline
+    :type events: Optional[LifeEventIndex]
+    :param pool: Figure pool to draw on, the shared pool by default
+    :type pool: Optional[FigurePool]
+    :returns: BytesIO object containing the PNG chart.
+    :rtype: BytesIO
+    """
+    if pool is None:
+        pool = chart_figure_pool
+    buffer = BytesIO()
+    with pool.figure() as figure:
+        axes = figure.add_subplot()
+        CHART_RENDERERS[chart_type](axes, stats, labels, events)
+        axes.set_title(labels.title)
+        figure.tight_layout()
+        figure.savefig(buffer, format="png")
+    buffer.seek(0)
+    return buffer
+
+
+def _draw_pie(
+    axes: "Axes",
+    stats: LifeCalculationResult,
+    labels: ChartLabels,
+    events: Optional[LifeEventIndex],
+) -> None:
+    """Draw weeks lived versus weeks remaining as a pie.
+
+    :param axes: Axes to draw on
+    :type axes: Axes
+    :param stats: Life statistics of the user
+    :type stats: LifeCalculationResult
+    :param labels: Localized chart texts
+    :type labels: ChartLabels
+    :param events: Unused, accepted for a uniform renderer signature
+    :type events: Optional[LifeEventIndex]
+    :returns: None
+    """
+    axes.pie(
+        [
+            min(stats.total_weeks_lived, stats.total_weeks_expected),
+            stats.remaining_weeks,
+        ],
+        labels=[labels.lived, labels.future],
+        colors=[_rgb(COLORS["lived"]), _rgb(COLORS["background"])],
+        wedgeprops={"edgecolor": _rgb(COLORS["axis"])},
+        autopct="%1.1f%%",
+        startangle=90,
+        counterclock=False,
+    )
+    axes.axis("equal")
+
+
+def _draw_bar(
+    axes: "Axes",
+    stats: LifeCalculationResult,
+    labels: ChartLabels,
+    events: Optional[LifeEventIndex],
+) -> None:
+    """Draw lived and remaining weeks for every decade of life.
+
+    :param axes: Axes to draw on
+    :type axes: Axes
+    :param stats: Life statistics of the user
+    :type stats: LifeCalculationResult
+    :param labels: Localized chart texts
+    :type labels: ChartLabels
+    :param events: Unused, accepted for a uniform renderer signature
+    :type events: Optional[LifeEventIndex]
+    :returns: None
+    """
+    starts = range(0, stats.life_expectancy, YEARS_PER_DECADE)
+    ends = [min(start + YEARS_PER_DECADE, stats.life_expectancy) for start in starts]
+    totals = [(end - start) * WEEKS_PER_YEAR for start, end in zip(starts, ends)]
+    lived = [
+        max(0, min(stats.total_weeks_lived - start * WEEKS_PER_YEAR, total))
+        for start, total in zip(starts, totals)
+    ]
+    positions = list(range(len(totals)))
+
+    axes.barh(positions, lived, color=_rgb(COLORS["lived"]), label=labels.lived)
+    axes.barh(
+        positions,
+        [total - done for total, done in zip(totals, lived)],
+        left=lived,
+        color=_rgb(COLORS["background"]),
+        edgecolor=_rgb(COLORS["axis"]),
+        label=labels.future,
+    )
+    axes.set_yticks(
+        positions, [f"{start}–{end - 1}" for start, end in zip(starts, ends)]
+    )
+    axes.invert_yaxis()
+    axes.set_xlabel(labels.weeks_axis)
+    axes.set_ylabel(labels.age_axis)
+    axes.legend(loc="lower right")
+
+
+def _draw_timeline(
+    axes: "Axes",
+    stats: LifeCalculationResult,
+    labels: ChartLabels,
+    events: Optional[LifeEventIndex],
+) -> None:
+    """Draw cumulative weeks lived by age with life events marked.
+
+    :param axes: Axes to draw on
+    :type axes: Axes
+    :param stats: Life statistics of the user
+    :type stats: LifeCalculationResult
+    :param labels: Localized chart texts
+    :type labels: ChartLabels
+    :param events: Optional life events to mark on the line
+    :type events: Optional[LifeEventIndex]
+    :returns: None
+    """
+    weeks_lived = min(stats.total_weeks_lived, stats.total_weeks_expected)
+    age_now = weeks_lived / WEEKS_PER_YEAR
+
+    axes.plot(
+        [0, age_now],
+        [0, weeks_lived],
+        color=_rgb(COLORS["lived"]),
+        linewidth=2.5,
+        label=labels.lived,
+    )
+    axes.plot(
+        [age_now, stats.life_expectancy],
+        [weeks_lived, stats.total_weeks_expected],
+        color=_rgb(COLORS["axis"]),
+        linestyle="--",
+        label=labels.future,
+    )
+
+    if events:
+        points = [
+            (week, event)
+            for week in sorted(events.by_week)
+            for event in events.by_week[week]
+        ]
+        axes.scatter(
+            [week / WEEKS_PER_YEAR for week, _ in points],
+            [week for week, _ in points],
+            color=[_rgb(_event_color(color=event.color)) for _, event in points],
+            zorder=3,
+            label=labels.events,
+        )
+        for week, event in points:
+            axes.annotate(
+                event.label,
+                (week / WEEKS_PER_YEAR, week),
+                xytext=(4, -10),
+                textcoords="offset points",
+                fontsize=8,
+            )
+
+    axes.set_xlim(0, stats.life_expectancy)
+    axes.set_ylim(0, stats.total_weeks_expected)
+    axes.set_xlabel(labels.age_axis)
+    axes.set_ylabel(labels.weeks_axis)
+    axes.grid(color=_rgb(COLORS["grid"]))
+    axes.legend(loc="upper left")
+
+
+# Drawing function for every chart type
+CHART_RENDERERS: dict[
+    ChartType,
+    Callable[[Any, LifeCalculationResult, ChartLabels, Optional[LifeEventIndex]], None],
+] = {
+    ChartType.PIE: _draw_pie,
+    ChartType.BAR: _draw_bar,
+    ChartType.TIMELINE: _draw_timeline,
+}
+
+
+def _chart_labels(chart_type: ChartType, pgettext: Callable) -> ChartLabels:
+    """Build the localized texts of a chart.
+
+    :param chart_type: Kind of chart to draw
+    :type chart_type: ChartType
+    :param pgettext: Bound pgettext of the user's language
+    :type pgettext: Callable
+    :returns: Localized chart texts
+    :rtype: ChartLabels
+    """
+    lived, future = _parse_legend_labels(
+        raw_legend=pgettext(*LEGEND_MESSAGES[GridGranularity.WEEKS])
+    )
+    return ChartLabels(
+        title=pgettext(*CHART_TITLE_MESSAGES[chart_type]),
+        lived=lived,
+        future=future,
+        age_axis=pgettext(*AGE_AXIS_MESSAGE),
+        weeks_axis=pgettext(*WEEKS_AXIS_MESSAGE),
+        events=pgettext(*EVENTS_LEGEND_MESSAGE),
+    )
+
+
+def _rgb(color: Tuple[int, int, int]) -> Tuple[float, float, float]:
+    """Convert an 8-bit RGB color into matplotlib's 0..1 range.
+
+    :param color: RGB color with 0..255 channels
+    :type color: Tuple[int, int, int]
+    :returns: RGB color with 0..1 channels
+    :rtype: Tuple[float, float, float]
+    """
+    return tuple(channel / 255 for channel in color)
+
+
+# Process wide pool shared by all chart renders
+chart_figure_pool = FigurePool()
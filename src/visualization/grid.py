@@ -1,16 +1,19 @@
 """Grid visualization for life weeks tracking."""
 
+from datetime import date
 from io import BytesIO
 from typing import TYPE_CHECKING, Any, Optional, Tuple
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import ImageDraw, ImageFont
 
 from ..core.life_calculator import calculate_life_statistics
+from ..core.life_events import LifeEventIndex
 from ..database.service import user_service
 
 if TYPE_CHECKING:
     from ..database.service import UserService
 from ..utils.config import (
+    BOT_NAME,
     CELL_SIZE,
     COLORS,
     DEFAULT_LANGUAGE,
@@ -19,33 +22,71 @@ from ..utils.config import (
     PADDING,
     WEEKS_PER_YEAR,
 )
+from ..utils.logger import get_logger
+from .layers import draw_event_overlay, event_cells, grid_layer_cache
+from .layout import (
+    GridGranularity,
+    GridLayout,
+    compute_grid_layout,
+    count_lived_cells,
+)
+
+logger = get_logger(f"{BOT_NAME}.Visualization")
+
+
+# Legend message (context, msgid) for every granularity
+LEGEND_MESSAGES: dict[GridGranularity, Tuple[str, str]] = {
+    GridGranularity.WEEKS: ("visualize.legend", "🟩 Lived weeks | ⬜ Future weeks"),
+    GridGranularity.MONTHS: (
+        "visualize.legend_months",
+        "🟩 Lived months | ⬜ Future months",
+    ),
+    GridGranularity.YEARS: (
+        "visualize.legend_years",
+        "🟩 Lived years | ⬜ Future years",
+    ),
+}
 
 
-def calculate_grid_dimensions() -> Tuple[int, int]:
+def calculate_grid_dimensions(layout: Optional[GridLayout] = None) -> Tuple[int, int]:
     """Calculate the dimensions of the visualization grid.
 
+    Without a layout the classic ``MAX_YEARS`` weekly grid is measured.
+
+    :param layout: Optional per-user grid geometry
+    :type layout: Optional[GridLayout]
     :returns: Tuple of (width, height) in pixels.
     :rtype: Tuple[int, int]
     """
+    if layout is not None:
+        return layout.width, layout.height
     width = (WEEKS_PER_YEAR * CELL_SIZE) + (2 * PADDING)
     height = (MAX_YEARS * CELL_SIZE) + (2 * PADDING)
     return width, height
 
 
 async def generate_visualization(
-    user_info: Any, user_service_instance: Optional["UserService"] = None
+    user_info: Any,
+    user_service_instance: Optional["UserService"] = None,
+    granularity: GridGranularity = GridGranularity.WEEKS,
 ) -> BytesIO:
     """Generate a visual representation of weeks lived.
 
     Creates a grid where:
-    - Each cell represents one week
-    - Each row represents one year (52 weeks)
-    - Green cells represent weeks lived
-    - Empty cells represent weeks not yet lived
+    - Each cell represents one week, month or year (``granularity``)
+    - Each row represents one year (a decade for the yearly grid)
+    - Rows cover the user's life expectancy
+    - Green cells represent time lived
+    - Empty cells represent time not yet lived
+    - Cells with life events are filled with the event's color
     - Years are labeled on the vertical axis
-    - Weeks are labeled on the horizontal axis (every 4th week)
+    - Columns are labeled on the horizontal axis
     - A legend is included at the bottom
 
+    The empty grid and the lived cells come from cached layers (see
+    :mod:`src.visualization.layers`); only the life event overlay and the
+    legend are drawn per call.
+
     This function accepts either a database ``User`` (with ``telegram_id``),
     a Telegram ``User`` (with ``id``), or a raw ``int`` user ID.
 
@@ -53,6 +94,8 @@ async def generate_visualization(
     :type user_info: Any
     :param user_service_instance: Optional user service instance to use
     :type user_service_instance: Optional[UserService]
+    :param granularity: Time span represented by one cell
+    :type granularity: GridGranularity
     :returns: BytesIO object containing the generated image.
     :rtype: BytesIO
     :raises TypeError: If ``user_info`` is not a supported type
@@ -61,16 +104,7 @@ async def generate_visualization(
     # Use provided service or singleton
     svc = user_service_instance or user_service
     # Resolve user id from various supported inputs
-    if hasattr(user_info, "telegram_id"):
-        user_id: int = int(getattr(user_info, "telegram_id"))
-    elif hasattr(user_info, "id"):
-        user_id = int(getattr(user_info, "id"))
-    elif isinstance(user_info, int):
-        user_id = user_info
-    else:
-        raise TypeError(
-            "generate_visualization expects DB User (telegram_id), Telegram User (id), or int user id"
-        )
+    user_id = _resolve_user_id(user_info=user_info, caller="generate_visualization")
 
     # Resolve complete user profile and language
     user_profile = await svc.get_user_profile(telegram_id=user_id)
@@ -84,67 +118,80 @@ async def generate_visualization(
         else DEFAULT_LANGUAGE
     )
 
-    # Calculate life statistics
+    # Calculate life statistics and the grid geometry they need
+    life_expectancy = user_profile.settings.life_expectancy or 80
     stats = calculate_life_statistics(
         birth_date=user_profile.settings.birth_date,
-        life_expectancy=user_profile.settings.life_expectancy or 80,
+        life_expectancy=life_expectancy,
+    )
+    layout = compute_grid_layout(
+        life_expectancy=life_expectancy,
+        granularity=granularity,
+        weeks_lived=stats.total_weeks_lived,
     )
-    weeks_lived: int = stats.total_weeks_lived
-
-    width, height = calculate_grid_dimensions()
-    image = Image.new("RGB", (width, height), COLORS["background"])
-    draw = ImageDraw.Draw(image)
-
-    # Draw grid and cells
-    current_week = 0
 
     # Prepare fonts
     font = _load_font(size=FONT_SIZE)
     small_font = _load_font(size=max(10, int(FONT_SIZE * 0.85)))
 
-    # Draw vertical axis (years)
-    for year in range(MAX_YEARS):
-        y = PADDING + (year * CELL_SIZE)
-        draw.text((5, y), str(year), fill=COLORS["axis"], font=font)
-
-    # Draw horizontal axis (weeks)
-    for week in range(0, WEEKS_PER_YEAR, 4):  # Label every 4th week
-        x = PADDING + (week * CELL_SIZE)
-        draw.text((x, 5), str(week + 1), fill=COLORS["axis"], font=font)
-
-    # Draw cells
-    for year in range(MAX_YEARS):
-        for week in range(WEEKS_PER_YEAR):
-            x = PADDING + (week * CELL_SIZE)
-            y = PADDING + (year * CELL_SIZE)
-
-            # Color cell based on whether week has been lived
-            if current_week < weeks_lived:
-                draw.rectangle(
-                    [x, y, x + CELL_SIZE - 1, y + CELL_SIZE - 1],
-                    fill=COLORS["lived"],
-                    outline=COLORS["grid"],
-                )
-            else:
-                draw.rectangle(
-                    [x, y, x + CELL_SIZE - 1, y + CELL_SIZE - 1],
-                    fill=COLORS["background"],
-                    outline=COLORS["grid"],
-                )
-
-            current_week += 1
-
-    # Add legend with colored markers (avoid emojis to ensure wide font support)
-    legend_y = height - 30
+    # Compose the cached progress layer with this user's life events
+    progress = grid_layer_cache.progress_layer(
+        user_id=user_id,
+        layout=layout,
+        lived_cells=count_lived_cells(stats=stats, granularity=granularity),
+        font=font,
+    )
+    image = progress.copy()
+    draw = ImageDraw.Draw(image)
+    events = await _load_event_index(
+        svc=svc, user_id=user_id, birth_date=user_profile.settings.birth_date
+    )
+    if events:
+        draw_event_overlay(
+            draw=draw,
+            layout=layout,
+            cells=event_cells(
+                index=events, layout=layout, life_expectancy=life_expectancy
+            ),
+        )
 
     # Use gettext for localization
     from ..i18n import use_locale
 
     _, _, pgettext = use_locale(user_lang)
-    legend_text: str = pgettext("visualize.legend", "🟩 Lived weeks | ⬜ Future weeks")
-
+    legend_text: str = pgettext(*LEGEND_MESSAGES[granularity])
     lived_label, future_label = _parse_legend_labels(raw_legend=legend_text)
+    _draw_legend(
+        draw=draw,
+        legend_y=layout.height - 30,
+        labels=(lived_label, future_label),
+        font=small_font,
+    )
+
+    # Convert to BytesIO
+    img_byte_arr = BytesIO()
+    image.save(img_byte_arr, format="PNG")
+    img_byte_arr.seek(0)
+
+    return img_byte_arr
+
+
+def _draw_legend(draw: Any, legend_y: int, labels: Tuple[str, str], font: Any) -> None:
+    """Draw the lived/future legend with colored markers.
+
+    Emojis are avoided to ensure wide font support.
 
+    :param draw: Pillow drawing context
+    :type draw: ImageDraw.ImageDraw
+    :param legend_y: Top coordinate of the legend
+    :type legend_y: int
+    :param labels: Tuple of (lived_label, future_label)
+    :type labels: Tuple[str, str]
+    :param font: Legend font
+    :type font: ImageFont.FreeTypeFont | ImageFont.ImageFont
+    :returns: None
+    """
+    lived_label, future_label = labels
     box_size = max(12, int(FONT_SIZE * 0.9))
     gap = 8
 
@@ -156,10 +203,10 @@ async def generate_visualization(
         outline=COLORS["grid"],
     )
     text_x = lx + box_size + gap
-    draw.text((text_x, legend_y), lived_label, fill=COLORS["text"], font=small_font)
+    draw.text((text_x, legend_y), lived_label, fill=COLORS["text"], font=font)
 
     # Measure width of first item to place the second item
-    bbox = draw.textbbox((0, 0), lived_label, font=small_font)
+    bbox = draw.textbbox((0, 0), lived_label, font=font)
     first_width = (box_size + gap) + (bbox[2] - bbox[0]) + 24
 
     # Second legend item: future
@@ -173,15 +220,56 @@ async def generate_visualization(
         (sx + box_size + gap, legend_y),
         future_label,
         fill=COLORS["text"],
-        font=small_font,
+        font=font,
     )
 
-    # Convert to BytesIO
-    img_byte_arr = BytesIO()
-    image.save(img_byte_arr, format="PNG")
-    img_byte_arr.seek(0)
 
-    return img_byte_arr
+async def _load_event_index(
+    svc: Any, user_id: int, birth_date: date
+) -> Optional[LifeEventIndex]:
+    """Load the week index of a user's life events for the overlay.
+
+    Events are an annotation only: a failed lookup is logged and the grid
+    is rendered without them.
+
+    :param svc: User service providing ``get_life_event_index``
+    :type svc: UserService
+    :param user_id: Telegram user ID
+    :type user_id: int
+    :param birth_date: User's birth date
+    :type birth_date: date
+    :returns: Life event index or None if it could not be loaded
+    :rtype: Optional[LifeEventIndex]
+    """
+    try:
+        return await svc.get_life_event_index(
+            telegram_id=user_id, birth_date=birth_date
+        )
+    except Exception as error:
+        logger.warning(f"Failed to load life events for user {user_id}: {error}")
+        return None
+
+
+def _resolve_user_id(user_info: Any, caller: str) -> int:
+    """Resolve a Telegram user id from the supported user representations.
+
+    :param user_info: DB ``User`` | Telegram ``User`` | ``int`` user id
+    :type user_info: Any
+    :param caller: Name of the public function, used in the error message
+    :type caller: str
+    :returns: Telegram user id
+    :rtype: int
+    :raises TypeError: If ``user_info`` is not a supported type
+    """
+    if hasattr(user_info, "telegram_id"):
+        return int(getattr(user_info, "telegram_id"))
+    if hasattr(user_info, "id"):
+        return int(getattr(user_info, "id"))
+    if isinstance(user_info, int):
+        return user_info
+    raise TypeError(
+        f"{caller} expects DB User (telegram_id), Telegram User (id), or int user id"
+    )
 
 
 def _select_font_path() -> str | None:
@@ -0,0 +1,284 @@
+"""Layered rendering of the raster life grid.
+
+The PNG grid is composed of three layers:
+
+1. **base** - canvas, axis labels and empty cells; depends only on the
+   :class:`GridLayout`, so it is shared by all users with the same layout
+2. **progress** - the base plus the lived cells; cached per user and
+   updated incrementally when the number of lived cells changes
+3. **overlay** - life events, drawn on a copy of the progress layer for
+   every request
+
+Recording a life event therefore only re-composites the overlay instead of
+redrawing every cell of the grid.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+from PIL import Image, ImageColor, ImageDraw
+
+from ..core.life_calculator import calculate_life_statistics
+from ..core.life_events import LifeEventIndex
+from ..utils.config import BOT_NAME, COLORS, GRID_LAYER_CACHE_SIZE
+from ..utils.logger import get_logger
+from .layout import GridGranularity, GridLayout, count_lived_cells
+
+logger = get_logger(f"{BOT_NAME}.GridLayerCache")
+
+RGB = Tuple[int, int, int]
+
+
+@dataclass(slots=True)
+class _ProgressLayer:
+    """Cached progress layer of one user.
+
+    :ivar lived_cells: Number of lived cells drawn on the image
+    :ivar image: Base layer with the lived cells filled in
+    """
+
+    lived_cells: int
+    image: Image.Image
+
+
+class GridLayerCache:
+    """LRU cache of base and progress layers.
+
+    Returned images are shared cache entries: callers must draw on a copy.
+
+    :ivar _max_entries: Maximum number of cached images per layer kind
+    :ivar _base_layers: Base layers keyed by layout
+    :ivar _progress_layers: Progress layers keyed by ``(user_id, layout)``
+    """
+
+    def __init__(self, max_entries: int = GRID_LAYER_CACHE_SIZE) -> None:
+        """Initialize an empty cache.
+
+        :param max_entries: Maximum number of cached images per layer kind;
+            0 disables caching
+        :type max_entries: int
+        :returns: None
+        """
+        self._max_entries = max(0, max_entries)
+        self._base_layers: OrderedDict[GridLayout, Image.Image] = OrderedDict()
+        self._progress_layers: OrderedDict[Tuple[int, GridLayout], _ProgressLayer] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        """Return the number of cached images."""
+        return len(self._base_layers) + len(self._progress_layers)
+
+    def base_layer(self, layout: GridLayout, font: Any) -> Image.Image:
+        """Return the base layer of a layout, drawing it on a cache miss.
+
+        :param layout: Grid geometry
+        :type layout: GridLayout
+        :param font: Axis label font, used only when the layer is drawn
+        :type font: ImageFont.FreeTypeFont | ImageFont.ImageFont
+        :returns: Canvas with axis labels and empty cells
+        :rtype: Image.Image
+        """
+        image = self._base_layers.get(layout)
+        if image is not None:
+            self._base_layers.move_to_end(layout)
+            return image
+
+        image = Image.new("RGB", (layout.width, layout.height), COLORS["background"])
+        draw = ImageDraw.Draw(image)
+        _draw_axes(draw=draw, layout=layout, font=font)
+        _fill_cells(
+            draw=draw,
+            layout=layout,
+            start=0,
+            stop=layout.total_cells,
+            fill=COLORS["background"],
+        )
+        self._store(self._base_layers, layout, image)
+        return image
+
+    def progress_layer(
+        self, user_id: int, layout: GridLayout, lived_cells: int, font: Any
+    ) -> Image.Image:
+        """Return the progress layer of a user.
+
+        A cached layer is brought up to date by drawing only the cells
+        between the cached and the requested lived count.
+
+        :param user_id: Telegram user ID
+        :type user_id: int
+        :param layout: Grid geometry
+        :type layout: GridLayout
+        :param lived_cells: Number of lived cells
+        :type lived_cells: int
+        :param font: Axis label font, used only when the base layer is drawn
+        :type font: ImageFont.FreeTypeFont | ImageFont.ImageFont
+        :returns: Base layer with the lived cells filled in
+        :rtype: Image.Image
+        """
+        lived_cells = max(0, min(lived_cells, layout.total_cells))
+        key = (user_id, layout)
+        layer = self._progress_layers.get(key)
+        if layer is None:
+            base = self.base_layer(layout=layout, font=font)
+            layer = _ProgressLayer(lived_cells=0, image=base.copy())
+            self._store(self._progress_layers, key, layer)
+        else:
+            self._progress_layers.move_to_end(key)
+
+        if layer.lived_cells != lived_cells:
+            draw = ImageDraw.Draw(layer.image)
+            if lived_cells > layer.lived_cells:
+                _fill_cells(
+                    draw, layout, layer.lived_cells, lived_cells, COLORS["lived"]
+                )
+            else:
+                # Birth date moved forward: turn surplus cells back into future
+                _fill_cells(
+                    draw, layout, lived_cells, layer.lived_cells, COLORS["background"]
+                )
+            layer.lived_cells = lived_cells
+        return layer.image
+
+    def clear(self) -> None:
+        """Drop all cached layers.
+
+        :returns: None
+        """
+        self._base_layers.clear()
+        self._progress_layers.clear()
+
+    def _store(self, entries: OrderedDict, key: Any, value: Any) -> None:
+        """Insert an entry and evict the least recently used ones.
+
+        :param entries: Cache to insert into
+        :type entries: OrderedDict
+        :param key: Cache key
+        :type key: Any
+        :param value: Cached value
+        :type value: Any
+        :returns: None
+        """
+        if self._max_entries == 0:
+            return
+        entries[key] = value
+        while len(entries) > self._max_entries:
+            entries.popitem(last=False)
+
+
+def event_cells(
+    index: LifeEventIndex, layout: GridLayout, life_expectancy: int
+) -> dict[int, RGB]:
+    """Map life events to grid cells and their colors.
+
+    When several events share a cell, the latest one decides the color.
+
+    :param index: Week index of the user's life events
+    :type index: LifeEventIndex
+    :param layout: Grid geometry
+    :type layout: GridLayout
+    :param life_expectancy: Expected life span in years
+    :type life_expectancy: int
+    :returns: Cell number to RGB color
+    :rtype: dict[int, RGB]
+    """
+    cells: dict[int, RGB] = {}
+    for week, events in index.by_week.items():
+        for event in events:
+            if layout.granularity == GridGranularity.WEEKS:
+                cell = week
+            else:
+                stats = calculate_life_statistics(
+                    birth_date=index.birth_date,
+                    life_expectancy=life_expectancy,
+                    reference_date=event.event_date,
+                )
+                cell = count_lived_cells(stats=stats, granularity=layout.granularity)
+            if cell < layout.total_cells:
+                cells[cell] = _event_color(color=event.color)
+    return cells
+
+
+def draw_event_overlay(draw: Any, layout: GridLayout, cells: dict[int, RGB]) -> None:
+    """Draw life event cells on top of the progress layer.
+
+    :param draw: Pillow drawing context of the composited image
+    :type draw: ImageDraw.ImageDraw
+    :param layout: Grid geometry
+    :type layout: GridLayout
+    :param cells: Cell number to RGB color, see :func:`event_cells`
+    :type cells: dict[int, RGB]
+    :returns: None
+    """
+    for cell, color in cells.items():
+        _fill_cells(draw=draw, layout=layout, start=cell, stop=cell + 1, fill=color)
+
+
+def _event_color(color: Optional[str]) -> RGB:
+    """Resolve the RGB color of an event cell.
+
+    :param color: Stored "#rrggbb" color or None
+    :type color: Optional[str]
+    :returns: RGB color, the default event color if missing or invalid
+    :rtype: RGB
+    """
+    if color:
+        try:
+            return ImageColor.getrgb(color)[:3]
+        except ValueError:
+            logger.warning(f"Ignoring invalid life event color {color!r}")
+    return COLORS["event"]
+
+
+def _draw_axes(draw: Any, layout: GridLayout, font: Any) -> None:
+    """Draw year labels on the vertical and column labels on the horizontal axis.
+
+    :param draw: Pillow drawing context
+    :type draw: ImageDraw.ImageDraw
+    :param layout: Grid geometry
+    :type layout: GridLayout
+    :param font: Label font
+    :type font: ImageFont.FreeTypeFont | ImageFont.ImageFont
+    :returns: None
+    """
+    for row in range(0, layout.rows, layout.row_label_step):
+        y = layout.padding + (row * layout.cell_size)
+        draw.text((5, y), layout.row_label(row), fill=COLORS["axis"], font=font)
+
+    for column in range(0, layout.columns, layout.column_label_step):
+        x = layout.padding + (column * layout.cell_size)
+        draw.text((x, 5), str(column + 1), fill=COLORS["axis"], font=font)
+
+
+def _fill_cells(
+    draw: Any, layout: GridLayout, start: int, stop: int, fill: RGB
+) -> None:
+    """Draw the outlined cells ``start`` to ``stop - 1`` in one color.
+
+    :param draw: Pillow drawing context
+    :type draw: ImageDraw.ImageDraw
+    :param layout: Grid geometry
+    :type layout: GridLayout
+    :param start: First cell number
+    :type start: int
+    :param stop: Cell number after the last cell
+    :type stop: int
+    :param fill: Cell color
+    :type fill: RGB
+    :returns: None
+    """
+    size = layout.cell_size
+    for cell in range(start, stop):
+        row, column = divmod(cell, layout.columns)
+        x = layout.padding + (column * size)
+        y = layout.padding + (row * size)
+        draw.rectangle(
+            [x, y, x + size - 1, y + size - 1],
+            fill=fill,
+            outline=COLORS["grid"],
+        )
+
+
+# Process wide cache shared by all raster grid renders
+grid_layer_cache = GridLayerCache()
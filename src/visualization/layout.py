@@ -0,0 +1,214 @@
+"""Grid geometry for life visualizations.
+
+A :class:`GridLayout` describes how many rows and columns a life grid has
+and how large each cell is. Rows follow the user's life expectancy instead
+of a fixed ``MAX_YEARS`` and cells are scaled to fit ``GRID_PIXEL_BUDGET``,
+so short and coarse grids are cheaper to draw than the classic weekly one.
+"""
+
+import math
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TYPE_CHECKING, Tuple
+
+from ..utils.config import (
+    CELL_SIZE,
+    FONT_SIZE,
+    GRID_PIXEL_BUDGET,
+    MAX_LIFE_EXPECTANCY,
+    MIN_CELL_SIZE,
+    PADDING,
+    WEEKS_PER_YEAR,
+)
+
+if TYPE_CHECKING:
+    from ..core.life_calculator import LifeCalculationResult
+
+# Narrowest canvas that still fits the legend
+MIN_CANVAS_WIDTH = 320
+
+
+class GridGranularity(StrEnum):
+    """Time span represented by a single grid cell."""
+
+    WEEKS = "weeks"
+    MONTHS = "months"
+    YEARS = "years"
+
+
+@dataclass(frozen=True, slots=True)
+class _GranularitySpec:
+    """Static geometry of a granularity.
+
+    :ivar columns: Cells per row
+    :ivar years_per_row: Years of life covered by one row
+    :ivar max_cell_size: Upper bound for the cell size in pixels
+    :ivar column_label_step: Label every n-th column on the horizontal axis
+    """
+
+    columns: int
+    years_per_row: int
+    max_cell_size: int
+    column_label_step: int
+
+
+_GRANULARITY_SPECS: dict[GridGranularity, _GranularitySpec] = {
+    GridGranularity.WEEKS: _GranularitySpec(
+        columns=WEEKS_PER_YEAR,
+        years_per_row=1,
+        max_cell_size=CELL_SIZE,
+        column_label_step=4,
+    ),
+    GridGranularity.MONTHS: _GranularitySpec(
+        columns=12,
+        years_per_row=1,
+        max_cell_size=3 * CELL_SIZE,
+        column_label_step=1,
+    ),
+    GridGranularity.YEARS: _GranularitySpec(
+        columns=10,
+        years_per_row=10,
+        max_cell_size=5 * CELL_SIZE,
+        column_label_step=1,
+    ),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class GridLayout:
+    """Resolved geometry of a life grid.
+
+    :ivar granularity: Time span represented by one cell
+    :ivar columns: Cells per row
+    :ivar rows: Number of rows
+    :ivar cell_size: Cell edge length in pixels
+    :ivar padding: Space around the grid in pixels
+    :ivar years_per_row: Years of life covered by one row
+    :ivar column_label_step: Label every n-th column on the horizontal axis
+    """
+
+    granularity: GridGranularity
+    columns: int
+    rows: int
+    cell_size: int
+    padding: int
+    years_per_row: int
+    column_label_step: int
+
+    @property
+    def grid_width(self) -> int:
+        """Width of the cell area in pixels."""
+        return self.columns * self.cell_size
+
+    @property
+    def grid_height(self) -> int:
+        """Height of the cell area in pixels."""
+        return self.rows * self.cell_size
+
+    @property
+    def width(self) -> int:
+        """Canvas width in pixels, including padding."""
+        return max(self.grid_width + 2 * self.padding, MIN_CANVAS_WIDTH)
+
+    @property
+    def height(self) -> int:
+        """Canvas height in pixels, including padding."""
+        return self.grid_height + 2 * self.padding
+
+    @property
+    def total_cells(self) -> int:
+        """Number of cells in the grid."""
+        return self.columns * self.rows
+
+    @property
+    def row_label_step(self) -> int:
+        """Label every n-th row so that axis labels do not overlap."""
+        return max(1, math.ceil(FONT_SIZE * 0.8 / self.cell_size))
+
+    def row_label(self, row: int) -> str:
+        """Return the vertical axis label (age in years) of a row.
+
+        :param row: Zero based row index
+        :type row: int
+        :returns: Axis label
+        :rtype: str
+        """
+        return str(row * self.years_per_row)
+
+    def lived_row_runs(self, lived_cells: int) -> list[Tuple[int, int]]:
+        """Collapse lived cells into one run per row.
+
+        Lived cells always form a contiguous prefix of the grid, so every
+        row holds at most one run starting at its first column.
+
+        :param lived_cells: Number of lived cells
+        :type lived_cells: int
+        :returns: List of (row, run_length) tuples for rows with lived cells
+        :rtype: list[Tuple[int, int]]
+        """
+        lived = max(0, min(lived_cells, self.total_cells))
+        full_rows, remainder = divmod(lived, self.columns)
+        runs = [(row, self.columns) for row in range(full_rows)]
+        if remainder:
+            runs.append((full_rows, remainder))
+        return runs
+
+
+def compute_grid_layout(
+    life_expectancy: int,
+    granularity: GridGranularity = GridGranularity.WEEKS,
+    weeks_lived: int = 0,
+    pixel_budget: int = GRID_PIXEL_BUDGET,
+) -> GridLayout:
+    """Compute the grid geometry for a user.
+
+    The grid covers the user's life expectancy, extended to the weeks
+    already lived for users who outlived it. The cell size is the largest
+    one that keeps the grid within ``pixel_budget``, clamped to
+    ``MIN_CELL_SIZE`` and the granularity's maximum.
+
+    :param life_expectancy: Expected life span in years
+    :type life_expectancy: int
+    :param granularity: Time span represented by one cell
+    :type granularity: GridGranularity
+    :param weeks_lived: Number of weeks lived
+    :type weeks_lived: int
+    :param pixel_budget: Maximum grid area in pixels
+    :type pixel_budget: int
+    :returns: Resolved grid geometry
+    :rtype: GridLayout
+    """
+    spec = _GRANULARITY_SPECS[granularity]
+    years_lived = math.ceil(max(0, weeks_lived) / WEEKS_PER_YEAR)
+    years = max(1, min(max(life_expectancy, years_lived), MAX_LIFE_EXPECTANCY))
+    rows = math.ceil(years / spec.years_per_row)
+    fitted_size = math.isqrt(pixel_budget // (spec.columns * rows))
+    cell_size = max(MIN_CELL_SIZE, min(spec.max_cell_size, fitted_size))
+    return GridLayout(
+        granularity=granularity,
+        columns=spec.columns,
+        rows=rows,
+        cell_size=cell_size,
+        padding=PADDING,
+        years_per_row=spec.years_per_row,
+        column_label_step=spec.column_label_step,
+    )
+
+
+def count_lived_cells(
+    stats: "LifeCalculationResult", granularity: GridGranularity
+) -> int:
+    """Count lived cells of a grid with the given granularity.
+
+    :param stats: Life statistics of the user
+    :type stats: LifeCalculationResult
+    :param granularity: Time span represented by one cell
+    :type granularity: GridGranularity
+    :returns: Number of lived cells
+    :rtype: int
+    """
+    if granularity == GridGranularity.MONTHS:
+        return stats.months_lived
+    if granularity == GridGranularity.YEARS:
+        return stats.age
+    return stats.total_weeks_lived
@@ -0,0 +1,390 @@
+"""Vector (SVG/PDF) export of the life weeks grid.
+
+The raster renderer in :mod:`src.visualization.grid` draws one rectangle per
+cell. For a printable poster this module produces a resolution independent
+document instead: lived cells are always a contiguous prefix of the grid, so
+each row collapses into a single run-length-encoded path and the whole
+document is assembled as a string.
+"""
+
+from enum import StrEnum
+from io import BytesIO
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from ..core.life_calculator import calculate_life_statistics
+from ..database.service import user_service
+from ..utils.config import COLORS, DEFAULT_LANGUAGE, FONT_SIZE
+from .grid import LEGEND_MESSAGES, _parse_legend_labels, _resolve_user_id
+from .layout import (
+    GridGranularity,
+    GridLayout,
+    compute_grid_layout,
+    count_lived_cells,
+)
+
+if TYPE_CHECKING:
+    from ..database.service import UserService
+
+# Average glyph width of a sans-serif font relative to its size
+AVERAGE_GLYPH_WIDTH_RATIO = 0.55
+
+
+class VectorFormat(StrEnum):
+    """Supported vector output formats."""
+
+    SVG = "svg"
+    PDF = "pdf"
+
+
+async def generate_vector_visualization(
+    user_info: Any,
+    user_service_instance: Optional["UserService"] = None,
+    output_format: VectorFormat = VectorFormat.SVG,
+    granularity: GridGranularity = GridGranularity.WEEKS,
+) -> BytesIO:
+    """Generate a vector life calendar poster of weeks lived.
+
+    Uses the same layout as :func:`src.visualization.grid.generate_visualization`
+    but emits one path per row instead of one rectangle per week.
+
+    :param user_info: DB ``User`` | Telegram ``User`` | ``int`` user id
+    :type user_info: Any
+    :param user_service_instance: Optional user service instance to use
+    :type user_service_instance: Optional[UserService]
+    :param output_format: Vector document format to produce
+    :type output_format: VectorFormat
+    :param granularity: Time span represented by one cell
+    :type granularity: GridGranularity
+    :returns: BytesIO object containing the generated document.
+    :rtype: BytesIO
+    :raises TypeError: If ``user_info`` is not a supported type
+    :raises ValueError: If user profile cannot be found in the database
+    """
+    svc = user_service_instance or user_service
+    user_id = _resolve_user_id(
+        user_info=user_info, caller="generate_vector_visualization"
+    )
+
+    user_profile = await svc.get_user_profile(telegram_id=user_id)
+    if not user_profile:
+        raise ValueError(f"User profile not found for telegram_id: {user_id}")
+    user_lang: str = (
+        user_profile.settings.language
+        if getattr(user_profile, "settings", None)
+        and getattr(user_profile.settings, "language", None)
+        else DEFAULT_LANGUAGE
+    )
+
+    life_expectancy = user_profile.settings.life_expectancy or 80
+    stats = calculate_life_statistics(
+        birth_date=user_profile.settings.birth_date,
+        life_expectancy=life_expectancy,
+    )
+    layout = compute_grid_layout(
+        life_expectancy=life_expectancy,
+        granularity=granularity,
+        weeks_lived=stats.total_weeks_lived,
+    )
+    lived_cells = count_lived_cells(stats=stats, granularity=granularity)
+
+    from ..i18n import use_locale
+
+    _, _, pgettext = use_locale(user_lang)
+    legend_text: str = pgettext(*LEGEND_MESSAGES[granularity])
+    labels = _parse_legend_labels(raw_legend=legend_text)
+
+    if output_format == VectorFormat.PDF:
+        document = render_pdf(layout=layout, lived_cells=lived_cells, labels=labels)
+    else:
+        document = render_svg(
+            layout=layout, lived_cells=lived_cells, labels=labels
+        ).encode("utf-8")
+
+    buffer = BytesIO(document)
+    buffer.seek(0)
+    return buffer
+
+
+def render_svg(layout: GridLayout, lived_cells: int, labels: Tuple[str, str]) -> str:
+    """Render the life grid as an SVG document.
+
+    Grid lines are drawn once through a ``<pattern>`` fill, so the document
+    size depends on the number of rows, not on the number of cells.
+
+    :param layout: Grid geometry
+    :type layout: GridLayout
+    :param lived_cells: Number of lived cells
+    :type lived_cells: int
+    :param labels: Tuple of (lived_label, future_label) legend texts
+    :type labels: Tuple[str, str]
+    :returns: SVG document
+    :rtype: str
+    """
+    width, height = layout.width, layout.height
+    size, padding = layout.cell_size, layout.padding
+    small_size = max(10, int(FONT_SIZE * 0.85))
+    grid_color = _hex(COLORS["grid"])
+
+    parts: list[str] = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}">',
+        "<defs>"
+        f'<pattern id="cell" width="{size}" height="{size}" '
+        f'x="{padding}" y="{padding}" patternUnits="userSpaceOnUse">'
+        f'<path d="M{size},0H0V{size}" fill="none" '
+        f'stroke="{grid_color}" stroke-width="1"/>'
+        "</pattern></defs>",
+        f'<rect width="{width}" height="{height}" fill="{_hex(COLORS["background"])}"/>',
+    ]
+
+    lived_fill = _hex(COLORS["lived"])
+    for row, run_length in layout.lived_row_runs(lived_cells=lived_cells):
+        run_width = run_length * size
+        parts.append(
+            f'<path d="M{padding},{padding + row * size}'
+            f'h{run_width}v{size}h-{run_width}z" fill="{lived_fill}"/>'
+        )
+
+    parts.append(
+        f'<rect x="{padding}" y="{padding}" width="{layout.grid_width}" '
+        f'height="{layout.grid_height}" fill="url(#cell)" stroke="{grid_color}"/>'
+    )
+
+    parts.append(
+        f'<g font-family="sans-serif" font-size="{FONT_SIZE}" '
+        f'fill="{_hex(COLORS["axis"])}" dominant-baseline="hanging">'
+    )
+    for row in range(0, layout.rows, layout.row_label_step):
+        parts.append(
+            f'<text x="5" y="{padding + row * size}">{layout.row_label(row)}</text>'
+        )
+    for column in range(0, layout.columns, layout.column_label_step):
+        parts.append(f'<text x="{padding + column * size}" y="5">{column + 1}</text>')
+    parts.append("</g>")
+
+    legend_y = height - 30
+    box_size = max(12, int(FONT_SIZE * 0.9))
+    parts.append(
+        f'<g font-family="sans-serif" font-size="{small_size}" '
+        f'fill="{_hex(COLORS["text"])}" dominant-baseline="hanging">'
+    )
+    for x, label, fill in _legend_items(
+        layout=layout, labels=labels, font_size=small_size
+    ):
+        parts.append(
+            f'<rect x="{x}" y="{legend_y}" width="{box_size}" height="{box_size}" '
+            f'fill="{_hex(fill)}" stroke="{grid_color}"/>'
+            f'<text x="{x + box_size + 8}" y="{legend_y}">{escape(label)}</text>'
+        )
+    parts.append("</g></svg>")
+    return "".join(parts)
+
+
+def render_pdf(layout: GridLayout, lived_cells: int, labels: Tuple[str, str]) -> bytes:
+    """Render the life grid as a single page PDF document.
+
+    The page uses one user space unit per raster pixel. Text is set in the
+    base-14 Helvetica font, so legend labels that cannot be encoded in
+    WinAnsi fall back to the English legend of the layout's granularity.
+
+    :param layout: Grid geometry
+    :type layout: GridLayout
+    :param lived_cells: Number of lived cells
+    :type lived_cells: int
+    :param labels: Tuple of (lived_label, future_label) legend texts
+    :type labels: Tuple[str, str]
+    :returns: PDF document
+    :rtype: bytes
+    """
+    width, height = layout.width, layout.height
+    size, padding = layout.cell_size, layout.padding
+    grid_top = height - padding
+    small_size = max(10, int(FONT_SIZE * 0.85))
+
+    ops: list[str] = [
+        f"{_pdf_rgb(COLORS['background'])} rg 0 0 {width} {height} re f",
+    ]
+    lived_runs = list(layout.lived_row_runs(lived_cells=lived_cells))
+    if lived_runs:
+        # "f" without a path is invalid, so a grid without lived cells skips it
+        ops.append(f"{_pdf_rgb(COLORS['lived'])} rg")
+        for row, run_length in lived_runs:
+            y = grid_top - (row + 1) * size
+            ops.append(f"{padding} {y} {run_length * size} {size} re")
+        ops.append("f")
+
+    ops.append(f"{_pdf_rgb(COLORS['grid'])} RG 0.5 w")
+    for row in range(layout.rows + 1):
+        y = grid_top - row * size
+        ops.append(f"{padding} {y} m {padding + layout.grid_width} {y} l")
+    for column in range(layout.columns + 1):
+        x = padding + column * size
+        ops.append(f"{x} {grid_top} m {x} {grid_top - layout.grid_height} l")
+    ops.append("S")
+
+    ops.append(f"{_pdf_rgb(COLORS['axis'])} rg")
+    for row in range(0, layout.rows, layout.row_label_step):
+        baseline = grid_top - row * size - FONT_SIZE
+        ops.append(
+            _pdf_text(x=5, y=baseline, size=FONT_SIZE, text=layout.row_label(row))
+        )
+    for column in range(0, layout.columns, layout.column_label_step):
+        ops.append(
+            _pdf_text(
+                x=padding + column * size,
+                y=height - 5 - FONT_SIZE,
+                size=FONT_SIZE,
+                text=str(column + 1),
+            )
+        )
+
+    # Base-14 fonts only cover WinAnsi, so e.g. Cyrillic legends use the msgid
+    fallbacks = _parse_legend_labels(raw_legend=LEGEND_MESSAGES[layout.granularity][1])
+    pdf_labels = (
+        _pdf_safe_label(text=labels[0], fallback=fallbacks[0]),
+        _pdf_safe_label(text=labels[1], fallback=fallbacks[1]),
+    )
+    box_size = max(12, int(FONT_SIZE * 0.9))
+    legend_y = 30 - box_size
+    for x, label, fill in _legend_items(
+        layout=layout, labels=pdf_labels, font_size=small_size
+    ):
+        ops.append(
+            f"{_pdf_rgb(fill)} rg {_pdf_rgb(COLORS['grid'])} RG "
+            f"{x} {legend_y} {box_size} {box_size} re B"
+        )
+        ops.append(f"{_pdf_rgb(COLORS['text'])} rg")
+        ops.append(
+            _pdf_text(x=x + box_size + 8, y=legend_y, size=small_size, text=label)
+        )
+
+    return _build_pdf(width=width, height=height, content="\n".join(ops))
+
+
+def _legend_items(
+    layout: GridLayout, labels: Tuple[str, str], font_size: int
+) -> list[Tuple[int, str, Tuple[int, int, int]]]:
+    """Lay out the two legend items horizontally.
+
+    Vector documents have no text metrics at build time, so the label width
+    is estimated from an average glyph width.
+
+    :param layout: Grid geometry
+    :type layout: GridLayout
+    :param labels: Tuple of (lived_label, future_label) legend texts
+    :type labels: Tuple[str, str]
+    :param font_size: Legend font size
+    :type font_size: int
+    :returns: List of (x, label, fill_color) tuples
+    :rtype: list[Tuple[int, str, Tuple[int, int, int]]]
+    """
+    box_size = max(12, int(FONT_SIZE * 0.9))
+    lived_label, future_label = labels
+    label_width = int(len(lived_label) * font_size * AVERAGE_GLYPH_WIDTH_RATIO)
+    second_x = layout.padding + (box_size + 8) + label_width + 24
+    return [
+        (layout.padding, lived_label, COLORS["lived"]),
+        (second_x, future_label, COLORS["background"]),
+    ]
+
+
+def _hex(color: Tuple[int, int, int]) -> str:
+    """Convert an RGB tuple to a hex color string.
+
+    :param color: RGB color tuple
+    :type color: Tuple[int, int, int]
+    :returns: Color in ``#rrggbb`` notation
+    :rtype: str
+    """
+    return "#{:02x}{:02x}{:02x}".format(*color)
+
+
+def _pdf_rgb(color: Tuple[int, int, int]) -> str:
+    """Convert an RGB tuple to PDF color operands.
+
+    :param color: RGB color tuple
+    :type color: Tuple[int, int, int]
+    :returns: Space separated color components in the 0..1 range
+    :rtype: str
+    """
+    return " ".join(f"{component / 255:.3f}" for component in color)
+
+
+def _pdf_safe_label(text: str, fallback: str) -> str:
+    """Return ``text`` if it can be set in a base-14 font, else ``fallback``.
+
+    :param text: Localized label
+    :type text: str
+    :param fallback: English label used when ``text`` is not WinAnsi encodable
+    :type fallback: str
+    :returns: Label suitable for PDF output
+    :rtype: str
+    """
+    try:
+        text.encode("cp1252")
+    except UnicodeEncodeError:
+        return fallback
+    return text
+
+
+def _pdf_text(x: int, y: int, size: int, text: str) -> str:
+    """Build a PDF text object.
+
+    :param x: Baseline x coordinate
+    :type x: int
+    :param y: Baseline y coordinate
+    :type y: int
+    :param size: Font size
+    :type size: int
+    :param text: WinAnsi encodable text
+    :type text: str
+    :returns: PDF content stream operators
+    :rtype: str
+    """
+    escaped = text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+    return f"BT /F1 {size} Tf {x} {y} Td ({escaped}) Tj ET"
+
+
+def _build_pdf(width: int, height: int, content: str) -> bytes:
+    """Assemble a single page PDF document around a content stream.
+
+    :param width: Page width in user space units
+    :type width: int
+    :param height: Page height in user space units
+    :type height: int
+    :param content: Page content stream
+    :type content: str
+    :returns: PDF document
+    :rtype: bytes
+    """
+    stream = content.encode("cp1252")
+    objects: list[bytes] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {width} {height}] "
+            f"/Resources << /Font << /F1 5 0 R >> >> /Contents 4 0 R >>"
+        ).encode("ascii"),
+        f"<< /Length {len(stream)} >>\nstream\n".encode("ascii")
+        + stream
+        + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica "
+        b"/Encoding /WinAnsiEncoding >>",
+    ]
+
+    document = bytearray(b"%PDF-1.4\n")
+    offsets: list[int] = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(document))
+        document += f"{number} 0 obj\n".encode("ascii") + body + b"\nendobj\n"
+
+    xref_offset = len(document)
+    document += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("ascii")
+    for offset in offsets:
+        document += f"{offset:010d} 00000 n \n".encode("ascii")
+    document += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref_offset}\n%%EOF\n"
+    ).encode("ascii")
+    return bytes(document)
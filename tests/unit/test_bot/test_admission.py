@@ -0,0 +1,179 @@
+"""Unit tests for AdmissionController.
+
+Tests acknowledgement, the precheck before queueing, per-user
+deduplication, load shedding, priority order and worker error handling.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.bot.admission import AdmissionController, AdmissionResult
+
+
+def _update(user_id: int) -> MagicMock:
+    """Create an update mock with a user and a message.
+
+    :param user_id: Telegram user ID
+    :type user_id: int
+    :returns: Update mock
+    :rtype: MagicMock
+    """
+    update = MagicMock()
+    update.effective_user.id = user_id
+    update.effective_user.language_code = "en"
+    update.effective_message.reply_text = AsyncMock()
+    return update
+
+
+class TestAdmissionController:
+    """Test suite for AdmissionController."""
+
+    def test_rejects_non_positive_limits(self) -> None:
+        """Test that capacity and workers must be positive."""
+        with pytest.raises(ValueError):
+            AdmissionController(capacity=0, workers=1)
+        with pytest.raises(ValueError):
+            AdmissionController(capacity=1, workers=0)
+
+    @pytest.mark.asyncio
+    async def test_queued_command_is_acknowledged_and_executed(self) -> None:
+        """Test that a queued command is acknowledged, then run by a worker."""
+        controller = AdmissionController(capacity=4, workers=1)
+        callback = AsyncMock()
+        update, context = _update(1), MagicMock()
+
+        result = await controller.admit("visualize", 10, callback)(update, context)
+        assert result is None
+        update.effective_message.reply_text.assert_awaited_once()
+
+        await asyncio.wait_for(controller._queue.join(), timeout=1)
+        await controller.stop()
+
+        callback.assert_awaited_once_with(update, context)
+
+    @pytest.mark.asyncio
+    async def test_repeated_command_is_collapsed(self) -> None:
+        """Test that a user's repeated command joins the pending job."""
+        controller = AdmissionController(capacity=4, workers=1)
+        callback = AsyncMock()
+
+        first = await controller.submit("visualize", 10, callback, _update(1), None)
+        repeated = _update(1)
+        second = await controller.submit("visualize", 10, callback, repeated, None)
+        other = await controller.submit("visualize", 10, callback, _update(2), None)
+
+        assert (first, second, other) == (
+            AdmissionResult.QUEUED,
+            AdmissionResult.DUPLICATE,
+            AdmissionResult.QUEUED,
+        )
+        repeated.effective_message.reply_text.assert_awaited_once()
+        assert (
+            "previous"
+            in repeated.effective_message.reply_text.await_args.kwargs["text"]
+        )
+        assert controller.queue_size == 2
+        await controller.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_precheck_runs_inline_without_acknowledgement(self) -> None:
+        """Test that a command ending in an error is answered by the handler only."""
+        controller = AdmissionController(capacity=4, workers=1)
+        callback = AsyncMock()
+        update, context = _update(1), MagicMock()
+
+        result = await controller.submit(
+            "visualize",
+            10,
+            callback,
+            update,
+            context,
+            precheck=AsyncMock(return_value=None),
+        )
+
+        assert result is AdmissionResult.INLINE
+        callback.assert_awaited_once_with(update, context)
+        update.effective_message.reply_text.assert_not_awaited()
+        assert controller.queue_size == 0
+
+    @pytest.mark.asyncio
+    async def test_notices_use_the_language_from_the_precheck(self) -> None:
+        """Test that the acknowledgement and duplicate notice follow the bot language."""
+        controller = AdmissionController(capacity=4, workers=1)
+        precheck = AsyncMock(return_value="ru")
+        first, repeated = _update(1), _update(1)
+
+        await controller.submit(
+            "visualize", 10, AsyncMock(), first, None, precheck=precheck
+        )
+        await controller.submit(
+            "visualize", 10, AsyncMock(), repeated, None, precheck=precheck
+        )
+        await controller.stop()
+
+        assert first.effective_message.reply_text.await_args.kwargs["text"] == (
+            "⏳ Рисую, секундочку…"
+        )
+        assert (
+            "предыдущий"
+            in repeated.effective_message.reply_text.await_args.kwargs["text"]
+        )
+        precheck.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_sheds_load(self) -> None:
+        """Test that commands beyond the capacity are rejected with a notice."""
+        controller = AdmissionController(capacity=1, workers=1)
+        callback = AsyncMock()
+        await controller.submit("visualize", 10, callback, _update(1), None)
+        shed = _update(2)
+
+        result = await controller.submit("visualize", 10, callback, shed, None)
+
+        assert result is AdmissionResult.REJECTED
+        shed.effective_message.reply_text.assert_awaited_once()
+        assert "busy" in shed.effective_message.reply_text.await_args.kwargs["text"]
+
+        # The rejected user may try again once there is room
+        await asyncio.wait_for(controller._queue.join(), timeout=1)
+        await controller.stop()
+        retried = await controller.submit("visualize", 10, callback, shed, None)
+        assert retried is AdmissionResult.QUEUED
+        await controller.stop()
+
+    @pytest.mark.asyncio
+    async def test_lower_priority_value_runs_first(self) -> None:
+        """Test that jobs run by priority, then in arrival order."""
+        controller = AdmissionController(capacity=4, workers=1)
+        order: list[str] = []
+
+        def recorder(name: str) -> AsyncMock:
+            return AsyncMock(side_effect=lambda *_: order.append(name))
+
+        await controller.submit("slow", 20, recorder("slow"), _update(1), None)
+        await controller.submit("a", 10, recorder("a"), _update(2), None)
+        await controller.submit("b", 10, recorder("b"), _update(3), None)
+
+        # Workers only pick jobs up once the test yields to the event loop
+        await asyncio.wait_for(controller._queue.join(), timeout=1)
+        await controller.stop()
+
+        assert order == ["a", "b", "slow"]
+
+    @pytest.mark.asyncio
+    async def test_failing_job_releases_user(self) -> None:
+        """Test that an exception keeps the worker alive and frees the user."""
+        controller = AdmissionController(capacity=4, workers=1)
+        failing = AsyncMock(side_effect=RuntimeError("boom"))
+        succeeding = AsyncMock()
+
+        await controller.submit("visualize", 10, failing, _update(1), None)
+        await asyncio.wait_for(controller._queue.join(), timeout=1)
+        result = await controller.submit("visualize", 10, succeeding, _update(1), None)
+        await asyncio.wait_for(controller._queue.join(), timeout=1)
+        await controller.stop()
+
+        assert result is AdmissionResult.QUEUED
+        succeeding.assert_awaited_once()
@@ -1,6 +1,7 @@
 """Unit tests for the bot application, focusing on LifeWeeksBot class behavior."""
 
 import asyncio
+import time
 from collections.abc import Coroutine
 from types import SimpleNamespace
 from typing import Any, List, Type
@@ -70,7 +71,7 @@ class TestLifeWeeksBot:
         """
         bot.__init__()
         assert bot._app is None
-        assert bot._scheduler_process is None
+        assert bot._scheduler_processes == []
         assert bot._scheduler_client is None
         mock_application_logger.info.assert_called_with("Initializing LifeWeeksBot")
 
@@ -235,7 +236,7 @@ class TestLifeWeeksBot:
         # First call returns True (process running), second call returns False
         # (after terminate+join, process stopped gracefully)
         mock_process.is_alive.side_effect = [True, False]
-        bot._scheduler_process = mock_process
+        bot._scheduler_processes = [mock_process]
 
         mock_client = AsyncMock()
         bot._scheduler_client = mock_client
@@ -248,9 +249,42 @@ class TestLifeWeeksBot:
         mock_client.shutdown.assert_awaited_once()
         mock_process.terminate.assert_called_once()
         mock_process.join.assert_called_once_with(timeout=5)
-        assert bot._scheduler_process is None
+        assert bot._scheduler_processes == []
         assert bot._scheduler_client is None
 
+    def test_terminating_a_hung_worker_keeps_the_loop_running(
+        self,
+        bot: LifeWeeksBot,
+    ) -> None:
+        """Verify that waiting for a worker to exit does not block the event loop.
+
+        :param bot: The bot instance
+        :type bot: LifeWeeksBot
+        :returns: None
+        :rtype: None
+        """
+        mock_process = MagicMock()
+        mock_process.is_alive.return_value = True
+        mock_process.join.side_effect = lambda timeout: time.sleep(0.2)
+        bot._scheduler_processes = [mock_process]
+        ticks: List[float] = []
+
+        async def tick() -> None:
+            while True:
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        async def terminate_while_ticking() -> None:
+            ticker = asyncio.create_task(tick())
+            await bot._terminate_scheduler_process(0)
+            ticker.cancel()
+
+        _run_async(terminate_while_ticking())
+
+        mock_process.kill.assert_called_once()
+        assert mock_process.join.call_count == 2
+        assert len(ticks) > 10
+
     def test_universal_text_handler_routes_correctly(self, bot: LifeWeeksBot) -> None:
         """Test all branches of the _universal_text_handler method.
 
@@ -333,7 +367,7 @@ class TestLifeWeeksBot:
 
             bot._setup_scheduler()
 
-            assert bot._scheduler_process is mock_process_instance
+            assert bot._scheduler_processes == [mock_process_instance]
             assert bot._scheduler_client is not None
             mock_process_instance.start.assert_called_once()
             bot.services.set_scheduler_client.assert_called_once()
@@ -633,3 +667,65 @@ class TestLifeWeeksBot:
         _run_async(bot._post_init_scheduler_start(mock_application))
 
         mock_application_logger.warning.assert_not_called()
+
+    def test_start_runs_webhook_when_enabled(
+        self, bot: LifeWeeksBot, mock_app: MagicMock
+    ) -> None:
+        """Verify that start() serves the webhook instead of polling when enabled.
+
+        :param bot: The bot instance
+        :type bot: LifeWeeksBot
+        :param mock_app: Mocked Application instance
+        :type mock_app: MagicMock
+        :returns: None
+        :rtype: None
+        """
+        bot._app = mock_app
+        with patch("src.bot.application.WEBHOOK_ENABLED", True), patch.object(
+            bot, "_run_webhook", new_callable=AsyncMock
+        ) as mock_run_webhook:
+            bot.start()
+
+        mock_run_webhook.assert_awaited_once()
+        bot._app.run_polling.assert_not_called()
+
+    def test_run_webhook_lifecycle(self, bot: LifeWeeksBot) -> None:
+        """Verify the webhook run starts and stops the app around the endpoint.
+
+        :param bot: The bot instance
+        :type bot: LifeWeeksBot
+        :returns: None
+        :rtype: None
+        """
+        bot._app = MagicMock()
+        bot._app.initialize = AsyncMock()
+        bot._app.start = AsyncMock()
+        bot._app.stop = AsyncMock()
+        bot._app.shutdown = AsyncMock()
+        bot._app.bot.set_webhook = AsyncMock()
+        bot._app.running = True
+        server = MagicMock(start=AsyncMock(), stop=AsyncMock())
+        stop_event = MagicMock(wait=AsyncMock())
+
+        with patch("src.bot.application.WebhookServer", return_value=server), patch(
+            "src.bot.application.asyncio.Event", return_value=stop_event
+        ), patch(
+            "src.bot.application.WEBHOOK_URL", "https://bot.example.com/telegram"
+        ), patch(
+            "src.bot.application.WEBHOOK_SECRET_TOKEN", "secret"
+        ), patch.object(
+            bot, "_post_init_scheduler_start", new_callable=AsyncMock
+        ) as mock_post_init, patch.object(
+            bot, "_post_shutdown_cleanup", new_callable=AsyncMock
+        ) as mock_cleanup:
+            _run_async(bot._run_webhook())
+
+        mock_post_init.assert_awaited_once_with(bot._app)
+        bot._app.start.assert_awaited_once()
+        server.start.assert_awaited_once()
+        bot._app.bot.set_webhook.assert_awaited_once()
+        assert bot._app.bot.set_webhook.call_args.kwargs["secret_token"] == "secret"
+        server.stop.assert_awaited_once()
+        bot._app.stop.assert_awaited_once()
+        bot._app.shutdown.assert_awaited_once()
+        mock_cleanup.assert_awaited_once_with(bot._app)
@@ -32,6 +32,27 @@ class TestLifeWeeksBotCoverage:
             "Failed to register handler 'test': Load failed"
         )
 
+    def test_register_handler_from_config_indexes_router(self, bot: LifeWeeksBot):
+        """Test that commands and callbacks are routed without extra PTB handlers."""
+        config = HandlerConfig(
+            module="test_module",
+            class_name="TestHandler",
+            command="test",
+            callbacks=[{"method": "handle_callback", "pattern": "test_.*"}],
+        )
+        handler_instance = MagicMock()
+        bot._plugin_loader = MagicMock()
+        bot._plugin_loader.load_handler_class.return_value = MagicMock(
+            return_value=handler_instance
+        )
+        bot._app = MagicMock()
+
+        bot._register_handler_from_config(config)
+
+        bot._app.add_handler.assert_not_called()
+        assert bot.router._commands["test"] is handler_instance.handle
+        assert bot.router._prefixes["test_"] is handler_instance.handle_callback
+
     def test_register_unknown_handler_fallback_present(
         self, bot: LifeWeeksBot, mock_app: MagicMock
     ):
@@ -2,14 +2,15 @@
 
 from copy import deepcopy
 from datetime import datetime, time
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.bot.application import LifeWeeksBot
-from src.contracts.scheduler_port_protocol import ScheduleTrigger
+from src.contracts.scheduler_port_protocol import JobInfo, ScheduleTrigger
 from src.core.dtos import UserProfileDTO, UserSettingsDTO, UserSubscriptionDTO
 from src.enums import NotificationFrequency, SubscriptionType, WeekDay
+from src.scheduler.sharding import ShardedSchedulerClient
 
 
 @pytest.fixture
@@ -150,3 +151,111 @@ class TestSchedulerRestoration:
         await bot._restore_scheduled_jobs()
 
         assert mock_scheduler_client.schedule_job.call_count == 2
+
+
+class TestSchedulerRestart:
+    """Tests for supervising and restarting the scheduler workers."""
+
+    def test_worker_without_heartbeat_is_not_alive(self, bot, mock_scheduler_client):
+        """Test that a running but silent worker counts as dead."""
+        bot._scheduler_client = ShardedSchedulerClient([mock_scheduler_client])
+        bot._scheduler_processes = [MagicMock()]
+        bot._scheduler_processes[0].is_alive.return_value = True
+        mock_scheduler_client.seconds_since_heartbeat = MagicMock(return_value=1)
+        assert bot._scheduler_is_alive(0) is True
+
+        mock_scheduler_client.seconds_since_heartbeat.return_value = 3600
+        assert bot._scheduler_is_alive(0) is False
+        assert bot._scheduler_is_alive(1) is False
+
+    @pytest.mark.asyncio
+    async def test_restart_replays_mirrored_jobs(self, bot, mock_scheduler_client):
+        """Test that only the restarted shard gets its jobs back and is reconciled."""
+        trigger = ScheduleTrigger(day_of_week=0, hour=9, minute=0)
+        mock_scheduler_client.get_all_jobs = MagicMock(
+            return_value=[
+                JobInfo(
+                    job_id="notification_123",
+                    trigger=trigger,
+                    kwargs={"message_type": "weekly_summary", "user_id": 123},
+                ),
+                JobInfo(job_id="other"),
+            ]
+        )
+        mock_scheduler_client.fail_pending = MagicMock()
+        other_shard = AsyncMock()
+        bot._scheduler_client = ShardedSchedulerClient(
+            [other_shard, mock_scheduler_client]
+        )
+        bot._scheduler_processes = [MagicMock(), MagicMock()]
+        new_client = AsyncMock()
+        new_client.wait_for_heartbeat.return_value = True
+        bot._start_scheduler_shard = MagicMock(return_value=new_client)
+
+        with patch(
+            "src.bot.application.ScheduleReconciler.run_once", new_callable=AsyncMock
+        ) as mock_reconcile:
+            assert await bot._restart_scheduler(1) is True
+
+        bot._start_scheduler_shard.assert_called_once_with(1)
+        bot._scheduler_processes[1].terminate.assert_called_once()
+        bot._scheduler_processes[0].terminate.assert_not_called()
+        mock_scheduler_client.stop_listening.assert_awaited_once()
+        mock_scheduler_client.fail_pending.assert_called_once()
+        new_client.schedule_job.assert_awaited_once_with(
+            job_id="notification_123",
+            trigger=trigger,
+            job_type="weekly_summary",
+            user_id=123,
+        )
+        assert bot._scheduler_client.shards == [other_shard, new_client]
+        other_shard.stop_listening.assert_not_awaited()
+        mock_reconcile.assert_awaited_once()
+        assert list(bot.schedule_reconcilers) == [1]
+        await bot.schedule_reconcilers[1].stop()
+
+    @pytest.mark.asyncio
+    async def test_restart_fails_without_heartbeat(self, bot, mock_scheduler_client):
+        """Test that a new worker that never reports back is a failed restart."""
+        mock_scheduler_client.get_all_jobs = MagicMock(return_value=[])
+        mock_scheduler_client.fail_pending = MagicMock()
+        bot._scheduler_client = ShardedSchedulerClient([mock_scheduler_client])
+        bot._scheduler_processes = [MagicMock()]
+        new_client = AsyncMock()
+        new_client.wait_for_heartbeat.return_value = False
+        bot._start_scheduler_shard = MagicMock(return_value=new_client)
+
+        assert await bot._restart_scheduler(0) is False
+        new_client.schedule_job.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_stopped_scheduler_drops_commands(
+        self, bot, mock_container, mock_scheduler_client
+    ):
+        """Test that a deposed leader's listeners no longer reach the workers."""
+        bot._scheduler_processes = [MagicMock()]
+
+        await bot._stop_scheduler()
+
+        mock_scheduler_client.shutdown.assert_awaited_once()
+        mock_container.set_scheduler_client.assert_called_once_with(None)
+        assert bot._scheduler_client is None
+        assert bot._scheduler_processes == []
+
+    @pytest.mark.asyncio
+    async def test_shutdown_releases_lease_after_stopping(
+        self, bot, mock_container, mock_scheduler_client
+    ):
+        """Test that the lease is handed over only once the workers are gone."""
+        mock_container.event_bus.stop = AsyncMock()
+        mock_container.cleanup = AsyncMock()
+        calls = []
+        bot.scheduler_leadership = MagicMock(
+            stop=AsyncMock(side_effect=lambda: calls.append("stop")),
+            release=AsyncMock(side_effect=lambda: calls.append("release")),
+        )
+        mock_scheduler_client.shutdown.side_effect = lambda: calls.append("shutdown")
+
+        await bot._post_shutdown_cleanup(MagicMock())
+
+        assert calls == ["stop", "shutdown", "release"]
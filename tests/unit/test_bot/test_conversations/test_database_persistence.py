@@ -0,0 +1,330 @@
+"""Unit tests for DatabasePersistence.
+
+Tests read-through caching, batched writes, expiry sweeping and backend
+selection of the database conversation state persistence, using an
+in-memory repository that counts its calls.
+"""
+
+import asyncio
+import time
+from typing import Optional, Sequence
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.bot.conversations import persistence as persistence_module
+from src.bot.conversations.persistence import (
+    DatabasePersistence,
+    TelegramContextPersistence,
+    get_state_persistence,
+)
+from src.bot.conversations.states import ConversationState
+from src.database.models.conversation_state import ConversationStateRecord
+
+USER_ID = 12345
+
+
+class InMemoryStateRepository:
+    """Conversation state repository keeping rows in a dict."""
+
+    def __init__(self) -> None:
+        """Initialize an empty repository."""
+        self.rows: dict[int, ConversationStateRecord] = {}
+        self.reads = 0
+        self.writes = 0
+        self.fail_writes = False
+
+    async def initialize(self) -> None:
+        """Nothing to initialize."""
+
+    async def get_state(self, telegram_id: int) -> Optional[ConversationStateRecord]:
+        """Return a stored row."""
+        self.reads += 1
+        return self.rows.get(telegram_id)
+
+    async def save_states(self, states: Sequence[ConversationStateRecord]) -> bool:
+        """Store rows unless writes fail."""
+        if self.fail_writes:
+            return False
+        self.writes += 1
+        for state in states:
+            self.rows[state.telegram_id] = state
+        return True
+
+    async def delete_states(self, telegram_ids: Sequence[int]) -> bool:
+        """Delete rows."""
+        for telegram_id in telegram_ids:
+            self.rows.pop(telegram_id, None)
+        return True
+
+    async def delete_expired_states(self, updated_before: float) -> int:
+        """Delete rows older than the cutoff."""
+        expired = [k for k, v in self.rows.items() if v.updated_at < updated_before]
+        for telegram_id in expired:
+            del self.rows[telegram_id]
+        return len(expired)
+
+
+@pytest.fixture
+def repository() -> InMemoryStateRepository:
+    """Create an empty in-memory repository.
+
+    :returns: Repository
+    :rtype: InMemoryStateRepository
+    """
+    return InMemoryStateRepository()
+
+
+@pytest.fixture
+def persistence(repository: InMemoryStateRepository) -> DatabasePersistence:
+    """Create a database persistence with a long cache TTL.
+
+    :param repository: In-memory repository
+    :type repository: InMemoryStateRepository
+    :returns: Persistence under test
+    :rtype: DatabasePersistence
+    """
+    return DatabasePersistence(
+        repository=repository,
+        cache_size=2,
+        cache_ttl_seconds=60,
+        flush_interval_seconds=60,
+        sweep_interval_seconds=60,
+        batch_size=3,
+    )
+
+
+class TestDatabasePersistence:
+    """Test suite for DatabasePersistence."""
+
+    @pytest.mark.asyncio
+    async def test_set_state_is_visible_before_flush(
+        self, persistence: DatabasePersistence, repository: InMemoryStateRepository
+    ) -> None:
+        """Test that a new state is served from memory until it is flushed."""
+        state = ConversationState.AWAITING_START_BIRTH_DATE
+        await persistence.set_state(user_id=USER_ID, state=state, context=None)
+
+        assert await persistence.get_state(user_id=USER_ID, context=None) == state
+        assert await persistence.is_state_valid(USER_ID, state, context=None)
+        assert repository.rows == {}
+
+        await persistence.flush()
+
+        assert repository.rows[USER_ID].state == state.value
+
+    @pytest.mark.asyncio
+    async def test_reads_through_cache(
+        self, persistence: DatabasePersistence, repository: InMemoryStateRepository
+    ) -> None:
+        """Test that repeated reads of a user hit the database once."""
+        for _ in range(3):
+            assert (
+                await persistence.get_state(user_id=USER_ID, context=None)
+                == ConversationState.IDLE
+            )
+
+        assert repository.reads == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_cache_entry_is_reloaded(
+        self, repository: InMemoryStateRepository
+    ) -> None:
+        """Test that states written by another process are picked up."""
+        persistence = DatabasePersistence(repository=repository, cache_ttl_seconds=0)
+        assert (
+            await persistence.get_state(user_id=USER_ID, context=None)
+            == ConversationState.IDLE
+        )
+        other_process = DatabasePersistence(repository=repository)
+        await other_process.set_state(
+            user_id=USER_ID,
+            state=ConversationState.AWAITING_SETTINGS_LANGUAGE,
+            context=None,
+        )
+        await other_process.flush()
+
+        with patch.object(
+            persistence_module.time, "time", return_value=time.time() + 1
+        ):
+            state = await persistence.get_state(user_id=USER_ID, context=None)
+
+        assert state == ConversationState.AWAITING_SETTINGS_LANGUAGE
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(
+        self, persistence: DatabasePersistence, repository: InMemoryStateRepository
+    ) -> None:
+        """Test that the least recently used users are evicted."""
+        for user_id in (1, 2, 3):
+            await persistence.get_state(user_id=user_id, context=None)
+
+        assert list(persistence._cache) == [2, 3]
+        await persistence.get_state(user_id=1, context=None)
+        assert repository.reads == 4
+
+    @pytest.mark.asyncio
+    async def test_changes_are_written_in_one_batch(
+        self, persistence: DatabasePersistence, repository: InMemoryStateRepository
+    ) -> None:
+        """Test that several changes produce a single write."""
+        for user_id in (1, 2):
+            await persistence.set_state(
+                user_id=user_id,
+                state=ConversationState.AWAITING_SETTINGS_LANGUAGE,
+                context=None,
+            )
+        await persistence.set_state(
+            user_id=1, state=ConversationState.AWAITING_SETTINGS_TIMEZONE, context=None
+        )
+
+        await persistence.flush()
+
+        assert repository.writes == 1
+        assert (
+            repository.rows[1].state
+            == ConversationState.AWAITING_SETTINGS_TIMEZONE.value
+        )
+        assert (
+            repository.rows[2].state
+            == ConversationState.AWAITING_SETTINGS_LANGUAGE.value
+        )
+
+    @pytest.mark.asyncio
+    async def test_full_batch_wakes_flush_loop(
+        self, persistence: DatabasePersistence, repository: InMemoryStateRepository
+    ) -> None:
+        """Test that reaching the batch size flushes before the interval."""
+        await persistence.start()
+        try:
+            for user_id in (1, 2, 3):
+                await persistence.set_state(
+                    user_id=user_id,
+                    state=ConversationState.AWAITING_SETTINGS_LANGUAGE,
+                    context=None,
+                )
+            for _ in range(10):
+                await asyncio.sleep(0)
+
+            assert set(repository.rows) == {1, 2, 3}
+        finally:
+            await persistence.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_retried(
+        self, persistence: DatabasePersistence, repository: InMemoryStateRepository
+    ) -> None:
+        """Test that changes stay pending when the write fails."""
+        await persistence.set_state(
+            user_id=USER_ID,
+            state=ConversationState.AWAITING_SETTINGS_LANGUAGE,
+            context=None,
+        )
+        repository.fail_writes = True
+        await persistence.flush()
+        assert repository.rows == {}
+
+        repository.fail_writes = False
+        await persistence.flush()
+
+        assert USER_ID in repository.rows
+
+    @pytest.mark.asyncio
+    async def test_clear_state_deletes_row(
+        self, persistence: DatabasePersistence, repository: InMemoryStateRepository
+    ) -> None:
+        """Test that clearing removes the state and its context data."""
+        await persistence.set_state(
+            user_id=USER_ID,
+            state=ConversationState.AWAITING_SETTINGS_LANGUAGE,
+            context=None,
+        )
+        await persistence.set_context_data(
+            user_id=USER_ID, data={"step": 1}, context=None
+        )
+        await persistence.flush()
+
+        await persistence.clear_state(user_id=USER_ID, context=None)
+        await persistence.stop()
+
+        assert repository.rows == {}
+        assert await persistence.get_context_data(USER_ID, context=None) == {}
+
+    @pytest.mark.asyncio
+    async def test_context_data_survives_state_change(
+        self, persistence: DatabasePersistence
+    ) -> None:
+        """Test that setting a state keeps the conversation context data."""
+        await persistence.set_context_data(
+            user_id=USER_ID, data={"step": 1}, context=None
+        )
+        await persistence.set_state(
+            user_id=USER_ID,
+            state=ConversationState.AWAITING_SETTINGS_LANGUAGE,
+            context=None,
+        )
+
+        assert await persistence.get_context_data(USER_ID, context=None) == {"step": 1}
+
+    @pytest.mark.asyncio
+    async def test_sweep_deletes_expired_states(
+        self, persistence: DatabasePersistence, repository: InMemoryStateRepository
+    ) -> None:
+        """Test that states older than the timeout are swept everywhere."""
+        await persistence.set_state(
+            user_id=USER_ID,
+            state=ConversationState.AWAITING_SETTINGS_LANGUAGE,
+            context=None,
+        )
+        await persistence.flush()
+
+        later = time.time() + persistence_module.DEFAULT_STATE_TIMEOUT_SECONDS + 1
+        with patch.object(persistence_module.time, "time", return_value=later):
+            deleted = await persistence.sweep()
+            state = await persistence.get_state(user_id=USER_ID, context=None)
+
+        assert deleted == 1
+        assert state == ConversationState.IDLE
+
+    @pytest.mark.asyncio
+    async def test_expired_state_is_invalid(
+        self, persistence: DatabasePersistence
+    ) -> None:
+        """Test that is_state_valid honours max_age_seconds."""
+        state = ConversationState.AWAITING_SETTINGS_LANGUAGE
+        await persistence.set_state(user_id=USER_ID, state=state, context=None)
+
+        assert not await persistence.is_state_valid(
+            USER_ID, state, context=None, max_age_seconds=-1
+        )
+        assert not await persistence.is_state_valid(
+            USER_ID, ConversationState.AWAITING_SETTINGS_TIMEZONE, context=None
+        )
+
+
+class TestGetStatePersistence:
+    """Test suite for backend selection."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Forget the process-wide persistence around each test."""
+        get_state_persistence.cache_clear()
+        yield
+        get_state_persistence.cache_clear()
+
+    @pytest.mark.parametrize(
+        "backend, expected",
+        [
+            ("memory", TelegramContextPersistence),
+            ("database", DatabasePersistence),
+            ("redis", TelegramContextPersistence),
+        ],
+    )
+    def test_backend_selection(self, backend: str, expected: type) -> None:
+        """Test that CONVERSATION_STATE_BACKEND selects the implementation."""
+        with (
+            patch.object(persistence_module, "CONVERSATION_STATE_BACKEND", backend),
+            patch.object(persistence_module, "DatabaseManager", MagicMock()),
+        ):
+            assert isinstance(get_state_persistence(), expected)
+            assert get_state_persistence() is get_state_persistence()
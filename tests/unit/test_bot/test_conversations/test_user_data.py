@@ -0,0 +1,138 @@
+"""Unit tests for ConversationUserData and UserDataEvictor.
+
+Tests the dict behaviour of the slotted user_data record and the idle and
+LRU eviction of per-user records from a real PTB application.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from telegram.ext import Application, ContextTypes
+
+from src.bot.conversations import user_data as user_data_module
+from src.bot.conversations.persistence import (
+    STATE_KEY,
+    TIMESTAMP_KEY,
+    TelegramContextPersistence,
+)
+from src.bot.conversations.states import ConversationState
+from src.bot.conversations.user_data import ConversationUserData, UserDataEvictor
+
+
+@pytest.fixture
+def application() -> Application:
+    """Create an application using ConversationUserData records.
+
+    :returns: Application that is never started
+    :rtype: Application
+    """
+    return (
+        Application.builder()
+        .token("123456:TEST")
+        .context_types(ContextTypes(user_data=ConversationUserData))
+        .build()
+    )
+
+
+def _touch(application: Application, user_id: int, at: float) -> None:
+    """Create a user's record as if it was last used at a given time.
+
+    :param application: Application owning the records
+    :type application: Application
+    :param user_id: Telegram user ID
+    :type user_id: int
+    :param at: ``time.monotonic()`` of the last access
+    :type at: float
+    :returns: None
+    """
+    application._user_data[user_id].last_access = at
+
+
+class TestConversationUserData:
+    """Test suite for ConversationUserData."""
+
+    def test_behaves_like_dict(self) -> None:
+        """Test item access, membership, pop and iteration."""
+        data = ConversationUserData()
+        data[STATE_KEY] = "start_birth_date"
+        data["custom"] = 1
+
+        assert data[STATE_KEY] == "start_birth_date"
+        assert data.get(TIMESTAMP_KEY) is None
+        assert dict(data) == {STATE_KEY: "start_birth_date", "custom": 1}
+        assert len(data) == 2
+        assert data.pop("custom") == 1
+        assert data.pop(TIMESTAMP_KEY, None) is None
+        with pytest.raises(KeyError):
+            del data[TIMESTAMP_KEY]
+
+        data.clear()
+        assert len(data) == 0
+        assert data._extra is None
+
+    def test_has_no_instance_dict(self) -> None:
+        """Test that records are slotted."""
+        assert not hasattr(ConversationUserData(), "__dict__")
+
+    def test_access_updates_last_access(self) -> None:
+        """Test that reads and writes refresh the LRU position."""
+        data = ConversationUserData()
+        with patch.object(user_data_module.time, "monotonic", return_value=1e9):
+            data.get(STATE_KEY)
+
+        assert data.last_access == 1e9
+
+    @pytest.mark.asyncio
+    async def test_works_with_context_persistence(self) -> None:
+        """Test that TelegramContextPersistence round-trips through a record."""
+        context = type("Context", (), {"user_data": ConversationUserData()})()
+        persistence = TelegramContextPersistence()
+        state = ConversationState.AWAITING_SETTINGS_LANGUAGE
+
+        await persistence.set_state(user_id=1, state=state, context=context)
+        assert await persistence.is_state_valid(1, state, context)
+
+        await persistence.clear_state(user_id=1, context=context)
+        assert len(context.user_data) == 0
+
+
+class TestUserDataEvictor:
+    """Test suite for UserDataEvictor."""
+
+    def test_drops_idle_users(self, application: Application) -> None:
+        """Test that records unused for the idle period are dropped."""
+        evictor = UserDataEvictor(max_users=10, interval_seconds=60, idle_seconds=300)
+        with patch.object(user_data_module.time, "monotonic", return_value=1000.0):
+            _touch(application, 1, at=600.0)
+            _touch(application, 2, at=900.0)
+
+            assert evictor.evict(application) == 1
+
+        assert set(application.user_data) == {2}
+
+    def test_drops_least_recently_used_above_limit(
+        self, application: Application
+    ) -> None:
+        """Test that only max_users of the most recently used records stay."""
+        evictor = UserDataEvictor(max_users=2, interval_seconds=60, idle_seconds=300)
+        with patch.object(user_data_module.time, "monotonic", return_value=1000.0):
+            for user_id, at in ((1, 950.0), (2, 800.0), (3, 990.0), (4, 900.0)):
+                _touch(application, user_id, at=at)
+
+            assert evictor.evict(application) == 2
+
+        assert set(application.user_data) == {1, 3}
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop(self, application: Application) -> None:
+        """Test that the loop evicts periodically until stopped."""
+        evictor = UserDataEvictor(max_users=10, interval_seconds=0, idle_seconds=-1)
+        _touch(application, 1, at=0.0)
+
+        evictor.start(application)
+        await asyncio.sleep(0.01)
+        await evictor.stop()
+
+        assert dict(application.user_data) == {}
+        assert evictor._task is None
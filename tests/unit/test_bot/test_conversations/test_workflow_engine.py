@@ -0,0 +1,285 @@
+"""Unit tests for the compiled workflow engine.
+
+Tests compilation of the shipped workflows, rejection of unresolvable
+names and the valid, invalid and timeout transitions.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.bot.conversations.state_machine import ConversationStateMachine
+from src.bot.conversations.states import ConversationState
+from src.bot.conversations.workflow_config import WorkflowConfig
+from src.bot.conversations.workflow_engine import (
+    CompiledState,
+    CompiledTransition,
+    WorkflowCompileError,
+    WorkflowEngine,
+    compile_state,
+    compile_workflows,
+)
+from src.core.exceptions import ValidationError as CoreValidationError
+from src.services.validation_service import ValidationService
+
+STATE = ConversationState.AWAITING_SETTINGS_BIRTH_DATE
+
+
+class Provider:
+    """Handler stub exposing every action named in the shipped workflows."""
+
+    def __init__(self) -> None:
+        """Create one AsyncMock per workflow action."""
+        for name in (
+            "create_user_profile",
+            "send_validation_error",
+            "send_timeout_message",
+            "update_birth_date",
+            "send_birth_date_validation_error",
+            "update_life_expectancy",
+            "send_life_expectancy_validation_error",
+            "update_notification_schedule",
+            "send_notification_schedule_validation_error",
+        ):
+            setattr(self, name, AsyncMock())
+
+    def validate_notification_schedule(self, text: str) -> str:
+        """Accept any schedule text.
+
+        :param text: Schedule text
+        :type text: str
+        :returns: The text unchanged
+        :rtype: str
+        """
+        return text
+
+
+@pytest.fixture
+def machine() -> MagicMock:
+    """Create a state machine mock whose states are valid.
+
+    :returns: Mocked state machine
+    :rtype: MagicMock
+    """
+    machine = MagicMock(spec=ConversationStateMachine)
+    machine.is_state_valid = AsyncMock(return_value=True)
+    machine.clear_state = AsyncMock()
+    machine.transition_to = AsyncMock()
+    return machine
+
+
+@pytest.fixture
+def update() -> MagicMock:
+    """Create an update with a text message.
+
+    :returns: Mocked update
+    :rtype: MagicMock
+    """
+    update = MagicMock()
+    update.effective_user.id = 42
+    update.message.text = " 01.01.1990 "
+    return update
+
+
+def _compiled(validator, on_valid, on_invalid=None, on_timeout=None) -> CompiledState:
+    """Build a compiled birth date state.
+
+    :param validator: Validator of the state
+    :param on_valid: Transition after successful validation
+    :param on_invalid: Transition after failed validation
+    :param on_timeout: Transition on expiry
+    :returns: Compiled state
+    :rtype: CompiledState
+    """
+    return CompiledState(
+        state=STATE,
+        validator=validator,
+        on_valid=on_valid,
+        on_invalid=on_invalid or CompiledTransition(target=STATE),
+        on_timeout=on_timeout or CompiledTransition(target=ConversationState.IDLE),
+        timeout_seconds=300.0,
+    )
+
+
+class TestCompileWorkflows:
+    """Test suite for workflow compilation."""
+
+    def test_shipped_workflows_compile(self) -> None:
+        """Test that every text state of the shipped workflows is compiled."""
+        engine = WorkflowEngine.from_directory(
+            providers={
+                "start_birth_date": Provider(),
+                "settings_birth_date": Provider(),
+                "settings_life_expectancy": Provider(),
+                "settings_notification_schedule": Provider(),
+            },
+            validators=ValidationService(),
+            machine=MagicMock(spec=ConversationStateMachine),
+        )
+
+        assert engine.states == {
+            ConversationState.AWAITING_START_BIRTH_DATE,
+            ConversationState.AWAITING_SETTINGS_BIRTH_DATE,
+            ConversationState.AWAITING_SETTINGS_LIFE_EXPECTANCY,
+            ConversationState.AWAITING_SETTINGS_NOTIFICATION_SCHEDULE,
+        }
+
+    def test_registration_completes_to_idle(self) -> None:
+        """Test that targets expecting no input end the conversation."""
+        provider = Provider()
+        engine = WorkflowEngine.from_directory(
+            providers={"start_birth_date": provider},
+            validators=ValidationService(),
+            machine=MagicMock(spec=ConversationStateMachine),
+        )
+        compiled = engine._table[ConversationState.AWAITING_START_BIRTH_DATE]
+
+        assert compiled.on_valid.target is ConversationState.IDLE
+        assert compiled.on_valid.action is provider.create_user_profile
+        assert compiled.on_invalid.target is ConversationState.AWAITING_START_BIRTH_DATE
+
+    def test_states_without_provider_are_skipped(self) -> None:
+        """Test that states nobody handles stay out of the table."""
+        workflow = WorkflowConfig.model_validate(
+            {
+                "name": "test",
+                "initial_state": "settings_birth_date",
+                "states": {
+                    "settings_birth_date": {
+                        "input_type": "text",
+                        "on_valid": {"target": "idle"},
+                    },
+                    "idle": {"input_type": "none"},
+                },
+            }
+        )
+
+        assert compile_workflows({"test": workflow}, {}, ValidationService()) == {}
+
+    def test_unknown_action_is_rejected(self) -> None:
+        """Test that an unresolvable action fails compilation."""
+        workflow = WorkflowConfig.model_validate(
+            {
+                "name": "test",
+                "initial_state": "settings_birth_date",
+                "states": {
+                    "settings_birth_date": {
+                        "input_type": "text",
+                        "on_valid": {"target": "idle", "action": "missing"},
+                    },
+                    "idle": {"input_type": "none"},
+                },
+            }
+        )
+
+        with pytest.raises(WorkflowCompileError):
+            compile_state(
+                workflow=workflow,
+                state=STATE,
+                config=workflow.states["settings_birth_date"],
+                provider=object(),
+                validators=ValidationService(),
+            )
+
+
+class TestWorkflowEngine:
+    """Test suite for WorkflowEngine transitions."""
+
+    @pytest.mark.asyncio
+    async def test_valid_input_runs_action_and_clears(
+        self, machine: MagicMock, update: MagicMock
+    ) -> None:
+        """Test that a valid value reaches the action and ends the conversation."""
+        action = AsyncMock()
+        engine = WorkflowEngine(
+            table={
+                STATE: _compiled(
+                    validator=str.upper,
+                    on_valid=CompiledTransition(ConversationState.IDLE, action),
+                )
+            },
+            machine=machine,
+        )
+        context = MagicMock()
+
+        await engine.handle_text(update, context, STATE)
+
+        action.assert_awaited_once_with(update, context, "01.01.1990")
+        machine.clear_state.assert_awaited_once_with(user_id=42, context=context)
+
+    @pytest.mark.asyncio
+    async def test_invalid_input_keeps_state(
+        self, machine: MagicMock, update: MagicMock
+    ) -> None:
+        """Test that a validation error reaches the action and keeps the state."""
+        error = CoreValidationError("bad", error_key="invalid")
+        action = AsyncMock()
+        engine = WorkflowEngine(
+            table={
+                STATE: _compiled(
+                    validator=MagicMock(side_effect=error),
+                    on_valid=CompiledTransition(ConversationState.IDLE),
+                    on_invalid=CompiledTransition(STATE, action),
+                )
+            },
+            machine=machine,
+        )
+
+        await engine.handle_text(update, MagicMock(), STATE)
+
+        assert action.await_args.args[2] is error
+        machine.clear_state.assert_not_awaited()
+        machine.transition_to.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_expired_state_runs_timeout(
+        self, machine: MagicMock, update: MagicMock
+    ) -> None:
+        """Test that expired input is not validated and the timeout applies."""
+        machine.is_state_valid.return_value = False
+        validator = MagicMock()
+        timeout_action = AsyncMock()
+        engine = WorkflowEngine(
+            table={
+                STATE: _compiled(
+                    validator=validator,
+                    on_valid=CompiledTransition(ConversationState.IDLE),
+                    on_timeout=CompiledTransition(
+                        ConversationState.IDLE, timeout_action
+                    ),
+                )
+            },
+            machine=machine,
+        )
+
+        await engine.handle_text(update, MagicMock(), STATE)
+
+        validator.assert_not_called()
+        timeout_action.assert_awaited_once()
+        machine.clear_state.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_transition_to_other_state(
+        self, machine: MagicMock, update: MagicMock
+    ) -> None:
+        """Test that a different target state is entered via the machine."""
+        target = ConversationState.AWAITING_SETTINGS_LIFE_EXPECTANCY
+        engine = WorkflowEngine(
+            table={
+                STATE: _compiled(validator=str, on_valid=CompiledTransition(target))
+            },
+            machine=machine,
+        )
+        context = MagicMock()
+
+        await engine.handle_text(update, context, STATE)
+
+        machine.transition_to.assert_awaited_once_with(
+            user_id=42, target_state=target, context=context
+        )
+
+    def test_handles_only_compiled_states(self) -> None:
+        """Test that uncompiled states are left to the legacy handlers."""
+        engine = WorkflowEngine(machine=MagicMock(spec=ConversationStateMachine))
+
+        assert not engine.handles(STATE)
@@ -3,12 +3,14 @@
 Tests the event handlers that bridge domain events to scheduler actions.
 """
 
-from datetime import time
+import asyncio
+from datetime import datetime, time, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.bot.event_listeners import (
+    NotificationRescheduler,
     handle_user_deleted,
     handle_user_settings_changed,
     register_event_listeners,
@@ -235,12 +237,152 @@ class TestEventListeners:
         event_bus = MagicMock()
         mock_container.get_event_bus.return_value = event_bus
 
-        register_event_listeners(mock_container)
+        rescheduler = NotificationRescheduler()
 
-        assert event_bus.subscribe.call_count == 2
+        assert register_event_listeners(mock_container, rescheduler) is rescheduler
+
+        assert event_bus.subscribe.call_count == 3
         # Verify subscriptions
         calls = event_bus.subscribe.call_args_list
         assert calls[0][1]["event_type"] == UserSettingsChangedEvent
-        assert calls[0][1]["handler"] == handle_user_settings_changed
+        assert calls[0][1]["handler"] == rescheduler.on_settings_changed
         assert calls[1][1]["event_type"] == UserDeletedEvent
         assert calls[1][1]["handler"] == handle_user_deleted
+        assert calls[2][1]["event_type"] == UserDeletedEvent
+        assert calls[2][1]["handler"] == rescheduler.on_user_deleted
+
+
+def _user(hour: int, notifications: bool = True) -> MagicMock:
+    """Create a user profile mock with a weekly Monday schedule.
+
+    :param hour: Notification hour
+    :type hour: int
+    :param notifications: Whether notifications are enabled
+    :type notifications: bool
+    :returns: User profile mock
+    :rtype: MagicMock
+    """
+    user = MagicMock()
+    user.settings.notifications = notifications
+    user.settings.notification_frequency = "weekly"
+    user.settings.notifications_day = WeekDay.MONDAY
+    user.settings.notifications_time = time(hour, 0)
+    user.settings.timezone = "UTC"
+    return user
+
+
+class TestNotificationRescheduler:
+    """Test suite for NotificationRescheduler."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Mock SchedulerClient of the listeners' container."""
+        with patch("src.bot.event_listeners.ServiceContainer") as mock_cls:
+            client = AsyncMock()
+            client.schedule_job.return_value = True
+            client.get_next_run_time = MagicMock(return_value=None)
+            mock_cls.return_value.get_scheduler_client.return_value = client
+            self.user_service = AsyncMock()
+            mock_cls.return_value.get_user_service.return_value = self.user_service
+            yield client
+
+    @pytest.mark.asyncio
+    async def test_unchanged_trigger_is_not_rescheduled(
+        self, mock_client: AsyncMock
+    ) -> None:
+        """Test that changes leaving the trigger as it is send no command."""
+        rescheduler = NotificationRescheduler()
+        self.user_service.get_user_profile.return_value = _user(hour=9)
+
+        await rescheduler.reschedule(123)
+        await rescheduler.reschedule(123)
+        self.user_service.get_user_profile.return_value = _user(hour=10)
+        await rescheduler.reschedule(123)
+
+        assert mock_client.schedule_job.await_count == 2
+        assert mock_client.schedule_job.await_args.kwargs["trigger"].hour == 10
+
+    @pytest.mark.asyncio
+    async def test_unchanged_trigger_is_resent_when_prewarmed(
+        self, mock_client: AsyncMock
+    ) -> None:
+        """Test that a change shortly before the slot replaces the staged payload."""
+        rescheduler = NotificationRescheduler()
+        self.user_service.get_user_profile.return_value = _user(hour=9)
+        await rescheduler.reschedule(123)
+
+        mock_client.get_next_run_time.return_value = datetime.now(
+            timezone.utc
+        ) + timedelta(minutes=1)
+        await rescheduler.reschedule(123)
+
+        assert mock_client.schedule_job.await_count == 2
+        mock_client.get_next_run_time.assert_called_with("notification_123")
+
+    @pytest.mark.asyncio
+    async def test_disabled_notifications_remove_job_once(
+        self, mock_client: AsyncMock
+    ) -> None:
+        """Test that an already removed job is not removed again."""
+        rescheduler = NotificationRescheduler()
+        self.user_service.get_user_profile.return_value = _user(9, False)
+
+        await rescheduler.reschedule(123)
+        await rescheduler.reschedule(123)
+
+        mock_client.remove_job.assert_awaited_once_with("notification_123")
+
+    @pytest.mark.asyncio
+    async def test_failed_schedule_is_retried(self, mock_client: AsyncMock) -> None:
+        """Test that a trigger the scheduler rejected is sent again."""
+        rescheduler = NotificationRescheduler()
+        self.user_service.get_user_profile.return_value = _user(hour=9)
+        mock_client.schedule_job.return_value = False
+
+        await rescheduler.reschedule(123)
+        await rescheduler.reschedule(123)
+
+        assert mock_client.schedule_job.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rapid_changes_are_debounced(self, mock_client: AsyncMock) -> None:
+        """Test that a burst of changes becomes one command with the last value."""
+        rescheduler = NotificationRescheduler(debounce_seconds=0.01)
+        self.user_service.get_user_profile.return_value = _user(hour=9)
+
+        for name in ("timezone", "language", "notification_schedule"):
+            await rescheduler.on_settings_changed(
+                UserSettingsChangedEvent(user_id=123, setting_name=name)
+            )
+        self.user_service.get_user_profile.return_value = _user(hour=11)
+        mock_client.schedule_job.assert_not_awaited()
+
+        await asyncio.wait_for(asyncio.gather(*rescheduler._pending.values()), 1)
+
+        mock_client.schedule_job.assert_awaited_once()
+        assert mock_client.schedule_job.await_args.kwargs["trigger"].hour == 11
+
+    @pytest.mark.asyncio
+    async def test_deleted_user_cancels_pending_reschedule(
+        self, mock_client: AsyncMock
+    ) -> None:
+        """Test that deleting a user drops their pending reschedule."""
+        rescheduler = NotificationRescheduler(debounce_seconds=60)
+        await rescheduler.on_settings_changed(
+            UserSettingsChangedEvent(user_id=123, setting_name="timezone")
+        )
+
+        await rescheduler.on_user_deleted(UserDeletedEvent(user_id=123))
+        await rescheduler.stop()
+
+        assert rescheduler._pending == {}
+        mock_client.schedule_job.assert_not_awaited()
+
+    def test_remembered_triggers_are_bounded(self) -> None:
+        """Test that the least recently rescheduled users are forgotten."""
+        rescheduler = NotificationRescheduler(max_users=2)
+
+        for user_id in (1, 2, 3):
+            rescheduler.remember(user_id, None)
+
+        assert list(rescheduler._triggers) == [2, 3]
@@ -0,0 +1,190 @@
+"""Unit tests for EventsHandler.
+
+This module contains tests for the EventsHandler class which handles
+the /events command for listing, adding and deleting life events.
+"""
+
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.bot.constants import COMMAND_EVENTS
+from src.bot.handlers.events_handler import EventsHandler
+from src.core.dtos import UserLifeEventDTO
+from src.database.service import UserLifeEventError
+from tests.unit.utils.fake_container import FakeServiceContainer
+
+
+class TestEventsHandler:
+    """Test suite for EventsHandler class."""
+
+    @pytest.fixture
+    def handler(self, mock_user_profile: MagicMock) -> EventsHandler:
+        """Create EventsHandler instance for a registered user.
+
+        :param mock_user_profile: Mocked user profile born 15.03.1990
+        :type mock_user_profile: MagicMock
+        :returns: Configured EventsHandler with fake service container
+        :rtype: EventsHandler
+        """
+        services = FakeServiceContainer()
+        services.user_service.get_user_profile.return_value = mock_user_profile
+        return EventsHandler(services)
+
+    @pytest.fixture(autouse=True)
+    def mock_use_locale(self, mocker):
+        """Mock use_locale to return untranslated messages.
+
+        :param mocker: Pytest mocker fixture
+        :type mocker: MockerFixture
+        :returns: Mocked pgettext function
+        :rtype: MagicMock
+        """
+        mock_pgettext = MagicMock(side_effect=lambda c, m: m)
+        mocker.patch(
+            "src.bot.handlers.events_handler.use_locale",
+            return_value=(None, None, mock_pgettext),
+        )
+        return mock_pgettext
+
+    @staticmethod
+    def _reply(mock_update: MagicMock) -> str:
+        """Return the text of the single reply."""
+        mock_update.message.reply_text.assert_called_once()
+        return mock_update.message.reply_text.call_args.kwargs["text"]
+
+    def test_handler_creation(self, handler: EventsHandler) -> None:
+        """Test that EventsHandler is created with correct command name."""
+        assert handler.command_name == f"/{COMMAND_EVENTS}"
+
+    @pytest.mark.asyncio
+    async def test_list_events(
+        self,
+        handler: EventsHandler,
+        mock_update: MagicMock,
+        mock_context: MagicMock,
+    ) -> None:
+        """Test that events are listed in order with escaped labels."""
+        mock_context.args = []
+        handler.services.user_service.get_life_events.return_value = [
+            UserLifeEventDTO(
+                id=7, event_date=date(2008, 6, 1), label="School <3", color=None
+            ),
+        ]
+
+        await handler.handle(mock_update, mock_context)
+
+        assert "1. 01.06.2008 — School &lt;3" in self._reply(mock_update)
+
+    @pytest.mark.asyncio
+    async def test_add_event_with_color(
+        self,
+        handler: EventsHandler,
+        mock_update: MagicMock,
+        mock_context: MagicMock,
+    ) -> None:
+        """Test that an event is stored with its label and lowercase color."""
+        mock_context.args = ["add", "01.09.2012", "First", "job", "#FF0000"]
+
+        await handler.handle(mock_update, mock_context)
+
+        handler.services.user_service.add_life_event.assert_awaited_once_with(
+            telegram_id=mock_update.effective_user.id,
+            event_date=date(2012, 9, 1),
+            label="First job",
+            color="#ff0000",
+        )
+        assert "Event added: 01.09.2012 — First job" in self._reply(mock_update)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "args,expected",
+        [
+            (["add", "2012-09-01", "Job"], "Invalid date format"),
+            (["add", "01.09.2012", "Job", "#red"], "Invalid color"),
+            (["add", "01.01.1980", "Before"], "before your birth date"),
+        ],
+    )
+    async def test_add_event_rejects_invalid_input(
+        self,
+        handler: EventsHandler,
+        mock_update: MagicMock,
+        mock_context: MagicMock,
+        args: list,
+        expected: str,
+    ) -> None:
+        """Test that invalid events are reported and not stored."""
+        mock_context.args = args
+
+        await handler.handle(mock_update, mock_context)
+
+        handler.services.user_service.add_life_event.assert_not_awaited()
+        assert expected in self._reply(mock_update)
+
+    @pytest.mark.asyncio
+    async def test_add_event_storage_failure(
+        self,
+        handler: EventsHandler,
+        mock_update: MagicMock,
+        mock_context: MagicMock,
+    ) -> None:
+        """Test that a storage failure is reported to the user."""
+        mock_context.args = ["add", "01.09.2012", "Job"]
+        handler.services.user_service.add_life_event.side_effect = UserLifeEventError(
+            "db down"
+        )
+
+        await handler.handle(mock_update, mock_context)
+
+        assert "Failed to save the event" in self._reply(mock_update)
+
+    @pytest.mark.asyncio
+    async def test_delete_event_by_list_number(
+        self,
+        handler: EventsHandler,
+        mock_update: MagicMock,
+        mock_context: MagicMock,
+    ) -> None:
+        """Test that the list number is resolved to the event id."""
+        mock_context.args = ["delete", "2"]
+        handler.services.user_service.get_life_events.return_value = [
+            UserLifeEventDTO(id=3, event_date=date(2008, 6, 1), label="a", color=None),
+            UserLifeEventDTO(id=9, event_date=date(2012, 9, 1), label="b", color=None),
+        ]
+
+        await handler.handle(mock_update, mock_context)
+
+        handler.services.user_service.delete_life_event.assert_awaited_once_with(
+            telegram_id=mock_update.effective_user.id, event_id=9
+        )
+        assert "Event deleted" in self._reply(mock_update)
+
+    @pytest.mark.asyncio
+    async def test_delete_unknown_number(
+        self,
+        handler: EventsHandler,
+        mock_update: MagicMock,
+        mock_context: MagicMock,
+    ) -> None:
+        """Test that an out of range number is reported as not found."""
+        mock_context.args = ["delete", "5"]
+
+        await handler.handle(mock_update, mock_context)
+
+        handler.services.user_service.delete_life_event.assert_not_awaited()
+        assert "Event 5 not found" in self._reply(mock_update)
+
+    @pytest.mark.asyncio
+    async def test_unknown_action_shows_usage(
+        self,
+        handler: EventsHandler,
+        mock_update: MagicMock,
+        mock_context: MagicMock,
+    ) -> None:
+        """Test that unsupported arguments show the usage help."""
+        mock_context.args = ["rename"]
+
+        await handler.handle(mock_update, mock_context)
+
+        assert "Usage" in self._reply(mock_update)
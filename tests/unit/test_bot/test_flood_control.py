@@ -0,0 +1,106 @@
+"""Unit tests for FloodController.
+
+Tests the token bucket budget, refilling, the single flood notice, the
+dropped update counters and the bounded number of buckets.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from telegram import Update
+from telegram.ext import ApplicationHandlerStop
+
+from src.bot.flood_control import FloodController
+
+
+def _update(user_id: int) -> MagicMock:
+    """Create an update mock with a user and a message.
+
+    :param user_id: Telegram user ID
+    :type user_id: int
+    :returns: Update mock
+    :rtype: MagicMock
+    """
+    update = MagicMock(spec=Update)
+    update.effective_user = MagicMock(id=user_id, language_code="en")
+    update.effective_message = MagicMock(reply_text=AsyncMock())
+    return update
+
+
+class TestFloodController:
+    """Test suite for FloodController."""
+
+    def test_burst_then_refill(self) -> None:
+        """Test that a user gets the burst at once and regains tokens over time."""
+        controller = FloodController(burst=3, rate_per_minute=60, max_users=10)
+
+        assert [controller.allow(1, now=0.0) for _ in range(4)] == [
+            True,
+            True,
+            True,
+            False,
+        ]
+        assert controller.allow(1, now=0.5) is False
+        assert controller.allow(1, now=1.5) is True
+        assert controller.dropped == 2
+        assert controller.dropped_by_user() == {1: 2}
+
+    def test_users_have_separate_budgets(self) -> None:
+        """Test that one flooding user does not throttle another."""
+        controller = FloodController(burst=1, rate_per_minute=1, max_users=10)
+
+        assert controller.allow(1, now=0.0) is True
+        assert controller.allow(1, now=0.0) is False
+        assert controller.allow(2, now=0.0) is True
+
+    def test_zero_burst_disables_limit(self) -> None:
+        """Test that flood control can be switched off."""
+        controller = FloodController(burst=0, rate_per_minute=1, max_users=10)
+
+        assert controller.enabled is False
+        assert all(controller.allow(1, now=0.0) for _ in range(100))
+
+    def test_buckets_are_bounded(self) -> None:
+        """Test that least recently active users' buckets are forgotten."""
+        controller = FloodController(burst=1, rate_per_minute=1, max_users=2)
+
+        for user_id in (1, 2, 3):
+            controller.allow(user_id, now=0.0)
+
+        assert list(controller._buckets) == [2, 3]
+
+    def test_drop_counts_of_forgotten_users_are_evicted(self) -> None:
+        """Test that per-user drop counts go with the bucket, the total stays."""
+        controller = FloodController(burst=1, rate_per_minute=1, max_users=2)
+
+        for user_id in (1, 1, 2, 2, 3):
+            controller.allow(user_id, now=0.0)
+
+        assert controller.dropped_by_user() == {2: 1}
+        assert controller.dropped == 2
+
+    @pytest.mark.asyncio
+    async def test_check_warns_once_per_flood(self) -> None:
+        """Test that only the first dropped update of a flood is answered."""
+        controller = FloodController(burst=1, rate_per_minute=1, max_users=10)
+        update = _update(1)
+
+        await controller.check(update, MagicMock())
+        for _ in range(3):
+            with pytest.raises(ApplicationHandlerStop):
+                await controller.check(update, MagicMock())
+
+        update.effective_message.reply_text.assert_awaited_once()
+        assert controller.dropped == 3
+
+    @pytest.mark.asyncio
+    async def test_check_ignores_updates_without_user(self) -> None:
+        """Test that updates without a sender are never throttled."""
+        controller = FloodController(burst=1, rate_per_minute=1, max_users=10)
+        update = MagicMock(spec=Update)
+        update.effective_user = None
+
+        for _ in range(3):
+            await controller.check(update, MagicMock())
+
+        assert controller.dropped == 0
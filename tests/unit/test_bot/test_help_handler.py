@@ -100,3 +100,34 @@ class TestHelpHandler:
         call_args = mock_update.message.reply_text.call_args
         assert "pgettext_help.text" in call_args.kwargs["text"]
         assert call_args.kwargs["parse_mode"] == ParseMode.HTML
+
+    @pytest.mark.asyncio
+    async def test_handle_reuses_cached_help(
+        self,
+        handler: HelpHandler,
+        mock_update: MagicMock,
+        mock_context: MagicMock,
+        mock_localization: MagicMock,
+    ) -> None:
+        """Test that the help message is translated once per language.
+
+        :param handler: HelpHandler instance
+        :type handler: HelpHandler
+        :param mock_update: Mocked Telegram Update object
+        :type mock_update: MagicMock
+        :param mock_context: Mocked Telegram Context object
+        :type mock_context: MagicMock
+        :param mock_localization: Mocked translate method
+        :type mock_localization: MagicMock
+        :returns: None
+        :rtype: None
+        """
+        profile = MagicMock()
+        profile.settings.language = "ru"
+        handler.services.user_service.get_user_profile.return_value = profile
+
+        await handler.handle(mock_update, mock_context)
+        await handler.handle(mock_update, mock_context)
+
+        assert mock_update.message.reply_text.call_count == 2
+        mock_localization.assert_called_once()
@@ -67,6 +67,7 @@ class TestPluginLoader:
                     "callbacks": [{"name": "cb", "method": "on_cb"}],
                     "text_input": "handle_text",
                     "waiting_states": ["waiting"],
+                    "priority": 10,
                 }
             ]
         }
@@ -83,6 +84,7 @@ class TestPluginLoader:
         assert len(config.callbacks) == 1
         assert config.text_input == "handle_text"
         assert config.waiting_states == ["waiting"]
+        assert config.priority == 10
 
     def test_discover_from_yaml_invalid_format(self, mock_config_path):
         """Test handling of invalid YAML."""
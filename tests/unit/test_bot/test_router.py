@@ -0,0 +1,237 @@
+"""Unit tests for the UpdateRouter.
+
+Tests command, callback query and text routing of the single PTB handler
+built from handler configurations.
+"""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from telegram import CallbackQuery, Chat, Message, MessageEntity, Update, User
+
+from src.bot.plugins.loader import HandlerConfig
+from src.bot.router import Route, UpdateRouter
+
+BOT_USERNAME = "LifeWeeksBot"
+
+
+def _make_bot() -> MagicMock:
+    """Create a bot mock with a username.
+
+    :returns: Bot mock
+    :rtype: MagicMock
+    """
+    bot = MagicMock()
+    bot.username = BOT_USERNAME
+    return bot
+
+
+def _message_update(text: str) -> Update:
+    """Create an update with a text message, marking a leading command.
+
+    :param text: Message text
+    :type text: str
+    :returns: Update with the message
+    :rtype: Update
+    """
+    entities = []
+    if text.startswith("/"):
+        length = len(text.split()[0])
+        entities = [
+            MessageEntity(type=MessageEntity.BOT_COMMAND, offset=0, length=length)
+        ]
+    message = Message(
+        message_id=1,
+        date=datetime.now(timezone.utc),
+        chat=Chat(id=1, type=Chat.PRIVATE),
+        from_user=User(id=1, first_name="Test", is_bot=False),
+        text=text,
+        entities=entities,
+    )
+    message.set_bot(_make_bot())
+    return Update(update_id=1, message=message)
+
+
+def _callback_update(data: str) -> Update:
+    """Create an update with a callback query.
+
+    :param data: Callback data
+    :type data: str
+    :returns: Update with the callback query
+    :rtype: Update
+    """
+    query = CallbackQuery(
+        id="1",
+        from_user=User(id=1, first_name="Test", is_bot=False),
+        chat_instance="1",
+        data=data,
+    )
+    return Update(update_id=1, callback_query=query)
+
+
+@pytest.fixture
+def handler() -> MagicMock:
+    """Create a handler instance with async methods.
+
+    :returns: Handler mock
+    :rtype: MagicMock
+    """
+    instance = MagicMock()
+    instance.handle = AsyncMock()
+    instance.handle_callback = AsyncMock()
+    instance.handle_selection_callback = AsyncMock()
+    return instance
+
+
+@pytest.fixture
+def router(handler: MagicMock) -> UpdateRouter:
+    """Create a router with one configured handler.
+
+    :param handler: Handler mock
+    :type handler: MagicMock
+    :returns: Router instance
+    :rtype: UpdateRouter
+    """
+    config = HandlerConfig(
+        module="module",
+        class_name="LanguageHandler",
+        command="settings_language",
+        callbacks=[
+            {"method": "handle_callback", "pattern": "settings_language"},
+            {"method": "handle_selection_callback", "pattern": "language_.*"},
+        ],
+    )
+    router = UpdateRouter()
+    router.register(config=config, handler=handler)
+    return router
+
+
+class TestUpdateRouter:
+    """Test suite for UpdateRouter."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "/settings_language",
+            "/Settings_Language",
+            f"/settings_language@{BOT_USERNAME}",
+        ],
+    )
+    def test_routes_command(
+        self, router: UpdateRouter, handler: MagicMock, text: str
+    ) -> None:
+        """Test that configured commands resolve to the handle method."""
+        route = router.check_update(_message_update(text))
+
+        assert route == Route(callback=handler.handle, args=[])
+
+    def test_command_args(self, router: UpdateRouter, handler: MagicMock) -> None:
+        """Test that the words after the command become its arguments."""
+        route = router.check_update(_message_update("/settings_language en  ru"))
+
+        assert route.args == ["en", "ru"]
+
+    @pytest.mark.parametrize("text", ["/weeks", "/settings_language@OtherBot"])
+    def test_ignores_unknown_command(self, router: UpdateRouter, text: str) -> None:
+        """Test that commands of other handlers or bots are not routed."""
+        assert router.check_update(_message_update(text)) is None
+
+    @pytest.mark.parametrize(
+        "data, method",
+        [
+            ("settings_language", "handle_callback"),
+            ("language_ru", "handle_selection_callback"),
+            ("language_", "handle_selection_callback"),
+        ],
+    )
+    def test_routes_callback(
+        self, router: UpdateRouter, handler: MagicMock, data: str, method: str
+    ) -> None:
+        """Test exact and prefix matching of callback data."""
+        route = router.check_update(_callback_update(data))
+
+        assert route.callback is getattr(handler, method)
+
+    def test_literal_pattern_matches_as_prefix(
+        self, router: UpdateRouter, handler: MagicMock
+    ) -> None:
+        """Test that literal patterns keep re.match prefix semantics."""
+        route = router.check_update(_callback_update("settings_language_extra"))
+
+        assert route.callback is handler.handle_callback
+
+    def test_longest_prefix_wins(self) -> None:
+        """Test that the most specific prefix is chosen."""
+        short, long = AsyncMock(), AsyncMock()
+        router = UpdateRouter()
+        router.add_callback(pattern="timezone_.*", callback=short)
+        router.add_callback(pattern="timezone_other", callback=long)
+
+        assert router.check_update(_callback_update("timezone_other")).callback is long
+        assert router.check_update(_callback_update("timezone_UTC")).callback is short
+
+    def test_regex_pattern_fallback(self) -> None:
+        """Test that patterns with regex syntax are matched with re."""
+        callback = AsyncMock()
+        router = UpdateRouter()
+        router.add_callback(pattern=r"day_\d+$", callback=callback)
+
+        assert router.check_update(_callback_update("day_12")).callback is callback
+        assert router.check_update(_callback_update("day_x")) is None
+
+    def test_literal_prefix_wins_over_earlier_regex(self) -> None:
+        """Test that a literal prefix is preferred to a regex registered first."""
+        regex, literal = AsyncMock(), AsyncMock()
+        router = UpdateRouter()
+        router.add_callback(pattern=r"day_\w+", callback=regex)
+        router.add_callback(pattern="day_off", callback=literal)
+
+        assert router.check_update(_callback_update("day_off")).callback is literal
+        assert router.check_update(_callback_update("day_on")).callback is regex
+
+    def test_ignores_unknown_callback(self, router: UpdateRouter) -> None:
+        """Test that unconfigured callback data is not routed."""
+        assert router.check_update(_callback_update("subscription_basic")) is None
+
+    def test_routes_text_to_text_handler(self, router: UpdateRouter) -> None:
+        """Test that plain text goes to the text handler when set."""
+        assert router.check_update(_message_update("hello")) is None
+
+        text_handler = AsyncMock()
+        router.set_text_handler(text_handler)
+
+        assert router.check_update(_message_update("hello")) == Route(
+            callback=text_handler
+        )
+
+    def test_ignores_non_update(self, router: UpdateRouter) -> None:
+        """Test that objects other than updates are not routed."""
+        assert router.check_update("update") is None
+
+    @pytest.mark.asyncio
+    async def test_handle_update_sets_args_and_calls_route(
+        self, router: UpdateRouter, handler: MagicMock
+    ) -> None:
+        """Test that handling exposes args and awaits the routed method."""
+        update = _message_update("/settings_language ru")
+        context = SimpleNamespace(args=None)
+
+        await router.handle_update(
+            update, MagicMock(), router.check_update(update), context
+        )
+
+        assert context.args == ["ru"]
+        handler.handle.assert_awaited_once_with(update, context)
+
+    @pytest.mark.asyncio
+    async def test_callback_contract_dispatches(
+        self, router: UpdateRouter, handler: MagicMock
+    ) -> None:
+        """Test that the PTB callback attribute also routes the update."""
+        update = _callback_update("language_en")
+
+        await router.callback(update, SimpleNamespace())
+
+        handler.handle_selection_callback.assert_awaited_once()
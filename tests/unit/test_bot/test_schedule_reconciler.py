@@ -0,0 +1,176 @@
+"""Unit tests for ScheduleReconciler.
+
+Tests the desired jobs built from user profiles, the in-sync shortcut,
+the transfer of only differing jobs, postponing for unhealthy workers, the
+restriction to the jobs of one shard and the read shared by the shards.
+"""
+
+from datetime import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.bot.schedule_reconciler import (
+    ScheduleReconciler,
+    ShardedDesiredJobs,
+    desired_jobs,
+)
+from src.enums import WeekDay
+from src.scheduler.digest import combine_digests
+
+
+def _user(user_id: int, hour: int = 9, notifications: bool = True) -> MagicMock:
+    """Create a subscribed user profile mock with a weekly Monday schedule.
+
+    :param user_id: Telegram user ID
+    :type user_id: int
+    :param hour: Notification hour
+    :type hour: int
+    :param notifications: Whether notifications are enabled
+    :type notifications: bool
+    :returns: User profile mock
+    :rtype: MagicMock
+    """
+    user = MagicMock()
+    user.telegram_id = user_id
+    user.subscription.is_active = True
+    user.settings.notifications = notifications
+    user.settings.notification_frequency = "weekly"
+    user.settings.notifications_day = WeekDay.MONDAY
+    user.settings.notifications_time = time(hour, 0)
+    user.settings.timezone = "UTC"
+    return user
+
+
+def _reconciler(users: list[MagicMock], client: AsyncMock) -> ScheduleReconciler:
+    """Create a reconciler over the given users.
+
+    :param users: User profiles in the database
+    :type users: list[MagicMock]
+    :param client: Scheduler client mock
+    :type client: AsyncMock
+    :returns: Reconciler with reconciliation loop disabled
+    :rtype: ScheduleReconciler
+    """
+    user_service = AsyncMock()
+    user_service.get_all_users.return_value = users
+    return ScheduleReconciler(
+        client=client,
+        desired=ShardedDesiredJobs(user_service=user_service),
+        interval_seconds=0,
+    )
+
+
+class TestScheduleReconciler:
+    """Test suite for ScheduleReconciler."""
+
+    def test_desired_jobs_skip_disabled_users(self) -> None:
+        """Test that only users with enabled notifications get a job."""
+        jobs = desired_jobs([_user(1), _user(2, notifications=False)])
+
+        assert list(jobs) == ["notification_1"]
+        assert jobs["notification_1"].job_type == "weekly_summary"
+        assert jobs["notification_1"].trigger.hour == 9
+
+    @pytest.mark.asyncio
+    async def test_matching_digest_transfers_nothing(self) -> None:
+        """Test that an in-sync worker gets no jobs."""
+        client = AsyncMock()
+        client.get_digest.return_value = {"digest": "same", "jobs": None}
+
+        assert await _reconciler([_user(1)], client).reconcile() == 0
+        client.schedule_job.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_only_differing_jobs_are_transferred(self) -> None:
+        """Test that missing, changed and stale jobs are fixed, others left."""
+        users = [_user(1), _user(2), _user(3, hour=10)]
+        current = desired_jobs([_user(1), _user(3, hour=9)])
+        worker_jobs = {job_id: job.digest for job_id, job in current.items()}
+        worker_jobs["notification_4"] = "stale"
+        client = AsyncMock()
+        client.get_digest.return_value = {
+            "digest": combine_digests(worker_jobs),
+            "jobs": worker_jobs,
+        }
+
+        assert await _reconciler(users, client).reconcile() == 3
+
+        scheduled = [
+            call.kwargs["job_id"] for call in client.schedule_job.await_args_list
+        ]
+        assert scheduled == ["notification_2", "notification_3"]
+        client.remove_job.assert_awaited_once_with("notification_4")
+
+    @pytest.mark.asyncio
+    async def test_unhealthy_worker_postpones_reconciliation(self) -> None:
+        """Test that nothing is compared while the worker is unhealthy."""
+        client = AsyncMock()
+        client.health_check.return_value = False
+
+        assert await _reconciler([_user(1)], client).run_once() is False
+        client.get_digest.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unanswered_digest_is_a_failure(self) -> None:
+        """Test that a worker not reporting its digest counts as not reconciled."""
+        client = AsyncMock()
+        client.health_check.return_value = True
+        client.get_digest.return_value = None
+
+        assert await _reconciler([_user(1)], client).run_once() is False
+
+    @pytest.mark.asyncio
+    async def test_shard_compares_only_its_users(self) -> None:
+        """Test that a shard's reconciler leaves other shards' users alone."""
+        client = AsyncMock()
+        client.get_digest.return_value = {"digest": "other", "jobs": {}}
+        user_service = AsyncMock()
+        user_service.get_all_users.return_value = [_user(1), _user(2), _user(3)]
+        reconciler = ScheduleReconciler(
+            client=client,
+            desired=ShardedDesiredJobs(user_service=user_service, shards=2),
+            interval_seconds=0,
+            shard=1,
+        )
+
+        assert await reconciler.reconcile() == 2
+
+        scheduled = [
+            call.kwargs["job_id"] for call in client.schedule_job.await_args_list
+        ]
+        assert scheduled == ["notification_1", "notification_3"]
+
+    @pytest.mark.asyncio
+    async def test_shards_share_one_read_per_pass(self) -> None:
+        """Test that the users are read once per pass over all shards."""
+        user_service = AsyncMock()
+        user_service.get_all_users.return_value = [_user(1), _user(2), _user(3)]
+        desired = ShardedDesiredJobs(user_service=user_service, shards=3)
+
+        for _ in range(2):
+            partitions = [await desired.for_shard(shard) for shard in range(3)]
+
+        assert user_service.get_all_users.await_count == 2
+        assert [list(jobs) for jobs in partitions] == [
+            ["notification_3"],
+            ["notification_1"],
+            ["notification_2"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_old_read_is_not_shared(self) -> None:
+        """Test that a shard reconciling long after the others reads again."""
+        user_service = AsyncMock()
+        user_service.get_all_users.return_value = [_user(1)]
+        desired = ShardedDesiredJobs(
+            user_service=user_service, shards=2, max_age_seconds=60
+        )
+
+        with patch(
+            "src.bot.schedule_reconciler.time.monotonic", side_effect=[0, 0, 61, 61]
+        ):
+            await desired.for_shard(0)
+            await desired.for_shard(1)
+
+        assert user_service.get_all_users.await_count == 2
@@ -0,0 +1,149 @@
+"""Unit tests for SchedulerLeadership.
+
+Tests starting the scheduler on election, stopping it when the lease is
+lost, renewing the lease during a slow start and releasing the lease on
+shutdown.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.bot.scheduler_leadership import SCHEDULER_LEASE_NAME, SchedulerLeadership
+
+
+def _leadership(repository: AsyncMock) -> SchedulerLeadership:
+    """Create an election with mocked scheduler callbacks.
+
+    :param repository: Lease repository mock
+    :type repository: AsyncMock
+    :returns: Election of the holder "bot-1:1"
+    :rtype: SchedulerLeadership
+    """
+    return SchedulerLeadership(
+        repository=repository,
+        holder="bot-1:1",
+        ttl_seconds=30,
+        on_elected=AsyncMock(),
+        on_deposed=AsyncMock(),
+    )
+
+
+class TestSchedulerLeadership:
+    """Test suite for SchedulerLeadership."""
+
+    @pytest.mark.asyncio
+    async def test_scheduler_starts_once_when_elected(self) -> None:
+        """Test that renewals of a held lease don't restart the scheduler."""
+        repository = AsyncMock()
+        repository.acquire_lease.return_value = True
+        leadership = _leadership(repository)
+
+        assert await leadership.check() is True
+        assert await leadership.check() is True
+        await leadership._transition
+
+        leadership._on_elected.assert_awaited_once()
+        leadership._on_deposed.assert_not_awaited()
+        assert repository.acquire_lease.await_args.args[:2] == (
+            SCHEDULER_LEASE_NAME,
+            "bot-1:1",
+        )
+
+    @pytest.mark.asyncio
+    async def test_follower_never_starts_scheduler(self) -> None:
+        """Test that a process without the lease runs no scheduler."""
+        repository = AsyncMock()
+        repository.acquire_lease.return_value = False
+        leadership = _leadership(repository)
+
+        assert await leadership.check() is False
+
+        leadership._on_elected.assert_not_awaited()
+        leadership._on_deposed.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_lost_lease_stops_scheduler(self) -> None:
+        """Test that a leader whose renewal fails stops its scheduler."""
+        repository = AsyncMock()
+        repository.acquire_lease.side_effect = [True, False]
+        leadership = _leadership(repository)
+
+        await leadership.check()
+        assert await leadership.check() is False
+        await leadership._transition
+
+        leadership._on_deposed.assert_awaited_once()
+        assert leadership.is_leader is False
+
+    @pytest.mark.asyncio
+    async def test_release_only_by_leader(self) -> None:
+        """Test that only a leader gives up the lease on shutdown."""
+        repository = AsyncMock()
+        repository.acquire_lease.return_value = True
+        leadership = _leadership(repository)
+
+        await leadership.release()
+        repository.release_lease.assert_not_awaited()
+
+        await leadership.check()
+        await leadership.release()
+        repository.release_lease.assert_awaited_once_with(
+            SCHEDULER_LEASE_NAME, "bot-1:1"
+        )
+        assert leadership.is_leader is False
+
+    @pytest.mark.asyncio
+    async def test_lease_is_renewed_during_a_slow_start(self) -> None:
+        """Test that a start outlasting the lease does not hold up renewals."""
+        repository = AsyncMock()
+        repository.acquire_lease.return_value = True
+        started = asyncio.Event()
+
+        async def slow_start() -> None:
+            await asyncio.sleep(1)
+            started.set()
+
+        leadership = SchedulerLeadership(
+            repository=repository,
+            holder="bot-1:1",
+            ttl_seconds=0.3,
+            on_elected=slow_start,
+            on_deposed=AsyncMock(),
+        )
+        leadership.start()
+        await asyncio.sleep(0.5)
+
+        assert not started.is_set()
+        assert repository.acquire_lease.await_count >= 3
+        await leadership.stop()
+
+    @pytest.mark.asyncio
+    async def test_losing_the_lease_cancels_a_pending_start(self) -> None:
+        """Test that a start still running when the lease is lost is cancelled."""
+        repository = AsyncMock()
+        repository.acquire_lease.side_effect = [True, False]
+        cancelled = asyncio.Event()
+
+        async def slow_start() -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        leadership = SchedulerLeadership(
+            repository=repository,
+            holder="bot-1:1",
+            ttl_seconds=30,
+            on_elected=slow_start,
+            on_deposed=AsyncMock(),
+        )
+        await leadership.check()
+        await asyncio.sleep(0)
+        await leadership.check()
+        await leadership._transition
+
+        assert cancelled.is_set()
+        leadership._on_deposed.assert_awaited_once()
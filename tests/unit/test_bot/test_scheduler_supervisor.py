@@ -0,0 +1,70 @@
+"""Unit tests for SchedulerSupervisor.
+
+Tests that live workers are left alone, dead ones are restarted, and
+consecutive restarts back off exponentially.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.bot.scheduler_supervisor import SchedulerSupervisor
+
+
+def _supervisor(alive: bool, restart: AsyncMock) -> SchedulerSupervisor:
+    """Create a supervisor over a worker with fixed liveness.
+
+    :param alive: Whether the worker is alive
+    :type alive: bool
+    :param restart: Restart callback
+    :type restart: AsyncMock
+    :returns: Supervisor
+    :rtype: SchedulerSupervisor
+    """
+    return SchedulerSupervisor(
+        is_alive=MagicMock(return_value=alive), restart=restart, check_interval=1
+    )
+
+
+class TestSchedulerSupervisor:
+    """Test suite for SchedulerSupervisor."""
+
+    @pytest.mark.asyncio
+    async def test_live_worker_is_not_restarted(self) -> None:
+        """Test that a worker sending heartbeats is left alone."""
+        restart = AsyncMock()
+
+        assert await _supervisor(True, restart).check() is True
+        restart.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @patch("src.bot.scheduler_supervisor.asyncio.sleep", new_callable=AsyncMock)
+    async def test_restarts_back_off_exponentially(self, mock_sleep: AsyncMock) -> None:
+        """Test that each consecutive restart waits twice as long."""
+        restart = AsyncMock(side_effect=[False, RuntimeError("spawn failed"), True])
+        supervisor = _supervisor(False, restart)
+
+        for _ in range(3):
+            assert await supervisor.check() is False
+
+        assert [call.args[0] for call in mock_sleep.await_args_list] == [1, 2, 4]
+        assert restart.await_count == 3
+        assert supervisor.restarts == 3
+
+    @pytest.mark.asyncio
+    @patch("src.bot.scheduler_supervisor.asyncio.sleep", new_callable=AsyncMock)
+    @patch("src.bot.scheduler_supervisor.time.monotonic")
+    async def test_stable_worker_resets_backoff(
+        self, mock_monotonic: MagicMock, mock_sleep: AsyncMock
+    ) -> None:
+        """Test that a worker alive for long enough restarts quickly again."""
+        is_alive = MagicMock(side_effect=[False, False, True, False])
+        supervisor = SchedulerSupervisor(
+            is_alive=is_alive, restart=AsyncMock(return_value=True), check_interval=1
+        )
+        mock_monotonic.side_effect = [0.0, 1.0, 1000.0, 1001.0]
+
+        for _ in range(4):
+            await supervisor.check()
+
+        assert [call.args[0] for call in mock_sleep.await_args_list] == [1, 2, 1]
@@ -176,3 +176,30 @@ class TestUnknownHandler:
         await handler.handle(mock_update, mock_context)
 
         mock_update.message.reply_text.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_handle_reuses_cached_reply(
+        self,
+        handler: UnknownHandler,
+        mock_update: MagicMock,
+        mock_context: MagicMock,
+        mock_use_locale: MagicMock,
+    ) -> None:
+        """Test that the reply is translated once per language.
+
+        :param handler: UnknownHandler instance
+        :type handler: UnknownHandler
+        :param mock_update: Mocked Telegram Update object
+        :type mock_update: MagicMock
+        :param mock_context: Mocked Telegram Context object
+        :type mock_context: MagicMock
+        :param mock_use_locale: Mocked pgettext function
+        :type mock_use_locale: MagicMock
+        :returns: None
+        :rtype: None
+        """
+        await handler.handle(mock_update, mock_context)
+        await handler.handle(mock_update, mock_context)
+
+        assert mock_update.message.reply_text.call_count == 2
+        mock_use_locale.assert_called_once()
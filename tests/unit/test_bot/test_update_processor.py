@@ -0,0 +1,191 @@
+"""Unit tests for PerUserUpdateProcessor.
+
+Tests per-user ordering, cross-user parallelism, the global processing
+limit and queue depth reporting.
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from telegram import Chat, Update, User
+
+from src.bot.update_processor import PerUserUpdateProcessor
+
+
+def _update(user_id: int | None, chat_id: int | None = None) -> MagicMock:
+    """Create an update mock with an effective user and chat.
+
+    :param user_id: Telegram user ID, None for updates without a user
+    :type user_id: int | None
+    :param chat_id: Telegram chat ID, None for updates without a chat
+    :type chat_id: int | None
+    :returns: Update mock
+    :rtype: MagicMock
+    """
+    update = MagicMock(spec=Update)
+    update.effective_user = (
+        User(id=user_id, first_name="Test", is_bot=False)
+        if user_id is not None
+        else None
+    )
+    update.effective_chat = (
+        Chat(id=chat_id, type=Chat.PRIVATE) if chat_id is not None else None
+    )
+    return update
+
+
+class TestPerUserUpdateProcessor:
+    """Test suite for PerUserUpdateProcessor."""
+
+    def test_rejects_non_positive_limit(self) -> None:
+        """Test that the global limit must be positive."""
+        with pytest.raises(ValueError):
+            PerUserUpdateProcessor(max_concurrent_updates=0)
+
+    def test_admits_more_updates_than_it_processes(self) -> None:
+        """Test that waiting updates do not count against the processing limit."""
+        processor = PerUserUpdateProcessor(max_concurrent_updates=4)
+
+        assert processor.processing_limit == 4
+        assert processor.max_concurrent_updates > 4
+
+    @pytest.mark.asyncio
+    async def test_same_user_updates_are_serialized_in_order(self) -> None:
+        """Test that one user's updates never overlap and keep arrival order."""
+        processor = PerUserUpdateProcessor(max_concurrent_updates=8)
+        events: list[str] = []
+
+        async def work(name: str, delay: float) -> None:
+            events.append(f"start {name}")
+            await asyncio.sleep(delay)
+            events.append(f"end {name}")
+
+        await asyncio.gather(
+            processor.process_update(_update(1), work("a", 0.02)),
+            processor.process_update(_update(1), work("b", 0.0)),
+            processor.process_update(_update(1), work("c", 0.01)),
+        )
+
+        assert events == ["start a", "end a", "start b", "end b", "start c", "end c"]
+
+    @pytest.mark.asyncio
+    async def test_different_users_run_in_parallel(self) -> None:
+        """Test that a slow update of one user does not block another user."""
+        processor = PerUserUpdateProcessor(max_concurrent_updates=8)
+        slow_started = asyncio.Event()
+        release_slow = asyncio.Event()
+        fast_done = asyncio.Event()
+
+        async def slow() -> None:
+            slow_started.set()
+            await release_slow.wait()
+
+        async def fast() -> None:
+            fast_done.set()
+
+        slow_task = asyncio.create_task(processor.process_update(_update(1), slow()))
+        await slow_started.wait()
+        await asyncio.wait_for(processor.process_update(_update(2), fast()), timeout=1)
+
+        assert fast_done.is_set()
+        release_slow.set()
+        await slow_task
+
+    @pytest.mark.asyncio
+    async def test_backlogged_user_does_not_stall_others(self) -> None:
+        """Test that updates queued behind one slow update leave slots free."""
+        processor = PerUserUpdateProcessor(max_concurrent_updates=2)
+        release = asyncio.Event()
+
+        async def blocked() -> None:
+            await release.wait()
+
+        async def fast() -> None:
+            pass
+
+        backlog = [
+            asyncio.create_task(processor.process_update(_update(1), blocked()))
+            for _ in range(16)
+        ]
+        await asyncio.sleep(0)
+
+        await asyncio.wait_for(processor.process_update(_update(2), fast()), timeout=1)
+
+        assert processor.queue_depth(1) == 16
+        release.set()
+        await asyncio.gather(*backlog)
+
+    @pytest.mark.asyncio
+    async def test_global_limit_bounds_processing(self) -> None:
+        """Test that at most the configured number of updates run at once."""
+        processor = PerUserUpdateProcessor(max_concurrent_updates=2)
+        running = 0
+        peak = 0
+
+        async def work() -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        await asyncio.gather(
+            *(processor.process_update(_update(user), work()) for user in range(6))
+        )
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_is_reported_and_cleared(self) -> None:
+        """Test that depths count waiting updates and idle users are forgotten."""
+        processor = PerUserUpdateProcessor(max_concurrent_updates=4, depth_warning=3)
+        release = asyncio.Event()
+
+        async def blocked() -> None:
+            await release.wait()
+
+        with patch("src.bot.update_processor.logger") as mock_logger:
+            tasks = [
+                asyncio.create_task(processor.process_update(_update(7), blocked()))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+
+            assert processor.queue_depth(7) == 3
+            assert processor.queue_depths() == {7: 3}
+            mock_logger.warning.assert_called_once()
+
+            release.set()
+            await asyncio.gather(*tasks)
+
+        assert processor.queue_depth(7) == 0
+        assert processor.queue_depths() == {}
+        assert processor._locks == {}
+
+    @pytest.mark.asyncio
+    async def test_failing_update_releases_user(self) -> None:
+        """Test that an exception does not leave the user locked."""
+        processor = PerUserUpdateProcessor(max_concurrent_updates=1)
+
+        async def fail() -> None:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await processor.process_update(_update(1), fail())
+
+        assert processor.queue_depths() == {}
+        assert processor._processing.locked() is False
+
+    @pytest.mark.parametrize(
+        "update, key",
+        [
+            (_update(1, chat_id=5), 1),
+            (_update(None, chat_id=5), 5),
+            (_update(None), None),
+            ("not an update", None),
+        ],
+    )
+    def test_user_key(self, update: object, key: int | None) -> None:
+        """Test that updates are keyed by user, then chat."""
+        assert PerUserUpdateProcessor._user_key(update) == key
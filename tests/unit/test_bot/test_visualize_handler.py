@@ -9,6 +9,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from src.bot.handlers.visualize_handler import VisualizeHandler
+from src.visualization.charts import ChartType
+from src.visualization.layout import GridGranularity
+from src.visualization.vector import VectorFormat
 from tests.unit.utils.fake_container import FakeServiceContainer
 
 
@@ -222,3 +225,273 @@ class TestVisualizeHandler:
             # Handler should return None and not send photo
             assert result is None
             mock_update.message.reply_photo.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("arg,extension", [("svg", "svg"), ("PDF", "pdf")])
+    async def test_handle_vector_poster(
+        self,
+        handler: VisualizeHandler,
+        mock_update: MagicMock,
+        mock_context: MagicMock,
+        mock_user_profile: MagicMock,
+        arg: str,
+        extension: str,
+    ) -> None:
+        """Test that /visualize svg|pdf sends a vector poster document.
+
+        :param handler: VisualizeHandler instance
+        :type handler: VisualizeHandler
+        :param mock_update: Mocked Telegram Update object
+        :type mock_update: MagicMock
+        :param mock_context: Mocked Telegram Context object
+        :type mock_context: MagicMock
+        :param mock_user_profile: Mocked user profile with settings
+        :type mock_user_profile: MagicMock
+        :returns: None
+        :rtype: None
+        """
+        handler.services.user_service.is_valid_user_profile.return_value = True
+        handler.services.user_service.get_user_profile.return_value = mock_user_profile
+        mock_user_profile.settings.language = "en"
+        mock_context.args = [arg]
+
+        with patch(
+            "src.bot.handlers.visualize_handler.generate_vector_visualization",
+            new_callable=AsyncMock,
+        ) as mock_generate_vector, patch(
+            "src.bot.handlers.visualize_handler.generate_visualization",
+            new_callable=AsyncMock,
+        ) as mock_generate_raster:
+            mock_generate_vector.return_value = b"doc"
+            await handler.handle(mock_update, mock_context)
+
+        mock_generate_raster.assert_not_awaited()
+        assert mock_generate_vector.call_args.kwargs["output_format"] == extension
+        mock_update.message.reply_photo.assert_not_called()
+        call_args = mock_update.message.reply_document.call_args
+        assert call_args.kwargs["filename"] == f"life_calendar.{extension}"
+        assert "pgettext_visualize.info_" in call_args.kwargs["caption"]
+
+    @pytest.mark.asyncio
+    async def test_handle_vector_poster_exception(
+        self,
+        handler: VisualizeHandler,
+        mock_update: MagicMock,
+        mock_context: MagicMock,
+        mock_user_profile: MagicMock,
+    ) -> None:
+        """Test that vector generation failures are logged and nothing is sent.
+
+        :param handler: VisualizeHandler instance
+        :type handler: VisualizeHandler
+        :param mock_update: Mocked Telegram Update object
+        :type mock_update: MagicMock
+        :param mock_context: Mocked Telegram Context object
+        :type mock_context: MagicMock
+        :param mock_user_profile: Mocked user profile with settings
+        :type mock_user_profile: MagicMock
+        :returns: None
+        :rtype: None
+        """
+        handler.services.user_service.is_valid_user_profile.return_value = True
+        handler.services.user_service.get_user_profile.return_value = mock_user_profile
+        mock_user_profile.settings.language = "en"
+        mock_context.args = ["svg"]
+
+        with patch(
+            "src.bot.handlers.visualize_handler.generate_vector_visualization",
+            new_callable=AsyncMock,
+            side_effect=Exception("boom"),
+        ):
+            result = await handler.handle(mock_update, mock_context)
+
+        assert result is None
+        mock_update.message.reply_document.assert_not_called()
+
+    def test_parse_visualize_args(self) -> None:
+        """Test parsing of format and granularity arguments.
+
+        :returns: None
+        :rtype: None
+        """
+        context = MagicMock()
+        context.args = ["Years", "pdf"]
+        assert VisualizeHandler._parse_visualize_args(context=context) == (
+            VectorFormat.PDF,
+            GridGranularity.YEARS,
+        )
+        context.args = ["png"]
+        assert VisualizeHandler._parse_visualize_args(context=context) == (
+            None,
+            GridGranularity.WEEKS,
+        )
+        assert VisualizeHandler._parse_visualize_args(context=MagicMock()) == (
+            None,
+            GridGranularity.WEEKS,
+        )
+
+    @pytest.mark.asyncio
+    async def test_handle_granularity_argument(
+        self,
+        handler: VisualizeHandler,
+        mock_update: MagicMock,
+        mock_context: MagicMock,
+        mock_user_profile: MagicMock,
+    ) -> None:
+        """Test that /visualize months renders the monthly raster grid.
+
+        :param handler: VisualizeHandler instance
+        :type handler: VisualizeHandler
+        :param mock_update: Mocked Telegram Update object
+        :type mock_update: MagicMock
+        :param mock_context: Mocked Telegram Context object
+        :type mock_context: MagicMock
+        :param mock_user_profile: Mocked user profile with settings
+        :type mock_user_profile: MagicMock
+        :returns: None
+        :rtype: None
+        """
+        handler.services.user_service.is_valid_user_profile.return_value = True
+        handler.services.user_service.get_user_profile.return_value = mock_user_profile
+        mock_user_profile.settings.language = "en"
+        mock_context.args = ["months"]
+
+        with patch(
+            "src.bot.handlers.visualize_handler.generate_visualization",
+            new_callable=AsyncMock,
+        ) as mock_generate_visualization:
+            await handler.handle(mock_update, mock_context)
+
+        assert (
+            mock_generate_visualization.call_args.kwargs["granularity"]
+            == GridGranularity.MONTHS
+        )
+        mock_update.message.reply_photo.assert_called_once()
+        caption = mock_update.message.reply_photo.call_args.kwargs["caption"]
+        assert "pgettext_visualize.info_months_" in caption
+        assert "Months lived" in caption and "weeks" not in caption
+
+    @pytest.mark.asyncio
+    async def test_handle_premium_chart(
+        self,
+        handler: VisualizeHandler,
+        mock_update: MagicMock,
+        mock_context: MagicMock,
+        mock_user_profile: MagicMock,
+    ) -> None:
+        """Test that /visualize timeline sends a chart to premium users.
+
+        :param handler: VisualizeHandler instance
+        :type handler: VisualizeHandler
+        :param mock_update: Mocked Telegram Update object
+        :type mock_update: MagicMock
+        :param mock_context: Mocked Telegram Context object
+        :type mock_context: MagicMock
+        :param mock_user_profile: Mocked user profile with settings
+        :type mock_user_profile: MagicMock
+        :returns: None
+        :rtype: None
+        """
+        handler.services.user_service.get_user_profile.return_value = mock_user_profile
+        mock_user_profile.is_premium = True
+        mock_context.args = ["Timeline"]
+
+        with patch(
+            "src.bot.handlers.visualize_handler.generate_chart",
+            new_callable=AsyncMock,
+            return_value=b"png",
+        ) as mock_generate_chart:
+            await handler.handle(mock_update, mock_context)
+
+        assert mock_generate_chart.call_args.kwargs["chart_type"] == ChartType.TIMELINE
+        call_args = mock_update.message.reply_photo.call_args
+        assert call_args.kwargs["photo"] == b"png"
+        assert "pgettext_visualize.info_" in call_args.kwargs["caption"]
+
+    @pytest.mark.asyncio
+    async def test_handle_chart_requires_premium(
+        self,
+        handler: VisualizeHandler,
+        mock_update: MagicMock,
+        mock_context: MagicMock,
+        mock_user_profile: MagicMock,
+    ) -> None:
+        """Test that basic users get an upgrade hint instead of a chart.
+
+        :param handler: VisualizeHandler instance
+        :type handler: VisualizeHandler
+        :param mock_update: Mocked Telegram Update object
+        :type mock_update: MagicMock
+        :param mock_context: Mocked Telegram Context object
+        :type mock_context: MagicMock
+        :param mock_user_profile: Mocked user profile with settings
+        :type mock_user_profile: MagicMock
+        :returns: None
+        :rtype: None
+        """
+        handler.services.user_service.get_user_profile.return_value = mock_user_profile
+        mock_user_profile.is_premium = False
+        mock_context.args = ["pie"]
+
+        with patch(
+            "src.bot.handlers.visualize_handler.generate_chart",
+            new_callable=AsyncMock,
+        ) as mock_generate_chart:
+            await handler.handle(mock_update, mock_context)
+
+        mock_generate_chart.assert_not_awaited()
+        mock_update.message.reply_photo.assert_not_called()
+        text = mock_update.message.reply_text.call_args.kwargs["text"]
+        assert "pgettext_visualize.premium_required_" in text
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "args, registered, premium, expected",
+        [
+            ([], True, False, "en"),
+            (["pdf"], True, False, "en"),
+            ([], False, False, None),
+            (["pie"], True, False, None),
+            (["pie"], True, True, "en"),
+        ],
+    )
+    async def test_admission_language(
+        self,
+        handler: VisualizeHandler,
+        mock_update: MagicMock,
+        mock_context: MagicMock,
+        mock_user_profile: MagicMock,
+        args: list,
+        registered: bool,
+        premium: bool,
+        expected: object,
+    ) -> None:
+        """Test that only commands doing their work are queued and acknowledged.
+
+        :param handler: VisualizeHandler instance
+        :type handler: VisualizeHandler
+        :param mock_update: Mocked Telegram Update object
+        :type mock_update: MagicMock
+        :param mock_context: Mocked Telegram Context object
+        :type mock_context: MagicMock
+        :param mock_user_profile: Mocked user profile with settings
+        :type mock_user_profile: MagicMock
+        :param args: Command arguments
+        :type args: list
+        :param registered: Whether the user is registered
+        :type registered: bool
+        :param premium: Whether the user has premium
+        :type premium: bool
+        :param expected: Expected language, None to run inline
+        :type expected: object
+        :returns: None
+        :rtype: None
+        """
+        mock_user_profile.settings.language = "en"
+        mock_user_profile.is_premium = premium
+        handler.services.user_service.get_user_profile.return_value = (
+            mock_user_profile if registered else None
+        )
+        mock_context.args = args
+
+        assert await handler.admission_language(mock_update, mock_context) == expected
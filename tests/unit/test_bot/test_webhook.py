@@ -0,0 +1,256 @@
+"""Unit tests for the embedded webhook endpoint.
+
+Recorded update JSON is POSTed over a real local socket, the way Telegram
+or a developer with curl would send it.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import AsyncIterator
+
+import pytest
+import pytest_asyncio
+from telegram import Update
+
+from src.bot.webhook import WebhookServer
+
+SECRET = "test-secret"
+PATH = "/telegram"
+
+RECORDED_UPDATE = {
+    "update_id": 42,
+    "message": {
+        "message_id": 7,
+        "date": 1700000000,
+        "chat": {"id": 123, "type": "private"},
+        "from": {"id": 123, "is_bot": False, "first_name": "Test"},
+        "text": "/weeks",
+        "entities": [{"type": "bot_command", "offset": 0, "length": 6}],
+    },
+}
+
+
+@pytest_asyncio.fixture
+async def application() -> SimpleNamespace:
+    """Create an application stand-in with a real update queue.
+
+    :returns: Object with update_queue and bot attributes
+    :rtype: SimpleNamespace
+    """
+    return SimpleNamespace(update_queue=asyncio.Queue(), bot=None)
+
+
+@pytest_asyncio.fixture
+async def server(application: SimpleNamespace) -> AsyncIterator[WebhookServer]:
+    """Start a webhook server on a free local port.
+
+    :param application: Application stand-in
+    :type application: SimpleNamespace
+    :returns: Running server
+    :rtype: AsyncIterator[WebhookServer]
+    """
+    webhook = WebhookServer(
+        application=application,
+        listen="127.0.0.1",
+        port=0,
+        path=PATH,
+        secret_token=SECRET,
+        max_body_bytes=4096,
+        read_timeout=0.2,
+        max_connections=2,
+    )
+    await webhook.start()
+    yield webhook
+    await webhook.stop()
+
+
+def _request(
+    body: bytes,
+    *,
+    method: str = "POST",
+    path: str = PATH,
+    secret: str | None = SECRET,
+    connection: str = "close",
+) -> bytes:
+    """Encode an HTTP/1.1 request.
+
+    :param body: Request body
+    :type body: bytes
+    :param method: Request method
+    :type method: str
+    :param path: Request path
+    :type path: str
+    :param secret: Secret token header value, None to omit the header
+    :type secret: str | None
+    :param connection: Connection header value
+    :type connection: str
+    :returns: Encoded request
+    :rtype: bytes
+    """
+    headers = [
+        f"{method} {path} HTTP/1.1",
+        "Host: localhost",
+        "Content-Type: application/json",
+        f"Content-Length: {len(body)}",
+        f"Connection: {connection}",
+    ]
+    if secret is not None:
+        headers.append(f"X-Telegram-Bot-Api-Secret-Token: {secret}")
+    return ("\r\n".join(headers) + "\r\n\r\n").encode() + body
+
+
+async def _send(server: WebhookServer, *requests: bytes) -> list[int]:
+    """Send requests over one connection and read the response statuses.
+
+    :param server: Running server
+    :type server: WebhookServer
+    :param requests: Encoded requests
+    :type requests: bytes
+    :returns: Status code of every response
+    :rtype: list[int]
+    """
+    reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+    statuses = []
+    try:
+        for request in requests:
+            writer.write(request)
+            await writer.drain()
+            status_line = await reader.readline()
+            statuses.append(int(status_line.split()[1]))
+            while (await reader.readline()) not in (b"\r\n", b""):
+                pass
+    finally:
+        writer.close()
+        await writer.wait_closed()
+    return statuses
+
+
+class TestWebhookServer:
+    """Test suite for WebhookServer."""
+
+    def test_requires_secret_token(self) -> None:
+        """Test that the endpoint cannot run without a secret token."""
+        with pytest.raises(ValueError):
+            WebhookServer(
+                application=SimpleNamespace(),
+                listen="127.0.0.1",
+                port=0,
+                path=PATH,
+                secret_token="",
+            )
+
+    @pytest.mark.asyncio
+    async def test_recorded_update_is_enqueued(
+        self, server: WebhookServer, application: SimpleNamespace
+    ) -> None:
+        """Test that a valid POST is acknowledged and queued as an Update."""
+        statuses = await _send(server, _request(json.dumps(RECORDED_UPDATE).encode()))
+
+        assert statuses == [200]
+        update = application.update_queue.get_nowait()
+        assert isinstance(update, Update)
+        assert update.update_id == 42
+        assert update.message.text == "/weeks"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "kwargs, status",
+        [
+            ({"secret": "wrong"}, 403),
+            ({"secret": None}, 403),
+            ({"path": "/other"}, 404),
+            ({"method": "GET"}, 405),
+        ],
+    )
+    async def test_rejected_requests(
+        self,
+        server: WebhookServer,
+        application: SimpleNamespace,
+        kwargs: dict,
+        status: int,
+    ) -> None:
+        """Test that wrong secrets, paths and methods enqueue nothing."""
+        body = json.dumps(RECORDED_UPDATE).encode()
+
+        assert await _send(server, _request(body, **kwargs)) == [status]
+        assert application.update_queue.empty()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("body", [b"{not json", b"[1, 2]", b'{"message": {}}'])
+    async def test_malformed_update(
+        self, server: WebhookServer, application: SimpleNamespace, body: bytes
+    ) -> None:
+        """Test that bodies which are not updates are rejected."""
+        assert await _send(server, _request(body)) == [400]
+        assert application.update_queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_oversized_body(
+        self, server: WebhookServer, application: SimpleNamespace
+    ) -> None:
+        """Test that bodies above the limit are rejected unread."""
+        assert await _send(server, _request(b" " * 5000)) == [413]
+        assert application.update_queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_keep_alive_connection(
+        self, server: WebhookServer, application: SimpleNamespace
+    ) -> None:
+        """Test that several updates can share one connection."""
+        first = dict(RECORDED_UPDATE, update_id=1)
+        second = dict(RECORDED_UPDATE, update_id=2)
+
+        statuses = await _send(
+            server,
+            _request(json.dumps(first).encode(), connection="keep-alive"),
+            _request(json.dumps(second).encode()),
+        )
+
+        assert statuses == [200, 200]
+        assert application.update_queue.get_nowait().update_id == 1
+        assert application.update_queue.get_nowait().update_id == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("sent", [b"", b"POST /telegram HTTP/1.1\r\nHost: x"])
+    async def test_slow_and_idle_connections_time_out(
+        self, server: WebhookServer, sent: bytes
+    ) -> None:
+        """Test that a client sending nothing or too slowly is disconnected."""
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        writer.write(sent)
+        await writer.drain()
+
+        assert await asyncio.wait_for(reader.read(), timeout=2) == b""
+        writer.close()
+        await writer.wait_closed()
+
+    @pytest.mark.asyncio
+    async def test_connection_limit(self, server: WebhookServer) -> None:
+        """Test that connections above the limit are answered with 503."""
+        held = [
+            await asyncio.open_connection("127.0.0.1", server.port) for _ in range(2)
+        ]
+        await asyncio.sleep(0.05)
+
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        response = await asyncio.wait_for(reader.read(), timeout=1)
+
+        assert response.startswith(b"HTTP/1.1 503 ")
+        writer.close()
+        await writer.wait_closed()
+        for _, held_writer in held:
+            held_writer.close()
+            await held_writer.wait_closed()
+
+    @pytest.mark.asyncio
+    async def test_oversized_header_line(
+        self, server: WebhookServer, application: SimpleNamespace
+    ) -> None:
+        """Test that a header line above the stream limit is answered with 431."""
+        request = _request(json.dumps(RECORDED_UPDATE).encode()).replace(
+            b"Host: localhost", b"Host: " + b"x" * 70000
+        )
+
+        assert await _send(server, request) == [431]
+        assert application.update_queue.empty()
@@ -181,84 +181,43 @@ class TestUseLocale:
     """Test class for use_locale function.
 
     This class contains all tests for the use_locale function,
-    including translator installation and return values.
+    which looks up translation functions in the preloaded registry.
     """
 
-    @patch("src.i18n.get_translator")
-    def test_use_locale_success(self, mock_get_translator) -> None:
-        """Test use_locale with successful translator installation.
-
-        This test verifies that use_locale properly installs translator
-        and returns the expected functions.
+    def test_use_locale_success(self) -> None:
+        """Test use_locale returns the registry's bound functions.
 
-        :param mock_get_translator: Mocked get_translator function
-        :type mock_get_translator: Mock
         :returns: None
         :rtype: None
         """
-        # Setup mock translator
-        mock_translator = Mock()
-        mock_gettext = Mock()
-        mock_ngettext = Mock()
-        mock_pgettext = Mock()
-
-        mock_translator.gettext = mock_gettext
-        mock_translator.ngettext = mock_ngettext
-        mock_translator.pgettext = mock_pgettext
-
-        mock_get_translator.return_value = mock_translator
-
-        # Test use_locale
-        gettext_func, ngettext_func, pgettext_func = use_locale("ru")
+        translations = Mock()
+        registry = Mock()
+        registry.get.return_value = translations
 
-        # Verify get_translator was called with correct language
-        mock_get_translator.assert_called_once_with("ru")
+        with patch("src.i18n.translation_registry", registry):
+            gettext_func, ngettext_func, pgettext_func = use_locale("ru")
 
-        # Verify translator.install was called
-        mock_translator.install.assert_called_once()
-
-        # Verify correct functions are returned
-        assert gettext_func == mock_gettext
-        assert ngettext_func == mock_ngettext
-        assert pgettext_func == mock_pgettext
+        registry.get.assert_called_once_with("ru")
+        assert gettext_func == translations.gettext
+        assert ngettext_func == translations.ngettext
+        assert pgettext_func == translations.pgettext
 
     @patch("src.i18n.get_translator")
-    def test_use_locale_with_different_language(self, mock_get_translator) -> None:
-        """Test use_locale with different language.
-
-        This test verifies that use_locale works correctly
-        with different language codes.
+    def test_use_locale_does_not_load_catalogs(self, mock_get_translator) -> None:
+        """Test use_locale does not load or install a catalog per call.
 
         :param mock_get_translator: Mocked get_translator function
         :type mock_get_translator: Mock
         :returns: None
         :rtype: None
         """
-        # Setup mock translator
-        mock_translator = Mock()
-        mock_gettext = Mock()
-        mock_ngettext = Mock()
-        mock_pgettext = Mock()
-
-        mock_translator.gettext = mock_gettext
-        mock_translator.ngettext = mock_ngettext
-        mock_translator.pgettext = mock_pgettext
-
-        mock_get_translator.return_value = mock_translator
-
-        # Test use_locale with Belarusian
-        gettext_func, ngettext_func, pgettext_func = use_locale("by")
-
-        # Verify get_translator was called with correct language
-        mock_get_translator.assert_called_once_with("by")
+        registry = Mock()
 
-        # Verify translator.install was called
-        mock_translator.install.assert_called_once()
+        with patch("src.i18n.translation_registry", registry):
+            use_locale("by")
 
-        # Verify correct functions are returned
-        assert gettext_func == mock_gettext
-        assert ngettext_func == mock_ngettext
-        assert pgettext_func == mock_pgettext
+        mock_get_translator.assert_not_called()
+        registry.get.return_value.install.assert_not_called()
 
 
 class TestNormalizeBabelLocale:
@@ -231,6 +231,22 @@ class TestLifeCalculator:
         expected_weeks = result.total_weeks_lived % 52
         assert result.weeks_in_current_year == expected_weeks
 
+    def test_months_lived_property(self) -> None:
+        """Test months_lived counts only complete calendar months."""
+        before_day = calculate_life_statistics(
+            birth_date=date(2000, 1, 20),
+            life_expectancy=80,
+            reference_date=date(2024, 6, 15),
+        )
+        on_day = calculate_life_statistics(
+            birth_date=date(2000, 1, 15),
+            life_expectancy=80,
+            reference_date=date(2024, 6, 15),
+        )
+
+        assert before_day.months_lived == 24 * 12 + 4
+        assert on_day.months_lived == 24 * 12 + 5
+
 
 class TestLeapYearHandlingV2:
     """Test suite for leap year edge case handling."""
@@ -0,0 +1,43 @@
+"""Unit tests for the life event week index."""
+
+from datetime import date
+
+from src.core.dtos import UserLifeEventDTO
+from src.core.life_events import LifeEventIndex, week_of_life
+
+BIRTH_DATE = date(2000, 1, 1)
+
+
+def _event(event_id: int, event_date: date) -> UserLifeEventDTO:
+    """Build a life event DTO."""
+    return UserLifeEventDTO(id=event_id, event_date=event_date, label="e", color=None)
+
+
+class TestLifeEventIndex:
+    """Test suite for LifeEventIndex."""
+
+    def test_week_of_life(self) -> None:
+        """Test that weeks are counted like total_weeks_lived."""
+        assert week_of_life(BIRTH_DATE, date(2000, 1, 7)) == 0
+        assert week_of_life(BIRTH_DATE, date(2000, 1, 8)) == 1
+        assert week_of_life(BIRTH_DATE, date(1999, 12, 31)) == -1
+
+    def test_build_groups_events_by_week_in_date_order(self) -> None:
+        """Test grouping, ordering and skipping of pre-birth events."""
+        late = _event(1, date(2000, 1, 10))
+        early = _event(2, date(2000, 1, 8))
+        other = _event(3, date(2001, 1, 1))
+
+        index = LifeEventIndex.build(
+            birth_date=BIRTH_DATE,
+            events=[late, other, _event(4, date(1990, 5, 5)), early],
+        )
+
+        assert index.events_in_week(1) == (early, late)
+        assert index.events_in_week(2) == ()
+        assert list(index) == [early, late, other]
+        assert len(index) == 3
+
+    def test_empty_index_is_falsy(self) -> None:
+        """Test that an index without events is falsy."""
+        assert not LifeEventIndex(birth_date=BIRTH_DATE)
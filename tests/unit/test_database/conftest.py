@@ -15,6 +15,9 @@ import pytest
 from src.database.models.user import User
 from src.database.models.user_settings import UserSettings
 from src.database.models.user_subscription import UserSubscription
+from src.database.repositories.sqlite.user_life_event_repository import (
+    SQLiteUserLifeEventRepository,
+)
 from src.database.repositories.sqlite.user_repository import SQLiteUserRepository
 from src.database.repositories.sqlite.user_settings_repository import (
     SQLiteUserSettingsRepository,
@@ -148,3 +151,18 @@ def mock_subscription_repository() -> MagicMock:
     mock.update_subscription = AsyncMock(return_value=True)
     mock.delete_subscription = AsyncMock(return_value=True)
     return mock
+
+
+@pytest.fixture
+def mock_life_event_repository() -> MagicMock:
+    """Create mock life event repository with async methods.
+
+    :returns: Mock life event repository with AsyncMock methods
+    :rtype: MagicMock
+    """
+    mock = MagicMock(spec=SQLiteUserLifeEventRepository)
+    mock.create_life_event = AsyncMock(return_value=True)
+    mock.get_life_events = AsyncMock(return_value=[])
+    mock.delete_life_event = AsyncMock(return_value=True)
+    mock.delete_life_events = AsyncMock(return_value=True)
+    return mock
@@ -0,0 +1,127 @@
+"""Unit tests for SQLiteConversationStateRepository class.
+
+Tests batched upserts, batched deletion and expiry sweeping of
+conversation states against a temporary SQLite database.
+"""
+
+import pytest
+import pytest_asyncio
+
+from src.database.models.conversation_state import ConversationStateRecord
+from src.database.repositories.sqlite.conversation_state_repository import (
+    SQLiteConversationStateRepository,
+)
+from tests.conftest import TEST_USER_ID
+
+
+class TestSQLiteConversationStateRepository:
+    """Test suite for SQLiteConversationStateRepository class."""
+
+    @pytest_asyncio.fixture
+    async def repository(self, temp_db_path):
+        """Create repository instance with temporary database.
+
+        :param temp_db_path: Temporary database path
+        :returns: SQLiteConversationStateRepository instance
+        :rtype: SQLiteConversationStateRepository
+        """
+        repo = SQLiteConversationStateRepository(temp_db_path)
+        await repo.initialize()
+        yield repo
+        await repo.close()
+
+    @staticmethod
+    def _state(
+        telegram_id: int = TEST_USER_ID,
+        state: str = "start_birth_date",
+        updated_at: float = 1000.0,
+        context_data: dict | None = None,
+    ) -> ConversationStateRecord:
+        """Build a conversation state model."""
+        return ConversationStateRecord(
+            telegram_id=telegram_id,
+            state=state,
+            state_id=f"id-{telegram_id}-{updated_at}",
+            updated_at=updated_at,
+            context_data=context_data,
+        )
+
+    @pytest.mark.asyncio
+    async def test_save_states_inserts_and_replaces(self, repository) -> None:
+        """Test that saving upserts every state in one batch.
+
+        :param repository: Repository instance
+        :type repository: SQLiteConversationStateRepository
+        :returns: None
+        :rtype: None
+        """
+        assert await repository.save_states([self._state(), self._state(42)])
+        assert await repository.save_states(
+            [self._state(state="settings_language", context_data={"step": 2})]
+        )
+
+        replaced = await repository.get_state(telegram_id=TEST_USER_ID)
+        other = await repository.get_state(telegram_id=42)
+
+        assert replaced.state == "settings_language"
+        assert replaced.context_data == {"step": 2}
+        assert other.state == "start_birth_date"
+
+    @pytest.mark.asyncio
+    async def test_get_state_missing(self, repository) -> None:
+        """Test that users without a state get None.
+
+        :param repository: Repository instance
+        :type repository: SQLiteConversationStateRepository
+        :returns: None
+        :rtype: None
+        """
+        assert await repository.get_state(telegram_id=TEST_USER_ID) is None
+
+    @pytest.mark.asyncio
+    async def test_empty_batches_are_noops(self, repository) -> None:
+        """Test that empty batches succeed without a statement.
+
+        :param repository: Repository instance
+        :type repository: SQLiteConversationStateRepository
+        :returns: None
+        :rtype: None
+        """
+        assert await repository.save_states([])
+        assert await repository.delete_states([])
+
+    @pytest.mark.asyncio
+    async def test_delete_states(self, repository) -> None:
+        """Test that only the given users' states are deleted.
+
+        :param repository: Repository instance
+        :type repository: SQLiteConversationStateRepository
+        :returns: None
+        :rtype: None
+        """
+        await repository.save_states([self._state(1), self._state(2), self._state(3)])
+
+        assert await repository.delete_states([1, 3])
+
+        assert await repository.get_state(telegram_id=1) is None
+        assert await repository.get_state(telegram_id=2) is not None
+        assert await repository.get_state(telegram_id=3) is None
+
+    @pytest.mark.asyncio
+    async def test_delete_expired_states(self, repository) -> None:
+        """Test that states set before the cutoff are swept.
+
+        :param repository: Repository instance
+        :type repository: SQLiteConversationStateRepository
+        :returns: None
+        :rtype: None
+        """
+        await repository.save_states(
+            [self._state(1, updated_at=100.0), self._state(2, updated_at=500.0)]
+        )
+
+        deleted = await repository.delete_expired_states(updated_before=300.0)
+
+        assert deleted == 1
+        assert await repository.get_state(telegram_id=1) is None
+        assert await repository.get_state(telegram_id=2) is not None
@@ -0,0 +1,72 @@
+"""Unit tests for SQLiteSchedulerLeaseRepository class.
+
+Tests taking, renewing, expiring and releasing the scheduler lease
+against a temporary SQLite database.
+"""
+
+import pytest
+import pytest_asyncio
+
+from src.database.repositories.sqlite.scheduler_lease_repository import (
+    SQLiteSchedulerLeaseRepository,
+)
+
+
+class TestSQLiteSchedulerLeaseRepository:
+    """Test suite for SQLiteSchedulerLeaseRepository class."""
+
+    @pytest_asyncio.fixture
+    async def repository(self, temp_db_path):
+        """Create repository instance with temporary database.
+
+        :param temp_db_path: Temporary database path
+        :returns: SQLiteSchedulerLeaseRepository instance
+        :rtype: SQLiteSchedulerLeaseRepository
+        """
+        repo = SQLiteSchedulerLeaseRepository(temp_db_path)
+        await repo.initialize()
+        yield repo
+        await repo.close()
+
+    @pytest.mark.asyncio
+    async def test_unexpired_lease_has_one_holder(self, repository) -> None:
+        """Test that a held lease is renewed by its holder and refused to others.
+
+        :param repository: Repository instance
+        :type repository: SQLiteSchedulerLeaseRepository
+        :returns: None
+        :rtype: None
+        """
+        assert await repository.acquire_lease("scheduler", "a", 1000.0, 30)
+        assert not await repository.acquire_lease("scheduler", "b", 1010.0, 30)
+        assert await repository.acquire_lease("scheduler", "a", 1020.0, 30)
+        # Renewed until 1050, so still refused after the first expiry
+        assert not await repository.acquire_lease("scheduler", "b", 1040.0, 30)
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_taken_over(self, repository) -> None:
+        """Test that another holder gets the lease once it expired.
+
+        :param repository: Repository instance
+        :type repository: SQLiteSchedulerLeaseRepository
+        :returns: None
+        :rtype: None
+        """
+        assert await repository.acquire_lease("scheduler", "a", 1000.0, 30)
+        assert await repository.acquire_lease("scheduler", "b", 1030.0, 30)
+        assert not await repository.acquire_lease("scheduler", "a", 1031.0, 30)
+
+    @pytest.mark.asyncio
+    async def test_release_frees_lease_of_holder_only(self, repository) -> None:
+        """Test that only the holder can release the lease.
+
+        :param repository: Repository instance
+        :type repository: SQLiteSchedulerLeaseRepository
+        :returns: None
+        :rtype: None
+        """
+        assert await repository.acquire_lease("scheduler", "a", 1000.0, 30)
+
+        assert not await repository.release_lease("scheduler", "b")
+        assert await repository.release_lease("scheduler", "a")
+        assert await repository.acquire_lease("scheduler", "b", 1001.0, 30)
@@ -0,0 +1,110 @@
+"""Unit tests for SQLiteUserLifeEventRepository class.
+
+Tests creation, ordered retrieval and deletion of life events against a
+temporary SQLite database.
+"""
+
+from datetime import date
+
+import pytest
+import pytest_asyncio
+
+from src.database.models.user_life_event import UserLifeEvent
+from src.database.repositories.sqlite.user_life_event_repository import (
+    SQLiteUserLifeEventRepository,
+)
+from tests.conftest import TEST_USER_ID
+
+
+class TestSQLiteUserLifeEventRepository:
+    """Test suite for SQLiteUserLifeEventRepository class."""
+
+    @pytest_asyncio.fixture
+    async def repository(self, temp_db_path):
+        """Create repository instance with temporary database.
+
+        :param temp_db_path: Temporary database path
+        :returns: SQLiteUserLifeEventRepository instance
+        :rtype: SQLiteUserLifeEventRepository
+        """
+        repo = SQLiteUserLifeEventRepository(temp_db_path)
+        await repo.initialize()
+        yield repo
+        await repo.close()
+
+    @staticmethod
+    def _event(event_date: date, telegram_id: int = TEST_USER_ID) -> UserLifeEvent:
+        """Build a life event model."""
+        return UserLifeEvent(
+            telegram_id=telegram_id, event_date=event_date, label="Event", color=None
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_life_events_ordered_by_date(self, repository) -> None:
+        """Test that events of a user are returned in date order.
+
+        :param repository: Repository instance
+        :type repository: SQLiteUserLifeEventRepository
+        :returns: None
+        :rtype: None
+        """
+        await repository.create_life_event(self._event(date(2010, 6, 1)))
+        await repository.create_life_event(self._event(date(2005, 1, 1)))
+        await repository.create_life_event(self._event(date(2001, 1, 1), 42))
+
+        events = await repository.get_life_events(telegram_id=TEST_USER_ID)
+
+        assert [event.event_date for event in events] == [
+            date(2005, 1, 1),
+            date(2010, 6, 1),
+        ]
+        assert all(event.id is not None for event in events)
+
+    @pytest.mark.asyncio
+    async def test_delete_life_event_checks_owner(self, repository) -> None:
+        """Test that a user can only delete own events.
+
+        :param repository: Repository instance
+        :type repository: SQLiteUserLifeEventRepository
+        :returns: None
+        :rtype: None
+        """
+        await repository.create_life_event(self._event(date(2005, 1, 1)))
+        (event,) = await repository.get_life_events(telegram_id=TEST_USER_ID)
+
+        assert not await repository.delete_life_event(telegram_id=42, event_id=event.id)
+        assert await repository.delete_life_event(
+            telegram_id=TEST_USER_ID, event_id=event.id
+        )
+        assert await repository.get_life_events(telegram_id=TEST_USER_ID) == []
+
+    @pytest.mark.asyncio
+    async def test_delete_life_events(self, repository) -> None:
+        """Test deleting all events of a user.
+
+        :param repository: Repository instance
+        :type repository: SQLiteUserLifeEventRepository
+        :returns: None
+        :rtype: None
+        """
+        await repository.create_life_event(self._event(date(2005, 1, 1)))
+        await repository.create_life_event(self._event(date(2006, 1, 1)))
+
+        assert await repository.delete_life_events(telegram_id=TEST_USER_ID)
+        assert not await repository.delete_life_events(telegram_id=TEST_USER_ID)
+
+    @pytest.mark.asyncio
+    async def test_get_life_events_uninitialized_returns_empty(
+        self, temp_db_path
+    ) -> None:
+        """Test that errors while reading are reported as no events.
+
+        :param temp_db_path: Temporary database path
+        :type temp_db_path: str
+        :returns: None
+        :rtype: None
+        """
+        SQLiteUserLifeEventRepository.reset_instances()
+        repo = SQLiteUserLifeEventRepository(temp_db_path)
+
+        assert await repo.get_life_events(telegram_id=TEST_USER_ID) == []
@@ -206,6 +206,31 @@ class TestSQLiteUserRepository:
             result = await repository.get_user(123)
             assert result is None
 
+    @pytest.mark.asyncio
+    async def test_iter_user_ids(self, repository, sample_user) -> None:
+        """Test that all user IDs are streamed across batches.
+
+        :param repository: Repository instance
+        :type repository: SQLiteUserRepository
+        :param sample_user: Sample user data
+        :type sample_user: User
+        :returns: None
+        :rtype: None
+        """
+        for offset in range(3):
+            await repository.create_user(
+                User(
+                    telegram_id=sample_user.telegram_id + offset,
+                    username=sample_user.username,
+                    first_name=sample_user.first_name,
+                    created_at=datetime.now(UTC),
+                )
+            )
+
+        ids = [telegram_id async for telegram_id in repository.iter_user_ids(2)]
+
+        assert sorted(ids) == [sample_user.telegram_id + i for i in range(3)]
+
     @pytest.mark.asyncio
     async def test_delete_user_success(self, repository, sample_user) -> None:
         """Test successful user deletion.
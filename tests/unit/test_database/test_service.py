@@ -10,6 +10,7 @@ from unittest.mock import AsyncMock, MagicMock, Mock
 import pytest
 
 from src.core.dtos import UserProfileDTO, UserSettingsDTO, UserSubscriptionDTO
+from src.database.models.user_life_event import UserLifeEvent
 from src.database.models.user_settings import UserSettings
 from src.database.models.user_subscription import UserSubscription
 from src.database.repositories.sqlite.user_repository import SQLiteUserRepository
@@ -22,6 +23,7 @@ from src.database.repositories.sqlite.user_subscription_repository import (
 from src.database.service import (
     UserAlreadyExistsError,
     UserDeletionError,
+    UserLifeEventError,
     UserNotFoundError,
     UserProfileError,
     UserRegistrationError,
@@ -1819,3 +1821,229 @@ class TestUserServiceGetAllUsers:
 
         # Should return empty list as user1 profile building failed
         assert result == []
+
+
+class TestUserServiceLifeEvents:
+    """Test suite for UserService life event methods."""
+
+    BIRTH_DATE = date(2000, 1, 1)
+
+    @pytest.fixture
+    def user_service(
+        self,
+        mock_user_repository: MagicMock,
+        mock_settings_repository: MagicMock,
+        mock_subscription_repository: MagicMock,
+        mock_life_event_repository: MagicMock,
+    ) -> UserService:
+        """Create UserService instance with mocked repositories.
+
+        :returns: UserService instance
+        :rtype: UserService
+        """
+        return UserService(
+            user_repository=mock_user_repository,
+            settings_repository=mock_settings_repository,
+            subscription_repository=mock_subscription_repository,
+            life_event_repository=mock_life_event_repository,
+        )
+
+    @pytest.mark.asyncio
+    async def test_add_life_event_invalidates_index(
+        self, user_service: UserService, mock_life_event_repository: MagicMock
+    ) -> None:
+        """Test that recording an event rebuilds the user's week index.
+
+        :returns: None
+        :rtype: None
+        """
+        first = await user_service.get_life_event_index(123, self.BIRTH_DATE)
+        assert await user_service.get_life_event_index(123, self.BIRTH_DATE) is first
+        mock_life_event_repository.get_life_events.return_value = [
+            UserLifeEvent(
+                id=1,
+                telegram_id=123,
+                event_date=date(2000, 1, 8),
+                label="Walk",
+                color="#112233",
+            )
+        ]
+
+        await user_service.add_life_event(
+            telegram_id=123, event_date=date(2000, 1, 8), label="Walk"
+        )
+        index = await user_service.get_life_event_index(123, self.BIRTH_DATE)
+
+        created = mock_life_event_repository.create_life_event.call_args.kwargs
+        assert created["event"].label == "Walk"
+        assert index is not first
+        assert [event.label for event in index.events_in_week(1)] == ["Walk"]
+        assert mock_life_event_repository.get_life_events.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_index_is_rebuilt_for_new_birth_date(
+        self, user_service: UserService
+    ) -> None:
+        """Test that a changed birth date does not reuse a stale index.
+
+        :returns: None
+        :rtype: None
+        """
+        first = await user_service.get_life_event_index(123, self.BIRTH_DATE)
+        second = await user_service.get_life_event_index(123, date(2001, 1, 1))
+
+        assert second is not first
+        assert second.birth_date == date(2001, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_add_life_event_failure_raises(
+        self, user_service: UserService, mock_life_event_repository: MagicMock
+    ) -> None:
+        """Test that a failed insert raises UserLifeEventError.
+
+        :returns: None
+        :rtype: None
+        """
+        mock_life_event_repository.create_life_event.return_value = False
+
+        with pytest.raises(UserLifeEventError):
+            await user_service.add_life_event(
+                telegram_id=123, event_date=date(2000, 1, 8), label="Walk"
+            )
+
+    @pytest.mark.asyncio
+    async def test_delete_life_event(
+        self, user_service: UserService, mock_life_event_repository: MagicMock
+    ) -> None:
+        """Test deleting an event and the profile cleanup of events.
+
+        :returns: None
+        :rtype: None
+        """
+        assert await user_service.delete_life_event(telegram_id=123, event_id=7)
+        mock_life_event_repository.delete_life_event.assert_awaited_once_with(
+            telegram_id=123, event_id=7
+        )
+
+        await user_service.delete_user_profile(telegram_id=123)
+
+        mock_life_event_repository.delete_life_events.assert_awaited_once_with(
+            telegram_id=123
+        )
+
+
+class TestUserServiceRegisteredUsers:
+    """Test suite for the in-memory set of registered users."""
+
+    @pytest.fixture
+    def user_service(
+        self,
+        mock_user_repository: MagicMock,
+        mock_settings_repository: MagicMock,
+        mock_subscription_repository: MagicMock,
+    ) -> UserService:
+        """Create UserService whose repository knows users 1 and 2.
+
+        :returns: UserService instance
+        :rtype: UserService
+        """
+
+        async def iter_user_ids(batch_size: int = 1000):
+            for telegram_id in (1, 2):
+                yield telegram_id
+
+        mock_user_repository.iter_user_ids = iter_user_ids
+        return UserService(
+            user_repository=mock_user_repository,
+            settings_repository=mock_settings_repository,
+            subscription_repository=mock_subscription_repository,
+        )
+
+    @pytest.mark.asyncio
+    async def test_unknown_users_skip_database(
+        self,
+        user_service: UserService,
+        mock_user_repository: MagicMock,
+        mock_settings_repository: MagicMock,
+    ) -> None:
+        """Test that lookups of unregistered users never query the database.
+
+        :returns: None
+        :rtype: None
+        """
+        assert await user_service.load_registered_users() == 2
+
+        assert await user_service.get_user_profile(telegram_id=3) is None
+        assert await user_service.is_valid_user_profile(telegram_id=3) is False
+        mock_user_repository.get_user.assert_not_called()
+        mock_settings_repository.get_user_settings.assert_not_called()
+
+        await user_service.get_user_profile(telegram_id=1)
+        mock_user_repository.get_user.assert_awaited_once_with(telegram_id=1)
+
+    @pytest.mark.asyncio
+    async def test_not_loaded_asks_database(
+        self, user_service: UserService, mock_user_repository: MagicMock
+    ) -> None:
+        """Test that every user is looked up until the set is loaded.
+
+        :returns: None
+        :rtype: None
+        """
+        assert user_service.is_known_unregistered(3) is False
+
+        await user_service.get_user_profile(telegram_id=3)
+
+        mock_user_repository.get_user.assert_awaited_once_with(telegram_id=3)
+
+    @pytest.mark.asyncio
+    async def test_failed_load_keeps_database_lookups(
+        self, user_service: UserService, mock_user_repository: MagicMock
+    ) -> None:
+        """Test that a failing ID scan leaves the filter disabled.
+
+        :returns: None
+        :rtype: None
+        """
+
+        async def failing(batch_size: int = 1000):
+            raise RuntimeError("database locked")
+            yield
+
+        mock_user_repository.iter_user_ids = failing
+
+        assert await user_service.load_registered_users() == 0
+        assert user_service.is_known_unregistered(3) is False
+
+    @pytest.mark.asyncio
+    async def test_create_and_delete_keep_set_in_sync(
+        self,
+        user_service: UserService,
+        mock_settings_repository: MagicMock,
+        mock_subscription_repository: MagicMock,
+    ) -> None:
+        """Test that registrations and deletions update the set.
+
+        :returns: None
+        :rtype: None
+        """
+        await user_service.load_registered_users()
+        mock_settings_repository.create_user_settings = AsyncMock(return_value=True)
+        mock_subscription_repository.create_subscription = AsyncMock(return_value=True)
+        user_info = Mock(id=3, username="new", first_name="New", last_name=None)
+
+        await user_service.create_user_profile(
+            user_info=user_info, birth_date=date(1990, 1, 1)
+        )
+        assert user_service.is_known_unregistered(3) is False
+
+        mock_settings_repository.delete_user_settings = AsyncMock(return_value=True)
+        mock_subscription_repository.delete_subscription = AsyncMock(return_value=True)
+        user_service.life_event_repository = MagicMock(
+            delete_life_events=AsyncMock(return_value=True)
+        )
+        await user_service.delete_user_profile(telegram_id=3)
+        assert user_service.is_known_unregistered(3) is True
+
+        assert await user_service.delete_user(telegram_id=1) is True
+        assert user_service.is_known_unregistered(1) is True
@@ -4,6 +4,7 @@ This module contains unit tests for the EventBus publish/subscribe
 pattern and domain event dataclasses.
 """
 
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -358,3 +359,138 @@ class TestEventBus:
         # Should log a warning
         mock_logger.warning.assert_called_once()
         assert "other_handler" in str(mock_logger.warning.call_args)
+
+    def test_rejects_non_positive_limits(self) -> None:
+        """Test that workers and queue size must be positive."""
+        with pytest.raises(ValueError):
+            EventBus(workers=0)
+        with pytest.raises(ValueError):
+            EventBus(queue_size=0)
+
+    @pytest.mark.asyncio
+    async def test_handlers_run_concurrently(self, event_bus: EventBus) -> None:
+        """Test that a slow handler does not delay the other handlers."""
+        release = asyncio.Event()
+        calls: list[str] = []
+
+        async def slow_handler(event: UserRegisteredEvent) -> None:
+            await release.wait()
+            calls.append("slow")
+
+        async def fast_handler(event: UserRegisteredEvent) -> None:
+            calls.append("fast")
+            release.set()
+
+        event_bus.subscribe(event_type=UserRegisteredEvent, handler=slow_handler)
+        event_bus.subscribe(event_type=UserRegisteredEvent, handler=fast_handler)
+
+        await asyncio.wait_for(
+            event_bus.publish_and_wait(UserRegisteredEvent(user_id=TEST_USER_ID)),
+            timeout=1,
+        )
+
+        assert calls == ["fast", "slow"]
+
+    @pytest.mark.asyncio
+    @patch("src.events.event_bus.logger")
+    async def test_handler_timeout_is_logged(
+        self,
+        mock_logger: MagicMock,
+        event_bus: EventBus,
+    ) -> None:
+        """Test that a handler exceeding its timeout is cancelled and logged."""
+        calls: list[str] = []
+
+        async def hanging_handler(event: UserRegisteredEvent) -> None:
+            await asyncio.Event().wait()
+
+        async def success_handler(event: UserRegisteredEvent) -> None:
+            calls.append("success")
+
+        event_bus.subscribe(
+            event_type=UserRegisteredEvent, handler=hanging_handler, timeout=0.01
+        )
+        event_bus.subscribe(event_type=UserRegisteredEvent, handler=success_handler)
+
+        await event_bus.publish_and_wait(UserRegisteredEvent(user_id=TEST_USER_ID))
+
+        assert calls == ["success"]
+        assert "timed out" in mock_logger.error.call_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_started_bus_publishes_in_background(
+        self, event_bus: EventBus
+    ) -> None:
+        """Test that publish returns before a started bus runs the handlers."""
+        release = asyncio.Event()
+        calls: list[int] = []
+
+        async def handler(event: UserSettingsChangedEvent) -> None:
+            await release.wait()
+            calls.append(event.user_id)
+
+        event_bus.subscribe(event_type=UserSettingsChangedEvent, handler=handler)
+        event_bus.start()
+
+        await event_bus.publish(
+            UserSettingsChangedEvent(user_id=TEST_USER_ID, setting_name="test")
+        )
+        assert calls == []
+
+        release.set()
+        await event_bus.stop()
+
+        assert calls == [TEST_USER_ID]
+        assert not event_bus.running
+
+    @pytest.mark.asyncio
+    async def test_events_of_one_user_stay_ordered(self) -> None:
+        """Test that one user's events are handled in publishing order."""
+        event_bus = EventBus(workers=3)
+        calls: list[str] = []
+
+        async def handler(event: UserSettingsChangedEvent) -> None:
+            await asyncio.sleep(0.01 if event.setting_name == "first" else 0)
+            calls.append(event.setting_name)
+
+        event_bus.subscribe(event_type=UserSettingsChangedEvent, handler=handler)
+        event_bus.start()
+
+        for name in ("first", "second"):
+            await event_bus.publish(
+                UserSettingsChangedEvent(user_id=TEST_USER_ID, setting_name=name)
+            )
+        await event_bus.stop()
+
+        assert calls == ["first", "second"]
+
+    @pytest.mark.asyncio
+    @patch("src.events.event_bus.logger")
+    async def test_full_queue_blocks_publisher(
+        self,
+        mock_logger: MagicMock,
+    ) -> None:
+        """Test that publishers wait for room once a worker's queue is full."""
+        event_bus = EventBus(workers=1, queue_size=1)
+        release = asyncio.Event()
+
+        async def handler(event: UserRegisteredEvent) -> None:
+            await release.wait()
+
+        event_bus.subscribe(event_type=UserRegisteredEvent, handler=handler)
+        event_bus.start()
+
+        # The worker takes the first event, the second one fills the queue
+        await event_bus.publish(UserRegisteredEvent(user_id=1))
+        await asyncio.sleep(0)
+        await event_bus.publish(UserRegisteredEvent(user_id=1))
+        blocked = asyncio.create_task(event_bus.publish(UserRegisteredEvent(user_id=1)))
+        await asyncio.sleep(0)
+
+        assert not blocked.done()
+        mock_logger.warning.assert_called_once()
+
+        release.set()
+        await asyncio.wait_for(blocked, timeout=1)
+        await event_bus.stop()
+        assert event_bus.pending == 0
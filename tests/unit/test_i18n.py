@@ -3,6 +3,7 @@
 Tests translation loading, locale normalization, and language name resolution.
 """
 
+import builtins
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -46,19 +47,20 @@ class TestI18n:
             i18n.DOMAIN, localedir=i18n.LOCALE_DIR, languages=["en"], fallback=True
         )
 
-    @patch("src.i18n.get_translator")
-    def test_use_locale(self, mock_get_translator):
-        """Test use_locale installs and returns functions."""
-        mock_trans = MagicMock()
-        mock_trans.gettext = "gettext"
-        mock_trans.ngettext = "ngettext"
-        mock_trans.pgettext = "pgettext"
-        mock_get_translator.return_value = mock_trans
+    def test_use_locale(self):
+        """Test use_locale returns functions of the preloaded catalog."""
+        registry = i18n.TranslationRegistry()
+        registry.load()
 
-        funcs = use_locale("en")
+        with patch("src.i18n.translation_registry", registry):
+            funcs = use_locale("en")
 
-        mock_trans.install.assert_called_once()
-        assert funcs == ("gettext", "ngettext", "pgettext")
+        translations = registry.get("en")
+        assert funcs == (
+            translations.gettext,
+            translations.ngettext,
+            translations.pgettext,
+        )
 
     @pytest.mark.parametrize(
         "input_lang,expected",
@@ -209,3 +211,105 @@ class TestI18n:
             ):
                 name = i18n._get_language_name_with_fallbacks("xx", "en")
                 assert name == "Test Language"
+
+
+class TestTranslationRegistry:
+    """Test suite for TranslationRegistry."""
+
+    def test_loads_all_catalogs_once(self):
+        """Test that lookups after loading do not reload catalogs."""
+        registry = i18n.TranslationRegistry()
+
+        with patch("src.i18n.get_translator", wraps=get_translator) as translator:
+            registry.get("ru")
+            registry.get("ru")
+            registry.get("ua")
+
+        assert registry.languages == {"en", "ru", "ua", "by"}
+        assert translator.call_count == len(registry.languages)
+
+    def test_translates_with_context(self):
+        """Test that bound pgettext uses the language's catalog."""
+        registry = i18n.TranslationRegistry()
+
+        assert registry.get("ru").pgettext("chart.axis_weeks", "Weeks") == "Недели"
+
+    @pytest.mark.parametrize("lang", ["xx", None])
+    def test_unknown_language_falls_back_to_english(self, lang):
+        """Test that languages without a catalog get the English one."""
+        registry = i18n.TranslationRegistry()
+
+        assert registry.get(lang) is registry.get("en")
+
+    def test_empty_locale_dir(self, tmp_path):
+        """Test that a directory without catalogs returns msgids."""
+        registry = i18n.TranslationRegistry(locale_dir=tmp_path)
+
+        assert registry.languages == frozenset()
+        assert registry.get("ru").pgettext("ctx", "Text") == "Text"
+
+    def test_nothing_installed_into_builtins(self, monkeypatch):
+        """Test that translating does not touch Python builtins."""
+        monkeypatch.delattr(builtins, "_", raising=False)
+
+        use_locale("ru")
+
+        assert not hasattr(builtins, "_")
+
+    def test_reload_replaces_catalogs(self):
+        """Test that load swaps in freshly loaded translations."""
+        registry = i18n.TranslationRegistry()
+        before = registry.get("en")
+
+        registry.load()
+
+        assert registry.get("en") is not before
+
+    def test_reload_bumps_version(self):
+        """Test that every load increments the registry version."""
+        registry = i18n.TranslationRegistry()
+        registry.get("en")
+        version = registry.version
+
+        registry.load()
+
+        assert registry.version == version + 1
+
+
+class TestLocaleArtifactCache:
+    """Test suite for LocaleArtifactCache."""
+
+    def test_builds_once_per_language_and_variant(self):
+        """Test that cached values are built on first use only."""
+        build = MagicMock(side_effect=lambda lang, *variant: (lang, *variant))
+        cache = i18n.LocaleArtifactCache(
+            build=build, registry=i18n.TranslationRegistry()
+        )
+
+        assert cache.get("ru") == ("ru",)
+        assert cache.get("ru") == ("ru",)
+        assert cache.get("ru", True) == ("ru", True)
+        assert cache.get("en", True) == ("en", True)
+
+        assert build.call_count == 3
+
+    def test_unknown_language_shares_fallback_entry(self):
+        """Test that languages without a catalog reuse the English value."""
+        build = MagicMock(side_effect=lambda lang: object())
+        cache = i18n.LocaleArtifactCache(
+            build=build, registry=i18n.TranslationRegistry()
+        )
+
+        assert cache.get("xx") is cache.get("en") is cache.get(None)
+        build.assert_called_once_with("en")
+
+    def test_reload_invalidates_entries(self):
+        """Test that values are rebuilt after the catalogs are reloaded."""
+        registry = i18n.TranslationRegistry()
+        cache = i18n.LocaleArtifactCache(build=lambda lang: object(), registry=registry)
+        before = cache.get("ru")
+
+        registry.load()
+
+        assert cache.get("ru") is not before
+        assert cache.get("ru") is cache.get("ru")
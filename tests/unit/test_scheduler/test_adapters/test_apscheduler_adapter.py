@@ -8,6 +8,7 @@ from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
 import pytest
+from apscheduler.events import EVENT_JOB_ERROR, EVENT_JOB_EXECUTED, EVENT_JOB_MISSED
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
@@ -195,6 +196,21 @@ class TestAPSchedulerAdapter:
         assert jobs[0].job_id == "job1"
         assert jobs[1].job_id == "job2"
 
+    def test_add_fire_listener_reports_job_id(
+        self,
+        adapter: APSchedulerAdapter,
+        mock_scheduler: MagicMock,
+    ) -> None:
+        """Test that a fire listener receives the ID of each job run."""
+        listener = MagicMock()
+
+        adapter.add_fire_listener(listener)
+
+        on_event, mask = mock_scheduler.add_listener.call_args.args
+        assert mask == EVENT_JOB_EXECUTED | EVENT_JOB_ERROR | EVENT_JOB_MISSED
+        on_event(MagicMock(job_id="notification_1"))
+        listener.assert_called_once_with("notification_1")
+
     def test_start_starts_scheduler_if_not_running(
         self,
         adapter: APSchedulerAdapter,
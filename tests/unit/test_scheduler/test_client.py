@@ -5,13 +5,19 @@ and response handling logic.
 """
 
 import asyncio
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.contracts.scheduler_port_protocol import ScheduleTrigger
+from src.contracts.scheduler_port_protocol import JobInfo, ScheduleTrigger
 from src.scheduler.client import SchedulerClient
-from src.scheduler.commands import SchedulerCommandType, SchedulerResponse
+from src.scheduler.commands import (
+    JobStateUpdate,
+    SchedulerCommandType,
+    SchedulerResponse,
+    WorkerHeartbeat,
+)
 
 
 class TestSchedulerClient:
@@ -59,6 +65,54 @@ class TestSchedulerClient:
         assert future.result() == response
         assert "cmd-123" not in client._response_futures
 
+    def test_job_state_updates_maintain_mirror(self, client):
+        """Test that pushed job states are answered from memory."""
+        next_run = datetime(2026, 1, 5, 10, 0, tzinfo=timezone.utc)
+        job = JobInfo(job_id="notification_1", next_run_time=next_run)
+
+        client._handle_response(JobStateUpdate(job_id="notification_1", job=job))
+
+        assert client.get_job("notification_1") is job
+        assert client.get_all_jobs() == [job]
+        assert client.get_next_run_time("notification_1") == next_run
+
+        client._handle_response(JobStateUpdate(job_id="notification_1"))
+
+        assert client.get_job("notification_1") is None
+        assert client.get_next_run_time("notification_1") is None
+        assert client.get_all_jobs() == []
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_marks_worker_alive(self, client):
+        """Test that a heartbeat resets the silence and wakes waiters."""
+        client._last_heartbeat -= 30
+        assert client.seconds_since_heartbeat() >= 30
+
+        waiter = asyncio.create_task(client.wait_for_heartbeat(timeout=1))
+        await asyncio.sleep(0)
+        client._handle_response(WorkerHeartbeat(pid=1))
+
+        assert await waiter is True
+        assert client.seconds_since_heartbeat() < 30
+
+    @pytest.mark.asyncio
+    async def test_wait_for_heartbeat_times_out(self, client):
+        """Test that a silent worker is reported after the timeout."""
+        assert await client.wait_for_heartbeat(timeout=0.01) is False
+
+    @pytest.mark.asyncio
+    async def test_fail_pending_answers_waiting_commands(self, client):
+        """Test that commands waiting on a replaced worker fail at once."""
+        future = asyncio.get_running_loop().create_future()
+        client._response_futures["cmd-1"] = future
+
+        client.fail_pending("restarted")
+
+        assert future.result() == SchedulerResponse(
+            command_id="cmd-1", success=False, error="restarted"
+        )
+        assert client._response_futures == {}
+
     @pytest.mark.asyncio
     async def test_listen_loop_processing(self, client, mock_queues):
         """Test processing of messages in listen loop."""
@@ -168,6 +222,19 @@ class TestSchedulerClient:
             assert result is False
             assert mock_send.call_args[0][0] == SchedulerCommandType.RESCHEDULE_JOB
 
+    @pytest.mark.asyncio
+    async def test_get_digest(self, client):
+        """Test digest request sends the combined digest."""
+        state = {"digest": "abc", "jobs": None}
+        with patch.object(client, "_send_command") as mock_send:
+            mock_send.return_value = SchedulerResponse("id", True, data=state)
+
+            assert await client.get_digest("abc") == state
+
+            mock_send.assert_awaited_once_with(
+                SchedulerCommandType.GET_DIGEST, payload={"digest": "abc"}
+            )
+
     @pytest.mark.asyncio
     async def test_health_check(self, client):
         """Test health_check method."""
@@ -3,11 +3,13 @@
 Tests the execute_notification_job function and its error handling paths.
 """
 
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.scheduler.jobs import execute_notification_job
+from src.scheduler.prewarm import PrewarmedNotification
 
 
 class TestSchedulerJobs:
@@ -150,6 +152,131 @@ class TestSchedulerJobs:
 
             assert mock_gateway.send_notification.called
 
+    @pytest.mark.asyncio
+    async def test_execute_notification_job_uses_prewarmed_payload(self):
+        """Test that a staged payload and image are sent without regenerating."""
+        user_id = 123
+        staged = PrewarmedNotification(
+            payload="staged-payload",
+            fire_time=datetime.now(timezone.utc),
+            image=b"png",
+        )
+
+        with patch("src.scheduler.jobs.ServiceContainer") as mock_container, patch(
+            "src.scheduler.jobs.notification_prewarm_cache"
+        ) as mock_cache:
+            mock_cache.take.return_value = staged
+            mock_notification_service = MagicMock()
+            mock_notification_service.generate_summary = AsyncMock()
+            mock_gateway = MagicMock()
+            mock_gateway.send_notification = AsyncMock(
+                return_value=MagicMock(success=True)
+            )
+            mock_gateway.send_photo = AsyncMock(return_value=True)
+            mock_container.return_value.get_notification_service.return_value = (
+                mock_notification_service
+            )
+            mock_container.return_value.get_notification_gateway.return_value = (
+                mock_gateway
+            )
+
+            await execute_notification_job(
+                user_id=user_id, message_type="weekly_summary"
+            )
+
+        mock_cache.take.assert_called_once_with(
+            user_id=user_id, message_type="weekly_summary"
+        )
+        mock_notification_service.generate_summary.assert_not_called()
+        mock_gateway.send_notification.assert_awaited_once_with("staged-payload")
+        mock_gateway.send_photo.assert_awaited_once_with(
+            recipient_id=user_id, photo=b"png"
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_notification_job_renders_image_on_cache_miss(self):
+        """Test that an image is rendered at fire time when none was staged."""
+        user_id = 123
+
+        with patch("src.scheduler.jobs.ServiceContainer") as mock_container, patch(
+            "src.scheduler.jobs.notification_prewarm_cache"
+        ) as mock_cache, patch(
+            "src.scheduler.jobs.SCHEDULER_PREWARM_RENDER_IMAGES", True
+        ), patch(
+            "src.scheduler.jobs.render_grid_image",
+            new_callable=AsyncMock,
+            return_value=b"png",
+        ) as mock_render:
+            mock_cache.take.return_value = None
+            mock_notification_service = MagicMock()
+            mock_notification_service.generate_summary = AsyncMock(
+                return_value="payload"
+            )
+            mock_gateway = MagicMock()
+            mock_gateway.send_notification = AsyncMock(
+                return_value=MagicMock(success=True)
+            )
+            mock_gateway.send_photo = AsyncMock(return_value=True)
+            mock_container.return_value.get_notification_service.return_value = (
+                mock_notification_service
+            )
+            mock_container.return_value.get_notification_gateway.return_value = (
+                mock_gateway
+            )
+
+            await execute_notification_job(
+                user_id=user_id, message_type="weekly_summary"
+            )
+
+        mock_render.assert_awaited_once_with(
+            user_id=user_id,
+            user_service=mock_container.return_value.get_user_service.return_value,
+        )
+        mock_gateway.send_notification.assert_awaited_once_with("payload")
+        mock_gateway.send_photo.assert_awaited_once_with(
+            recipient_id=user_id, photo=b"png"
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_notification_job_waits_for_planned_offset(self):
+        """Test that the send waits for the user's offset in a busy slot."""
+        user_id = 123
+        calls = []
+
+        with patch("src.scheduler.jobs.ServiceContainer") as mock_container, patch(
+            "src.scheduler.jobs.notification_prewarm_cache"
+        ) as mock_cache, patch(
+            "src.scheduler.jobs.delivery_planner"
+        ) as mock_planner, patch(
+            "src.scheduler.jobs.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            mock_cache.take.side_effect = lambda **_: calls.append("take")
+            mock_planner.offset.return_value = 4.2
+            mock_sleep.side_effect = lambda _: calls.append("sleep")
+            mock_notification_service = MagicMock()
+            mock_notification_service.generate_summary = AsyncMock(
+                return_value="payload"
+            )
+            mock_gateway = MagicMock()
+            mock_gateway.send_notification = AsyncMock(
+                return_value=MagicMock(success=True)
+            )
+            mock_container.return_value.get_notification_service.return_value = (
+                mock_notification_service
+            )
+            mock_container.return_value.get_notification_gateway.return_value = (
+                mock_gateway
+            )
+
+            await execute_notification_job(
+                user_id=user_id, message_type="weekly_summary"
+            )
+
+        mock_planner.offset.assert_called_once_with(user_id)
+        mock_sleep.assert_awaited_once_with(4.2)
+        assert calls == ["take", "sleep"]
+        mock_gateway.send_notification.assert_awaited_once_with("payload")
+
     @pytest.mark.asyncio
     async def test_execute_notification_job_exception(self):
         """Test notification job handling general exception."""
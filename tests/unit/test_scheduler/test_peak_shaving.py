@@ -0,0 +1,110 @@
+"""Unit tests for peak shaving of notification deliveries.
+
+Tests the jitter plan of a slot, the delivery simulation and the
+DeliveryPlanner's bookkeeping of slot audiences.
+"""
+
+from collections import Counter
+from unittest.mock import patch
+
+from src.scheduler.peak_shaving import (
+    DeliveryPlanner,
+    format_simulation,
+    plan_jitter,
+    simulate_delivery,
+)
+
+
+class TestPeakShaving:
+    """Test suite for plan_jitter, simulate_delivery and DeliveryPlanner."""
+
+    def test_plan_keeps_below_the_rate(self) -> None:
+        """Test that users are spaced by the rate and the plan is stable."""
+        offsets = plan_jitter(range(100), sends_per_second=10, window_seconds=600)
+
+        assert offsets == plan_jitter(reversed(range(100)), 10, 600)
+        assert sorted(offsets.values()) == [round(i * 0.1, 3) for i in range(100)]
+        per_second = Counter(int(offset) for offset in offsets.values())
+        assert max(per_second.values()) == 10
+
+    def test_plan_keeps_the_rate_beyond_the_window(self) -> None:
+        """Test that a slot too large for the window is still sent at the rate."""
+        offsets = plan_jitter(range(1000), sends_per_second=1, window_seconds=100)
+
+        assert max(offsets.values()) == 999
+        assert sorted(offsets.values())[1] == 1.0
+
+    def test_zero_window_disables_jitter(self) -> None:
+        """Test that without a window every user is sent at once."""
+        assert plan_jitter([1, 2, 3], 10, 0) == {1: 0.0, 2: 0.0, 3: 0.0}
+        assert plan_jitter([], 10, 600) == {}
+
+    def test_simulation_reports_shaved_peaks(self) -> None:
+        """Test that the simulation compares the peaks, busiest slot first."""
+        simulations = simulate_delivery(
+            {"Monday 09:00 UTC": 20, "Sunday 10:00 UTC": 5000},
+            sends_per_second=25,
+            window_seconds=600,
+        )
+
+        busiest, quiet = simulations
+        assert busiest.slot == "Sunday 10:00 UTC"
+        assert (busiest.peak_before, busiest.peak_after) == (5000, 25)
+        assert quiet.peak_after == 20 and quiet.spread_seconds == 0.76
+        assert all(simulation.within_rate for simulation in simulations)
+        table = format_simulation(simulations)
+        assert table.splitlines()[1].startswith("Sunday 10:00 UTC")
+        assert table.splitlines()[1].endswith("yes/yes")
+
+    def test_simulation_flags_slots_over_the_window(self) -> None:
+        """Test that a slot the window cannot absorb overruns it, not the rate."""
+        (simulation,) = simulate_delivery({"hotspot": 20000}, 25, 600)
+
+        assert simulation.peak_after == 25
+        assert simulation.within_rate
+        assert not simulation.within_window
+
+    def test_planner_follows_slot_changes(self) -> None:
+        """Test that joining users are planned and leaving ones keep the plan."""
+        planner = DeliveryPlanner(sends_per_second=1, window_seconds=600)
+        planner.assign(1, "monday")
+        planner.assign(2, "monday")
+        planned = {1: planner.offset(1), 2: planner.offset(2)}
+
+        assert sorted(planned.values()) == [0.0, 1.0]
+
+        # A user moving on while the slot is sent does not shift the others
+        planner.assign(2, "tuesday")
+        assert planner.offset(1) == planned[1]
+        assert planner.offset(2) == 0.0
+
+        planner.assign(3, "tuesday")
+        assert sorted([planner.offset(2), planner.offset(3)]) == [0.0, 1.0]
+        planner.remove(2)
+        planner.remove(1)
+        assert planner.offset(2) == 0.0
+        assert planner._offsets.keys() == {"tuesday"}
+
+    def test_planner_warns_about_slots_over_the_window(self) -> None:
+        """Test that a slot taking longer than the window is logged."""
+        planner = DeliveryPlanner(sends_per_second=1, window_seconds=1)
+        for user_id in range(3):
+            planner.assign(user_id, "monday")
+
+        with patch("src.scheduler.peak_shaving.logger") as mock_logger:
+            planner.offset(0)
+
+        mock_logger.warning.assert_called_once()
+
+    def test_planner_configure_replans(self) -> None:
+        """Test that a new rate applies to slots planned before."""
+        planner = DeliveryPlanner(sends_per_second=1, window_seconds=600)
+        planner.assign(1, "monday")
+        planner.assign(2, "monday")
+        before = max(planner.offset(1), planner.offset(2))
+
+        planner.configure(sends_per_second=4, window_seconds=600)
+
+        assert max(planner.offset(1), planner.offset(2)) == before / 4
+        planner.clear()
+        assert planner.offset(1) == 0.0
@@ -0,0 +1,209 @@
+"""Unit tests for scheduler notification prewarming.
+
+Tests the PrewarmCache slot handling and the NotificationPrewarmer
+window selection, pacing and image rendering.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from io import BytesIO
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.contracts.scheduler_port_protocol import JobInfo
+from src.events.domain_events import NotificationPayload
+from src.scheduler.prewarm import (
+    NotificationPrewarmer,
+    PrewarmCache,
+    PrewarmedNotification,
+)
+
+NOW = datetime(2024, 6, 3, 8, 55, tzinfo=timezone.utc)
+SLOT = datetime(2024, 6, 3, 9, 0, tzinfo=timezone.utc)
+
+
+def _payload(user_id: int) -> NotificationPayload:
+    """Build a minimal payload for a user."""
+    return NotificationPayload(
+        recipient_id=user_id, message_type="weekly_summary", title="t", body="b"
+    )
+
+
+def _job(user_id: int, fire_time: datetime | None) -> JobInfo:
+    """Build a notification job as returned by the scheduler adapter."""
+    return JobInfo(
+        job_id=f"notification_{user_id}",
+        next_run_time=fire_time,
+        kwargs={"user_id": user_id, "message_type": "weekly_summary"},
+    )
+
+
+class TestPrewarmCache:
+    """Test suite for PrewarmCache."""
+
+    def test_take_returns_entry_for_current_slot(self) -> None:
+        """Test that a staged entry is returned once around its slot."""
+        cache = PrewarmCache()
+        entry = PrewarmedNotification(payload=_payload(1), fire_time=SLOT)
+        cache.stage(user_id=1, message_type="weekly_summary", entry=entry)
+
+        assert cache.take(1, "weekly_summary", now=SLOT + timedelta(seconds=3)) is entry
+        assert cache.take(1, "weekly_summary", now=SLOT) is None
+
+    def test_take_discards_entry_for_other_slot(self) -> None:
+        """Test that an entry prepared for a missed slot is never sent."""
+        cache = PrewarmCache(tolerance_seconds=60)
+        entry = PrewarmedNotification(payload=_payload(1), fire_time=SLOT)
+        cache.stage(user_id=1, message_type="weekly_summary", entry=entry)
+
+        assert cache.take(1, "weekly_summary", now=SLOT + timedelta(hours=1)) is None
+        assert len(cache) == 0
+
+    def test_evict_expired(self) -> None:
+        """Test that entries past their slot are evicted."""
+        cache = PrewarmCache(tolerance_seconds=60)
+        cache.stage(1, "weekly_summary", PrewarmedNotification(_payload(1), SLOT))
+        cache.stage(
+            2,
+            "weekly_summary",
+            PrewarmedNotification(_payload(2), SLOT + timedelta(days=1)),
+        )
+
+        assert cache.evict_expired(now=SLOT + timedelta(minutes=5)) == 1
+        assert cache.is_staged(2, "weekly_summary", SLOT + timedelta(days=1))
+
+    def test_evict_user(self) -> None:
+        """Test that all staged entries of one user are evicted."""
+        cache = PrewarmCache()
+        cache.stage(1, "weekly_summary", PrewarmedNotification(_payload(1), SLOT))
+        cache.stage(1, "daily_summary", PrewarmedNotification(_payload(1), SLOT))
+        cache.stage(2, "weekly_summary", PrewarmedNotification(_payload(2), SLOT))
+
+        assert cache.evict_user(1) == 2
+        assert len(cache) == 1
+        assert cache.is_staged(2, "weekly_summary", SLOT)
+
+
+class TestNotificationPrewarmer:
+    """Test suite for NotificationPrewarmer."""
+
+    @pytest.fixture
+    def notification_service(self) -> MagicMock:
+        """Create a notification service generating payloads per user."""
+        service = MagicMock()
+        service.generate_summary = AsyncMock(
+            side_effect=lambda user_id, **_: _payload(user_id)
+        )
+        return service
+
+    def _prewarmer(
+        self,
+        jobs: list[JobInfo],
+        notification_service: MagicMock,
+        cache: PrewarmCache,
+        user_service: MagicMock | None = None,
+    ) -> NotificationPrewarmer:
+        """Create a prewarmer over a fixed job list."""
+        scheduler = MagicMock()
+        scheduler.get_all_jobs.return_value = jobs
+        return NotificationPrewarmer(
+            scheduler=scheduler,
+            notification_service=notification_service,
+            cache=cache,
+            window_seconds=300,
+            interval_seconds=100,
+            user_service=user_service,
+        )
+
+    @pytest.mark.asyncio
+    async def test_stages_only_jobs_within_window(
+        self, notification_service: MagicMock
+    ) -> None:
+        """Test that jobs outside the window or without run time are skipped."""
+        cache = PrewarmCache()
+        jobs = [
+            _job(1, NOW + timedelta(seconds=30)),
+            _job(2, NOW + timedelta(hours=2)),
+            _job(3, None),
+            JobInfo(job_id="maintenance", next_run_time=SLOT),
+        ]
+        prewarmer = self._prewarmer(jobs, notification_service, cache)
+
+        assert await prewarmer.prewarm_due(now=NOW) == 1
+        assert cache.is_staged(1, "weekly_summary", NOW + timedelta(seconds=30))
+        notification_service.generate_summary.assert_awaited_once_with(
+            user_id=1,
+            message_type="weekly_summary",
+            reference_date=date(2024, 6, 3),
+        )
+
+    @pytest.mark.asyncio
+    async def test_work_is_paced_across_window(
+        self, notification_service: MagicMock
+    ) -> None:
+        """Test that a popular slot is prepared over several runs."""
+        cache = PrewarmCache()
+        jobs = [_job(user_id, SLOT) for user_id in range(6)]
+        prewarmer = self._prewarmer(jobs, notification_service, cache)
+
+        # 300s before the slot with a 100s interval leaves three runs
+        assert await prewarmer.prewarm_due(now=SLOT - timedelta(seconds=300)) == 2
+        assert await prewarmer.prewarm_due(now=SLOT - timedelta(seconds=200)) == 2
+        assert await prewarmer.prewarm_due(now=SLOT - timedelta(seconds=100)) == 2
+        assert await prewarmer.prewarm_due(now=SLOT - timedelta(seconds=50)) == 0
+        assert len(cache) == 6
+
+    @pytest.mark.asyncio
+    async def test_missing_payload_is_not_staged(
+        self, notification_service: MagicMock
+    ) -> None:
+        """Test that users without a payload are not staged."""
+        notification_service.generate_summary = AsyncMock(return_value=None)
+        cache = PrewarmCache()
+        prewarmer = self._prewarmer([_job(1, SLOT)], notification_service, cache)
+
+        assert await prewarmer.prewarm_due(now=NOW) == 0
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_renders_image_when_enabled(
+        self, notification_service: MagicMock
+    ) -> None:
+        """Test that the grid image is pre-rendered with a user service."""
+        cache = PrewarmCache()
+        user_service = MagicMock()
+        prewarmer = self._prewarmer(
+            [_job(1, SLOT)], notification_service, cache, user_service=user_service
+        )
+
+        with patch(
+            "src.visualization.grid.generate_visualization",
+            new_callable=AsyncMock,
+            return_value=BytesIO(b"png"),
+        ) as mock_generate:
+            await prewarmer.prewarm_due(now=NOW)
+
+        mock_generate.assert_awaited_once_with(
+            user_info=1, user_service_instance=user_service
+        )
+        assert cache.take(1, "weekly_summary", now=SLOT).image == b"png"
+
+    @pytest.mark.asyncio
+    async def test_render_failure_keeps_payload(
+        self, notification_service: MagicMock
+    ) -> None:
+        """Test that a failed render still stages the text payload."""
+        cache = PrewarmCache()
+        prewarmer = self._prewarmer(
+            [_job(1, SLOT)], notification_service, cache, user_service=MagicMock()
+        )
+
+        with patch(
+            "src.visualization.grid.generate_visualization",
+            new_callable=AsyncMock,
+            side_effect=ValueError("no profile"),
+        ):
+            await prewarmer.prewarm_due(now=NOW)
+
+        entry = cache.take(1, "weekly_summary", now=SLOT)
+        assert entry is not None and entry.image is None
@@ -0,0 +1,87 @@
+"""Unit tests for scheduler sharding.
+
+Tests the partition of jobs by user ID and the routing, merging and
+health checks of ShardedSchedulerClient.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.contracts.scheduler_port_protocol import JobInfo, ScheduleTrigger
+from src.scheduler.sharding import ShardedSchedulerClient, shard_for_job
+
+
+class TestSharding:
+    """Test suite for shard_for_job and ShardedSchedulerClient."""
+
+    def test_jobs_follow_their_user(self) -> None:
+        """Test that a user's jobs share a shard and other jobs get a stable one."""
+        assert shard_for_job("notification_7", 3) == 7 % 3
+        assert shard_for_job("reminder_7", 3) == shard_for_job("notification_7", 3)
+        assert shard_for_job("maintenance", 3) == shard_for_job("maintenance", 3)
+        assert shard_for_job("notification_7", 1) == 0
+
+    def test_requires_a_shard(self) -> None:
+        """Test that a sharded client cannot be empty."""
+        with pytest.raises(ValueError):
+            ShardedSchedulerClient([])
+
+    @pytest.mark.asyncio
+    async def test_commands_go_to_the_owning_shard(self) -> None:
+        """Test that job commands reach only the worker owning the job."""
+        shards = [AsyncMock(), AsyncMock()]
+        client = ShardedSchedulerClient(shards)
+        trigger = ScheduleTrigger(day_of_week=0, hour=9, minute=0)
+
+        await client.schedule_job("notification_3", trigger, "weekly", user_id=3)
+        await client.reschedule_job("notification_3", trigger)
+        await client.remove_job("notification_4")
+
+        shards[1].schedule_job.assert_awaited_once_with(
+            job_id="notification_3", trigger=trigger, job_type="weekly", user_id=3
+        )
+        shards[1].reschedule_job.assert_awaited_once_with("notification_3", trigger)
+        shards[0].remove_job.assert_awaited_once_with("notification_4")
+        shards[0].schedule_job.assert_not_awaited()
+
+    def test_job_mirrors_are_merged(self) -> None:
+        """Test that lookups use the owning shard's mirror and listings all."""
+        shards = [MagicMock(), MagicMock()]
+        shards[0].get_all_jobs.return_value = [JobInfo(job_id="notification_2")]
+        shards[1].get_all_jobs.return_value = [JobInfo(job_id="notification_1")]
+        client = ShardedSchedulerClient(shards)
+
+        client.get_job("notification_1")
+
+        shards[1].get_job.assert_called_once_with("notification_1")
+        assert [job.job_id for job in client.get_all_jobs()] == [
+            "notification_2",
+            "notification_1",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_health_check_needs_every_shard(self) -> None:
+        """Test that one unhealthy worker fails the health check."""
+        shards = [AsyncMock(), AsyncMock()]
+        shards[0].health_check.return_value = True
+        shards[1].health_check.return_value = False
+        client = ShardedSchedulerClient(shards)
+
+        assert await client.health_check() is False
+
+        shards[1].health_check.return_value = True
+        assert await client.health_check() is True
+
+    @pytest.mark.asyncio
+    async def test_replaced_shard_gets_its_commands(self) -> None:
+        """Test that a restarted worker's client takes over its shard."""
+        shards = [AsyncMock(), AsyncMock()]
+        client = ShardedSchedulerClient(shards)
+        restarted = AsyncMock()
+
+        client.replace_shard(1, restarted)
+        await client.remove_job("notification_1")
+
+        restarted.remove_job.assert_awaited_once_with("notification_1")
+        shards[1].remove_job.assert_not_awaited()
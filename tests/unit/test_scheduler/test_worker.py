@@ -6,15 +6,27 @@ and integration with the underlying scheduler adapter.
 
 import asyncio
 import signal
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
+from zoneinfo import ZoneInfo
 
 import pytest
 
-from src.contracts.scheduler_port_protocol import SchedulerPortProtocol, ScheduleTrigger
+from src.contracts.scheduler_port_protocol import (
+    JobInfo,
+    SchedulerPortProtocol,
+    ScheduleTrigger,
+)
 from src.scheduler.commands import (
+    JobStateUpdate,
     SchedulerCommand,
     SchedulerCommandType,
+    WorkerHeartbeat,
 )
+from src.scheduler.digest import combine_digests, job_digest
+from src.scheduler.peak_shaving import DeliveryPlanner
+from src.scheduler.prewarm import PrewarmCache, PrewarmedNotification
 from src.scheduler.worker import SchedulerWorker
 
 
@@ -37,6 +49,12 @@ class TestSchedulerWorker:
         scheduler.is_running = True
         return scheduler
 
+    @pytest.fixture(autouse=True)
+    def mock_planner(self):
+        """Keep the process-wide delivery planner out of the tests."""
+        with patch("src.scheduler.worker.delivery_planner") as planner:
+            yield planner
+
     @pytest.fixture
     def worker(self, mock_queues, mock_scheduler):
         """Create SchedulerWorker instance."""
@@ -96,14 +114,20 @@ class TestSchedulerWorker:
             "user_id": 123,
         }
 
-        worker._response_queue.put.assert_called_once()
-        response = worker._response_queue.put.call_args[0][0]
+        # The job's new state reaches the client's mirror before the response
+        update, response = [
+            call.args[0] for call in worker._response_queue.put.call_args_list
+        ]
+        assert update == JobStateUpdate(
+            job_id="job1", job=mock_scheduler.get_job.return_value
+        )
         assert response.success is True
 
     @pytest.mark.asyncio
     async def test_process_command_remove_job(self, worker, mock_scheduler):
         """Test processing REMOVE_JOB command."""
         mock_scheduler.remove_job.return_value = True
+        mock_scheduler.get_job.return_value = None
         command = SchedulerCommand(
             id="cmd1", type=SchedulerCommandType.REMOVE_JOB, payload={"job_id": "job1"}
         )
@@ -111,6 +135,8 @@ class TestSchedulerWorker:
         await worker._process_command(command)
 
         mock_scheduler.remove_job.assert_called_with("job1")
+        update = worker._response_queue.put.call_args_list[0].args[0]
+        assert update == JobStateUpdate(job_id="job1")
         response = worker._response_queue.put.call_args[0][0]
         assert response.success is True
 
@@ -147,6 +173,102 @@ class TestSchedulerWorker:
         mock_scheduler.reschedule_job.assert_called_once()
         assert worker._response_queue.put.call_args[0][0].success is True
 
+    def test_delivery_slots_follow_the_utc_fire_time(
+        self, worker, mock_scheduler, mock_planner
+    ):
+        """Test that users of different zones firing together share a slot."""
+        planner = DeliveryPlanner(sends_per_second=1, window_seconds=600)
+        mock_planner.assign.side_effect = planner.assign
+        mock_planner.remove.side_effect = planner.remove
+        monday = datetime(2026, 10, 19, 9, 0)
+        jobs = {
+            "notification_1": JobInfo(
+                job_id="notification_1",
+                next_run_time=monday.replace(tzinfo=ZoneInfo("Europe/Berlin")),
+                kwargs={"user_id": 1},
+            ),
+            "notification_2": JobInfo(
+                job_id="notification_2",
+                next_run_time=monday.replace(tzinfo=ZoneInfo("Europe/Paris")),
+                kwargs={"user_id": 2},
+            ),
+        }
+        mock_scheduler.get_job.side_effect = jobs.get
+        for user_id, zone in ((1, "Europe/Berlin"), (2, "Europe/Paris")):
+            worker._handle_schedule_job(
+                {
+                    "job_id": f"notification_{user_id}",
+                    "trigger": {
+                        "day_of_week": "mon",
+                        "hour": 9,
+                        "minute": 0,
+                        "timezone": zone,
+                    },
+                    "job_type": "notification",
+                    "user_id": user_id,
+                }
+            )
+
+        assert sorted([planner.offset(1), planner.offset(2)]) == [0.0, 1.0]
+
+        # After its run the job moves on to next week's slot
+        jobs["notification_1"] = replace(
+            jobs["notification_1"],
+            next_run_time=jobs["notification_1"].next_run_time + timedelta(weeks=1),
+        )
+        worker._handle_job_fired("notification_1")
+        assert planner.offset(1) == 0.0
+        worker._handle_remove_job("notification_2")
+        assert planner.offset(2) == 0.0
+        assert mock_planner.remove.call_args.args == (2,)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "command_type, payload",
+        [
+            (
+                SchedulerCommandType.SCHEDULE_JOB,
+                {
+                    "job_id": "notification_123",
+                    "trigger": {"day_of_week": "mon", "hour": 9, "minute": 0},
+                    "job_type": "weekly_summary",
+                    "user_id": 123,
+                },
+            ),
+            (
+                SchedulerCommandType.RESCHEDULE_JOB,
+                {
+                    "job_id": "notification_123",
+                    "trigger": {"day_of_week": "tue", "hour": 9, "minute": 0},
+                },
+            ),
+            (SchedulerCommandType.REMOVE_JOB, {"job_id": "notification_123"}),
+        ],
+    )
+    async def test_job_changes_evict_prewarmed_notifications(
+        self, worker, mock_scheduler, command_type, payload
+    ):
+        """Test that payloads staged from old settings are never sent."""
+        cache = PrewarmCache()
+        slot = datetime(2026, 10, 19, 9, 0, tzinfo=timezone.utc)
+        cache.stage(123, "weekly_summary", PrewarmedNotification("old", slot))
+        cache.stage(456, "weekly_summary", PrewarmedNotification("other", slot))
+        worker._schedules["notification_123"] = (
+            ScheduleTrigger(day_of_week="mon", hour=9, minute=0),
+            "weekly_summary",
+        )
+        mock_scheduler.get_job.return_value = JobInfo(
+            job_id="notification_123", kwargs={"user_id": 123}
+        )
+
+        with patch("src.scheduler.worker.notification_prewarm_cache", cache):
+            await worker._process_command(
+                SchedulerCommand(id="cmd1", type=command_type, payload=payload)
+            )
+
+        assert not cache.is_staged(123, "weekly_summary", slot)
+        assert cache.is_staged(456, "weekly_summary", slot)
+
     @pytest.mark.asyncio
     async def test_process_command_get_job(self, worker, mock_scheduler):
         """Test processing GET_JOB command."""
@@ -161,19 +283,55 @@ class TestSchedulerWorker:
         response = worker._response_queue.put.call_args[0][0]
         assert response.data == {"id": "job1"}
 
+    def test_fired_job_state_is_published(self, worker, mock_scheduler):
+        """Test that a job's state is pushed to the client after it fires."""
+        job = MagicMock()
+        mock_scheduler.get_job.return_value = job
+
+        worker._publish_job_state("job1")
+
+        worker._response_queue.put.assert_called_once_with(
+            JobStateUpdate(job_id="job1", job=job)
+        )
+
     @pytest.mark.asyncio
-    async def test_process_command_get_all_jobs(self, worker, mock_scheduler):
-        """Test processing GET_ALL_JOBS command."""
-        mock_scheduler.get_all_jobs.return_value = [{"id": "job1"}]
-        command = SchedulerCommand(
-            id="cmd1", type=SchedulerCommandType.GET_ALL_JOBS, payload={}
+    async def test_process_command_get_digest(self, worker):
+        """Test that job digests are only sent when the combined one differs."""
+        trigger = ScheduleTrigger(day_of_week=0, hour=10, minute=0)
+        worker._schedules["job1"] = (trigger, "weekly_summary")
+        digests = {"job1": job_digest(trigger, "weekly_summary")}
+
+        await worker._process_command(
+            SchedulerCommand(
+                id="cmd1",
+                type=SchedulerCommandType.GET_DIGEST,
+                payload={"digest": combine_digests(digests)},
+            )
         )
+        assert worker._response_queue.put.call_args[0][0].data["jobs"] is None
 
-        await worker._process_command(command)
+        await worker._process_command(
+            SchedulerCommand(
+                id="cmd2",
+                type=SchedulerCommandType.GET_DIGEST,
+                payload={"digest": combine_digests({})},
+            )
+        )
+        assert worker._response_queue.put.call_args[0][0].data["jobs"] == digests
 
-        mock_scheduler.get_all_jobs.assert_called_once()
-        response = worker._response_queue.put.call_args[0][0]
-        assert response.data == [{"id": "job1"}]
+    @pytest.mark.asyncio
+    async def test_heartbeat_loop_sends_heartbeats(self, worker):
+        """Test that the worker pushes heartbeats while running."""
+        worker._running = True
+
+        async def stop_after_first(_seconds):
+            worker._running = False
+
+        with patch("src.scheduler.worker.asyncio.sleep", side_effect=stop_after_first):
+            await worker._heartbeat_loop()
+
+        heartbeat = worker._response_queue.put.call_args[0][0]
+        assert isinstance(heartbeat, WorkerHeartbeat)
 
     @pytest.mark.asyncio
     async def test_process_command_health_check(self, worker, mock_scheduler):
@@ -453,3 +611,33 @@ class TestSchedulerWorker:
         worker._running = True
         worker._handle_shutdown_signal(signal.SIGTERM, None)
         assert worker._running is False
+
+    @pytest.mark.asyncio
+    async def test_prewarm_loop_runs_until_stopped(self, worker):
+        """Test that the prewarm loop survives errors and stops with the worker."""
+        worker._running = True
+        worker._prewarmer = MagicMock()
+        worker._prewarmer.interval_seconds = 15
+        worker._prewarmer.prewarm_due = AsyncMock(side_effect=[Exception("db down"), 3])
+
+        sleeps: list[float] = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+            if len(sleeps) == 2:
+                worker._running = False
+
+        with patch("src.scheduler.worker.asyncio.sleep", side_effect=fake_sleep), patch(
+            "src.scheduler.worker.logger"
+        ) as mock_logger:
+            await worker._prewarm_loop()
+
+        assert worker._prewarmer.prewarm_due.await_count == 2
+        assert sleeps == [15, 15]
+        mock_logger.error.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_prewarm_loop_disabled(self, worker):
+        """Test that the prewarm loop exits immediately without a prewarmer."""
+        worker._running = True
+        await worker._prewarm_loop()
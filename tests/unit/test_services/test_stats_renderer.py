@@ -0,0 +1,77 @@
+"""Unit tests for StatsMessageRenderer and the cached number formatters."""
+
+from datetime import date
+
+import pytest
+from babel.numbers import format_decimal, format_percent
+
+from src.core.life_calculator import calculate_life_statistics
+from src.i18n import get_number_formatter, normalize_babel_locale, use_locale
+from src.services.stats_renderer import StatsMessageRenderer
+
+STATS = calculate_life_statistics(
+    birth_date=date(1960, 3, 15),
+    life_expectancy=95,
+    reference_date=date(2024, 6, 1),
+)
+
+
+class TestLocaleNumberFormatter:
+    """Test suite for get_number_formatter."""
+
+    @pytest.mark.parametrize("lang", ["en", "ru", "ua", "by"])
+    def test_matches_babel_output(self, lang: str) -> None:
+        """Test that cached patterns format like the Babel helpers."""
+        formatter = get_number_formatter(lang)
+        locale = normalize_babel_locale(lang)
+
+        assert formatter.decimal(64) == format_decimal(64, locale=locale)
+        assert formatter.integer(4940) == format_decimal(
+            4940, locale=locale, format="#,##0"
+        )
+        assert formatter.percent(0.6789) == format_percent(
+            0.6789, locale=locale, format="#0.1%"
+        )
+
+    def test_formatter_is_cached_per_language(self) -> None:
+        """Test that the locale and patterns are resolved once per language."""
+        assert get_number_formatter("ru") is get_number_formatter("ru")
+
+    def test_unknown_language_uses_english(self) -> None:
+        """Test that an unparsable code formats with the English locale."""
+        assert get_number_formatter("xx-yy").integer(1234) == "1,234"
+
+
+class TestStatsMessageRenderer:
+    """Test suite for StatsMessageRenderer."""
+
+    def test_format_values(self) -> None:
+        """Test that every placeholder is formatted for the language."""
+        values = StatsMessageRenderer().format_values(stats=STATS, lang="ru")
+
+        assert values["weeks_lived"] == format_decimal(
+            STATS.total_weeks_lived, locale="ru", format="#,##0"
+        )
+        assert values["life_expectancy"] == "95"
+        assert set(values) == {
+            "age",
+            "weeks_lived",
+            "life_expectancy",
+            "remaining_weeks",
+            "life_percentage",
+            "days_until_birthday",
+        }
+
+    def test_render_uses_translated_template(self) -> None:
+        """Test that the message is the translated template with the values."""
+        _, _, pgettext = use_locale("ru")
+
+        message = StatsMessageRenderer().render(
+            stats=STATS, lang="ru", pgettext=pgettext
+        )
+
+        assert "95" in message
+        assert format_decimal(STATS.total_weeks_lived, locale="ru", format="#,##0") in (
+            message
+        )
+        assert "%(" not in message
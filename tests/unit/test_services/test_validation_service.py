@@ -1,6 +1,6 @@
 """Unit tests for ValidationService.
 
-Tests birth date and life expectancy validation with various
+Tests birth date, life expectancy and life event validation with various
 valid and invalid inputs.
 """
 
@@ -12,8 +12,11 @@ from src.core.exceptions import ValidationError as CoreValidationError
 from src.services.validation_service import (
     ERROR_DATE_IN_FUTURE,
     ERROR_DATE_TOO_OLD,
+    ERROR_INVALID_COLOR,
     ERROR_INVALID_DATE_FORMAT,
     ERROR_INVALID_NUMBER,
+    ERROR_LABEL_REQUIRED,
+    ERROR_LABEL_TOO_LONG,
     ERROR_VALUE_TOO_HIGH,
     ERROR_VALUE_TOO_LOW,
     ValidationService,
@@ -204,3 +207,47 @@ class TestValidateLifeExpectancy:
         with pytest.raises(CoreValidationError) as exc_info:
             service.validate_life_expectancy(input_str="")
         assert exc_info.value.error_key == ERROR_INVALID_NUMBER
+
+
+class TestValidateLifeEvent:
+    """Test suite for life event validation."""
+
+    @pytest.fixture
+    def service(self) -> ValidationService:
+        """Create ValidationService instance for testing.
+
+        :returns: ValidationService instance
+        :rtype: ValidationService
+        """
+        return ValidationService()
+
+    def test_valid_event_is_normalized(self, service: ValidationService) -> None:
+        """Test that the label is stripped and the color lowercased."""
+        result = service.validate_life_event(
+            date_str="01.09.2012", label="  First job ", color="#FF9800"
+        )
+        assert result.event_date == date(2012, 9, 1)
+        assert result.label == "First job"
+        assert result.color == "#ff9800"
+
+    @pytest.mark.parametrize(
+        "date_str,label,color,error_key",
+        [
+            ("2012-09-01", "Job", None, ERROR_INVALID_DATE_FORMAT),
+            ("01.09.2012", "   ", None, ERROR_LABEL_REQUIRED),
+            ("01.09.2012", "x" * 101, None, ERROR_LABEL_TOO_LONG),
+            ("01.09.2012", "Job", "orange", ERROR_INVALID_COLOR),
+        ],
+    )
+    def test_invalid_event_rejected(
+        self,
+        service: ValidationService,
+        date_str: str,
+        label: str,
+        color: str,
+        error_key: str,
+    ) -> None:
+        """Test that invalid input is mapped to the matching error key."""
+        with pytest.raises(CoreValidationError) as exc_info:
+            service.validate_life_event(date_str=date_str, label=label, color=color)
+        assert exc_info.value.error_key == error_key
@@ -430,3 +430,61 @@ class TestConfig:
         # Just verify they can be imported without errors
         assert DEFAULT_SUBSCRIPTION_MESSAGE_PROBABILITY is not None
         assert SUBSCRIPTION_MESSAGE_PROBABILITY is not None
+
+    @patch.dict(
+        os.environ,
+        {
+            "SCHEDULER_PREWARM_WINDOW_SECONDS": "600",
+            "SCHEDULER_PREWARM_INTERVAL_SECONDS": "-1",
+            "SCHEDULER_PREWARM_RENDER_IMAGES": "Yes",
+        },
+    )
+    def test_scheduler_prewarm_settings_from_env(self) -> None:
+        """Test that prewarm settings are read and validated from environment.
+
+        :returns: None
+        :rtype: None
+        """
+        import importlib
+
+        import src.utils.config
+
+        importlib.reload(src.utils.config)
+
+        from src.utils.config import (
+            DEFAULT_SCHEDULER_PREWARM_INTERVAL_SECONDS,
+            SCHEDULER_PREWARM_INTERVAL_SECONDS,
+            SCHEDULER_PREWARM_RENDER_IMAGES,
+            SCHEDULER_PREWARM_WINDOW_SECONDS,
+        )
+
+        assert SCHEDULER_PREWARM_WINDOW_SECONDS == 600
+        # Negative values fall back to the default
+        assert (
+            SCHEDULER_PREWARM_INTERVAL_SECONDS
+            == DEFAULT_SCHEDULER_PREWARM_INTERVAL_SECONDS
+        )
+        assert SCHEDULER_PREWARM_RENDER_IMAGES is True
+
+    def test_registered_users_filter_is_off_with_several_processes(self) -> None:
+        """Test that settings for several bot processes disable the ID filter.
+
+        :returns: None
+        :rtype: None
+        """
+        import importlib
+
+        import src.utils.config
+
+        cases = [
+            ({}, True),
+            ({"REGISTERED_USERS_FILTER": "false"}, False),
+            ({"SCHEDULER_LEADER_ELECTION": "true"}, False),
+            ({"CONVERSATION_STATE_BACKEND": "database"}, False),
+        ]
+        for environ, enabled in cases:
+            with patch.dict(os.environ, environ, clear=True):
+                importlib.reload(src.utils.config)
+
+                assert src.utils.config.REGISTERED_USERS_FILTER is enabled
+        importlib.reload(src.utils.config)
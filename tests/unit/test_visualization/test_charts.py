@@ -0,0 +1,164 @@
+"""Tests for premium matplotlib charts and the figure pool."""
+
+import subprocess
+import sys
+import threading
+from datetime import date
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.core.dtos import UserLifeEventDTO
+from src.core.life_calculator import calculate_life_statistics
+from src.core.life_events import LifeEventIndex
+from src.visualization.charts import (
+    ChartLabels,
+    ChartType,
+    FigurePool,
+    generate_chart,
+    render_chart,
+)
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+BIRTH_DATE = date(1990, 1, 1)
+STATS = calculate_life_statistics(
+    birth_date=BIRTH_DATE, life_expectancy=80, reference_date=date(2024, 1, 1)
+)
+
+
+class TestFigurePool:
+    """Test class for FigurePool."""
+
+    def test_figures_are_reused_and_cleared(self) -> None:
+        """Test that a returned figure is handed out again without artists."""
+        pool = FigurePool(size=1, figsize=(2, 2))
+
+        with pool.figure() as first:
+            first.add_subplot()
+        with pool.figure() as second:
+            assert second is first
+            assert not second.axes
+
+    def test_pool_is_filled_on_first_use(self) -> None:
+        """Test that all figures are created when the pool is first used."""
+        pool = FigurePool(size=3, figsize=(2, 2))
+        assert len(pool) == 0
+
+        with pool.figure():
+            assert len(pool) == 2
+        assert len(pool) == 3
+
+    def test_busy_pool_creates_extra_figure(self) -> None:
+        """Test that concurrent use gets a temporary figure that is dropped."""
+        pool = FigurePool(size=1, figsize=(2, 2))
+
+        with pool.figure() as first, pool.figure() as second:
+            assert first is not second
+        assert len(pool) == 1
+
+    def test_zero_size_disables_pooling(self) -> None:
+        """Test that no figures are kept with a size of zero."""
+        pool = FigurePool(size=0, figsize=(2, 2))
+
+        with pool.figure() as figure:
+            assert figure is not None
+        assert len(pool) == 0
+
+    def test_matplotlib_is_imported_lazily(self) -> None:
+        """Test that importing the chart module does not import matplotlib."""
+        code = (
+            "import sys, src.bot, src.visualization.charts; "
+            "sys.exit('matplotlib' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], check=False)
+
+        assert result.returncode == 0
+
+
+class TestRenderChart:
+    """Test class for render_chart function."""
+
+    @pytest.mark.parametrize("chart_type", list(ChartType))
+    def test_renders_png(self, chart_type: ChartType) -> None:
+        """Test that every chart type renders a PNG on the pooled figure."""
+        pool = FigurePool(size=1, figsize=(4, 3))
+        events = LifeEventIndex.build(
+            birth_date=BIRTH_DATE,
+            events=[
+                UserLifeEventDTO(
+                    id=1, event_date=date(2012, 9, 1), label="Job", color="#ff0000"
+                )
+            ],
+        )
+
+        image = render_chart(
+            chart_type=chart_type,
+            stats=STATS,
+            labels=ChartLabels(title="Title"),
+            events=events,
+            pool=pool,
+        )
+
+        assert image.getvalue().startswith(PNG_SIGNATURE)
+        assert len(pool) == 1
+
+
+class TestGenerateChart:
+    """Test class for generate_chart function."""
+
+    @pytest.fixture
+    def service(self) -> Mock:
+        """Provide a user service returning a profile with settings."""
+        profile = Mock()
+        profile.settings.language = "ru"
+        profile.settings.birth_date = BIRTH_DATE
+        profile.settings.life_expectancy = 80
+        svc = Mock()
+        svc.get_user_profile = AsyncMock(return_value=profile)
+        svc.get_life_event_index = AsyncMock(
+            return_value=LifeEventIndex(birth_date=BIRTH_DATE)
+        )
+        return svc
+
+    @pytest.mark.asyncio
+    async def test_generates_timeline_with_events(self, service: Mock) -> None:
+        """Test that the timeline loads the user's life events."""
+        image = await generate_chart(
+            user_info=1, user_service_instance=service, chart_type=ChartType.TIMELINE
+        )
+
+        assert image.getvalue().startswith(PNG_SIGNATURE)
+        service.get_life_event_index.assert_awaited_once_with(
+            telegram_id=1, birth_date=BIRTH_DATE
+        )
+
+    @pytest.mark.asyncio
+    async def test_pie_skips_events(self, service: Mock) -> None:
+        """Test that charts without event markers do not load events."""
+        await generate_chart(
+            user_info=1, user_service_instance=service, chart_type=ChartType.PIE
+        )
+
+        service.get_life_event_index.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_renders_off_the_event_loop(self, service: Mock) -> None:
+        """Test that the chart is drawn in a worker thread."""
+        threads: list[int] = []
+
+        def record_thread(**_: object) -> None:
+            threads.append(threading.get_ident())
+
+        with patch("src.visualization.charts.render_chart", side_effect=record_thread):
+            await generate_chart(user_info=1, user_service_instance=service)
+
+        assert threads and threads[0] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_user_not_found(self) -> None:
+        """Test that a missing profile raises ValueError."""
+        svc = Mock()
+        svc.get_user_profile = AsyncMock(return_value=None)
+
+        with pytest.raises(ValueError):
+            await generate_chart(user_info=1, user_service_instance=svc)
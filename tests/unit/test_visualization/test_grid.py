@@ -1,10 +1,15 @@
 """Tests for grid visualization functionality."""
 
+from datetime import date
 from io import BytesIO
 from unittest.mock import AsyncMock, Mock, mock_open, patch
 
 import pytest
+from PIL import Image
 
+from src.core.dtos import UserLifeEventDTO
+from src.core.life_calculator import calculate_life_statistics
+from src.core.life_events import LifeEventIndex
 from src.database.models.user import User
 from src.database.models.user_settings import UserSettings
 from src.database.models.user_subscription import UserSubscription
@@ -15,6 +20,12 @@ from src.visualization.grid import (
     calculate_grid_dimensions,
     generate_visualization,
 )
+from src.visualization.layers import GridLayerCache, _fill_cells
+from src.visualization.layout import (
+    GridGranularity,
+    compute_grid_layout,
+    count_lived_cells,
+)
 
 
 class TestCalculateGridDimensions:
@@ -102,6 +113,7 @@ class TestGenerateVisualization:
         # Create mock user profile
         self.mock_user_settings = Mock(spec=UserSettings)
         self.mock_user_settings.language = "en"
+        self.mock_user_settings.life_expectancy = 80
 
         self.mock_user_subscription = Mock(spec=UserSubscription)
 
@@ -113,7 +125,7 @@ class TestGenerateVisualization:
     @pytest.mark.asyncio
     @patch("src.visualization.grid.user_service")
     @patch("src.visualization.grid.calculate_life_statistics")
-    @patch("src.visualization.grid.Image")
+    @patch("src.visualization.grid.grid_layer_cache")
     @patch("src.visualization.grid.ImageDraw")
     @patch("src.visualization.grid._load_font")
     @patch("src.i18n.use_locale")
@@ -124,7 +136,7 @@ class TestGenerateVisualization:
         mock_use_locale,
         mock_load_font,
         mock_image_draw,
-        mock_image,
+        mock_layer_cache,
         mock_calculator,
         mock_user_service,
     ) -> None:
@@ -146,7 +158,9 @@ class TestGenerateVisualization:
         mock_calculator.return_value = mock_stats
 
         mock_image_instance = Mock()
-        mock_image.new.return_value = mock_image_instance
+        mock_layer_cache.progress_layer.return_value.copy.return_value = (
+            mock_image_instance
+        )
 
         mock_draw = Mock()
         mock_draw.textbbox.return_value = (
@@ -181,14 +195,14 @@ class TestGenerateVisualization:
             life_expectancy=self.mock_user_profile.settings.life_expectancy,
         )
 
-        # Verify image creation
-        mock_image.new.assert_called_once()
+        # Verify the cached progress layer is copied before drawing on it
+        mock_layer_cache.progress_layer.assert_called_once()
         mock_image_draw.Draw.assert_called_once_with(mock_image_instance)
 
     @pytest.mark.asyncio
     @patch("src.visualization.grid.user_service")
     @patch("src.visualization.grid.calculate_life_statistics")
-    @patch("src.visualization.grid.Image")
+    @patch("src.visualization.grid.grid_layer_cache")
     @patch("src.visualization.grid.ImageDraw")
     @patch("src.visualization.grid._load_font")
     @patch("src.i18n.use_locale")
@@ -199,7 +213,7 @@ class TestGenerateVisualization:
         mock_use_locale,
         mock_load_font,
         mock_image_draw,
-        mock_image,
+        mock_layer_cache,
         mock_calculator,
         mock_user_service,
     ) -> None:
@@ -221,7 +235,9 @@ class TestGenerateVisualization:
         mock_calculator.return_value = mock_stats
 
         mock_image_instance = Mock()
-        mock_image.new.return_value = mock_image_instance
+        mock_layer_cache.progress_layer.return_value.copy.return_value = (
+            mock_image_instance
+        )
 
         mock_draw = Mock()
         mock_draw.textbbox.return_value = (
@@ -258,7 +274,7 @@ class TestGenerateVisualization:
     @pytest.mark.asyncio
     @patch("src.visualization.grid.user_service")
     @patch("src.visualization.grid.calculate_life_statistics")
-    @patch("src.visualization.grid.Image")
+    @patch("src.visualization.grid.grid_layer_cache")
     @patch("src.visualization.grid.ImageDraw")
     @patch("src.visualization.grid._load_font")
     @patch("src.i18n.use_locale")
@@ -269,7 +285,7 @@ class TestGenerateVisualization:
         mock_use_locale,
         mock_load_font,
         mock_image_draw,
-        mock_image,
+        mock_layer_cache,
         mock_calculator,
         mock_user_service,
     ) -> None:
@@ -291,7 +307,9 @@ class TestGenerateVisualization:
         mock_calculator.return_value = mock_stats
 
         mock_image_instance = Mock()
-        mock_image.new.return_value = mock_image_instance
+        mock_layer_cache.progress_layer.return_value.copy.return_value = (
+            mock_image_instance
+        )
 
         mock_draw = Mock()
         mock_draw.textbbox.return_value = (
@@ -391,7 +409,7 @@ class TestGenerateVisualization:
     @pytest.mark.asyncio
     @patch("src.visualization.grid.user_service")
     @patch("src.visualization.grid.calculate_life_statistics")
-    @patch("src.visualization.grid.Image")
+    @patch("src.visualization.grid.grid_layer_cache")
     @patch("src.visualization.grid.ImageDraw")
     @patch("src.visualization.grid._load_font")
     @patch("src.i18n.use_locale")
@@ -402,7 +420,7 @@ class TestGenerateVisualization:
         mock_use_locale,
         mock_load_font,
         mock_image_draw,
-        mock_image,
+        mock_layer_cache,
         mock_calculator,
         mock_user_service,
     ) -> None:
@@ -417,6 +435,7 @@ class TestGenerateVisualization:
         # Setup user profile without language setting
         mock_user_settings_no_lang = Mock(spec=UserSettings)
         mock_user_settings_no_lang.language = None
+        mock_user_settings_no_lang.life_expectancy = 80
 
         mock_user_profile_no_lang = Mock(spec=User)
         mock_user_profile_no_lang.telegram_id = 12345
@@ -432,7 +451,9 @@ class TestGenerateVisualization:
         mock_calculator.return_value = mock_stats
 
         mock_image_instance = Mock()
-        mock_image.new.return_value = mock_image_instance
+        mock_layer_cache.progress_layer.return_value.copy.return_value = (
+            mock_image_instance
+        )
 
         mock_draw = Mock()
         mock_draw.textbbox.return_value = (
@@ -818,3 +839,104 @@ class TestParseLegendLabels:
 
         assert lived_label == "Lived weeks"
         assert future_label == "Future weeks"
+
+
+class TestGenerateVisualizationLayout:
+    """Test class for layout-driven rendering in generate_visualization."""
+
+    @staticmethod
+    def _service(events: LifeEventIndex | None = None) -> Mock:
+        """Create a user service with a 60-year profile born 1990-01-01."""
+        profile = Mock()
+        profile.settings.language = "en"
+        profile.settings.birth_date = date(1990, 1, 1)
+        profile.settings.life_expectancy = 60
+        svc = Mock()
+        svc.get_user_profile = AsyncMock(return_value=profile)
+        svc.get_life_event_index = AsyncMock(
+            return_value=events or LifeEventIndex(birth_date=date(1990, 1, 1))
+        )
+        return svc
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "granularity,expected_cells",
+        [
+            (GridGranularity.WEEKS, 60 * 52),
+            (GridGranularity.MONTHS, 60 * 12),
+            (GridGranularity.YEARS, 60),
+        ],
+    )
+    @patch("src.visualization.grid._load_font")
+    @patch("src.visualization.grid.ImageDraw")
+    @patch("src.visualization.layers.ImageDraw")
+    @patch("src.visualization.layers.Image")
+    async def test_cells_follow_life_expectancy_and_granularity(
+        self,
+        mock_image,
+        mock_layers_draw,
+        mock_image_draw,
+        mock_load_font,
+        granularity: GridGranularity,
+        expected_cells: int,
+    ) -> None:
+        """Test that only the cells of the user's grid are drawn.
+
+        :returns: None
+        :rtype: None
+        """
+        mock_draw = Mock()
+        mock_draw.textbbox.return_value = (0, 0, 100, 20)
+        mock_image_draw.Draw.return_value = mock_draw
+        mock_layers_draw.Draw.return_value = mock_draw
+
+        with patch("src.visualization.grid.grid_layer_cache", GridLayerCache()):
+            await generate_visualization(
+                1, user_service_instance=self._service(), granularity=granularity
+            )
+
+        layout = compute_grid_layout(life_expectancy=60, granularity=granularity)
+        mock_image.new.assert_called_once_with(
+            "RGB", (layout.width, layout.height), (255, 255, 255)
+        )
+        lived = count_lived_cells(
+            stats=calculate_life_statistics(
+                birth_date=date(1990, 1, 1), life_expectancy=60
+            ),
+            granularity=granularity,
+        )
+        # Base cells, lived cells of the progress layer and two legend markers
+        assert mock_draw.rectangle.call_count == expected_cells + lived + 2
+
+    @pytest.mark.asyncio
+    async def test_new_event_only_redraws_overlay(self) -> None:
+        """Test that a recorded event reuses the cached grid layers.
+
+        :returns: None
+        :rtype: None
+        """
+        cache = GridLayerCache()
+        event = UserLifeEventDTO(
+            id=1, event_date=date(1990, 1, 20), label="Walk", color="#0000ff"
+        )
+        with patch("src.visualization.grid.grid_layer_cache", cache), patch(
+            "src.visualization.layers._fill_cells", wraps=_fill_cells
+        ) as fill_cells:
+            await generate_visualization(1, user_service_instance=self._service())
+            first_render_calls = fill_cells.call_count
+
+            index = LifeEventIndex.build(birth_date=date(1990, 1, 1), events=[event])
+            result = await generate_visualization(
+                1, user_service_instance=self._service(events=index)
+            )
+
+        # Base and progress layer were drawn once; the second call only
+        # filled the single event cell
+        assert first_render_calls == 2
+        assert fill_cells.call_count == 3
+        assert fill_cells.call_args.kwargs["start"] == 2
+        image = Image.open(result)
+        layout = compute_grid_layout(life_expectancy=60)
+        x = layout.padding + 2 * layout.cell_size + layout.cell_size // 2
+        y = layout.padding + layout.cell_size // 2
+        assert image.getpixel((x, y)) == (0, 0, 255)
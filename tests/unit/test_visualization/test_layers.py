@@ -0,0 +1,156 @@
+"""Tests for layered rendering of the raster life grid."""
+
+from datetime import date
+from unittest.mock import patch
+
+from PIL import ImageDraw
+
+from src.core.dtos import UserLifeEventDTO
+from src.core.life_events import LifeEventIndex
+from src.visualization.layers import (
+    GridLayerCache,
+    _fill_cells,
+    draw_event_overlay,
+    event_cells,
+)
+from src.visualization.layout import GridGranularity, compute_grid_layout
+
+LAYOUT = compute_grid_layout(life_expectancy=10)
+BIRTH_DATE = date(2000, 1, 1)
+LIVED = (76, 175, 80)
+BACKGROUND = (255, 255, 255)
+
+
+def _cell_pixel(image, cell: int) -> tuple:
+    """Return the color in the middle of a cell."""
+    row, column = divmod(cell, LAYOUT.columns)
+    half = LAYOUT.cell_size // 2
+    return image.getpixel(
+        (
+            LAYOUT.padding + column * LAYOUT.cell_size + half,
+            LAYOUT.padding + row * LAYOUT.cell_size + half,
+        )
+    )
+
+
+def _event(event_id: int, event_date: date, color: str | None = None):
+    """Build a life event DTO."""
+    return UserLifeEventDTO(id=event_id, event_date=event_date, label="e", color=color)
+
+
+class TestGridLayerCache:
+    """Test suite for GridLayerCache."""
+
+    def test_base_layer_is_shared_per_layout(self) -> None:
+        """Test that the base layer is drawn once per layout."""
+        cache = GridLayerCache()
+
+        first = cache.base_layer(layout=LAYOUT, font=None)
+
+        assert cache.base_layer(layout=LAYOUT, font=None) is first
+        assert first.size == (LAYOUT.width, LAYOUT.height)
+        assert _cell_pixel(first, 0) == BACKGROUND
+
+    def test_progress_layer_draws_only_new_cells(self) -> None:
+        """Test that a growing lived count only fills the new cells."""
+        cache = GridLayerCache()
+        cache.progress_layer(user_id=1, layout=LAYOUT, lived_cells=10, font=None)
+
+        with patch(
+            "src.visualization.layers._fill_cells", wraps=_fill_cells
+        ) as fill_cells:
+            image = cache.progress_layer(
+                user_id=1, layout=LAYOUT, lived_cells=15, font=None
+            )
+
+        fill_cells.assert_called_once()
+        assert fill_cells.call_args.args[2:4] == (10, 15)
+        assert _cell_pixel(image, 14) == LIVED
+        assert _cell_pixel(image, 15) == BACKGROUND
+
+    def test_progress_layer_reverts_surplus_cells(self) -> None:
+        """Test that a shrinking lived count turns cells back into future."""
+        cache = GridLayerCache()
+        cache.progress_layer(user_id=1, layout=LAYOUT, lived_cells=60, font=None)
+
+        image = cache.progress_layer(user_id=1, layout=LAYOUT, lived_cells=5, font=None)
+
+        assert _cell_pixel(image, 4) == LIVED
+        assert _cell_pixel(image, 5) == BACKGROUND
+        assert _cell_pixel(cache.base_layer(LAYOUT, None), 4) == BACKGROUND
+
+    def test_least_recently_used_layers_are_evicted(self) -> None:
+        """Test that the cache stays within its size per layer kind."""
+        cache = GridLayerCache(max_entries=1)
+
+        cache.progress_layer(user_id=1, layout=LAYOUT, lived_cells=1, font=None)
+        cache.progress_layer(user_id=2, layout=LAYOUT, lived_cells=1, font=None)
+
+        assert len(cache) == 2
+
+    def test_zero_size_disables_caching(self) -> None:
+        """Test that no layers are kept with a size of zero."""
+        cache = GridLayerCache(max_entries=0)
+
+        image = cache.progress_layer(user_id=1, layout=LAYOUT, lived_cells=3, font=None)
+
+        assert len(cache) == 0
+        assert _cell_pixel(image, 2) == LIVED
+
+
+class TestEventOverlay:
+    """Test suite for event_cells and draw_event_overlay."""
+
+    def test_weekly_cells_use_event_colors(self) -> None:
+        """Test that events map to their week and color, latest wins."""
+        index = LifeEventIndex.build(
+            birth_date=BIRTH_DATE,
+            events=[
+                _event(1, date(2000, 1, 15), "#ff0000"),
+                _event(2, date(2000, 1, 16), "#00ff00"),
+                _event(3, date(2000, 3, 1)),
+            ],
+        )
+
+        cells = event_cells(index=index, layout=LAYOUT, life_expectancy=10)
+
+        assert cells == {2: (0, 255, 0), 8: (255, 152, 0)}
+
+    def test_coarse_cells_and_out_of_grid_events(self) -> None:
+        """Test month mapping and that events beyond the grid are dropped."""
+        layout = compute_grid_layout(
+            life_expectancy=10, granularity=GridGranularity.MONTHS
+        )
+        index = LifeEventIndex.build(
+            birth_date=BIRTH_DATE,
+            events=[_event(1, date(2001, 3, 5)), _event(2, date(2030, 1, 1))],
+        )
+
+        cells = event_cells(index=index, layout=layout, life_expectancy=10)
+
+        assert list(cells) == [14]
+
+    def test_invalid_color_falls_back(self) -> None:
+        """Test that an unparsable color uses the default event color."""
+        index = LifeEventIndex.build(
+            birth_date=BIRTH_DATE, events=[_event(1, BIRTH_DATE, "#nothex")]
+        )
+
+        assert event_cells(index=index, layout=LAYOUT, life_expectancy=10) == {
+            0: (255, 152, 0)
+        }
+
+    def test_overlay_is_drawn_on_copy(self) -> None:
+        """Test that the overlay fills event cells without touching the cache."""
+        cache = GridLayerCache()
+        progress = cache.progress_layer(
+            user_id=1, layout=LAYOUT, lived_cells=5, font=None
+        )
+        image = progress.copy()
+
+        draw_event_overlay(
+            draw=ImageDraw.Draw(image), layout=LAYOUT, cells={3: (0, 0, 255)}
+        )
+
+        assert _cell_pixel(image, 3) == (0, 0, 255)
+        assert _cell_pixel(progress, 3) == LIVED
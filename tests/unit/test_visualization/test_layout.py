@@ -0,0 +1,120 @@
+"""Tests for life grid geometry."""
+
+from datetime import date
+
+import pytest
+
+from src.core.life_calculator import calculate_life_statistics
+from src.visualization.layout import (
+    MIN_CANVAS_WIDTH,
+    GridGranularity,
+    compute_grid_layout,
+    count_lived_cells,
+)
+
+
+class TestComputeGridLayout:
+    """Test class for compute_grid_layout function."""
+
+    def test_classic_weekly_grid(self) -> None:
+        """Test that a 90-year weekly grid keeps the classic 10px cells."""
+        layout = compute_grid_layout(life_expectancy=90)
+
+        assert (layout.columns, layout.rows, layout.cell_size) == (52, 90, 10)
+        assert (layout.width, layout.height) == (600, 980)
+
+    def test_rows_follow_life_expectancy(self) -> None:
+        """Test that short life expectancy produces a shorter grid."""
+        short = compute_grid_layout(life_expectancy=60)
+        classic = compute_grid_layout(life_expectancy=90)
+
+        assert short.rows == 60
+        assert short.width * short.height < classic.width * classic.height
+
+    def test_long_grid_shrinks_cells_to_budget(self) -> None:
+        """Test that a 120-year grid scales cells down to the pixel budget."""
+        layout = compute_grid_layout(life_expectancy=120)
+
+        assert layout.rows == 120
+        assert layout.cell_size == 8
+
+    def test_grid_extends_to_weeks_lived(self) -> None:
+        """Test that users who outlived their expectancy see all lived weeks."""
+        layout = compute_grid_layout(life_expectancy=70, weeks_lived=75 * 52 + 3)
+
+        assert layout.rows == 76
+
+    def test_cell_size_lower_bound(self) -> None:
+        """Test that tiny budgets never go below the minimum cell size."""
+        layout = compute_grid_layout(life_expectancy=90, pixel_budget=100)
+
+        assert layout.cell_size == 4
+
+    @pytest.mark.parametrize(
+        "granularity,columns,rows",
+        [(GridGranularity.MONTHS, 12, 80), (GridGranularity.YEARS, 10, 8)],
+    )
+    def test_coarse_granularities(
+        self, granularity: GridGranularity, columns: int, rows: int
+    ) -> None:
+        """Test that coarse grids have far fewer cells than the weekly one."""
+        layout = compute_grid_layout(life_expectancy=80, granularity=granularity)
+        weekly = compute_grid_layout(life_expectancy=80)
+
+        assert (layout.columns, layout.rows) == (columns, rows)
+        assert layout.total_cells * 4 < weekly.total_cells
+        assert layout.width >= MIN_CANVAS_WIDTH
+
+    def test_yearly_row_labels_are_decades(self) -> None:
+        """Test that yearly grid rows are labeled with decade start ages."""
+        layout = compute_grid_layout(
+            life_expectancy=80, granularity=GridGranularity.YEARS
+        )
+
+        assert [layout.row_label(row) for row in range(3)] == ["0", "10", "20"]
+
+
+class TestLivedRowRuns:
+    """Test class for GridLayout.lived_row_runs method."""
+
+    def test_partial_last_row(self) -> None:
+        """Test that a partial row becomes a shorter trailing run."""
+        layout = compute_grid_layout(life_expectancy=80)
+
+        assert layout.lived_row_runs(lived_cells=110) == [(0, 52), (1, 52), (2, 6)]
+
+    def test_zero_and_negative(self) -> None:
+        """Test that no runs are produced when nothing is lived."""
+        layout = compute_grid_layout(life_expectancy=80)
+
+        assert layout.lived_row_runs(lived_cells=0) == []
+        assert layout.lived_row_runs(lived_cells=-5) == []
+
+    def test_clamped_to_grid(self) -> None:
+        """Test that runs never exceed the grid size."""
+        layout = compute_grid_layout(
+            life_expectancy=20, granularity=GridGranularity.YEARS
+        )
+
+        assert layout.lived_row_runs(lived_cells=500) == [(0, 10), (1, 10)]
+
+
+class TestCountLivedCells:
+    """Test class for count_lived_cells function."""
+
+    def test_counts_per_granularity(self) -> None:
+        """Test that lived cells use weeks, months or years lived."""
+        stats = calculate_life_statistics(
+            birth_date=date(2000, 1, 1),
+            life_expectancy=80,
+            reference_date=date(2024, 6, 15),
+        )
+
+        assert (
+            count_lived_cells(stats=stats, granularity=GridGranularity.WEEKS)
+            == stats.total_weeks_lived
+        )
+        assert count_lived_cells(stats=stats, granularity=GridGranularity.MONTHS) == (
+            24 * 12 + 5
+        )
+        assert count_lived_cells(stats=stats, granularity=GridGranularity.YEARS) == 24
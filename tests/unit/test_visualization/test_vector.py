@@ -0,0 +1,189 @@
+"""Tests for vector (SVG/PDF) grid visualization."""
+
+import re
+from datetime import date
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.visualization.layout import GridGranularity, compute_grid_layout
+from src.visualization.vector import (
+    VectorFormat,
+    _build_pdf,
+    _pdf_safe_label,
+    generate_vector_visualization,
+    render_pdf,
+    render_svg,
+)
+
+# Classic 80-year weekly grid: 40px padding, 10px cells
+WEEKLY_LAYOUT = compute_grid_layout(life_expectancy=80)
+
+
+class TestRenderSvg:
+    """Test class for render_svg function."""
+
+    def test_one_path_per_lived_row(self) -> None:
+        """Test that lived weeks are emitted as one path per row."""
+        svg = render_svg(
+            layout=WEEKLY_LAYOUT, lived_cells=110, labels=("Lived", "Future")
+        )
+
+        lived_paths = re.findall(r'<path d="M40,\d+h\d+v10h-\d+z"', svg)
+        assert len(lived_paths) == 3
+        assert '<path d="M40,60h60v10h-60z"' in svg
+        assert "<rect" in svg and "url(#cell)" in svg
+
+    def test_svg_uses_layout_geometry(self) -> None:
+        """Test that the SVG canvas follows the computed layout."""
+        layout = compute_grid_layout(
+            life_expectancy=60, granularity=GridGranularity.YEARS
+        )
+        svg = render_svg(layout=layout, lived_cells=25, labels=("Lived", "Future"))
+
+        assert f'width="{layout.width}" height="{layout.height}"' in svg
+        assert f'<text x="5" y="{40 + 5 * layout.cell_size}">50</text>' in svg
+
+    def test_labels_are_escaped(self) -> None:
+        """Test that legend labels are XML escaped."""
+        svg = render_svg(
+            layout=WEEKLY_LAYOUT, lived_cells=0, labels=("<Lived & co>", "Future")
+        )
+
+        assert "&lt;Lived &amp; co&gt;" in svg
+        assert svg.startswith("<svg") and svg.endswith("</svg>")
+
+
+class TestRenderPdf:
+    """Test class for render_pdf and its helpers."""
+
+    def test_pdf_structure(self) -> None:
+        """Test that the PDF has a valid header, xref table and trailer."""
+        pdf = render_pdf(
+            layout=WEEKLY_LAYOUT, lived_cells=110, labels=("Lived", "Future")
+        )
+
+        assert pdf.startswith(b"%PDF-1.4")
+        assert pdf.rstrip().endswith(b"%%EOF")
+        startxref = int(pdf.rsplit(b"startxref\n", 1)[1].split(b"\n", 1)[0])
+        assert pdf[startxref:].startswith(b"xref")
+
+    def test_lived_cells_fill(self) -> None:
+        """Test that the lived cells are filled, and no fill without a path."""
+        lived = render_pdf(
+            layout=WEEKLY_LAYOUT, lived_cells=110, labels=("Lived", "Future")
+        )
+        empty = render_pdf(
+            layout=WEEKLY_LAYOUT, lived_cells=0, labels=("Lived", "Future")
+        )
+
+        assert lived.count(b" re\nf\n") == 1
+        assert b"\nf\n" not in empty
+
+    def test_xref_offsets_point_to_objects(self) -> None:
+        """Test that every xref entry points at its object header."""
+        pdf = _build_pdf(width=100, height=100, content="0 0 1 1 re f")
+
+        xref = pdf[pdf.index(b"xref") :].split(b"\n")
+        for number, entry in enumerate(xref[3:8], start=1):
+            offset = int(entry[:10])
+            assert pdf[offset:].startswith(f"{number} 0 obj".encode("ascii"))
+
+    def test_non_latin_labels_fall_back(self) -> None:
+        """Test that labels outside WinAnsi fall back to English."""
+        pdf = render_pdf(
+            layout=WEEKLY_LAYOUT, lived_cells=10, labels=("Прожитые недели", "Будущие")
+        )
+
+        assert b"(Lived weeks)" in pdf
+        assert b"(Future weeks)" in pdf
+
+    def test_pdf_safe_label(self) -> None:
+        """Test label selection for base-14 fonts."""
+        assert _pdf_safe_label(text="Semaines vécues", fallback="x") == (
+            "Semaines vécues"
+        )
+        assert _pdf_safe_label(text="Тижні", fallback="x") == "x"
+
+
+class TestGenerateVectorVisualization:
+    """Test class for generate_vector_visualization function."""
+
+    @pytest.fixture
+    def service(self) -> Mock:
+        """Provide a user service returning a profile with settings."""
+        profile = Mock()
+        profile.settings.language = "en"
+        profile.settings.birth_date = date(1990, 1, 1)
+        profile.settings.life_expectancy = 80
+        svc = Mock()
+        svc.get_user_profile = AsyncMock(return_value=profile)
+        return svc
+
+    @pytest.mark.asyncio
+    async def test_generates_svg(self, service: Mock) -> None:
+        """Test SVG generation for a user id."""
+        result = await generate_vector_visualization(123, user_service_instance=service)
+
+        assert result.getvalue().startswith(b"<svg")
+        service.get_user_profile.assert_awaited_once_with(telegram_id=123)
+
+    @pytest.mark.asyncio
+    async def test_generates_pdf(self, service: Mock) -> None:
+        """Test PDF generation for a user id."""
+        result = await generate_vector_visualization(
+            123, user_service_instance=service, output_format=VectorFormat.PDF
+        )
+
+        assert result.getvalue().startswith(b"%PDF")
+
+    @pytest.mark.asyncio
+    async def test_generates_yearly_grid(self, service: Mock) -> None:
+        """Test that the granularity selects the yearly grid."""
+        result = await generate_vector_visualization(
+            123, user_service_instance=service, granularity=GridGranularity.YEARS
+        )
+
+        assert len(re.findall(r"<path d=\"M40,", result.getvalue().decode())) == 4
+
+    @pytest.mark.asyncio
+    async def test_unsupported_input(self) -> None:
+        """Test that unsupported input raises TypeError."""
+        with pytest.raises(TypeError) as exc_info:
+            await generate_vector_visualization("invalid_input")
+
+        assert "generate_vector_visualization expects" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_user_not_found(self) -> None:
+        """Test that a missing profile raises ValueError."""
+        svc = Mock()
+        svc.get_user_profile = AsyncMock(return_value=None)
+
+        with pytest.raises(ValueError):
+            await generate_vector_visualization(1, user_service_instance=svc)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "granularity, lived, future",
+        [
+            (GridGranularity.MONTHS, b"(Lived months)", b"(Future months)"),
+            (GridGranularity.YEARS, b"(Lived years)", b"(Future years)"),
+        ],
+    )
+    async def test_cyrillic_pdf_falls_back_to_granularity_labels(
+        self, service: Mock, granularity: GridGranularity, lived: bytes, future: bytes
+    ) -> None:
+        """Test that a Cyrillic PDF legend falls back to the grid's own unit."""
+        service.get_user_profile.return_value.settings.language = "ru"
+
+        result = await generate_vector_visualization(
+            123,
+            user_service_instance=service,
+            output_format=VectorFormat.PDF,
+            granularity=granularity,
+        )
+
+        pdf = result.getvalue()
+        assert lived in pdf and future in pdf
+        assert b"weeks" not in pdf
@@ -69,6 +69,9 @@ class FakeServiceContainer:
         self.user_service.update_user_subscription = AsyncMock(return_value=None)
         self.user_service.delete_user_profile = AsyncMock(return_value=None)
         self.user_service.get_all_users = AsyncMock(return_value=[])
+        self.user_service.add_life_event = AsyncMock(return_value=None)
+        self.user_service.get_life_events = AsyncMock(return_value=[])
+        self.user_service.delete_life_event = AsyncMock(return_value=True)
 
         self.event_bus.publish = AsyncMock(return_value=None)
 